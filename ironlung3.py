@@ -8,6 +8,7 @@ Usage:
     python ironlung3.py --nightly    # Run nightly cycle (headless)
     python ironlung3.py --orchestrator  # Run background orchestrator
     python ironlung3.py --version    # Show version
+    python ironlung3.py --db-profile # Record per-statement SQL timings
 
 The Iron Lung breathes.
 """
@@ -47,7 +48,36 @@ def main() -> int:
         action="store_true",
         help="Show service readiness report and exit",
     )
+    parser.add_argument(
+        "--nightly-runs",
+        nargs="?",
+        type=int,
+        const=5,
+        default=None,
+        metavar="N",
+        help="Show step states of the last N nightly runs (default 5) and exit",
+    )
+    parser.add_argument(
+        "--nightly-report",
+        nargs="?",
+        type=int,
+        const=30,
+        default=None,
+        metavar="N",
+        help="Show step timing trends and regressions over the last N nightly runs "
+        "(default 30) and exit",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--db-profile",
+        nargs="?",
+        type=float,
+        const=-1.0,
+        default=None,
+        metavar="SLOW_MS",
+        help="Record per-statement SQL timings; statements slower than SLOW_MS "
+        "(default 50) get their query plan captured",
+    )
 
     args = parser.parse_args()
 
@@ -88,6 +118,11 @@ def main() -> int:
         print()
         return 0
 
+    if args.db_profile is not None:
+        from src.db.profiler import get_query_profiler
+
+        get_query_profiler().enable(slow_ms=args.db_profile if args.db_profile >= 0 else None)
+
     # Initialize database
     from src.db.database import Database
 
@@ -99,6 +134,22 @@ def main() -> int:
         logger.error(f"Failed to initialize database: {e}")
         return 1
 
+    # --nightly-runs: print checkpoint state of recent nightly runs and exit
+    if args.nightly_runs is not None:
+        from src.autonomous.nightly import format_nightly_runs
+
+        print(format_nightly_runs(db.get_nightly_runs(limit=max(args.nightly_runs, 1))))
+        db.close()
+        return 0
+
+    # --nightly-report: print nightly telemetry trends and exit
+    if args.nightly_report is not None:
+        from src.autonomous.nightly_report import build_nightly_report, format_nightly_report
+
+        print(format_nightly_report(build_nightly_report(db, limit=max(args.nightly_report, 2))))
+        db.close()
+        return 0
+
     # Seed database with sample data if empty (first run)
     _seed_status = ""
     try:
@@ -196,6 +247,7 @@ def main() -> int:
             )
         else:
             logger.info("Nightly cycle completed successfully")
+        _log_db_profile(logger)
         db.close()
         return 0
 
@@ -206,6 +258,7 @@ def main() -> int:
         orchestrator = Orchestrator()
         _register_orchestrator_tasks(orchestrator, db)
         orchestrator.run_headless()
+        _log_db_profile(logger)
         db.close()
         return 0
 
@@ -224,11 +277,21 @@ def main() -> int:
         app.run()
     finally:
         orchestrator.stop()
+        _log_db_profile(logger)
         db.close()
     logger.info("IronLung 3 shutdown complete")
     return 0
 
 
+def _log_db_profile(logger: logging.Logger) -> None:
+    """Write the query profiler's report to the log if profiling is on."""
+    from src.db.profiler import get_query_profiler
+
+    profiler = get_query_profiler()
+    if profiler.enabled:
+        logger.info(f"Database profile (top statements by total time):\n{profiler.format_report()}")
+
+
 def _register_orchestrator_tasks(orchestrator, db) -> None:  # type: ignore[no-untyped-def]
     """Register recurring background tasks with the orchestrator.
 
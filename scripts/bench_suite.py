@@ -0,0 +1,361 @@
+"""End-to-end benchmark suite over a synthetic rolodex.
+
+Builds (or reuses) a rolodex from scripts/generate_rolodex.py, copies it to
+a scratch directory and times the operations that scale with the pipeline:
+
+    todays_queue      get_todays_queue
+    search            Database.search over a few common terms
+    monthly_summary   generate_monthly_summary for the anchor month
+    intake_analyze    IntakeFunnel.analyze on an import with duplicates
+    intake_commit     IntakeFunnel.commit of that import
+    rescore_all       rescore_all
+    groundskeeper     Groundskeeper.run_maintenance
+    nightly_cycle     run_nightly_cycle with every external client offline
+
+Read-only benchmarks run --repeat times and report the median; the ones
+that write run once, in the order above, on the same copy. Results are
+written as JSON. With --compare, each median is checked against an earlier
+result file and anything more than --threshold slower is flagged; the
+script then exits 1 so it can gate CI.
+
+Usage:
+    python scripts/bench_suite.py --size 10k
+    python scripts/bench_suite.py --size 100k --out after.json --compare before.json
+    python scripts/bench_suite.py --size 1k --only todays_queue search
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import src.core.config as config_module
+from scripts.generate_rolodex import SIZES, generate_rolodex, parse_size
+from src.core.config import Config
+from src.db.database import Database, archive_path_for
+from src.db.intake import ImportPreview, ImportRecord, IntakeFunnel
+
+DEFAULT_CACHE_DIR = ROOT / "data" / "bench"
+
+# Medians slower than baseline by this fraction are regressions
+DEFAULT_THRESHOLD = 0.20
+
+# Differences below this many seconds are noise, whatever the ratio
+NOISE_FLOOR_SECONDS = 0.005
+
+SEARCH_TERMS = ["smith", "branch manager", "encompass", "summit lending", "fha"]
+
+
+class Suite:
+    """Shared state for one benchmark run."""
+
+    def __init__(self, db: Database, anchor: date, prospects: int, seed: int):
+        self.db = db
+        self.anchor = anchor
+        self.prospects = prospects
+        self.seed = seed
+        self.preview: Optional[ImportPreview] = None
+
+    def import_records(self) -> list[ImportRecord]:
+        """An import file: mostly new contacts, some existing emails, some incomplete."""
+        rng = random.Random(self.seed + 1)
+        count = max(100, self.prospects // 20)
+        existing = [
+            row[0]
+            for row in self.db._get_connection().execute(
+                "SELECT value FROM contact_methods WHERE type = 'email' ORDER BY id LIMIT ?",
+                (count,),
+            )
+        ]
+        records = []
+        for i in range(count):
+            roll = rng.random()
+            if roll < 0.2 and existing:
+                email = rng.choice(existing)
+                first, last = email.split("@")[0].split(".")[:2]
+                records.append(
+                    ImportRecord(
+                        first_name=first.title(),
+                        last_name=last.title(),
+                        email=email,
+                        company_name="Summit Lending LLC",
+                    )
+                )
+            elif roll < 0.3:
+                records.append(ImportRecord(first_name=f"Partial{i}", company_name=""))
+            else:
+                records.append(
+                    ImportRecord(
+                        first_name=f"Import{i}",
+                        last_name=rng.choice(["Reyes", "Walsh", "Okoye", "Brandt", "Sato"]),
+                        email=f"import{i}.{self.seed}@newlead.example.com",
+                        phone=f"(512) 555-{i % 10000:04d}",
+                        company_name=f"New Lead Lending {i % 500}",
+                        title="Loan Officer",
+                        state="TX",
+                        source="bench",
+                    )
+                )
+        return records
+
+    # -- benchmarks ---------------------------------------------------------
+
+    def todays_queue(self) -> dict[str, Any]:
+        from src.engine.cadence import get_todays_queue
+
+        return {"queue": len(get_todays_queue(self.db))}
+
+    def search(self) -> dict[str, Any]:
+        return {"hits": sum(len(self.db.search(term)) for term in SEARCH_TERMS)}
+
+    def monthly_summary(self) -> dict[str, Any]:
+        from src.engine.export import generate_monthly_summary
+
+        summary = generate_monthly_summary(self.db, self.anchor.strftime("%Y-%m"))
+        return {"calls": summary.calls_made, "emails": summary.emails_sent}
+
+    def intake_analyze(self) -> dict[str, Any]:
+        records = self.import_records()
+        self.preview = IntakeFunnel(self.db).analyze(records, source_name="bench")
+        return {"records": len(records)}
+
+    def intake_commit(self) -> dict[str, Any]:
+        if self.preview is None:
+            self.intake_analyze()
+        assert self.preview is not None
+        result = IntakeFunnel(self.db).commit(self.preview)
+        return {"imported": result.imported_count}
+
+    def rescore_all(self) -> dict[str, Any]:
+        from src.engine.scoring import rescore_all
+
+        return {"scored": rescore_all(self.db)}
+
+    def groundskeeper(self) -> dict[str, Any]:
+        from src.engine.groundskeeper import Groundskeeper
+
+        return {"flagged": Groundskeeper(self.db).run_maintenance().get("flagged", 0)}
+
+    def nightly_cycle(self) -> dict[str, Any]:
+        from src.autonomous.nightly import run_nightly_cycle
+
+        result = run_nightly_cycle(self.db)
+        return {"errors": len(result.errors), "scored": result.prospects_scored}
+
+
+# (name, repeatable) in run order; writers come last and run once
+BENCHMARKS: list[tuple[str, bool]] = [
+    ("todays_queue", True),
+    ("search", True),
+    ("monthly_summary", True),
+    ("intake_analyze", True),
+    ("intake_commit", False),
+    ("rescore_all", False),
+    ("groundskeeper", False),
+    ("nightly_cycle", False),
+]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+def _copy_database(source: Path, target: Path) -> None:
+    """Copy a closed database and its activity archive."""
+    shutil.copy2(source, target)
+    archive = Path(archive_path_for(str(source)))
+    if archive.exists():
+        shutil.copy2(archive, archive_path_for(str(target)))
+
+
+def prepare_rolodex(
+    prospects: int, seed: int, anchor: date, cache_dir: Path, log: Callable[[str], None]
+) -> tuple[Path, dict[str, Any]]:
+    """Return a cached rolodex database for these parameters, generating it if needed."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"rolodex-{prospects}-s{seed}-{anchor.isoformat()}.db"
+    stats_path = path.with_suffix(".json")
+    if path.exists() and stats_path.exists():
+        log(f"Reusing {path}")
+        return path, json.loads(stats_path.read_text(encoding="utf-8"))
+
+    for stale in (path, Path(archive_path_for(str(path)))):
+        stale.unlink(missing_ok=True)
+    log(f"Generating {prospects:,} prospects into {path} ...")
+    db = Database(str(path), compress_text=False)
+    db.initialize()
+    try:
+        stats = generate_rolodex(db, prospects, seed=seed, anchor=anchor)
+    finally:
+        db.close()
+    stats_dict = asdict(stats)
+    stats_path.write_text(json.dumps(stats_dict, indent=2), encoding="utf-8")
+    log(f"Generated in {stats.seconds:.1f}s")
+    return path, stats_dict
+
+
+def run_suite(
+    source: Path,
+    prospects: int,
+    seed: int,
+    anchor: date,
+    repeat: int,
+    only: Optional[list[str]],
+    log: Callable[[str], None],
+) -> dict[str, Any]:
+    """Time every selected benchmark on a scratch copy of ``source``."""
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="ironlung-bench-") as tmp:
+        work = Path(tmp)
+        db_path = work / "ironlung3.db"
+        _copy_database(source, db_path)
+
+        # Offline configuration: scratch paths and no API credentials
+        saved_config = config_module._config
+        config_module._config = Config(
+            db_path=db_path,
+            log_path=work / "logs",
+            backup_path=work / "backups",
+            cloud_sync_path=None,
+        )
+        db = Database(str(db_path), compress_text=False)
+        db.initialize()
+        suite = Suite(db, anchor, prospects, seed)
+        try:
+            for name, repeatable in BENCHMARKS:
+                if only and name not in only:
+                    continue
+                runs: list[float] = []
+                detail: dict[str, Any] = {}
+                for _ in range(repeat if repeatable else 1):
+                    started = time.perf_counter()
+                    detail = getattr(suite, name)()
+                    runs.append(time.perf_counter() - started)
+                median = statistics.median(runs)
+                results[name] = {
+                    "median_s": round(median, 6),
+                    "runs_s": [round(r, 6) for r in runs],
+                    "detail": detail,
+                }
+                log(f"  {name:<16} {median * 1000:>10.1f} ms  {detail}")
+        finally:
+            db.close()
+            config_module._config = saved_config
+    return results
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """Benchmarks whose median grew by more than ``threshold`` over ``baseline``."""
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        old, new = before["median_s"], current["median_s"]
+        if new - old > NOISE_FLOOR_SECONDS and old > 0 and new / old > 1 + threshold:
+            regressions.append({"name": name, "before_s": old, "after_s": new, "ratio": new / old})
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--size", default="1k", help=f"{', '.join(SIZES)} or a prospect count (default 1k)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=None,
+        help="'Today' for the generated history, YYYY-MM-DD (default today)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per read-only benchmark")
+    parser.add_argument("--only", nargs="+", choices=[name for name, _ in BENCHMARKS])
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--out", type=Path, default=None, help="Result JSON path")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline result JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--verbose", action="store_true", help="Show application logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    prospects = parse_size(args.size)
+    anchor = args.anchor or date.today()
+    log = print
+
+    source, rolodex = prepare_rolodex(prospects, args.seed, anchor, args.cache_dir, log)
+    log(f"Benchmarking {prospects:,} prospects ({rolodex['activities']:,} activities)")
+    results = run_suite(source, prospects, args.seed, anchor, args.repeat, args.only, log)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "size": prospects,
+            "seed": args.seed,
+            "anchor": anchor.isoformat(),
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "rolodex": rolodex,
+        },
+        "results": results,
+    }
+    out = args.out or args.cache_dir / (
+        f"results-{prospects}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    log(f"Results written to {out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("meta", {}).get("size") != prospects:
+            log("Warning: baseline was run at a different size")
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            log(
+                f"REGRESSION {r['name']}: {r['before_s'] * 1000:.1f} ms -> "
+                f"{r['after_s'] * 1000:.1f} ms ({r['ratio']:.2f}x)"
+            )
+        if regressions:
+            return 1
+        log(f"No regressions over {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Benchmark compressed text storage: file size and card-render read latency.
+
+Builds two throwaway databases with the same synthetic pipeline, one with
+IRONLUNG_COMPRESS_TEXT off and one with it on, then reports the file size
+after VACUUM and how long get_prospect_full() (what a card render loads)
+takes per prospect in each.
+
+Usage:
+    python scripts/bench_text_compression.py
+    python scripts/bench_text_compression.py --prospects 5000 --activities 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.db.database import Database
+
+PARAGRAPHS = [
+    "Thanks for taking the time to walk through your current pipeline process.",
+    "As promised, here is a short summary of how teams like yours cut turn times.",
+    "Most branches we work with were juggling spreadsheets and three separate inboxes.",
+    "Happy to set up a 20-minute demo with your processing lead next week.",
+    "Let me know if Tuesday or Thursday afternoon works better on your end.",
+    "I also attached the rate-lock workflow one-pager your team asked about.",
+]
+
+
+def _email_body(rng: random.Random) -> str:
+    """A 1-3 KB email in the shape Anne and nurture drafts produce."""
+    lines = [f"Hi {rng.choice(['Dana', 'Chris', 'Pat', 'Morgan'])},", ""]
+    for _ in range(rng.randint(8, 20)):
+        lines.append(" ".join(rng.sample(PARAGRAPHS, k=3)))
+    lines += ["", "Best,", "Jeff"]
+    return "\n".join(lines)
+
+
+def _populate(db: Database, prospects: int, activities: int, seed: int) -> list[int]:
+    """Insert the same synthetic pipeline into ``db`` and return prospect ids."""
+    rng = random.Random(seed)
+    conn = db._get_connection()
+    ids: list[int] = []
+    with db.transaction():
+        company_id = db._lastrowid(
+            conn.execute(
+                "INSERT INTO companies (name, name_normalized, state) VALUES (?, ?, ?)",
+                ("Bench Lending", "bench lending", "TX"),
+            )
+        )
+        for i in range(prospects):
+            cursor = conn.execute(
+                """INSERT INTO prospects
+                   (company_id, first_name, last_name, population, close_notes, custom_fields)
+                   VALUES (?, ?, ?, 'engaged', ?, ?)""",
+                (
+                    company_id,
+                    f"First{i}",
+                    f"Last{i}",
+                    db._encode_text(" ".join(rng.sample(PARAGRAPHS, k=4)) * 3),
+                    db._encode_text('{"branch": "North", "loan_types": ["FHA", "VA"]}' * 8),
+                ),
+            )
+            ids.append(db._lastrowid(cursor))
+        for pid in ids:
+            for _ in range(activities):
+                is_email = rng.random() < 0.6
+                conn.execute(
+                    """INSERT INTO activities (prospect_id, activity_type, email_body, notes)
+                       VALUES (?, ?, ?, ?)""",
+                    (
+                        pid,
+                        "email_sent" if is_email else "call",
+                        db._encode_text(_email_body(rng)) if is_email else None,
+                        "Left voicemail, will retry Thursday" if not is_email else None,
+                    ),
+                )
+    conn.execute("VACUUM")
+    return ids
+
+
+def _time_cards(db: Database, ids: list[int], samples: int, seed: int) -> list[float]:
+    """Milliseconds per get_prospect_full() over a random sample of prospects."""
+    rng = random.Random(seed)
+    timings = []
+    for pid in rng.choices(ids, k=samples):
+        start = time.perf_counter()
+        db.get_prospect_full(pid)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prospects", type=int, default=2000)
+    parser.add_argument("--activities", type=int, default=20, help="activities per prospect")
+    parser.add_argument("--samples", type=int, default=1000, help="card renders timed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for compressed in (False, True):
+            path = Path(tmp) / f"bench_{'zlib' if compressed else 'plain'}.db"
+            db = Database(str(path), compress_text=compressed)
+            db.initialize()
+            ids = _populate(db, args.prospects, args.activities, seed=7)
+            _time_cards(db, ids, samples=100, seed=1)  # warm the page cache
+            timings = _time_cards(db, ids, args.samples, seed=2)
+            db.close()
+            results[compressed] = (path.stat().st_size, timings)
+
+        print(
+            f"{args.prospects} prospects x {args.activities} activities, "
+            f"{args.samples} card renders\n"
+        )
+        print(f"{'storage':<8} {'file MB':>8} {'median ms':>10} {'p95 ms':>8}")
+        for compressed, (size, timings) in results.items():
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            print(
+                f"{'zlib' if compressed else 'plain':<8} {size / 1e6:>8.1f} "
+                f"{statistics.median(timings):>10.3f} {p95:>8.3f}"
+            )
+        plain, zlib_ = results[False][0], results[True][0]
+        print(f"\nfile size: {zlib_ / plain:.0%} of plain")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,463 @@
+"""Generate a deterministic synthetic rolodex for scale testing.
+
+Builds companies, prospects across every population, contact methods,
+multi-year activity histories, tags and intel nuggets. The same seed and
+anchor date always produce the same rows, so benchmark runs on different
+commits measure the code, not the data.
+
+Rows are written with executemany in one transaction per chunk, with ids
+assigned up front so activities and nuggets can reference each other. The
+schema's triggers (search index, pipeline counters, last activity) fire as
+they would for real data.
+
+Usage:
+    python scripts/generate_rolodex.py --size 10k --out data/bench/rolodex-10k.db
+    python scripts/generate_rolodex.py --size 1m --out big.db --seed 7 --anchor 2026-03-01
+
+Library use (see scripts/bench_suite.py):
+    from scripts.generate_rolodex import generate_rolodex
+
+    stats = generate_rolodex(db, prospects=10_000, seed=42)
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.core.phone import normalize_phone
+from src.db.database import Database, intel_content_hash
+from src.db.models import normalize_company_name, timezone_from_state
+
+# Named sizes accepted by --size
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Prospects written per transaction
+CHUNK_SIZE = 5_000
+
+# (population, weight) - roughly the shape of a working pipeline
+POPULATION_WEIGHTS = [
+    ("unengaged", 52),
+    ("engaged", 9),
+    ("broken", 12),
+    ("parked", 8),
+    ("lost", 9),
+    ("dead_dnc", 3),
+    ("partnership", 4),
+    ("closed_won", 3),
+]
+STAGES = ["pre_demo", "demo_scheduled", "post_demo", "closing"]
+
+# (activity_type, outcome choices, weight)
+ACTIVITY_WEIGHTS = [
+    ("call", ["no_answer", "spoke_with", "interested", "not_now", "not_interested"], 30),
+    ("voicemail", ["left_vm"], 20),
+    ("email_sent", [None], 24),
+    ("email_received", ["replied", "ooo"], 8),
+    ("note", [None], 10),
+    ("status_change", [None], 4),
+    ("demo_scheduled", ["demo_set"], 2),
+    ("demo_completed", ["demo_completed"], 2),
+]
+
+# fmt: off
+FIRST_NAMES = [
+    "James", "Maria", "Robert", "Linda", "Michael", "Patricia", "David", "Jennifer",
+    "Carlos", "Susan", "Daniel", "Karen", "Kevin", "Nancy", "Brian", "Lisa", "Jason",
+    "Angela", "Chris", "Dana", "Morgan", "Pat", "Taylor", "Jordan", "Casey", "Priya",
+    "Wei", "Fatima", "Andre", "Keisha", "Luis", "Mei", "Omar", "Rosa", "Tyler", "Erin",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris",
+    "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "Nguyen", "Patel",
+    "Kim", "Chen", "Okafor", "Schultz", "Romero", "Bennett", "Foster", "Hayes",
+]
+TITLES = [
+    "Branch Manager", "Loan Officer", "VP of Lending", "Operations Manager",
+    "Processing Manager", "President", "Owner", "Chief Operating Officer",
+    "Senior Loan Officer", "Director of Sales", "Underwriting Manager",
+]
+COMPANY_WORDS_A = [
+    "Summit", "Lone Star", "Pioneer", "Heritage", "Liberty", "Keystone", "Frontier",
+    "Guardian", "Cornerstone", "Evergreen", "Gulf Coast", "Prairie", "Red River",
+    "Blue Ridge", "Capital", "First", "Granite", "Harbor", "Magnolia", "Sterling",
+]
+COMPANY_WORDS_B = [
+    "Home", "Mortgage", "Lending", "Funding", "Financial", "Capital", "Home Loans",
+    "Residential", "Bank", "Credit Union", "Equity", "Trust",
+]
+# fmt: on
+COMPANY_SUFFIXES = ["LLC", "Inc.", "Group", "Co.", "Partners", "Corp."]
+STATES = ["TX", "CA", "FL", "GA", "NC", "AZ", "CO", "OH", "IL", "NY", "WA", "TN", "OK", "LA"]
+SOURCES = ["csv_import", "activecampaign", "referral", "conference", "linkedin", "cold_list"]
+TAGS = ["hot", "referral", "conference-2025", "fha", "va", "jumbo", "reverse", "needs-demo"]
+COMPETITORS = ["Encompass", "LendingPad", "Calyx", "Byte", "MeridianLink"]
+LOST_REASONS = ["lost_to_competitor", "not_buying", "timing", "budget", "out_of_business"]
+NOTE_PHRASES = [
+    "Pain point: pipeline visibility across branches is poor.",
+    "Currently using {competitor} and unhappy with support.",
+    "They do mostly FHA and VA loans, some jumbo.",
+    "Decision by end of quarter; budget approved.",
+    "Asked for pricing on the team plan.",
+    "Spoke with assistant, call back next week.",
+    "Wants a demo with the processing lead.",
+    "Contract renewal with {competitor} is in the spring.",
+    "Referred by a partner branch.",
+    "Left voicemail about rate-lock workflow.",
+]
+NUGGETS = {
+    "pain_point": ["Manual status updates eat 2 hours a day", "Losing files between LOs"],
+    "competitor": ["Evaluating {competitor}", "Current vendor is {competitor}"],
+    "loan_type": ["FHA heavy", "VA and jumbo", "Reverse mortgages"],
+    "decision_timeline": ["Deciding this quarter", "Budget cycle starts in January"],
+    "key_fact": ["12 branches in the state", "Owner makes all software calls"],
+}
+
+
+@dataclass
+class RolodexStats:
+    """Rows written by generate_rolodex."""
+
+    seed: int
+    anchor: str
+    companies: int = 0
+    prospects: int = 0
+    contact_methods: int = 0
+    activities: int = 0
+    intel_nuggets: int = 0
+    tags: int = 0
+    seconds: float = 0.0
+
+
+def _weighted(rng: random.Random, table: list) -> tuple:
+    return rng.choices(table, weights=[row[-1] for row in table], k=1)[0]
+
+
+def _ts(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _next_ids(db: Database) -> dict[str, int]:
+    """First free id per table, so a rolodex can be added to a non-empty database."""
+    conn = db._get_connection()
+    ids = {}
+    for table in ("companies", "prospects", "contact_methods", "activities", "intel_nuggets"):
+        row = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()
+        ids[table] = int(row[0]) + 1
+    return ids
+
+
+def generate_rolodex(
+    db: Database,
+    prospects: int,
+    seed: int = 42,
+    anchor: Optional[date] = None,
+    years: int = 3,
+    activities_per_prospect: int = 12,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> RolodexStats:
+    """Write a synthetic rolodex into ``db``.
+
+    Args:
+        db: Initialized database
+        prospects: Number of prospects to create
+        seed: Random seed; same seed and anchor give the same rows
+        anchor: "Today" for the generated history (defaults to today)
+        years: How far back prospects and activities go
+        activities_per_prospect: Average activities per prospect
+        progress: Called with (prospects_written, prospects) after each chunk
+
+    Returns:
+        RolodexStats with row counts
+    """
+    started = time.perf_counter()
+    anchor = anchor or date.today()
+    rng = random.Random(seed)
+    stats = RolodexStats(seed=seed, anchor=anchor.isoformat())
+    conn = db._get_connection()
+    ids = _next_ids(db)
+    midnight = datetime.combine(anchor, datetime.min.time())
+    origin = midnight - timedelta(days=365 * years)
+    span_seconds = int((midnight - origin).total_seconds())
+
+    # Companies: about four contacts each, assigned at random
+    company_count = max(1, prospects // 4)
+    company_rows = []
+    for i in range(company_count):
+        name = (
+            f"{rng.choice(COMPANY_WORDS_A)} {rng.choice(COMPANY_WORDS_B)} "
+            f"{rng.choice(COMPANY_SUFFIXES)}"
+        )
+        state = rng.choice(STATES)
+        slug = normalize_company_name(name).replace(" ", "")[:20]
+        company_rows.append(
+            (
+                ids["companies"] + i,
+                name,
+                normalize_company_name(name),
+                f"{slug}{i}.com",
+                state,
+                timezone_from_state(state),
+                _ts(origin + timedelta(seconds=rng.randrange(span_seconds))),
+            )
+        )
+    with db.transaction():
+        for start in range(0, len(company_rows), CHUNK_SIZE):
+            conn.executemany(
+                """INSERT INTO companies
+                   (id, name, name_normalized, domain, state, timezone, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?7)""",
+                company_rows[start : start + CHUNK_SIZE],
+            )
+    stats.companies = company_count
+
+    prospect_id = ids["prospects"]
+    method_id = ids["contact_methods"]
+    activity_id = ids["activities"]
+    nugget_id = ids["intel_nuggets"]
+    for chunk_start in range(0, prospects, CHUNK_SIZE):
+        chunk_end = min(chunk_start + CHUNK_SIZE, prospects)
+        p_rows, m_rows, a_rows, n_rows, t_rows = [], [], [], [], []
+        for _ in range(chunk_start, chunk_end):
+            pid = prospect_id
+            prospect_id += 1
+            company_id = ids["companies"] + rng.randrange(company_count)
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            population = _weighted(rng, POPULATION_WEIGHTS)[0]
+            created = origin + timedelta(seconds=rng.randrange(span_seconds))
+            competitor = rng.choice(COMPETITORS)
+            notes = " ".join(
+                phrase.format(competitor=competitor)
+                for phrase in rng.sample(NOTE_PHRASES, k=rng.randint(0, 2))
+            )
+
+            stage = follow_up = parked_month = None
+            lost_reason = lost_competitor = lost_date = dead_reason = dead_date = None
+            deal_value = close_date = None
+            if population in ("engaged", "unengaged"):
+                # Mostly upcoming, some due today, some overdue
+                follow_up = _ts(
+                    midnight + timedelta(days=rng.randint(-10, 30), hours=rng.randint(8, 17))
+                )
+            if population == "engaged":
+                stage = rng.choice(STAGES)
+            elif population == "parked":
+                parked = anchor + timedelta(days=rng.randint(0, 180))
+                parked_month = parked.strftime("%Y-%m")
+            elif population == "lost":
+                lost_reason = rng.choice(LOST_REASONS)
+                lost_competitor = competitor if lost_reason == "lost_to_competitor" else None
+                lost_date = (anchor - timedelta(days=rng.randint(1, 365 * years))).isoformat()
+            elif population == "dead_dnc":
+                dead_reason = "dnc"
+                dead_date = (anchor - timedelta(days=rng.randint(1, 365))).isoformat()
+            elif population == "closed_won":
+                deal_value = rng.randrange(5_000, 120_000, 500)
+                close_date = (anchor - timedelta(days=rng.randint(1, 365 * years))).isoformat()
+
+            p_rows.append(
+                (
+                    pid,
+                    company_id,
+                    first,
+                    last,
+                    rng.choice(TITLES),
+                    population,
+                    stage,
+                    follow_up,
+                    parked_month,
+                    rng.randint(0, 8),
+                    rng.randint(0, 100),
+                    rng.randint(0, 100),
+                    rng.choice(SOURCES),
+                    dead_reason,
+                    dead_date,
+                    lost_reason,
+                    lost_competitor,
+                    lost_date,
+                    deal_value,
+                    close_date,
+                    notes or None,
+                    _ts(created),
+                )
+            )
+
+            # Contact methods: broken records are missing some
+            if population != "broken" or rng.random() < 0.5:
+                m_rows.append(
+                    (
+                        method_id,
+                        pid,
+                        "email",
+                        f"{first}.{last}.{pid}@example.com".lower(),
+                        None,
+                        1,
+                        _ts(created),
+                    )
+                )
+                method_id += 1
+            if population != "broken" or rng.random() < 0.3:
+                phone = (
+                    f"({rng.randint(201, 989)}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}"
+                )
+                phone_key = normalize_phone(phone) or None
+                m_rows.append((method_id, pid, "phone", phone, phone_key, 1, _ts(created)))
+                method_id += 1
+
+            # Activity history between creation and the anchor
+            history = []
+            window = max(1, int((midnight - created).total_seconds()))
+            for _ in range(rng.randint(0, activities_per_prospect * 2)):
+                history.append(created + timedelta(seconds=rng.randrange(window)))
+            history.sort()
+            activity_ids = []
+            for moment in history:
+                activity_type, outcomes, _weight = _weighted(rng, ACTIVITY_WEIGHTS)
+                subject = body = None
+                if activity_type.startswith("email"):
+                    subject = f"Following up - {rng.choice(COMPANY_WORDS_A)} pipeline"
+                    phrase = rng.choice(NOTE_PHRASES).format(competitor=competitor)
+                    body = f"Hi {first},\n\n{phrase}"
+                note = None
+                if rng.random() < 0.6:
+                    note = rng.choice(NOTE_PHRASES).format(competitor=competitor)
+                a_rows.append(
+                    (
+                        activity_id,
+                        pid,
+                        activity_type,
+                        rng.choice(outcomes),
+                        subject,
+                        body,
+                        note,
+                        "user",
+                        _ts(moment),
+                    )
+                )
+                activity_ids.append(activity_id)
+                activity_id += 1
+
+            # Intel on worked prospects
+            if population in ("engaged", "lost", "closed_won") or rng.random() < 0.05:
+                for category in rng.sample(list(NUGGETS), k=rng.randint(1, 3)):
+                    content = rng.choice(NUGGETS[category]).format(competitor=competitor)
+                    source = rng.choice(activity_ids) if activity_ids else None
+                    n_rows.append(
+                        (
+                            nugget_id,
+                            pid,
+                            category,
+                            content,
+                            intel_content_hash(content),
+                            source,
+                            _ts(created),
+                        )
+                    )
+                    nugget_id += 1
+
+            if rng.random() < 0.25:
+                for tag in rng.sample(TAGS, k=rng.randint(1, 2)):
+                    t_rows.append((pid, tag, _ts(created)))
+
+        with db.transaction():
+            conn.executemany(
+                """INSERT INTO prospects
+                   (id, company_id, first_name, last_name, title, population,
+                    engagement_stage, follow_up_date, parked_month, attempt_count,
+                    prospect_score, data_confidence, source, dead_reason, dead_date,
+                    lost_reason, lost_competitor, lost_date, deal_value, close_date,
+                    notes, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                           ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?22)""",
+                p_rows,
+            )
+            conn.executemany(
+                """INSERT INTO contact_methods
+                   (id, prospect_id, type, value, phone_normalized, is_primary, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                m_rows,
+            )
+            conn.executemany(
+                """INSERT INTO activities
+                   (id, prospect_id, activity_type, outcome, email_subject, email_body,
+                    notes, created_by, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                a_rows,
+            )
+            conn.executemany(
+                """INSERT INTO intel_nuggets
+                   (id, prospect_id, category, content, content_hash, source_activity_id,
+                    extracted_date)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                n_rows,
+            )
+            conn.executemany(
+                "INSERT INTO prospect_tags (prospect_id, tag_name, created_at) VALUES (?, ?, ?)",
+                t_rows,
+            )
+
+        stats.prospects += len(p_rows)
+        stats.contact_methods += len(m_rows)
+        stats.activities += len(a_rows)
+        stats.intel_nuggets += len(n_rows)
+        stats.tags += len(t_rows)
+        if progress:
+            progress(chunk_end, prospects)
+
+    stats.seconds = round(time.perf_counter() - started, 2)
+    return stats
+
+
+def parse_size(value: str) -> int:
+    """Accept a named size (1k, 10k, 100k, 1m) or a plain count."""
+    return SIZES.get(value.lower()) or int(value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", default="1k", help="1k, 10k, 100k, 1m or a prospect count")
+    parser.add_argument("--out", type=Path, required=True, help="Database file to create")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--activities", type=int, default=12, help="Average per prospect")
+    args = parser.parse_args()
+
+    if args.out.exists():
+        print(f"{args.out} already exists; choose a new path", file=sys.stderr)
+        return 1
+
+    db = Database(str(args.out), compress_text=False)
+    db.initialize()
+    try:
+        stats = generate_rolodex(
+            db,
+            parse_size(args.size),
+            seed=args.seed,
+            anchor=args.anchor,
+            years=args.years,
+            activities_per_prospect=args.activities,
+            progress=lambda done, total: print(f"  {done:,}/{total:,} prospects", end="\r"),
+        )
+    finally:
+        db.close()
+    print()
+    for key, value in asdict(stats).items():
+        print(f"{key:>16}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
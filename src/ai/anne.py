@@ -33,10 +33,29 @@ from src.db.models import (
     IntelNugget,
     Population,
     Prospect,
+    ProspectFull,
 )
 
 logger = get_logger(__name__)
 
+# Actions execute_actions dispatches to _execute_<action>
+_ACTION_TYPES = frozenset(
+    {
+        "log_activity",
+        "log_note",
+        "set_follow_up",
+        "park",
+        "population_change",
+        "schedule_demo",
+        "dial",
+        "flag_suspect",
+        "send_email",
+    }
+)
+
+# Actions with side effects outside the database; run after the unit commits
+_EXTERNAL_ACTIONS = frozenset({"dial", "send_email"})
+
 # Anne's system prompt — defines her personality and role
 _SYSTEM_PROMPT = """\
 You are Anne, the AI sales assistant for Jeff Soderstrom at Nexys LLC.
@@ -468,61 +487,52 @@ class Anne(ClaudeClientMixin):
     def execute_actions(self, actions: list[dict]) -> dict:
         """Execute confirmed actions.
 
+        Database actions for the card run as one unit of work (one commit),
+        each in its own savepoint so a failed action leaves the others intact.
+        Actions that reach outside the app (dial, send_email) run after the
+        commit so the database is not held during network calls.
+
         Returns dict with results of each action.
         """
         results: dict[str, Any] = {"executed": [], "failed": []}
+        external: list[dict] = []
 
-        for action in actions:
-            action_type = action.get("action", "")
-            try:
-                if action_type == "log_activity":
-                    self._execute_log_activity(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "log_note":
-                    self._execute_log_note(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "set_follow_up":
-                    self._execute_set_follow_up(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "park":
-                    self._execute_park(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "population_change":
-                    self._execute_population_change(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "schedule_demo":
-                    self._execute_schedule_demo(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "dial":
-                    self._execute_dial(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "flag_suspect":
-                    self._execute_flag_suspect(action)
-                    results["executed"].append(action_type)
-
-                elif action_type == "send_email":
-                    self._execute_send_email(action)
-                    results["executed"].append(action_type)
+        with self.db.transaction():
+            for action in actions:
+                if action.get("action", "") in _EXTERNAL_ACTIONS:
+                    external.append(action)
+                    continue
+                self._execute_action(action, results, atomic=True)
 
-                elif action_type == "deep_dive":
-                    # Handled by GUI layer — app.py switches card view
-                    results["executed"].append(action_type)
+        for action in external:
+            self._execute_action(action, results, atomic=False)
 
-                else:
-                    results["failed"].append({"action": action_type, "error": "Unknown action"})
+        return results
 
-            except Exception as e:
-                logger.error(f"Action failed: {action_type}: {e}")
-                results["failed"].append({"action": action_type, "error": str(e)})
+    def _execute_action(self, action: dict, results: dict[str, Any], atomic: bool) -> None:
+        """Run one action and record the outcome in ``results``."""
+        action_type = action.get("action", "")
+        try:
+            if action_type == "deep_dive":
+                # Handled by GUI layer — app.py switches card view
+                results["executed"].append(action_type)
+                return
+
+            handler = getattr(self, f"_execute_{action_type}", None)
+            if action_type not in _ACTION_TYPES or handler is None:
+                results["failed"].append({"action": action_type, "error": "Unknown action"})
+                return
+
+            if atomic:
+                with self.db.transaction():
+                    handler(action)
+            else:
+                handler(action)
+            results["executed"].append(action_type)
 
-        return results
+        except Exception as e:
+            logger.error(f"Action failed: {action_type}: {e}")
+            results["failed"].append({"action": action_type, "error": str(e)})
 
     def pre_generate_cards(self, prospect_ids: list[int]) -> dict[int, str]:
         """Batch-generate card presentations for queue.
@@ -531,10 +541,15 @@ class Anne(ClaudeClientMixin):
         Used during nightly cycle or between cards for low latency.
         """
         generated: dict[int, str] = {}
+        try:
+            preloaded = self.db.get_prospect_full_many(prospect_ids)
+        except Exception as e:
+            logger.warning(f"Batch load for pre-generation failed: {e}")
+            preloaded = {}
 
         for pid in prospect_ids:
             try:
-                context = self._build_prospect_context(pid)
+                context = self._build_prospect_context(pid, preloaded.get(pid))
                 if not context:
                     continue
 
@@ -652,16 +667,19 @@ class Anne(ClaudeClientMixin):
     # PRIVATE: Context Building
     # =========================================================================
 
-    def _build_prospect_context(self, prospect_id: int) -> Optional[dict]:
-        """Build full context for a prospect."""
-        full = self.db.get_prospect_full(prospect_id)
+    def _build_prospect_context(
+        self, prospect_id: int, full: Optional[ProspectFull] = None
+    ) -> Optional[dict]:
+        """Build full context for a prospect, reusing ``full`` if already loaded."""
+        if full is None:
+            full = self.db.get_prospect_full(prospect_id)
         if not full:
             return None
 
         from src.ai.card_story import generate_story
 
-        story = generate_story(self.db, prospect_id)
-        nuggets = self.db.get_intel_nuggets(prospect_id)
+        story = generate_story(self.db, prospect_id, full)
+        nuggets = full.intel_nuggets
 
         return {
             "prospect": full.prospect,
@@ -6,28 +6,31 @@ Generates narrative from notes:
 """
 
 from datetime import date, datetime
+from typing import Optional
 
 from src.core.logging import get_logger
 from src.db.database import Database
-from src.db.models import Activity, ActivityType, IntelNugget, Population
+from src.db.models import Activity, ActivityType, IntelNugget, Population, ProspectFull
 
 logger = get_logger(__name__)
 
 
-def generate_story(db: Database, prospect_id: int) -> str:
+def generate_story(db: Database, prospect_id: int, full: Optional[ProspectFull] = None) -> str:
     """Generate narrative from prospect history.
 
     Reads activities, intel nuggets, and prospect state to build
-    a human-readable story Anne can present.
+    a human-readable story Anne can present. Pass ``full`` when it has
+    already been loaded to skip the database round trip.
     """
-    full = db.get_prospect_full(prospect_id)
+    if full is None:
+        full = db.get_prospect_full(prospect_id)
     if not full:
         return "No prospect data found."
 
     p = full.prospect
     company = full.company
     activities = full.activities  # most recent first
-    nuggets = db.get_intel_nuggets(prospect_id)
+    nuggets = full.intel_nuggets
 
     parts: list[str] = []
 
@@ -8,6 +8,7 @@ from typing import Any, Optional
 
 from src.core.config import get_config
 from src.core.logging import get_logger
+from src.utils.run_metrics import count_api_call
 
 logger = get_logger(__name__)
 
@@ -55,6 +56,7 @@ class ClaudeClientMixin:
             input_tokens: Input tokens consumed
             output_tokens: Output tokens consumed
         """
+        count_api_call()
         try:
             from src.utils.cost_tracking import get_cost_tracker
 
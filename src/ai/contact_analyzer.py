@@ -50,7 +50,7 @@ def analyze_company(db: Database, company_id: int) -> CompanyAnalysis:
     prospects = conn.execute(
         """SELECT p.id, p.first_name, p.last_name, p.population,
                   p.engagement_stage, p.prospect_score, p.follow_up_date,
-                  p.last_contact_date, p.attempt_count
+                  p.last_contact_date, p.attempt_count, p.last_activity_at
            FROM prospects p
            WHERE p.company_id = ?
              AND p.population NOT IN (?, ?)
@@ -78,17 +78,10 @@ def analyze_company(db: Database, company_id: int) -> CompanyAnalysis:
         pop = p["population"]
 
         # Check recent activity
-        last_activity = conn.execute(
-            """SELECT MAX(created_at) as last_act
-               FROM activities
-               WHERE prospect_id = ?""",
-            (pid,),
-        ).fetchone()
-
         has_recent_activity = False
-        if last_activity and last_activity["last_act"]:
+        if p["last_activity_at"]:
             try:
-                act_str = str(last_activity["last_act"])[:10]
+                act_str = str(p["last_activity_at"])[:10]
                 act_date = date.fromisoformat(act_str)
                 has_recent_activity = act_date >= date.fromisoformat(stale_cutoff)
             except (ValueError, TypeError):
@@ -207,13 +200,11 @@ def find_stalling_patterns(db: Database) -> list[dict]:
     rows = conn.execute(
         """SELECT p.id, p.first_name, p.last_name, p.engagement_stage,
                   p.follow_up_date, c.name as company_name,
-                  MAX(a.created_at) as last_activity
+                  p.last_activity_at as last_activity
            FROM prospects p
            LEFT JOIN companies c ON p.company_id = c.id
-           LEFT JOIN activities a ON a.prospect_id = p.id
            WHERE p.population = ?
-           GROUP BY p.id
-           HAVING last_activity IS NULL OR DATE(last_activity) < DATE(?)""",
+             AND (p.last_activity_at IS NULL OR p.last_activity_at < DATE(?))""",
         (Population.ENGAGED.value, stale_cutoff),
     ).fetchall()
 
@@ -285,7 +285,7 @@ class Copilot(ClaudeClientMixin):
         return None
 
     def _find_prospect_by_name(self, name: str):
-        """Find a prospect by partial name match."""
+        """Find a prospect by name (each word matches as a prefix)."""
         prospects = self.db.get_prospects(search_query=name, limit=5)
         if not prospects and " " in name:
             # Full name didn't match — try last name alone
@@ -160,14 +160,12 @@ def interrogate_cards(db: Database) -> InterrogationReport:
     stale_rows = conn.execute(
         """SELECT p.id, p.first_name, p.last_name, p.engagement_stage,
                   c.name as company_name,
-                  MAX(a.created_at) as last_activity
+                  p.last_activity_at as last_activity
            FROM prospects p
            LEFT JOIN companies c ON p.company_id = c.id
-           LEFT JOIN activities a ON a.prospect_id = p.id
            WHERE p.population = ?
-             AND p.follow_up_date IS NOT NULL
-           GROUP BY p.id
-           HAVING last_activity IS NULL OR DATE(last_activity) < DATE(?)""",
+             AND (p.last_activity_at IS NULL OR p.last_activity_at < DATE(?))
+             AND p.follow_up_date IS NOT NULL""",
         (Population.ENGAGED.value, stale_cutoff),
     ).fetchall()
 
@@ -204,7 +202,7 @@ def interrogate_cards(db: Database) -> InterrogationReport:
            FROM prospects p
            LEFT JOIN companies c ON p.company_id = c.id
            WHERE p.follow_up_date IS NOT NULL
-             AND DATE(p.follow_up_date) < DATE(?)
+             AND p.follow_up_date < DATE(?)
              AND p.population NOT IN (?, ?, ?)
            ORDER BY p.follow_up_date ASC""",
         (
@@ -293,7 +291,6 @@ def get_card_findings(db: Database, prospect_id: int) -> list[CardFinding]:
     Returns any relevant findings for this prospect that Anne
     should mention when presenting the card.
     """
-    conn = db._get_connection()
     today = date.today()
     findings: list[CardFinding] = []
 
@@ -341,30 +338,20 @@ def get_card_findings(db: Database, prospect_id: int) -> list[CardFinding]:
             pass
 
     # Check stale
-    if prospect.population == Population.ENGAGED:
-        last_act = conn.execute(
-            "SELECT MAX(created_at) as last_act FROM activities WHERE prospect_id = ?",
-            (prospect_id,),
-        ).fetchone()
-        if last_act and last_act["last_act"]:
-            try:
-                act_str = str(last_act["last_act"])[:10]
-                act_date = date.fromisoformat(act_str)
-                days_stale = (today - act_date).days
-                if days_stale >= 14:
-                    findings.append(
-                        CardFinding(
-                            prospect_id=prospect_id,
-                            prospect_name=name,
-                            company_name=company_name,
-                            finding_type="stale_engaged",
-                            description=f"No activity for {days_stale} days",
-                            severity="high" if days_stale >= 21 else "medium",
-                            suggested_action="Momentum is fading. Re-engage now.",
-                        )
-                    )
-            except (ValueError, TypeError):
-                pass
+    if prospect.population == Population.ENGAGED and prospect.last_activity_at:
+        days_stale = (today - prospect.last_activity_at.date()).days
+        if days_stale >= 14:
+            findings.append(
+                CardFinding(
+                    prospect_id=prospect_id,
+                    prospect_name=name,
+                    company_name=company_name,
+                    finding_type="stale_engaged",
+                    description=f"No activity for {days_stale} days",
+                    severity="high" if days_stale >= 21 else "medium",
+                    suggested_action="Momentum is fading. Re-engage now.",
+                )
+            )
 
     # Check data quality
     if prospect.prospect_score >= 70 and prospect.data_confidence <= 40:
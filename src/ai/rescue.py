@@ -103,7 +103,7 @@ class RescueEngine:
                LEFT JOIN companies c ON p.company_id = c.id
                WHERE p.population = ?
                  AND p.follow_up_date IS NOT NULL
-                 AND DATE(p.follow_up_date) <= ?
+                 AND p.follow_up_date < DATE(?, '+1 day')
                ORDER BY p.follow_up_date ASC""",
             (Population.ENGAGED.value, target_date.isoformat()),
         ).fetchall()
@@ -154,7 +154,7 @@ class RescueEngine:
                LEFT JOIN companies c ON p.company_id = c.id
                WHERE p.population = ?
                  AND p.follow_up_date IS NOT NULL
-                 AND DATE(p.follow_up_date) <= ?
+                 AND p.follow_up_date < DATE(?, '+1 day')
                ORDER BY p.prospect_score DESC
                LIMIT 10""",
             (Population.UNENGAGED.value, target_date.isoformat()),
@@ -4,7 +4,7 @@ from typing import Optional
 
 from src.core.logging import get_logger
 from src.db.database import Database
-from src.db.models import Activity, ActivityType
+from src.db.models import MESSAGE_SOURCE, Activity, ActivityType
 
 logger = get_logger(__name__)
 
@@ -12,9 +12,8 @@ logger = get_logger(__name__)
 def capture_email_activity(db: Database, message_id: str) -> Optional[int]:
     """Capture email as activity. Returns activity ID if created, None if duplicate.
 
-    Looks up whether an activity with this message_id has already been captured
-    (stored in the notes field as 'message_id:<id>'). If not, creates a new
-    EMAIL_RECEIVED activity record.
+    The activity is keyed by its ``message_id`` column; the unique index on
+    activities makes a second capture of the same message a no-op.
 
     Args:
         db: Database instance
@@ -27,30 +26,22 @@ def capture_email_activity(db: Database, message_id: str) -> Optional[int]:
         logger.warning("capture_email_activity called with empty message_id")
         return None
 
-    conn = db._get_connection()
-
-    # Check if already captured by searching notes for the message_id marker
-    marker = f"message_id:{message_id}"
-    existing = conn.execute(
-        "SELECT id FROM activities WHERE notes LIKE ? LIMIT 1",
-        (f"%{marker}%",),
-    ).fetchone()
-
-    if existing:
-        logger.debug(
-            "Email activity already captured",
-            extra={"context": {"message_id": message_id, "activity_id": existing["id"]}},
-        )
-        return None
-
-    # Create activity record
+    # Create activity record (ignored if this message was already captured)
     activity = Activity(
         prospect_id=0,  # Will be updated by caller if prospect is matched
         activity_type=ActivityType.EMAIL_RECEIVED,
-        notes=marker,
         created_by="system",
+        message_id=message_id,
+        message_source=MESSAGE_SOURCE,
     )
-    activity_id = db.create_activity(activity)
+    activity_id = db.create_activity_once(activity)
+    if activity_id is None:
+        logger.debug(
+            "Email activity already captured",
+            extra={"context": {"message_id": message_id}},
+        )
+        return None
+
     logger.info(
         "Email activity captured",
         extra={"context": {"message_id": message_id, "activity_id": activity_id}},
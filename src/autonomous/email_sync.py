@@ -5,7 +5,13 @@ from typing import Optional
 
 from src.core.logging import get_logger
 from src.db.database import Database
-from src.db.models import Activity, ActivityOutcome, ActivityType, AttemptType
+from src.db.models import (
+    MESSAGE_SOURCE,
+    Activity,
+    ActivityOutcome,
+    ActivityType,
+    AttemptType,
+)
 from src.integrations.outlook import OutlookClient
 
 logger = get_logger(__name__)
@@ -57,7 +63,6 @@ class EmailSync:
             return 0
 
         synced = 0
-        conn = self.db._get_connection()
 
         for message in messages:
             # Match by recipient email to a prospect
@@ -66,30 +71,21 @@ class EmailSync:
                 if prospect_id is None:
                     continue
 
-                # Check for duplicate by message_id in notes
+                # Create EMAIL_SENT activity; already-synced messages are ignored
                 msg_id = message.get("id", "")
-                marker = f"message_id:{msg_id}"
-                existing = conn.execute(
-                    "SELECT id FROM activities WHERE notes LIKE ? AND activity_type = ? LIMIT 1",
-                    (f"%{marker}%", ActivityType.EMAIL_SENT.value),
-                ).fetchone()
-
-                if existing:
-                    continue
-
-                # Create EMAIL_SENT activity
                 activity = Activity(
                     prospect_id=prospect_id,
                     activity_type=ActivityType.EMAIL_SENT,
                     email_subject=message.get("subject", ""),
                     email_body=(message.get("body", "") or "")[:500],
                     attempt_type=AttemptType.PERSONAL,
-                    notes=marker,
                     created_by="system",
+                    message_id=msg_id or None,
+                    message_source=MESSAGE_SOURCE,
                 )
                 try:
-                    self.db.create_activity(activity)
-                    synced += 1
+                    if self.db.create_activity_once(activity) is not None:
+                        synced += 1
                 except Exception as exc:
                     logger.warning(
                         "Failed to create sent email activity",
@@ -133,7 +129,6 @@ class EmailSync:
             return 0
 
         synced = 0
-        conn = self.db._get_connection()
 
         for message in messages:
             if not message.from_address:
@@ -144,14 +139,10 @@ class EmailSync:
             if prospect_id is None:
                 continue
 
-            # Check for duplicate by message_id in notes
-            marker = f"message_id:{message.id}"
-            existing = conn.execute(
-                "SELECT id FROM activities WHERE notes LIKE ? AND activity_type = ? LIMIT 1",
-                (f"%{marker}%", ActivityType.EMAIL_RECEIVED.value),
-            ).fetchone()
-
-            if existing:
+            # Skip (and don't re-classify) messages that are already logged
+            if message.id and self.db.get_message_activity(
+                message.id, MESSAGE_SOURCE, ActivityType.EMAIL_RECEIVED
+            ):
                 continue
 
             # Classify the reply for outcome
@@ -171,12 +162,13 @@ class EmailSync:
                 outcome=outcome,
                 email_subject=message.subject,
                 email_body=(message.body or "")[:500],
-                notes=marker,
                 created_by="system",
+                message_id=message.id or None,
+                message_source=MESSAGE_SOURCE,
             )
             try:
-                self.db.create_activity(activity)
-                synced += 1
+                if self.db.create_activity_once(activity) is not None:
+                    synced += 1
             except Exception as exc:
                 logger.warning(
                     "Failed to create received email activity",
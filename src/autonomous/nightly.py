@@ -1,31 +1,71 @@
 """Nightly cycle - System maintenance while Jeff sleeps.
 
 11-step cycle running 2:00 AM - 7:00 AM:
-    1. Backup (local + cloud)
+    1. Backup (local + cloud), then archive old activities and compress text
     2. Pull from ActiveCampaign
     3. Run dedup
     4. Assess new records
     5. Autonomous research on Broken
     6. Groundskeeper: flag stale data
-    7. Re-score all active prospects
+    7. Re-score active prospects whose inputs changed
     8. Check monthly buckets
     9. Draft nurture sequences
     10. Pre-generate morning brief + cards
     11. Extract intel nuggets
+
+Steps run in parallel where NIGHTLY_STEPS allows; each one's wait and run
+time lands in NightlyCycleResult.steps. Run and step state is kept in the
+nightly_runs table, so an interrupted run resumes where it stopped.
 """
 
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
 
+from src.core.exceptions import DatabaseError
 from src.core.logging import get_logger
 from src.db.database import Database
-from src.db.models import Population
+from src.db.models import NightlyRun, NightlyRunStep, NightlyStatus, Population
+from src.utils.run_metrics import api_calls_on_thread, peak_rss_kb
 
 logger = get_logger(__name__)
 
 _CYCLE_METADATA_KEY = "nightly_cycle_last_run"
 
+# change_log consumer name for step 4
+_ASSESS_CONSUMER = "nightly_assess"
+
+# An interrupted run older than this is abandoned and a fresh one started
+RESUME_WINDOW_HOURS = 24
+
+
+@dataclass
+class StepTiming:
+    """How one nightly step ran.
+
+    Attributes:
+        name: Step name (see NIGHTLY_STEPS)
+        wait_seconds: Time between its dependencies finishing and a worker picking it up
+        duration_seconds: Time the step itself took
+        error: Error message if the step raised
+        skipped: Already done by the interrupted run this one resumed
+        rows_processed: Rows the step reported reading or evaluating
+        rows_written: Rows the step's thread inserted, updated or deleted
+        api_calls: Outbound API requests the step's thread made
+    """
+
+    name: str
+    wait_seconds: float = 0.0
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    skipped: bool = False
+    rows_processed: int = 0
+    rows_written: int = 0
+    api_calls: int = 0
+
 
 @dataclass
 class NightlyCycleResult:
@@ -34,6 +74,8 @@ class NightlyCycleResult:
     started_at: datetime
     completed_at: Optional[datetime] = None
     backups_created: int = 0
+    activities_archived: int = 0
+    texts_compressed: int = 0
     prospects_imported: int = 0
     duplicates_merged: int = 0
     research_completed: int = 0
@@ -44,194 +86,305 @@ class NightlyCycleResult:
     cards_prepared: int = 0
     intel_extracted: int = 0
     errors: list[str] = field(default_factory=list)
+    steps: list[StepTiming] = field(default_factory=list)
+    run_id: Optional[int] = None
+    resumed: bool = False
+    peak_rss_kb: Optional[int] = None
 
 
-def run_nightly_cycle(db: Database) -> NightlyCycleResult:
-    """Execute full 11-step nightly cycle.
-
-    Each step is wrapped in try/except so one failure doesn't stop
-    the entire cycle. Errors are collected in the result.
+class StepCheckpoint:
+    """Resume point for one step of a persisted run.
 
-    Args:
-        db: Database instance
+    ``cursor`` is the progress marker the step saved before its run was
+    interrupted, or None on a fresh start. Long steps call save() as they
+    go; what they store is theirs to interpret. Steps also set
+    ``rows_processed`` to how many rows they read or evaluated, for the
+    run telemetry; rows written and API calls are measured by the runner.
+    """
 
-    Returns:
-        NightlyCycleResult with metrics from each step
+    def __init__(self, cursor: Optional[str] = None, store: Optional[Callable[[str], None]] = None):
+        self.cursor = cursor
+        self.rows_processed = 0
+        self._store = store
+
+    def save(self, cursor: str) -> None:
+        """Record progress; a failed write is logged and the step carries on."""
+        self.cursor = cursor
+        if self._store is None:
+            return
+        try:
+            self._store(cursor)
+        except DatabaseError as e:
+            logger.warning(f"Failed to save nightly checkpoint: {e}")
+
+
+@dataclass(frozen=True)
+class NightlyStep:
+    """One node of the nightly dependency graph.
+
+    Attributes:
+        name: Short identifier, used for dependencies and timings
+        label: Step number and title for logs and error messages
+        run: Does the work and fills its fields of the result
+        depends_on: Steps that must finish (successfully or not) first
     """
-    result = NightlyCycleResult(started_at=datetime.now())
-    logger.info("Nightly cycle starting")
 
-    # Step 1: Backup
-    logger.info("Nightly step 1/11: Backup")
-    try:
-        from src.db.backup import BackupManager
+    name: str
+    label: str
+    run: Callable[[Database, NightlyCycleResult, StepCheckpoint], None]
+    depends_on: tuple[str, ...] = ()
+
+
+def _step_backup(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    from src.db.backup import BackupManager
+
+    backup = BackupManager()
+    backup.create_backup(label="nightly")
+    backup.sync_to_cloud()
+    backup.cleanup_old_backups(keep_days=30)
+    result.backups_created = 1
+    logger.info("Nightly step 1 complete: backup created")
+
+
+def _step_archive(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    """Move activities past the horizon to the archive database."""
+    from pathlib import Path
+
+    from src.core.config import get_config
+    from src.db.backup import BackupManager
+
+    horizon = get_config().activity_archive_days
+    if horizon > 0:
+        result.activities_archived = db.archive_activities(older_than_days=horizon)
+        checkpoint.rows_processed = result.activities_archived
+        if result.activities_archived:
+            BackupManager(db_path=Path(db.db_path)).backup_archive()
+        logger.info(f"Nightly step 1 complete: {result.activities_archived} activities archived")
+
+
+def _step_compress(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    """Compress free-text columns written since the last run (opt-in)."""
+    if db.compress_text:
+        result.texts_compressed = db.reencode_text_columns()
+        checkpoint.rows_processed = result.texts_compressed
+        logger.info(f"Nightly step 1 complete: {result.texts_compressed} rows compressed")
+
+
+def _step_ac_pull(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    """Pull from ActiveCampaign (threshold-gated)."""
+    from src.core.config import get_config
+    from src.integrations.activecampaign import ActiveCampaignClient
+
+    ac = ActiveCampaignClient()
+    if not ac.is_configured():
+        logger.info("Nightly step 2 skipped: ActiveCampaign not configured")
+        return
+
+    threshold = get_config().ac_replenish_threshold
+    unengaged_count = db.get_population_counts().get(Population.UNENGAGED, 0)
+    if unengaged_count < threshold:
+        contacts = ac.get_contacts(limit=100)
+        checkpoint.rows_processed = len(contacts)
+        imported = _import_ac_contacts(db, contacts)
+        result.prospects_imported = imported
+        logger.info(
+            f"Nightly step 2 complete: {imported} contacts imported "
+            f"(unengaged {unengaged_count} < threshold {threshold})"
+        )
+    else:
+        logger.info(
+            f"Nightly step 2 skipped: unengaged count {unengaged_count} "
+            f">= threshold {threshold}"
+        )
 
-        backup = BackupManager()
-        backup.create_backup(label="nightly")
-        backup.sync_to_cloud()
-        backup.cleanup_old_backups(keep_days=30)
-        result.backups_created = 1
-        logger.info("Nightly step 1 complete: backup created")
-    except Exception as e:
-        result.errors.append(f"Step 1 (Backup): {e}")
-        logger.error(f"Nightly step 1 failed: {e}", exc_info=True)
 
-    # Step 2: Pull from ActiveCampaign (threshold-gated)
-    logger.info("Nightly step 2/11: ActiveCampaign pull")
-    try:
-        from src.core.config import get_config
-        from src.integrations.activecampaign import ActiveCampaignClient
-
-        ac = ActiveCampaignClient()
-        if ac.is_configured():
-            config = get_config()
-            threshold = config.ac_replenish_threshold
-            pop_counts = db.get_population_counts()
-            unengaged_count = pop_counts.get(Population.UNENGAGED, 0)
-
-            if unengaged_count < threshold:
-                contacts = ac.get_contacts(limit=100)
-                imported = _import_ac_contacts(db, contacts)
-                result.prospects_imported = imported
-                logger.info(
-                    f"Nightly step 2 complete: {imported} contacts imported "
-                    f"(unengaged {unengaged_count} < threshold {threshold})"
-                )
-            else:
-                logger.info(
-                    f"Nightly step 2 skipped: unengaged count {unengaged_count} "
-                    f">= threshold {threshold}"
-                )
-        else:
-            logger.info("Nightly step 2 skipped: ActiveCampaign not configured")
-    except Exception as e:
-        result.errors.append(f"Step 2 (AC Pull): {e}")
-        logger.error(f"Nightly step 2 failed: {e}", exc_info=True)
+def _step_dedup(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    # Dedup is already handled by the intake module during import.
+    # No additional pass needed unless we detect issues.
+    result.duplicates_merged = 0
+    logger.info("Nightly step 3 complete: dedup handled during import")
 
-    # Step 3: Dedup (handled during import, minimal pass here)
-    logger.info("Nightly step 3/11: Dedup check")
-    try:
-        # Dedup is already handled by the intake module during import.
-        # No additional pass needed unless we detect issues.
-        result.duplicates_merged = 0
-        logger.info("Nightly step 3 complete: dedup handled during import")
-    except Exception as e:
-        result.errors.append(f"Step 3 (Dedup): {e}")
-        logger.error(f"Nightly step 3 failed: {e}", exc_info=True)
 
-    # Step 4: Assess new records
-    logger.info("Nightly step 4/11: Assess new records")
-    try:
-        from src.db.models import ContactMethodType, assess_completeness
+def _step_assess(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    evaluated, promoted = _assess_broken(db)
+    checkpoint.rows_processed = evaluated
+    logger.info(f"Nightly step 4 complete: {promoted} records promoted from broken")
 
-        # Find any records that might need reassessment
-        broken = db.get_prospects(population=Population.BROKEN, limit=500)
-        assessed = 0
-        for prospect in broken:
-            if prospect.id is None:
-                continue
-            contact_methods = db.get_contact_methods(prospect.id)
-            new_pop = assess_completeness(prospect, contact_methods)
-            if new_pop == Population.UNENGAGED and prospect.population == Population.BROKEN:
-                from src.engine.populations import transition_prospect
 
-                transition_prospect(
-                    db, prospect.id, Population.UNENGAGED, "Nightly assessment: data complete"
-                )
-                assessed += 1
-        logger.info(f"Nightly step 4 complete: {assessed} records promoted from broken")
-    except Exception as e:
-        result.errors.append(f"Step 4 (Assess): {e}")
-        logger.error(f"Nightly step 4 failed: {e}", exc_info=True)
+def _step_research(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    from src.engine.research import ResearchEngine
 
-    # Step 5: Autonomous research on Broken
-    logger.info("Nightly step 5/11: Autonomous research")
-    try:
-        from src.engine.research import ResearchEngine
+    engine = ResearchEngine(db)
+    result.research_completed = engine.run_batch(
+        limit=50, cursor=checkpoint.cursor, on_progress=checkpoint.save
+    )
+    checkpoint.rows_processed = result.research_completed
+    logger.info(f"Nightly step 5 complete: {result.research_completed} prospects researched")
 
-        engine = ResearchEngine(db)
-        researched = engine.run_batch(limit=50)
-        result.research_completed = researched
-        logger.info(f"Nightly step 5 complete: {researched} prospects researched")
-    except Exception as e:
-        result.errors.append(f"Step 5 (Research): {e}")
-        logger.error(f"Nightly step 5 failed: {e}", exc_info=True)
 
-    # Step 6: Groundskeeper - flag stale data
-    logger.info("Nightly step 6/11: Groundskeeper")
-    try:
-        from src.engine.groundskeeper import Groundskeeper
+def _step_groundskeeper(
+    db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint
+) -> None:
+    from src.engine.groundskeeper import Groundskeeper
 
-        gk = Groundskeeper(db)
-        maintenance = gk.run_maintenance()
-        result.stale_flagged = maintenance.get("flagged", 0)
-        logger.info(f"Nightly step 6 complete: {result.stale_flagged} stale records flagged")
-    except Exception as e:
-        result.errors.append(f"Step 6 (Groundskeeper): {e}")
-        logger.error(f"Nightly step 6 failed: {e}", exc_info=True)
+    maintenance = Groundskeeper(db).run_maintenance()
+    result.stale_flagged = maintenance.get("flagged", 0)
+    checkpoint.rows_processed = maintenance.get("checked", 0)
+    logger.info(f"Nightly step 6 complete: {result.stale_flagged} stale records flagged")
 
-    # Step 7: Re-score all active prospects
-    logger.info("Nightly step 7/11: Re-scoring")
-    try:
-        from src.engine.scoring import rescore_all
 
-        scored = rescore_all(db)
-        result.prospects_scored = scored
-        logger.info(f"Nightly step 7 complete: {scored} prospects re-scored")
-    except Exception as e:
-        result.errors.append(f"Step 7 (Rescore): {e}")
-        logger.error(f"Nightly step 7 failed: {e}", exc_info=True)
+def _step_rescore(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    from src.engine.scoring import rescore_all
 
-    # Step 8: Monthly bucket auto-activation
-    logger.info("Nightly step 8/11: Monthly buckets")
-    try:
-        activated = _activate_monthly_buckets(db)
-        result.buckets_activated = activated
-        logger.info(f"Nightly step 8 complete: {activated} parked prospects activated")
-    except Exception as e:
-        result.errors.append(f"Step 8 (Buckets): {e}")
-        logger.error(f"Nightly step 8 failed: {e}", exc_info=True)
+    result.prospects_scored = rescore_all(db, cursor=checkpoint.cursor, on_progress=checkpoint.save)
+    checkpoint.rows_processed = result.prospects_scored
+    logger.info(f"Nightly step 7 complete: {result.prospects_scored} prospects re-scored")
 
-    # Step 9: Draft nurture sequences
-    logger.info("Nightly step 9/11: Nurture drafting")
-    try:
-        from src.engine.nurture import NurtureEngine
 
-        nurture = NurtureEngine(db)
-        drafted = nurture.generate_nurture_batch(limit=25)
-        result.nurture_drafted = len(drafted) if isinstance(drafted, list) else drafted
-        logger.info(f"Nightly step 9 complete: {result.nurture_drafted} nurture emails drafted")
-    except Exception as e:
-        result.errors.append(f"Step 9 (Nurture): {e}")
-        logger.error(f"Nightly step 9 failed: {e}", exc_info=True)
+def _step_buckets(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    result.buckets_activated = _activate_monthly_buckets(db)
+    checkpoint.rows_processed = result.buckets_activated
+    logger.info(f"Nightly step 8 complete: {result.buckets_activated} parked prospects activated")
 
-    # Step 10: Pre-generate morning brief
-    logger.info("Nightly step 10/11: Morning brief")
-    try:
-        from src.content.morning_brief import generate_morning_brief
 
-        brief = generate_morning_brief(db)
-        result.cards_prepared = 1
-        logger.info(f"Nightly step 10 complete: morning brief generated")
-    except Exception as e:
-        result.errors.append(f"Step 10 (Brief): {e}")
-        logger.error(f"Nightly step 10 failed: {e}", exc_info=True)
+def _step_nurture(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    from src.engine.nurture import NurtureEngine
+
+    drafted = NurtureEngine(db).generate_nurture_batch(limit=25)
+    result.nurture_drafted = len(drafted) if isinstance(drafted, list) else drafted
+    checkpoint.rows_processed = result.nurture_drafted
+    logger.info(f"Nightly step 9 complete: {result.nurture_drafted} nurture emails drafted")
+
+
+def _step_brief(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    from src.content.morning_brief import generate_morning_brief
+
+    generate_morning_brief(db)
+    result.cards_prepared = 1
+    logger.info("Nightly step 10 complete: morning brief generated")
+
+
+def _step_intel(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+    # Resumes from its own activity watermark, so needs no step cursor
+    from src.engine.intel_extract import extract_intel_backlog
+
+    backlog = extract_intel_backlog(db)
+    result.intel_extracted = backlog.extracted
+    checkpoint.rows_processed = backlog.scanned
+    logger.info(
+        f"Nightly step 11 complete: {backlog.extracted} intel nuggets extracted "
+        f"from {backlog.scanned} activities"
+    )
+
+
+# The nightly cycle as a dependency graph, in the order steps are numbered.
+# The backup and the ActiveCampaign pull depend on nothing and nothing waits
+# on the pull, so a slow API does not hold up the brief; contacts it imports
+# are assessed and scored through the change log next run.
+NIGHTLY_STEPS: list[NightlyStep] = [
+    NightlyStep("backup", "1 (Backup)", _step_backup),
+    # After the backup so every row is in either the backup or the archive copy,
+    # and after intel so old notes are scanned before they leave activities
+    NightlyStep("archive", "1 (Archive)", _step_archive, ("backup", "intel")),
+    NightlyStep("compress", "1 (Compress)", _step_compress, ("archive",)),
+    NightlyStep("ac_pull", "2 (AC Pull)", _step_ac_pull),
+    NightlyStep("dedup", "3 (Dedup)", _step_dedup, ("ac_pull",)),
+    NightlyStep("assess", "4 (Assess)", _step_assess),
+    NightlyStep("research", "5 (Research)", _step_research, ("assess",)),
+    NightlyStep("groundskeeper", "6 (Groundskeeper)", _step_groundskeeper, ("assess",)),
+    NightlyStep("buckets", "8 (Buckets)", _step_buckets),
+    NightlyStep(
+        "rescore", "7 (Rescore)", _step_rescore, ("assess", "research", "groundskeeper", "buckets")
+    ),
+    NightlyStep("nurture", "9 (Nurture)", _step_nurture, ("rescore",)),
+    NightlyStep("brief", "10 (Brief)", _step_brief, ("rescore", "nurture")),
+    # Dedup merges the activities intel reads and links nuggets to
+    NightlyStep("intel", "11 (Intel)", _step_intel, ("dedup",)),
+]
+
+# Worker threads running nightly steps at once
+NIGHTLY_WORKERS = 4
+
+
+def run_nightly_cycle(
+    db: Database, max_workers: int = NIGHTLY_WORKERS, resume: bool = True
+) -> NightlyCycleResult:
+    """Execute full 11-step nightly cycle.
+
+    Steps run on a bounded thread pool as soon as the steps they depend on
+    (NIGHTLY_STEPS) have finished. Each worker thread reads through its own
+    connection; writes take turns on the shared writer. A step that fails
+    is logged and recorded in the result and its dependents still run, so
+    one failure doesn't stop the cycle. ``:memory:`` databases have a single
+    connection and run the steps one at a time.
+
+    Each run and the state of each step are kept in nightly_runs. If the
+    last run was interrupted less than RESUME_WINDOW_HOURS ago, this run
+    picks it up: finished steps are skipped and long steps continue from
+    their saved cursor.
+
+    Args:
+        db: Database instance
+        max_workers: Steps allowed to run at the same time
+        resume: Continue an interrupted run instead of starting over
 
-    # Step 11: Extract intel nuggets from recent activities
-    logger.info("Nightly step 11/11: Intel extraction")
+    Returns:
+        NightlyCycleResult with metrics and per-step timings
+    """
+    result = NightlyCycleResult(started_at=datetime.now())
+    run = _open_run(db, resume)
+    if run is not None:
+        result.run_id = run.id
+        result.resumed = run.resumes > 0
+    logger.info(
+        "Nightly cycle resuming" if result.resumed else "Nightly cycle starting",
+        extra={"context": {"run_id": result.run_id}},
+    )
+
+    workers = 1 if db.db_path == ":memory:" else max(1, max_workers)
+    _run_steps(db, NIGHTLY_STEPS, result, workers, run)
+
+    # Drop change_log rows every consumer has acknowledged
     try:
-        extracted = _extract_intel_from_activities(db)
-        result.intel_extracted = extracted
-        logger.info(f"Nightly step 11 complete: {extracted} intel nuggets extracted")
+        db.prune_change_log()
     except Exception as e:
-        result.errors.append(f"Step 11 (Intel): {e}")
-        logger.error(f"Nightly step 11 failed: {e}", exc_info=True)
+        logger.warning(f"Failed to prune change log: {e}")
 
     # Record completion
     result.completed_at = datetime.now()
+    result.peak_rss_kb = peak_rss_kb()
+    if run is not None and run.id is not None:
+        failed = any(t.error for t in result.steps)
+        try:
+            db.finish_nightly_run(
+                run.id,
+                NightlyStatus.FAILED if failed else NightlyStatus.DONE,
+                duration_seconds=(result.completed_at - result.started_at).total_seconds(),
+                peak_rss_kb=result.peak_rss_kb,
+            )
+        except DatabaseError as e:
+            logger.warning(f"Failed to close nightly run: {e}")
     _record_cycle_run(db)
 
     error_count = len(result.errors)
+    slowest = max(result.steps, key=lambda t: t.duration_seconds, default=None)
+    logger.info(
+        "Nightly cycle timings",
+        extra={
+            "context": {
+                "elapsed_seconds": round(
+                    (result.completed_at - result.started_at).total_seconds(), 2
+                ),
+                "slowest_step": slowest.name if slowest else None,
+                "peak_rss_kb": result.peak_rss_kb,
+                "steps": {
+                    t.name: {"wait": round(t.wait_seconds, 2), "run": round(t.duration_seconds, 2)}
+                    for t in result.steps
+                    if not t.skipped
+                },
+            }
+        },
+    )
     if error_count == 0:
         logger.info("Nightly cycle completed successfully")
     else:
@@ -240,10 +393,167 @@ def run_nightly_cycle(db: Database) -> NightlyCycleResult:
     return result
 
 
+def _interrupted_run(db: Database) -> Optional[NightlyRun]:
+    """The last nightly run, if it never finished and is recent enough to resume."""
+    run = db.get_unfinished_nightly_run()
+    return run if run is not None and _resumable(run) else None
+
+
+def _resumable(run: NightlyRun) -> bool:
+    if run.started_at is None:
+        return False
+    return datetime.now() - run.started_at <= timedelta(hours=RESUME_WINDOW_HOURS)
+
+
+def _open_run(db: Database, resume: bool) -> Optional[NightlyRun]:
+    """Resume the interrupted run or start a new one.
+
+    Runs without checkpoints (returns None) if the run table can't be
+    written, rather than skipping the cycle.
+    """
+    names = [step.name for step in NIGHTLY_STEPS]
+    try:
+        unfinished = db.get_unfinished_nightly_run()
+        if unfinished is not None and unfinished.id is not None:
+            if resume and _resumable(unfinished):
+                run = db.resume_nightly_run(unfinished.id, names)
+                logger.info(
+                    "Resuming interrupted nightly run",
+                    extra={
+                        "context": {
+                            "run_id": run.id,
+                            "done": [s.name for s in run.steps if s.status == NightlyStatus.DONE],
+                        }
+                    },
+                )
+                return run
+            db.finish_nightly_run(unfinished.id, NightlyStatus.ABANDONED)
+        return db.start_nightly_run(names)
+    except DatabaseError as e:
+        logger.warning(f"Nightly checkpoints unavailable, running without: {e}")
+        return None
+
+
+def _run_steps(
+    db: Database,
+    steps: list[NightlyStep],
+    result: NightlyCycleResult,
+    workers: int,
+    run: Optional[NightlyRun] = None,
+) -> None:
+    """Run ``steps`` in dependency order on up to ``workers`` threads.
+
+    With a persisted ``run``, steps it already finished are skipped and
+    every state change and checkpoint is written to it.
+    """
+    names = {step.name for step in steps}
+    blocked = {step.name: set(step.depends_on) & names for step in steps}
+    by_name = {step.name: step for step in steps}
+    lock = threading.Lock()
+    run_id = run.id if run is not None else None
+
+    def mark(name: str, status: NightlyStatus, error: Optional[str] = None) -> None:
+        if run_id is None:
+            return
+        try:
+            db.update_nightly_step(run_id, name, status, error=error)
+        except DatabaseError as e:
+            logger.warning(f"Failed to record nightly step {name} as {status.value}: {e}")
+
+    def record(timing: StepTiming) -> None:
+        if run_id is None:
+            return
+        status = NightlyStatus.FAILED if timing.error else NightlyStatus.DONE
+        try:
+            db.record_nightly_step(
+                run_id,
+                NightlyRunStep(
+                    name=timing.name,
+                    status=status,
+                    error=timing.error,
+                    wait_seconds=timing.wait_seconds,
+                    duration_seconds=timing.duration_seconds,
+                    rows_processed=timing.rows_processed,
+                    rows_written=timing.rows_written,
+                    api_calls=timing.api_calls,
+                ),
+            )
+        except DatabaseError as e:
+            logger.warning(f"Failed to record nightly step {timing.name} as {status.value}: {e}")
+
+    def checkpoint_for(name: str) -> StepCheckpoint:
+        if run is None or run_id is None:
+            return StepCheckpoint()
+        saved = run.step(name)
+        return StepCheckpoint(
+            cursor=saved.cursor if saved else None,
+            store=lambda cursor: db.checkpoint_nightly_step(run_id, name, cursor),
+        )
+
+    def execute(step: NightlyStep, ready: float) -> None:
+        started = time.monotonic()
+        timing = StepTiming(name=step.name, wait_seconds=started - ready)
+        checkpoint = checkpoint_for(step.name)
+        logger.info(f"Nightly step {step.label} starting")
+        mark(step.name, NightlyStatus.RUNNING)
+        written_before = db.rows_written_on_thread()
+        calls_before = api_calls_on_thread()
+        try:
+            step.run(db, result, checkpoint)
+        except Exception as e:
+            timing.error = str(e)
+            with lock:
+                result.errors.append(f"Step {step.label}: {e}")
+            logger.error(f"Nightly step {step.label} failed: {e}", exc_info=True)
+        timing.duration_seconds = time.monotonic() - started
+        timing.rows_processed = checkpoint.rows_processed
+        timing.rows_written = db.rows_written_on_thread() - written_before
+        timing.api_calls = api_calls_on_thread() - calls_before
+        try:
+            record(timing)
+        finally:
+            db.release_thread_connection()
+        with lock:
+            result.steps.append(timing)
+
+    def release(finished: str) -> None:
+        for deps in blocked.values():
+            deps.discard(finished)
+
+    if run is not None:
+        for saved in run.steps:
+            if saved.status == NightlyStatus.DONE and saved.name in blocked:
+                del blocked[saved.name]
+                release(saved.name)
+                result.steps.append(StepTiming(name=saved.name, skipped=True))
+                logger.info(f"Nightly step {by_name[saved.name].label} already done, skipping")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nightly") as pool:
+        running: dict[Future[None], str] = {}
+
+        def submit_ready() -> None:
+            for name in [n for n, deps in blocked.items() if not deps]:
+                del blocked[name]
+                running[pool.submit(execute, by_name[name], time.monotonic())] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                release(running.pop(future))
+            submit_ready()
+
+    if blocked:
+        # Only reachable with a dependency cycle in ``steps``
+        raise ValueError(f"Nightly steps never became ready: {', '.join(sorted(blocked))}")
+
+
 def run_condensed_cycle(db: Database) -> NightlyCycleResult:
     """Run quick catch-up after missed nightly cycle.
 
     Only runs critical steps: backup, bucket activation, morning brief.
+    If last night's run was interrupted, finishes that run from its
+    checkpoints instead.
 
     Args:
         db: Database instance
@@ -251,6 +561,18 @@ def run_condensed_cycle(db: Database) -> NightlyCycleResult:
     Returns:
         NightlyCycleResult with metrics
     """
+    try:
+        interrupted = _interrupted_run(db)
+    except DatabaseError as e:
+        logger.warning(f"Failed to check for an interrupted nightly run: {e}")
+        interrupted = None
+    if interrupted is not None:
+        logger.info(
+            "Catch-up finishing interrupted nightly run",
+            extra={"context": {"run_id": interrupted.id}},
+        )
+        return run_nightly_cycle(db)
+
     result = NightlyCycleResult(started_at=datetime.now())
     logger.info("Condensed cycle starting")
 
@@ -307,6 +629,30 @@ def check_last_run(db: Database) -> Optional[datetime]:
         return None
 
 
+def format_nightly_runs(runs: list[NightlyRun]) -> str:
+    """Render runs and their step states as plain text (``--nightly-runs``)."""
+    if not runs:
+        return "No nightly runs recorded."
+
+    def stamp(value: Optional[datetime]) -> str:
+        return value.strftime("%Y-%m-%d %H:%M") if value else "-"
+
+    lines = []
+    for run in runs:
+        resumed = f", resumed {run.resumes}x" if run.resumes else ""
+        lines.append(
+            f"Run {run.id} [{run.status.value}] started {stamp(run.started_at)}, "
+            f"finished {stamp(run.completed_at)}{resumed}"
+        )
+        for step in run.steps:
+            detail = step.error or (step.cursor if step.status != NightlyStatus.DONE else None)
+            lines.append(
+                f"  {step.name:<14} {step.status.value:<8} {stamp(step.completed_at)}"
+                + (f"  {detail[:80]}" if detail else "")
+            )
+    return "\n".join(lines)
+
+
 def _record_cycle_run(db: Database) -> None:
     """Record nightly cycle completion in system_metadata."""
     try:
@@ -315,6 +661,52 @@ def _record_cycle_run(db: Database) -> None:
         logger.warning(f"Failed to record cycle run: {e}")
 
 
+def _assess_broken(db: Database) -> tuple[int, int]:
+    """Promote Broken prospects whose data is now complete.
+
+    Only prospects whose row or contact methods changed since the last run
+    are re-assessed; the first run (or one after the change log was pruned
+    past this step's watermark) walks every Broken prospect.
+
+    Args:
+        db: Database instance
+
+    Returns:
+        (Broken prospects evaluated, number promoted to Unengaged)
+    """
+    from src.db.models import assess_completeness
+    from src.engine.populations import transition_prospect
+
+    changes = db.read_changes(_ASSESS_CONSUMER, entities=("prospects", "contact_methods"))
+    if changes.full:
+        candidates = (
+            (prospect, db.get_contact_methods(prospect.id))
+            for batch in db.iter_prospects(populations=[Population.BROKEN])
+            for prospect in batch
+            if prospect.id is not None
+        )
+    else:
+        loaded = db.get_prospect_full_many(sorted(changes.prospect_ids), activity_limit=0)
+        candidates = (
+            (full.prospect, full.contact_methods)
+            for full in loaded.values()
+            if full.prospect.population == Population.BROKEN
+        )
+
+    evaluated = promoted = 0
+    for prospect, contact_methods in candidates:
+        evaluated += 1
+        if assess_completeness(prospect, contact_methods) == Population.UNENGAGED:
+            assert prospect.id is not None
+            transition_prospect(
+                db, prospect.id, Population.UNENGAGED, "Nightly assessment: data complete"
+            )
+            promoted += 1
+
+    db.ack_changes(changes)
+    return evaluated, promoted
+
+
 def _is_first_business_day(today: Optional[date] = None) -> bool:
     """Check if today is the first business day of the month.
 
@@ -365,23 +757,23 @@ def _activate_monthly_buckets(db: Database, force: bool = False) -> int:
         return 0
 
     current_month = today.strftime("%Y-%m")
-    parked = db.get_prospects(population=Population.PARKED, limit=500)
     activated = 0
 
-    for prospect in parked:
-        if prospect.id is None:
-            continue
-        if prospect.parked_month and prospect.parked_month <= current_month:
-            try:
-                transition_prospect(
-                    db,
-                    prospect.id,
-                    Population.UNENGAGED,
-                    f"Monthly bucket: parked_month {prospect.parked_month} reached",
-                )
-                activated += 1
-            except Exception as e:
-                logger.warning(f"Failed to activate parked prospect {prospect.id}: {e}")
+    for parked in db.iter_prospects(populations=[Population.PARKED]):
+        for prospect in parked:
+            if prospect.id is None:
+                continue
+            if prospect.parked_month and prospect.parked_month <= current_month:
+                try:
+                    transition_prospect(
+                        db,
+                        prospect.id,
+                        Population.UNENGAGED,
+                        f"Monthly bucket: parked_month {prospect.parked_month} reached",
+                    )
+                    activated += 1
+                except Exception as e:
+                    logger.warning(f"Failed to activate parked prospect {prospect.id}: {e}")
 
     if activated > 0:
         logger.info(f"Activated {activated} parked prospects for {current_month}")
@@ -460,107 +852,3 @@ def _import_ac_contacts(db: Database, contacts: list) -> int:
         imported += 1
 
     return imported
-
-
-def _extract_intel_from_activities(db: Database) -> int:
-    """Extract intel nuggets from recent activities.
-
-    Scans activities from the last 24 hours for notable content
-    and creates intel nuggets.
-
-    Returns:
-        Number of nuggets extracted
-    """
-    from src.db.models import IntelCategory, IntelNugget
-
-    yesterday = (datetime.now()).strftime("%Y-%m-%d 00:00:00")
-
-    # Get recent activities with notes
-    rows = db.get_recent_activities_with_notes(since=yesterday, limit=100)
-
-    extracted = 0
-    for row in rows:
-        notes = row["notes"] or ""
-        prospect_id = row["prospect_id"]
-        activity_id = row["id"]
-
-        # Simple keyword-based intel extraction
-        nuggets_to_create: list[tuple[IntelCategory, str]] = []
-
-        notes_lower = notes.lower()
-
-        # Pain point detection
-        pain_keywords = [
-            "struggling with",
-            "frustrated",
-            "problem with",
-            "challenge",
-            "pain point",
-            "issue with",
-            "concerned about",
-            "worried about",
-        ]
-        for kw in pain_keywords:
-            if kw in notes_lower:
-                nuggets_to_create.append(
-                    (IntelCategory.PAIN_POINT, f"Mentioned: {kw} - {notes[:200]}")
-                )
-                break
-
-        # Competitor detection
-        comp_keywords = [
-            "competitor",
-            "also looking at",
-            "comparing",
-            "currently using",
-            "switched from",
-            "considering",
-        ]
-        for kw in comp_keywords:
-            if kw in notes_lower:
-                nuggets_to_create.append(
-                    (IntelCategory.COMPETITOR, f"Competitor intel: {notes[:200]}")
-                )
-                break
-
-        # Timeline detection
-        timeline_keywords = [
-            "by end of",
-            "q1",
-            "q2",
-            "q3",
-            "q4",
-            "this quarter",
-            "next month",
-            "next quarter",
-            "deadline",
-            "timeline",
-        ]
-        for kw in timeline_keywords:
-            if kw in notes_lower:
-                nuggets_to_create.append(
-                    (IntelCategory.DECISION_TIMELINE, f"Timeline: {notes[:200]}")
-                )
-                break
-
-        for category, content in nuggets_to_create:
-            # Check for duplicate nuggets
-            existing = db.get_intel_nuggets(prospect_id)
-            is_duplicate = any(n.category == category and n.content == content for n in existing)
-            if not is_duplicate:
-                nugget = IntelNugget(
-                    prospect_id=prospect_id,
-                    category=category,
-                    content=content,
-                    source_activity_id=activity_id,
-                )
-                try:
-                    db.create_intel_nugget(nugget)
-                    extracted += 1
-                except Exception:
-                    logger.debug(
-                        f"Failed to create intel nugget for prospect {prospect_id}",
-                        exc_info=True,
-                    )
-
-    return extracted
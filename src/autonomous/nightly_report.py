@@ -0,0 +1,222 @@
+"""Nightly run telemetry report.
+
+Reads the per-step measurements run_nightly_cycle stores in nightly_runs
+and answers capacity questions: how long each step takes now, how that
+compares with its recent baseline, which step is slowest and how memory
+and work volumes are trending as the rolodex grows.
+
+The baseline for a step is the median duration over the BASELINE_RUNS
+finished runs before the latest one. A step has regressed when its latest
+duration is REGRESSION_FACTOR times that baseline and at least
+REGRESSION_MIN_SECONDS slower, so sub-second steps do not raise alarms.
+
+Usage:
+    from src.autonomous.nightly_report import build_nightly_report, format_nightly_report
+
+    report = build_nightly_report(db)
+    print(format_nightly_report(report))
+"""
+
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Optional
+
+from src.db.database import Database
+from src.db.models import NightlyRun, NightlyStatus
+
+# Finished runs before the latest that make up the baseline
+BASELINE_RUNS = 7
+
+# Latest/baseline duration ratio that counts as a regression
+REGRESSION_FACTOR = 1.5
+
+# Regressions must also be at least this many seconds slower than the baseline
+REGRESSION_MIN_SECONDS = 5.0
+
+_SPARK = "▁▂▃▄▅▆▇█"
+
+
+@dataclass
+class StepTrend:
+    """One step's duration history and latest measurements.
+
+    Attributes:
+        name: Step name
+        durations: Seconds per finished run, oldest first (None where it did not run)
+        latest_seconds: Duration in the latest finished run
+        baseline_seconds: Median over the baseline runs before it
+        rows_processed: Rows processed in the latest run
+        rows_written: Rows written in the latest run
+        api_calls: API calls in the latest run
+    """
+
+    name: str
+    durations: list[Optional[float]] = field(default_factory=list)
+    latest_seconds: Optional[float] = None
+    baseline_seconds: Optional[float] = None
+    rows_processed: int = 0
+    rows_written: int = 0
+    api_calls: int = 0
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Latest duration over baseline, if both are known."""
+        if self.latest_seconds is None or not self.baseline_seconds:
+            return None
+        return self.latest_seconds / self.baseline_seconds
+
+    @property
+    def regressed(self) -> bool:
+        """True if the latest run is well beyond the baseline."""
+        ratio = self.ratio
+        if ratio is None or self.latest_seconds is None or self.baseline_seconds is None:
+            return False
+        return (
+            ratio >= REGRESSION_FACTOR
+            and self.latest_seconds - self.baseline_seconds >= REGRESSION_MIN_SECONDS
+        )
+
+
+@dataclass
+class NightlyReport:
+    """Trends over recent finished nightly runs.
+
+    Attributes:
+        runs: Finished runs, oldest first
+        steps: Per-step trends in declaration order
+        baseline_runs: Runs the baseline was taken over
+    """
+
+    runs: list[NightlyRun] = field(default_factory=list)
+    steps: list[StepTrend] = field(default_factory=list)
+    baseline_runs: int = BASELINE_RUNS
+
+    @property
+    def latest(self) -> Optional[NightlyRun]:
+        return self.runs[-1] if self.runs else None
+
+    @property
+    def slowest(self) -> Optional[StepTrend]:
+        """Step with the longest duration in the latest run."""
+        timed = [s for s in self.steps if s.latest_seconds is not None]
+        return max(timed, key=lambda s: s.latest_seconds or 0.0, default=None)
+
+    @property
+    def regressions(self) -> list[StepTrend]:
+        """Regressed steps, worst ratio first."""
+        return sorted(
+            (s for s in self.steps if s.regressed), key=lambda s: s.ratio or 0.0, reverse=True
+        )
+
+    @property
+    def duration_baseline(self) -> Optional[float]:
+        """Median whole-run duration over the baseline runs."""
+        values = [
+            r.duration_seconds
+            for r in self.runs[-self.baseline_runs - 1 : -1]
+            if r.duration_seconds is not None
+        ]
+        return median(values) if values else None
+
+
+def build_nightly_report(
+    db: Database, limit: int = 30, baseline_runs: int = BASELINE_RUNS
+) -> NightlyReport:
+    """Load the last ``limit`` finished nightly runs and compute step trends.
+
+    Steps skipped in a resumed run keep the measurements of the attempt
+    that finished them.
+    """
+    runs = [
+        run
+        for run in db.get_nightly_runs(limit=limit, kind="nightly")
+        if run.status in (NightlyStatus.DONE, NightlyStatus.FAILED)
+    ]
+    runs.reverse()
+    report = NightlyReport(runs=runs, baseline_runs=baseline_runs)
+    if not runs:
+        return report
+
+    names: list[str] = []
+    for run in runs:
+        names.extend(s.name for s in run.steps if s.name not in names)
+
+    for name in names:
+        trend = StepTrend(name=name)
+        for run in runs:
+            step = run.step(name)
+            trend.durations.append(step.duration_seconds if step else None)
+        latest = runs[-1].step(name)
+        if latest is not None:
+            trend.latest_seconds = latest.duration_seconds
+            trend.rows_processed = latest.rows_processed
+            trend.rows_written = latest.rows_written
+            trend.api_calls = latest.api_calls
+        history = [d for d in trend.durations[-baseline_runs - 1 : -1] if d is not None]
+        trend.baseline_seconds = median(history) if history else None
+        report.steps.append(trend)
+    return report
+
+
+def _sparkline(values: list[Optional[float]]) -> str:
+    known = [v for v in values if v is not None]
+    if not known:
+        return ""
+    top = max(known) or 1.0
+    return "".join(
+        " " if v is None else _SPARK[min(int(v / top * (len(_SPARK) - 1)), len(_SPARK) - 1)]
+        for v in values
+    )
+
+
+def _seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value >= 60:
+        return f"{value / 60:.1f}m"
+    return f"{value:.1f}s"
+
+
+def format_nightly_report(report: NightlyReport) -> str:
+    """Render the report as a plain-text table."""
+    latest = report.latest
+    if latest is None:
+        return "No finished nightly runs recorded."
+
+    baseline = report.duration_baseline
+    peak = f"{latest.peak_rss_kb / 1024:.0f} MB" if latest.peak_rss_kb else "-"
+    started = f" {latest.started_at:%Y-%m-%d %H:%M}" if latest.started_at else ""
+    lines = [
+        f"Latest run {latest.id} ({latest.status.value}){started}: "
+        f"{_seconds(latest.duration_seconds)} (baseline {_seconds(baseline)}), "
+        f"peak memory {peak}"
+    ]
+    slowest = report.slowest
+    if slowest is not None:
+        lines.append(f"Slowest step: {slowest.name} ({_seconds(slowest.latest_seconds)})")
+    regressions = report.regressions
+    if regressions:
+        lines.append(
+            "Regressions: "
+            + ", ".join(
+                f"{s.name} {_seconds(s.latest_seconds)} vs {_seconds(s.baseline_seconds)} "
+                f"({s.ratio or 0:.1f}x)"
+                for s in regressions
+            )
+        )
+    else:
+        lines.append(f"No regressions against the last {report.baseline_runs} runs.")
+
+    lines.append("")
+    lines.append(
+        f"{'step':<14} {'latest':>8} {'baseline':>9} {'rows in':>9} {'rows out':>9} "
+        f"{'api':>5}  trend ({len(report.runs)} runs)"
+    )
+    for s in report.steps:
+        flag = "  REGRESSED" if s.regressed else ""
+        lines.append(
+            f"{s.name:<14} {_seconds(s.latest_seconds):>8} {_seconds(s.baseline_seconds):>9} "
+            f"{s.rows_processed:>9} {s.rows_written:>9} {s.api_calls:>5}  "
+            f"{_sparkline(s.durations)}{flag}"
+        )
+    return "\n".join(lines)
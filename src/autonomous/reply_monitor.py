@@ -17,6 +17,7 @@ from typing import Optional
 from src.core.logging import get_logger
 from src.db.database import Database
 from src.db.models import (
+    MESSAGE_SOURCE,
     Activity,
     ActivityOutcome,
     ActivityType,
@@ -66,6 +67,7 @@ class ReplyMonitor:
             List of MatchedReply objects for all matched incoming emails.
         """
         matched_replies: list[MatchedReply] = []
+        activities: list[tuple[str, Activity]] = []
 
         # Retrieve recent emails from Outlook
         try:
@@ -127,16 +129,12 @@ class ReplyMonitor:
                 outcome=outcome,
                 email_subject=message.subject,
                 email_body=message.body[:500] if message.body else None,
-                notes=f"message_id:{message.id} classification:{classification.value}",
+                notes=f"classification:{classification.value}",
                 created_by="system",
+                message_id=message.id or None,
+                message_source=MESSAGE_SOURCE,
             )
-            try:
-                self.db.create_activity(activity)
-            except Exception as exc:
-                logger.warning(
-                    "Failed to log email activity",
-                    extra={"context": {"message_id": message.id, "error": str(exc)}},
-                )
+            activities.append((message.id, activity))
 
             logger.info(
                 "Reply matched to prospect",
@@ -150,6 +148,19 @@ class ReplyMonitor:
                 },
             )
 
+        # One commit for the whole poll; a bad row only loses its own savepoint
+        if activities:
+            with self.db.transaction():
+                for message_id, activity in activities:
+                    try:
+                        with self.db.transaction():
+                            self.db.create_activity_once(activity)
+                    except Exception as exc:
+                        logger.warning(
+                            "Failed to log email activity",
+                            extra={"context": {"message_id": message_id, "error": str(exc)}},
+                        )
+
         logger.info(
             "Inbox poll complete",
             extra={"context": {"matched": len(matched_replies)}},
@@ -172,7 +183,7 @@ class ReplyMonitor:
         # where there is no subsequent STATUS_CHANGE for the same prospect
         rows = conn.execute(
             """
-            SELECT a.id, a.prospect_id, a.outcome, a.email_subject, a.notes, a.created_at,
+            SELECT a.id, a.prospect_id, a.outcome, a.email_subject, a.message_id, a.created_at,
                    p.first_name, p.last_name
             FROM activities a
             JOIN prospects p ON a.prospect_id = p.id
@@ -198,14 +209,6 @@ class ReplyMonitor:
 
         pending: list[MatchedReply] = []
         for row in rows:
-            # Extract message_id from notes if available
-            notes = row["notes"] or ""
-            message_id = ""
-            for part in notes.split():
-                if part.startswith("message_id:"):
-                    message_id = part[len("message_id:") :]
-                    break
-
             # Map outcome back to classification
             outcome_str = row["outcome"]
             if outcome_str == ActivityOutcome.INTERESTED.value:
@@ -231,7 +234,7 @@ class ReplyMonitor:
 
             pending.append(
                 MatchedReply(
-                    message_id=message_id,
+                    message_id=row["message_id"] or "",
                     prospect_id=row["prospect_id"],
                     prospect_name=prospect_name,
                     subject=row["email_subject"] or "",
@@ -264,15 +267,9 @@ class ReplyMonitor:
             logger.warning("mark_reviewed called with empty message_id")
             return False
 
-        conn = self.db._get_connection()
-
-        # Find the original EMAIL_RECEIVED activity by message_id in notes
-        marker = f"message_id:{message_id}"
-        original = conn.execute(
-            "SELECT prospect_id FROM activities WHERE notes LIKE ? AND activity_type = ? LIMIT 1",
-            (f"%{marker}%", ActivityType.EMAIL_RECEIVED.value),
-        ).fetchone()
-
+        original = self.db.get_message_activity(
+            message_id, MESSAGE_SOURCE, ActivityType.EMAIL_RECEIVED
+        )
         if original is None:
             logger.warning(
                 "Could not find original activity for review",
@@ -280,17 +277,19 @@ class ReplyMonitor:
             )
             return False
 
-        prospect_id = original["prospect_id"]
+        prospect_id = original.prospect_id
 
-        # Log the review as a STATUS_CHANGE activity
+        # Log the review as a STATUS_CHANGE activity; reviewing twice is a no-op
         activity = Activity(
             prospect_id=prospect_id,
             activity_type=ActivityType.STATUS_CHANGE,
-            notes=f"Reply reviewed: {action} (message_id:{message_id})",
+            notes=f"Reply reviewed: {action}",
             created_by="user",
+            message_id=message_id,
+            message_source=MESSAGE_SOURCE,
         )
         try:
-            self.db.create_activity(activity)
+            self.db.create_activity_once(activity)
             logger.info(
                 "Reply marked as reviewed",
                 extra={
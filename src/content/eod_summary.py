@@ -103,9 +103,10 @@ def generate_eod_summary(db: Database) -> EODSummary:
     tomorrow_follow_ups = conn.execute(
         """SELECT COUNT(*) as cnt FROM prospects
            WHERE follow_up_date IS NOT NULL
-           AND DATE(follow_up_date) = DATE(?)
+           AND follow_up_date >= DATE(?) AND follow_up_date < DATE(?, '+1 day')
            AND population NOT IN (?, ?, ?)""",
         (
+            tomorrow_iso,
             tomorrow_iso,
             Population.DEAD_DNC.value,
             Population.CLOSED_WON.value,
@@ -62,8 +62,9 @@ def generate_morning_brief(db: Database) -> MorningBrief:
     today_str = today.strftime("%A, %B %d, %Y")
 
     # Get population counts
-    pop_counts = db.get_population_counts()
-    total = sum(pop_counts.values())
+    counters = db.get_pipeline_counters(today)
+    pop_counts = counters.population_counts
+    total = counters.total
 
     # Format population summary
     population_counts: dict[str, int] = {}
@@ -111,15 +112,7 @@ def generate_morning_brief(db: Database) -> MorningBrief:
     orphan_count = len(orphans)
 
     # Count engaged follow-ups for today
-    conn = db._get_connection()
-    today_iso = today.isoformat()
-    engaged_today_rows = conn.execute(
-        """SELECT COUNT(*) as cnt FROM prospects
-           WHERE population = ? AND follow_up_date IS NOT NULL
-           AND DATE(follow_up_date) = DATE(?)""",
-        (Population.ENGAGED.value, today_iso),
-    ).fetchone()
-    engaged_follow_ups = engaged_today_rows["cnt"] if engaged_today_rows else 0
+    engaged_follow_ups = counters.follow_ups_today.get(Population.ENGAGED, 0)
 
     # Get unengaged queue count
     unengaged_count = pop_counts.get(Population.UNENGAGED, 0)
@@ -161,6 +154,7 @@ def generate_morning_brief(db: Database) -> MorningBrief:
     # Overnight changes (system activities from last 24 hours)
     overnight_lines = []
     yesterday = (datetime.now() - timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
+    conn = db._get_connection()
     system_activities = conn.execute(
         """SELECT a.*, p.first_name, p.last_name
            FROM activities a
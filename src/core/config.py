@@ -41,6 +41,10 @@ class Config:
         trello_api_key: Trello API key (Phase 5)
         trello_token: Trello API token (Phase 5)
         trello_board_id: Trello board ID (Phase 5)
+        activity_archive_days: Age in days after which the nightly cycle moves
+            activities to the archive database (0 disables archival)
+        compress_text: Store email bodies, close notes and custom fields as
+            compressed BLOBs (see src/db/compression.py)
         debug: Enable debug mode
         dry_run: Log but don't send emails
     """
@@ -75,6 +79,12 @@ class Config:
     trello_token: Optional[str] = None
     trello_board_id: Optional[str] = None
 
+    # Activity archival horizon (see Database.archive_activities)
+    activity_archive_days: int = 365
+
+    # Compressed storage for large free-text columns
+    compress_text: bool = False
+
     # Feature flags
     debug: bool = False
     dry_run: bool = False
@@ -221,6 +231,8 @@ def load_config(env_file: Optional[Path] = None) -> Config:
         trello_api_key=_get_str("TRELLO_API_KEY", env_vars),
         trello_token=_get_str("TRELLO_TOKEN", env_vars),
         trello_board_id=_get_str("TRELLO_BOARD_ID", env_vars),
+        activity_archive_days=_get_int("IRONLUNG_ACTIVITY_ARCHIVE_DAYS", 365, env_vars),
+        compress_text=_get_bool("IRONLUNG_COMPRESS_TEXT", False, env_vars),
         debug=_get_bool("IRONLUNG_DEBUG", False, env_vars),
         dry_run=_get_bool("IRONLUNG_DRY_RUN", False, env_vars),
     )
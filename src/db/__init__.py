@@ -2,12 +2,16 @@
 
 This package provides all database functionality:
     - database: Connection management and CRUD operations
+    - connection: Per-thread readers and a single serialized writer
+    - profiler: Per-statement timing and query-plan capture
     - models: Dataclasses and enumerations
     - backup: Backup and restore functionality
     - intake: Import deduplication and DNC protection
 
 Modules:
     - database: SQLite connection and operations
+    - connection: Thread-aware connection routing
+    - profiler: Query instrumentation
     - models: Data models and enumerations
     - backup: Backup system
     - intake: Import funnel with dedup and DNC protection
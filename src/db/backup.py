@@ -5,6 +5,7 @@ Provides:
     - Cloud sync to OneDrive
     - Backup retention cleanup
     - Safe restore with pre-restore backup
+    - Rolling copy of the activity archive database
 
 Usage:
     from src.db.backup import BackupManager
@@ -28,6 +29,9 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Rolling copy of the activity archive inside the backup directory
+ARCHIVE_BACKUP_NAME = "activity_archive.db"
+
 
 @dataclass
 class BackupInfo:
@@ -51,6 +55,10 @@ class BackupManager:
 
     Backup naming format: ironlung3_YYYYMMDD_HHMMSS_label.db
 
+    The activity archive (see Database.archive_activities) only changes when
+    the nightly cycle moves rows into it, so it is kept as one rolling copy,
+    activity_archive.db, rather than in every timestamped backup.
+
     Labels:
         - manual: User-triggered backup
         - nightly: Nightly cycle backup
@@ -124,6 +132,37 @@ class BackupManager:
                 dest.unlink()
             raise DatabaseError(f"Backup failed: {e}") from e
 
+    def backup_archive(self) -> Optional[Path]:
+        """Refresh the rolling copy of the activity archive database.
+
+        Returns:
+            Path to the copy, or None if there is no archive yet
+
+        Raises:
+            DatabaseError: If backup fails
+        """
+        from src.core.security import restrict_permissions, secure_mkdir
+        from src.db.database import archive_path_for
+
+        source = Path(archive_path_for(str(self.db_path)))
+        if not source.exists():
+            return None
+
+        dest = self.backup_path / ARCHIVE_BACKUP_NAME
+        try:
+            secure_mkdir(self.backup_path)
+            with (
+                sqlite3.connect(str(source)) as source_conn,
+                sqlite3.connect(str(dest)) as dest_conn,
+            ):
+                source_conn.backup(dest_conn)
+            restrict_permissions(dest)
+        except (sqlite3.Error, OSError) as e:
+            raise DatabaseError(f"Archive backup failed: {e}") from e
+
+        logger.info("Archive backup refreshed", extra={"context": {"path": str(dest)}})
+        return dest
+
     def list_backups(self) -> list[BackupInfo]:
         """List all backups, newest first.
 
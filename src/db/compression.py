@@ -0,0 +1,67 @@
+"""Compressed storage for large free-text columns.
+
+Email bodies, close notes and custom-field JSON are written once and read
+back whole, never filtered in SQL, so they can be stored compressed.
+
+Format:
+    A BLOB whose first byte is the format version, followed by the payload.
+    Version 1 is a zlib stream of the UTF-8 text. Plain TEXT values are
+    left untouched, so compressed and uncompressed rows mix freely and the
+    feature can be switched on or off at any time.
+
+Usage:
+    from src.db.compression import compress_text, decompress_text
+
+    stored = compress_text(body)       # bytes, or body unchanged if too small
+    body = decompress_text(stored)     # always str (or None)
+"""
+
+import zlib
+from typing import Optional, Union
+
+from src.core.exceptions import DatabaseError
+
+# First byte of every compressed value
+FORMAT_VERSION = 1
+
+# Values shorter than this (in UTF-8 bytes) are stored as plain TEXT;
+# zlib's header and the BLOB overhead eat the savings on short strings.
+MIN_COMPRESS_BYTES = 256
+
+# zlib level: 6 is the library default and within a few percent of 9
+COMPRESSION_LEVEL = 6
+
+StoredText = Union[str, bytes]
+
+
+def compress_text(value: Optional[str]) -> Optional[StoredText]:
+    """Return the storage form of ``value``.
+
+    Values that are short, or that zlib cannot shrink, come back unchanged.
+    """
+    if value is None:
+        return None
+    raw = value.encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return value
+    framed = bytes([FORMAT_VERSION]) + zlib.compress(raw, COMPRESSION_LEVEL)
+    return framed if len(framed) < len(raw) else value
+
+
+def decompress_text(value: Optional[StoredText]) -> Optional[str]:
+    """Return the text for a stored value, plain or compressed.
+
+    Raises:
+        DatabaseError: If a BLOB has an unknown version or a corrupt payload
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if not value:
+        return ""
+    version = value[0]
+    if version != FORMAT_VERSION:
+        raise DatabaseError(f"Unknown compressed text format version: {version}")
+    try:
+        return zlib.decompress(value[1:]).decode("utf-8")
+    except (zlib.error, UnicodeDecodeError) as e:
+        raise DatabaseError(f"Corrupt compressed text: {e}") from e
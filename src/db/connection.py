@@ -0,0 +1,407 @@
+"""Thread-aware SQLite connection management for IronLung 3.
+
+The Tk thread, the Orchestrator daemon and TaskManager workers all share one
+Database. A single sqlite3.Connection cannot be used safely across threads,
+and funnelling everything through one connection serializes readers behind
+writers even though the database runs in WAL mode.
+
+Provides:
+    - One read connection per thread (``PRAGMA query_only``)
+    - One writer connection shared by all threads, serialized by a gate
+    - RoutedConnection: a sqlite3.Connection look-alike that sends each
+      statement to the right one
+
+Routing rules:
+    - Statements that only read go to the calling thread's reader
+    - Everything else takes the writer gate and runs on the writer
+    - Once a thread opens a write transaction it keeps the gate until
+      commit()/rollback(), and all of its statements (reads included) go to
+      the writer so it sees its own uncommitted changes
+    - Inside begin_unit()/end_unit() commit() and rollback() are no-ops, so
+      several Database calls share one transaction; nested units are savepoints
+    - Inside snapshot() the thread's reader holds one read transaction, so
+      every read it routes sees the same committed state
+
+``:memory:`` databases exist only inside one connection, so they use a
+single connection for both roles.
+
+Usage:
+    from src.db.connection import ConnectionManager
+
+    manager = ConnectionManager("ironlung3.db", configure=setup_fn)
+    conn = manager.routed()
+    conn.execute("SELECT ...")          # thread's reader
+    conn.execute("UPDATE ...")          # writer, gate held
+    conn.commit()                       # gate released
+"""
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from src.core.logging import get_logger
+from src.db.profiler import ProfiledCursor, get_query_profiler
+
+logger = get_logger(__name__)
+
+# Seconds a thread waits for the writer before reporting "database is locked"
+DEFAULT_WRITE_TIMEOUT = 30.0
+
+_WRITE_KEYWORDS = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+_LEADING_COMMENTS = re.compile(r"^\s*(--[^\n]*\n\s*|/\*.*?\*/\s*)*", re.DOTALL)
+
+
+def is_read_only(sql: str) -> bool:
+    """Return True if ``sql`` can run on a query-only connection.
+
+    Errs on the side of the writer: anything unrecognized is a write.
+    """
+    body = _LEADING_COMMENTS.sub("", sql).lstrip("( \t\r\n")
+    head = body.split(None, 1)[0].upper() if body else ""
+    if head in ("SELECT", "EXPLAIN", "VALUES"):
+        return True
+    if head == "WITH":
+        return _WRITE_KEYWORDS.search(body) is None
+    if head == "PRAGMA":
+        return "=" not in body
+    return False
+
+
+class _WriterGate:
+    """Mutual exclusion for the writer, owned by one thread at a time."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._owner: Optional[int] = None
+
+    @property
+    def held_by_me(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def acquire(self, timeout: float) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                return
+            if not self._cond.wait_for(lambda: self._owner is None, timeout=timeout):
+                raise sqlite3.OperationalError("database is locked (writer busy)")
+            self._owner = me
+
+    def release(self) -> None:
+        with self._cond:
+            if self._owner == threading.get_ident():
+                self._owner = None
+                self._cond.notify_all()
+
+
+class ConnectionManager:
+    """Opens and hands out reader/writer connections for one database file.
+
+    Attributes:
+        db_path: Path to database file (or ":memory:")
+        write_timeout: Seconds to wait for the writer gate
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        configure: Callable[[sqlite3.Connection, bool], None],
+        write_timeout: float = DEFAULT_WRITE_TIMEOUT,
+    ):
+        """Initialize connection manager.
+
+        Args:
+            db_path: Path to database file. ":memory:" uses one shared connection.
+            configure: Called on every new connection with (conn, is_writer)
+            write_timeout: Seconds to wait for the writer gate
+        """
+        self.db_path = db_path
+        self.write_timeout = write_timeout
+        self._configure = configure
+        self._gate = _WriterGate()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: list[sqlite3.Connection] = []
+        self._routed = RoutedConnection(self)
+
+    @property
+    def shared(self) -> bool:
+        """True when readers and the writer are the same connection."""
+        return self.db_path == ":memory:"
+
+    @property
+    def gate(self) -> _WriterGate:
+        return self._gate
+
+    def _open(self, is_writer: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            timeout=self.write_timeout,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn, is_writer)
+        return conn
+
+    def writer(self) -> sqlite3.Connection:
+        """Return the single writer connection, opening it on first use."""
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = self._open(is_writer=True)
+        return self._writer
+
+    def reader(self) -> sqlite3.Connection:
+        """Return the calling thread's read connection."""
+        if self.shared:
+            return self.writer()
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            # Make sure the writer (and with it WAL mode) exists first
+            self.writer()
+            conn = self._open(is_writer=False)
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def snapshot(self, schemas: Iterable[str] = ("main",)) -> Iterator[sqlite3.Connection]:
+        """Pin the calling thread's reader to one committed state of the database.
+
+        Opens a read transaction on the reader and touches each schema so
+        WAL fixes its snapshot immediately. Until the block exits, reads
+        routed from this thread see that state and never what other threads
+        commit meanwhile. Snapshots nest; only the outermost one ends the
+        read transaction. Reads made while the thread holds the writer gate
+        still go to the writer.
+
+        Args:
+            schemas: Attached schemas to pin along with main
+
+        Yields:
+            The pinned reader connection
+        """
+        if self.shared:
+            yield self.writer()
+            return
+        conn = self.reader()
+        depth: int = getattr(self._local, "snapshot_depth", 0)
+        if depth == 0:
+            conn.execute("BEGIN")
+            try:
+                for schema in schemas:
+                    conn.execute(f"SELECT COUNT(*) FROM {schema}.sqlite_master").fetchone()
+            except BaseException:
+                conn.rollback()
+                raise
+        self._local.snapshot_depth = depth + 1
+        try:
+            yield conn
+        finally:
+            self._local.snapshot_depth = depth
+            if depth == 0:
+                conn.rollback()
+
+    def release_reader(self) -> None:
+        """Close the calling thread's read connection, if it has one.
+
+        For worker threads that are about to finish; the thread opens a
+        new reader if it reads again.
+        """
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._readers:
+                self._readers.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def rows_written(self) -> int:
+        """Rows the calling thread has inserted, updated or deleted so far.
+
+        Counts the rowcount of each write statement routed to the writer,
+        including ones later rolled back; trigger side effects are not counted.
+        """
+        return int(getattr(self._local, "rows_written", 0))
+
+    def _count_written(self, rows: int) -> None:
+        self._local.rows_written = getattr(self._local, "rows_written", 0) + rows
+
+    def routed(self) -> "RoutedConnection":
+        """Return the routing connection facade."""
+        return self._routed
+
+    def close(self) -> None:
+        """Close every connection this manager opened."""
+        with self._lock:
+            for conn in self._readers:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._readers.clear()
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        self._local = threading.local()
+
+
+class RoutedConnection:
+    """sqlite3.Connection look-alike that routes statements by thread and role.
+
+    Implements the subset of the Connection API the codebase uses:
+    execute, executemany, executescript, commit, rollback, in_transaction
+    and set_trace_callback. While the query profiler is enabled, statements
+    run on ProfiledCursor so their timing and row counts are recorded.
+    """
+
+    def __init__(self, manager: ConnectionManager):
+        self._manager = manager
+        # Open unit-of-work nesting depth; only touched by the gate owner
+        self._depth = 0
+
+    def _run_on_writer(self, fn: Callable[[sqlite3.Connection], sqlite3.Cursor]) -> sqlite3.Cursor:
+        """Run ``fn`` on the writer, holding the gate only while a transaction is open."""
+        writer = self._manager.writer()
+        was_in_transaction = writer.in_transaction
+        try:
+            result = fn(writer)
+            if isinstance(result, sqlite3.Cursor) and result.rowcount > 0:
+                self._manager._count_written(result.rowcount)
+            return result
+        except BaseException:
+            # A statement that failed while opening its own implicit transaction
+            # must not leave the writer (and the gate) tied up.
+            if not was_in_transaction and writer.in_transaction:
+                writer.rollback()
+            raise
+        finally:
+            if not writer.in_transaction:
+                self._manager.gate.release()
+
+    @staticmethod
+    def _execute(conn: sqlite3.Connection, sql: str, parameters: Any) -> sqlite3.Cursor:
+        profiler = get_query_profiler()
+        if not profiler.enabled:
+            return conn.execute(sql, parameters)
+        cursor = conn.cursor(ProfiledCursor)
+        cursor.track(profiler, sql, parameters)
+        return cursor.run(cursor.execute, sql, parameters)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        """Execute one statement on the reader or writer as appropriate."""
+        manager = self._manager
+        if manager.gate.held_by_me or not is_read_only(sql):
+            manager.gate.acquire(manager.write_timeout)
+            return self._run_on_writer(lambda w: self._execute(w, sql, parameters))
+        return self._execute(manager.reader(), sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        """Execute a write statement for each parameter set on the writer."""
+        self._manager.gate.acquire(self._manager.write_timeout)
+
+        def run(writer: sqlite3.Connection) -> sqlite3.Cursor:
+            profiler = get_query_profiler()
+            if not profiler.enabled:
+                return writer.executemany(sql, seq_of_parameters)
+            cursor = writer.cursor(ProfiledCursor)
+            cursor.track(profiler, sql, None, explainable=False)
+            return cursor.run(cursor.executemany, sql, seq_of_parameters)
+
+        return self._run_on_writer(run)
+
+    def executescript(self, sql_script: str) -> sqlite3.Cursor:
+        """Execute a multi-statement script on the writer."""
+        self._manager.gate.acquire(self._manager.write_timeout)
+        return self._run_on_writer(lambda w: w.executescript(sql_script))
+
+    def commit(self) -> None:
+        """Commit the calling thread's write transaction and release the writer.
+
+        Deferred to end_unit() while a unit of work is open.
+        """
+        if not self._manager.gate.held_by_me or self._depth:
+            return
+        try:
+            self._manager.writer().commit()
+        finally:
+            if not self._manager.writer().in_transaction:
+                self._manager.gate.release()
+
+    def rollback(self) -> None:
+        """Roll back the calling thread's write transaction and release the writer.
+
+        Deferred to end_unit() while a unit of work is open.
+        """
+        if not self._manager.gate.held_by_me or self._depth:
+            return
+        try:
+            self._manager.writer().rollback()
+        finally:
+            self._manager.gate.release()
+
+    def begin_unit(self) -> None:
+        """Open a unit of work: a transaction, or a savepoint when nested."""
+        manager = self._manager
+        manager.gate.acquire(manager.write_timeout)
+        writer = manager.writer()
+        try:
+            if self._depth:
+                writer.execute(f"SAVEPOINT unit_{self._depth}")
+            elif not writer.in_transaction:
+                writer.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            if not writer.in_transaction:
+                manager.gate.release()
+            raise
+        self._depth += 1
+
+    def end_unit(self, commit: bool) -> None:
+        """Close the innermost unit of work, committing or rolling it back."""
+        manager = self._manager
+        writer = manager.writer()
+        self._depth -= 1
+        try:
+            if self._depth == 0:
+                try:
+                    if commit:
+                        writer.commit()
+                    else:
+                        writer.rollback()
+                except sqlite3.Error:
+                    if writer.in_transaction:
+                        writer.rollback()
+                    raise
+            elif commit:
+                writer.execute(f"RELEASE unit_{self._depth}")
+            else:
+                writer.execute(f"ROLLBACK TO unit_{self._depth}")
+                writer.execute(f"RELEASE unit_{self._depth}")
+        finally:
+            if not writer.in_transaction:
+                manager.gate.release()
+
+    @property
+    def in_unit(self) -> bool:
+        """True if the calling thread has a unit of work open."""
+        return self._manager.gate.held_by_me and self._depth > 0
+
+    @property
+    def in_transaction(self) -> bool:
+        """True if the calling thread has an open write transaction."""
+        return self._manager.gate.held_by_me and self._manager.writer().in_transaction
+
+    def set_trace_callback(self, callback: Optional[Callable[[str], None]]) -> None:
+        """Trace statements on the writer and the calling thread's reader."""
+        self._manager.writer().set_trace_callback(callback)
+        self._manager.reader().set_trace_callback(callback)
@@ -1,10 +1,14 @@
 """SQLite database connection and operations for IronLung 3.
 
 Provides:
-    - Connection management with WAL mode
+    - Connection management with WAL mode (per-thread readers, single writer)
     - Schema creation and migration
     - CRUD operations for all tables
     - Query builders with filtering
+    - Ranked full-text search over prospects (FTS5)
+    - Consistent read snapshots for reports and exports
+    - Change log with per-consumer watermarks for incremental processing
+    - Nightly run and step checkpoints for resuming an interrupted cycle
 
 Usage:
     from src.db.database import Database
@@ -16,19 +20,27 @@ Usage:
     company_id = db.create_company(company)
 """
 
+import hashlib
+import json
+import re
 import sqlite3
-from datetime import date, datetime
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from src.core.config import get_config
 from src.core.exceptions import DatabaseError
 from src.core.logging import get_logger
+from src.core.phone import normalize_phone
+from src.db.compression import MIN_COMPRESS_BYTES, compress_text, decompress_text
+from src.db.connection import ConnectionManager, RoutedConnection
 from src.db.models import (
     Activity,
     ActivityOutcome,
     ActivityType,
     AttemptType,
+    ChangeSet,
     Company,
     ContactMethod,
     ContactMethodType,
@@ -38,6 +50,10 @@ from src.db.models import (
     IntelCategory,
     IntelNugget,
     LostReason,
+    NightlyRun,
+    NightlyRunStep,
+    NightlyStatus,
+    PipelineCounters,
     Population,
     Prospect,
     ProspectFull,
@@ -52,7 +68,542 @@ logger = get_logger(__name__)
 
 
 # Schema version for migrations
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 13
+
+# Activities moved per transaction by Database.archive_activities()
+ARCHIVE_BATCH_SIZE = 1000
+
+# Free-text columns stored compressed when Database.compress_text is on
+# (never filtered in SQL; see src/db/compression.py)
+COMPRESSED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "prospects": ("close_notes", "custom_fields"),
+    "activities": ("email_body",),
+}
+
+# Rows re-encoded per transaction by Database.reencode_text_columns()
+REENCODE_BATCH_SIZE = 500
+
+# change_log rows older than this are pruned even if a consumer has not read them
+CHANGE_LOG_RETENTION_DAYS = 30
+
+# system_metadata keys: per-consumer change_log watermark, highest seq pruned
+_CHANGE_WATERMARK_KEY = "change_log_watermark:"
+_CHANGE_LOG_PRUNED_KEY = "change_log_pruned_through"
+
+# Rebuilds prospect_search rows for the prospects matching ``where``
+_SEARCH_ROW_SQL = """INSERT INTO prospect_search
+                   (rowid, first_name, last_name, title, company_name, notes, intel)
+               SELECT p.id, p.first_name, p.last_name, p.title, c.name, p.notes,
+                      (SELECT group_concat(n.content, ' ') FROM intel_nuggets n
+                        WHERE n.prospect_id = p.id)
+               FROM prospects p LEFT JOIN companies c ON c.id = p.company_id
+               WHERE {where}"""
+
+# Date columns kept in a canonical sortable form ('YYYY-MM-DD...') so range
+# predicates like ``follow_up_date < DATE(?, '+1 day')`` can use an index.
+# Values whose leading 10 chars are not their own DATE() are rewritten with
+# the given SQL function; unparseable values (including '') become NULL.
+_CANONICAL_DATE_COLUMNS = {"follow_up_date": "datetime", "lost_date": "date"}
+
+
+def _canonical_date_statements() -> list[str]:
+    """Backfill and trigger statements enforcing _CANONICAL_DATE_COLUMNS."""
+    statements: list[str] = []
+    for column, func in _CANONICAL_DATE_COLUMNS.items():
+        statements.append(
+            f"""UPDATE prospects SET {column} = {func}({column})
+               WHERE {column} IS NOT NULL AND substr({column}, 1, 10) IS NOT DATE({column})"""
+        )
+        for event, name in (("INSERT", "ai"), (f"UPDATE OF {column}", "au")):
+            statements.append(
+                f"""CREATE TRIGGER IF NOT EXISTS prospects_{column}_canonical_{name}
+                   AFTER {event} ON prospects
+                   WHEN NEW.{column} IS NOT NULL
+                    AND substr(NEW.{column}, 1, 10) IS NOT DATE(NEW.{column})
+                   BEGIN
+                       UPDATE prospects SET {column} = {func}(NEW.{column}) WHERE id = NEW.id;
+                   END"""
+            )
+    return statements
+
+
+# Headline counts kept in pipeline_counters by triggers, one row per
+# (metric, day, bucket). 'day' is '' for undated metrics.
+#   population  bucket=population                  prospects in it
+#   follow_up   bucket=population, day=follow-up   prospects due that day
+#   demo        bucket=population, day=follow-up   ...in the demo_scheduled stage
+#   activity    bucket=activity_type, day=created  activities logged that day
+#   worked      bucket='', day=created             distinct prospects touched that day
+_COUNTER_UPSERT = """INSERT INTO pipeline_counters (metric, day, bucket, value)
+                   SELECT '{metric}', {day}, {bucket}, {delta} WHERE {where}
+                   ON CONFLICT (metric, day, bucket) DO UPDATE SET value = value + excluded.value"""
+
+_COUNTER_BACKFILL_SQL = [
+    """INSERT INTO pipeline_counters (metric, day, bucket, value)
+       SELECT 'population', '', population, COUNT(*) FROM prospects GROUP BY population""",
+    """INSERT INTO pipeline_counters (metric, day, bucket, value)
+       SELECT 'follow_up', DATE(follow_up_date), population, COUNT(*) FROM prospects
+       WHERE DATE(follow_up_date) IS NOT NULL GROUP BY 2, 3""",
+    """INSERT INTO pipeline_counters (metric, day, bucket, value)
+       SELECT 'demo', DATE(follow_up_date), population, COUNT(*) FROM prospects
+       WHERE DATE(follow_up_date) IS NOT NULL AND engagement_stage = 'demo_scheduled'
+       GROUP BY 2, 3""",
+    """INSERT INTO pipeline_counters (metric, day, bucket, value)
+       SELECT 'activity', DATE(created_at), activity_type, COUNT(*) FROM activities
+       WHERE DATE(created_at) IS NOT NULL GROUP BY 2, 3""",
+    """INSERT INTO pipeline_counters (metric, day, bucket, value)
+       SELECT 'worked', DATE(created_at), '', COUNT(DISTINCT prospect_id) FROM activities
+       WHERE DATE(created_at) IS NOT NULL GROUP BY 2""",
+]
+
+
+def _prospect_counter_sql(row: str, delta: int) -> list[str]:
+    """Counter adjustments for one prospect row image (NEW or OLD)."""
+    day = f"DATE({row}.follow_up_date)"
+    return [
+        _COUNTER_UPSERT.format(
+            metric="population", day="''", bucket=f"{row}.population", delta=delta, where="1"
+        ),
+        _COUNTER_UPSERT.format(
+            metric="follow_up",
+            day=day,
+            bucket=f"{row}.population",
+            delta=delta,
+            where=f"{day} IS NOT NULL",
+        ),
+        _COUNTER_UPSERT.format(
+            metric="demo",
+            day=day,
+            bucket=f"{row}.population",
+            delta=delta,
+            where=f"{day} IS NOT NULL AND {row}.engagement_stage = 'demo_scheduled'",
+        ),
+    ]
+
+
+def _activity_counter_sql(row: str, delta: int, worked_where: str) -> list[str]:
+    """Counter adjustments for one activity row image (NEW or OLD)."""
+    day = f"DATE({row}.created_at)"
+    return [
+        _COUNTER_UPSERT.format(
+            metric="activity",
+            day=day,
+            bucket=f"{row}.activity_type",
+            delta=delta,
+            where=f"{day} IS NOT NULL",
+        ),
+        _COUNTER_UPSERT.format(
+            metric="worked",
+            day=day,
+            bucket="''",
+            delta=delta,
+            where=f"{day} IS NOT NULL AND {worked_where}",
+        ),
+    ]
+
+
+def _no_other_activity(row: str, exclude_id: Optional[str] = None) -> str:
+    """SQL condition: the prospect has no (other) activity on the row's day."""
+    exclude = f" AND a.id <> {exclude_id}" if exclude_id else ""
+    return f"""NOT EXISTS (SELECT 1 FROM activities a
+                  WHERE a.prospect_id = {row}.prospect_id
+                    AND DATE(a.created_at) = DATE({row}.created_at){exclude})"""
+
+
+def _counter_statements() -> list[str]:
+    """Table, backfill and triggers for pipeline_counters."""
+
+    def trigger(name: str, event: str, body: list[str], when: str = "") -> str:
+        when_sql = f" WHEN {when}" if when else ""
+        statements = "".join(f"{sql};\n" for sql in body)
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event}{when_sql}\nBEGIN\n{statements}END"
+        )
+
+    activity_moved = (
+        "(OLD.prospect_id IS NOT NEW.prospect_id "
+        "OR DATE(OLD.created_at) IS NOT DATE(NEW.created_at))"
+    )
+    return [
+        """CREATE TABLE IF NOT EXISTS pipeline_counters (
+               metric TEXT NOT NULL,
+               day TEXT NOT NULL,
+               bucket TEXT NOT NULL,
+               value INTEGER NOT NULL DEFAULT 0,
+               PRIMARY KEY (metric, day, bucket)
+           ) WITHOUT ROWID""",
+        *_COUNTER_BACKFILL_SQL,
+        trigger(
+            "pipeline_counters_prospect_ai", "INSERT ON prospects", _prospect_counter_sql("NEW", 1)
+        ),
+        trigger(
+            "pipeline_counters_prospect_ad", "DELETE ON prospects", _prospect_counter_sql("OLD", -1)
+        ),
+        trigger(
+            "pipeline_counters_prospect_au",
+            "UPDATE OF population, follow_up_date, engagement_stage ON prospects",
+            _prospect_counter_sql("OLD", -1) + _prospect_counter_sql("NEW", 1),
+            when="OLD.population IS NOT NEW.population "
+            "OR DATE(OLD.follow_up_date) IS NOT DATE(NEW.follow_up_date) "
+            "OR OLD.engagement_stage IS NOT NEW.engagement_stage",
+        ),
+        trigger(
+            "pipeline_counters_activity_ai",
+            "INSERT ON activities",
+            _activity_counter_sql("NEW", 1, _no_other_activity("NEW", exclude_id="NEW.id")),
+        ),
+        trigger(
+            "pipeline_counters_activity_ad",
+            "DELETE ON activities",
+            _activity_counter_sql("OLD", -1, _no_other_activity("OLD")),
+        ),
+        trigger(
+            "pipeline_counters_activity_au",
+            "UPDATE OF activity_type, created_at, prospect_id ON activities",
+            _activity_counter_sql("OLD", -1, f"{activity_moved} AND {_no_other_activity('OLD')}")
+            + _activity_counter_sql(
+                "NEW", 1, f"{activity_moved} AND {_no_other_activity('NEW', exclude_id='NEW.id')}"
+            ),
+            when="OLD.activity_type IS NOT NEW.activity_type "
+            "OR DATE(OLD.created_at) IS NOT DATE(NEW.created_at) "
+            "OR OLD.prospect_id IS NOT NEW.prospect_id",
+        ),
+    ]
+
+
+# prospects.last_activity_* = the latest activity by (created_at, id)
+_LAST_ACTIVITY_SQL = """UPDATE prospects SET (last_activity_at, last_activity_type) = (
+                            SELECT a.created_at, a.activity_type FROM activities a
+                            WHERE a.prospect_id = prospects.id
+                            ORDER BY a.created_at DESC, a.id DESC LIMIT 1)
+                        WHERE {where}"""
+
+
+# Tables whose row changes are recorded in change_log, with the SQL giving the
+# owning prospect (company changes fan out to their prospects when read).
+_CHANGE_LOG_TABLES = {
+    "prospects": "{row}.id",
+    "companies": "NULL",
+    "contact_methods": "{row}.prospect_id",
+    "activities": "{row}.prospect_id",
+    "data_freshness": "{row}.prospect_id",
+    "intel_nuggets": "{row}.prospect_id",
+}
+
+# Columns whose change counts as a change to the row. Derived prospect columns
+# (score, confidence, last_activity_*) and updated_at are left out so writing
+# them back does not mark the prospect changed again. Other tables log any update.
+_CHANGE_LOG_COLUMNS = {
+    "prospects": (
+        "company_id", "first_name", "last_name", "title", "population", "engagement_stage",
+        "follow_up_date", "last_contact_date", "parked_month", "attempt_count",
+        "preferred_contact_method", "source", "referred_by_prospect_id", "dead_reason",
+        "dead_date", "lost_reason", "lost_competitor", "lost_date", "deal_value", "close_date",
+        "close_notes", "notes", "custom_fields",
+    ),
+    "companies": ("name", "domain", "loan_types", "size", "state", "timezone", "notes"),
+    "intel_nuggets": ("prospect_id", "category", "content", "source_activity_id"),
+}  # fmt: skip
+
+_CHANGE_LOG_INSERT = """INSERT INTO change_log (entity, entity_id, prospect_id, op)
+                        VALUES ('{table}', {row}.id, {prospect}, '{op}')"""
+
+
+def _change_log_statements() -> list[str]:
+    """Table and triggers for change_log."""
+    statements = [
+        """CREATE TABLE IF NOT EXISTS change_log (
+               seq INTEGER PRIMARY KEY AUTOINCREMENT,
+               entity TEXT NOT NULL,
+               entity_id INTEGER NOT NULL,
+               prospect_id INTEGER,
+               op TEXT NOT NULL,
+               changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+           )""",
+    ]
+    for table, prospect in _CHANGE_LOG_TABLES.items():
+        for name, event, row, op in (
+            ("ai", "INSERT", "NEW", "insert"),
+            ("ad", "DELETE", "OLD", "delete"),
+        ):
+            log = _CHANGE_LOG_INSERT.format(
+                table=table, row=row, prospect=prospect.format(row=row), op=op
+            )
+            statements.append(
+                f"""CREATE TRIGGER IF NOT EXISTS change_log_{table}_{name}
+                   AFTER {event} ON {table} BEGIN
+                       {log};
+                   END"""
+            )
+
+        columns = _CHANGE_LOG_COLUMNS.get(table)
+        event = f"UPDATE OF {', '.join(columns)}" if columns else "UPDATE"
+        when = "WHEN " + " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns) if columns else ""
+        body = [
+            _CHANGE_LOG_INSERT.format(
+                table=table, row="NEW", prospect=prospect.format(row="NEW"), op="update"
+            )
+        ]
+        if prospect != "NULL" and table != "prospects":
+            # A row moved to another prospect (merge) changes the old owner too
+            body.append(
+                f"""INSERT INTO change_log (entity, entity_id, prospect_id, op)
+                    SELECT '{table}', OLD.id, OLD.prospect_id, 'update'
+                    WHERE OLD.prospect_id IS NOT NEW.prospect_id"""
+            )
+        statements.append(
+            f"""CREATE TRIGGER IF NOT EXISTS change_log_{table}_au
+               AFTER {event} ON {table} {when}
+               BEGIN
+                   {";".join(body)};
+               END"""
+        )
+    return statements
+
+
+# Sequential migrations applied on top of the v1 DDL (see docs/SCHEMA-SPEC.md).
+# Each version's statements run in a single transaction together with the
+# schema_version bump, so a failed migration leaves the database untouched.
+MIGRATIONS: dict[int, list[str]] = {
+    # v2: canonical 10-digit phone key so phone lookups are an index seek
+    2: [
+        "ALTER TABLE contact_methods ADD COLUMN phone_normalized TEXT",
+        """UPDATE contact_methods SET phone_normalized = NULLIF(normalize_phone(value), '')
+           WHERE type = 'phone'""",
+        """CREATE INDEX IF NOT EXISTS idx_contact_methods_phone_normalized
+           ON contact_methods(phone_normalized) WHERE type = 'phone'""",
+        """CREATE INDEX IF NOT EXISTS idx_contact_methods_email_lower
+           ON contact_methods(LOWER(value)) WHERE type = 'email'""",
+    ],
+    # v3: FTS5 search index over prospects, company names, notes and intel
+    3: [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS prospect_search USING fts5(
+               first_name, last_name, title, company_name, notes, intel,
+               tokenize = 'unicode61 remove_diacritics 2',
+               prefix = '2 3'
+           )""",
+        _SEARCH_ROW_SQL.format(where="1"),
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_ai AFTER INSERT ON prospects BEGIN
+               {_SEARCH_ROW_SQL.format(where="p.id = NEW.id")};
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_au
+           AFTER UPDATE OF first_name, last_name, title, notes, company_id ON prospects
+           WHEN OLD.first_name IS NOT NEW.first_name OR OLD.last_name IS NOT NEW.last_name
+             OR OLD.title IS NOT NEW.title OR OLD.notes IS NOT NEW.notes
+             OR OLD.company_id IS NOT NEW.company_id
+           BEGIN
+               DELETE FROM prospect_search WHERE rowid = OLD.id;
+               {_SEARCH_ROW_SQL.format(where="p.id = NEW.id")};
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS prospect_search_ad AFTER DELETE ON prospects BEGIN
+               DELETE FROM prospect_search WHERE rowid = OLD.id;
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_company_au
+           AFTER UPDATE OF name ON companies WHEN OLD.name IS NOT NEW.name
+           BEGIN
+               DELETE FROM prospect_search
+                WHERE rowid IN (SELECT id FROM prospects WHERE company_id = NEW.id);
+               {_SEARCH_ROW_SQL.format(where="p.company_id = NEW.id")};
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_nugget_ai AFTER INSERT ON intel_nuggets BEGIN
+               DELETE FROM prospect_search WHERE rowid = NEW.prospect_id;
+               {_SEARCH_ROW_SQL.format(where="p.id = NEW.prospect_id")};
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_nugget_au
+           AFTER UPDATE OF content, prospect_id ON intel_nuggets BEGIN
+               DELETE FROM prospect_search WHERE rowid IN (OLD.prospect_id, NEW.prospect_id);
+               {_SEARCH_ROW_SQL.format(where="p.id IN (OLD.prospect_id, NEW.prospect_id)")};
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospect_search_nugget_ad AFTER DELETE ON intel_nuggets BEGIN
+               DELETE FROM prospect_search WHERE rowid = OLD.prospect_id;
+               {_SEARCH_ROW_SQL.format(where="p.id = OLD.prospect_id")};
+           END""",
+    ],
+    # v4: canonical follow-up/lost dates + composite indexes for queue queries
+    4: [
+        *_canonical_date_statements(),
+        """CREATE INDEX IF NOT EXISTS idx_prospects_population_follow_up
+           ON prospects(population, follow_up_date)""",
+        """CREATE INDEX IF NOT EXISTS idx_prospects_population_score
+           ON prospects(population, prospect_score DESC)""",
+        """CREATE INDEX IF NOT EXISTS idx_prospects_population_lost_date
+           ON prospects(population, lost_date)""",
+    ],
+    # v5: external message ids on activities, lifted out of 'message_id:<id>' notes
+    5: [
+        "ALTER TABLE activities ADD COLUMN message_id TEXT",
+        "ALTER TABLE activities ADD COLUMN message_source TEXT",
+        """UPDATE activities
+           SET message_id = substr(notes, instr(notes, 'message_id:') + 11),
+               message_source = 'outlook'
+           WHERE activity_type IN ('email_sent', 'email_received')
+             AND instr(notes, 'message_id:') > 0""",
+        """UPDATE activities SET message_id = substr(message_id, 1, instr(message_id, ' ') - 1)
+           WHERE instr(message_id, ' ') > 0""",
+        # Older syncs could log the same message twice; keep the first copy
+        """UPDATE activities SET message_id = NULL, message_source = NULL
+           WHERE message_id IS NOT NULL AND id NOT IN (
+               SELECT MIN(id) FROM activities WHERE message_id IS NOT NULL
+               GROUP BY message_id, message_source, activity_type, prospect_id
+           )""",
+        """UPDATE activities
+           SET notes = NULLIF(TRIM(REPLACE(notes, 'message_id:' || message_id, '')), '')
+           WHERE message_id IS NOT NULL""",
+        """CREATE UNIQUE INDEX IF NOT EXISTS idx_activities_message
+           ON activities(message_id, message_source, activity_type, prospect_id)
+           WHERE message_id IS NOT NULL""",
+    ],
+    # v6: trigger-maintained headline counts (status bar, cockpit, brief)
+    6: _counter_statements(),
+    # v7: denormalized last touch on prospects for staleness reports
+    7: [
+        "ALTER TABLE prospects ADD COLUMN last_activity_at TEXT",
+        "ALTER TABLE prospects ADD COLUMN last_activity_type TEXT",
+        """CREATE INDEX IF NOT EXISTS idx_activities_prospect_created
+           ON activities(prospect_id, created_at)""",
+        _LAST_ACTIVITY_SQL.format(where="1"),
+        """CREATE INDEX IF NOT EXISTS idx_prospects_population_last_activity
+           ON prospects(population, last_activity_at)""",
+        """CREATE TRIGGER IF NOT EXISTS prospects_last_activity_ai AFTER INSERT ON activities
+           BEGIN
+               UPDATE prospects
+               SET last_activity_at = NEW.created_at, last_activity_type = NEW.activity_type
+               WHERE id = NEW.prospect_id
+                 AND (last_activity_at IS NULL OR last_activity_at <= NEW.created_at);
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospects_last_activity_ad AFTER DELETE ON activities
+           BEGIN
+               {_LAST_ACTIVITY_SQL.format(where="id = OLD.prospect_id")};
+           END""",
+        f"""CREATE TRIGGER IF NOT EXISTS prospects_last_activity_au
+           AFTER UPDATE OF created_at, activity_type, prospect_id ON activities
+           BEGIN
+               {_LAST_ACTIVITY_SQL.format(where="id IN (OLD.prospect_id, NEW.prospect_id)")};
+           END""",
+    ],
+    # v8: index the nugget -> activity foreign key checked when activities are archived
+    8: [
+        """CREATE INDEX IF NOT EXISTS idx_nuggets_source_activity
+           ON intel_nuggets(source_activity_id)""",
+    ],
+    # v9: change_log of row inserts/updates/deletes for incremental nightly consumers
+    9: _change_log_statements(),
+    # v10: latest verification per (prospect, field) for the Groundskeeper scan
+    10: [
+        """CREATE INDEX IF NOT EXISTS idx_freshness_prospect_field
+           ON data_freshness(prospect_id, field_name, verified_date)""",
+    ],
+    # v11: nightly runs with per-step checkpoints, so an interrupted run resumes
+    11: [
+        """CREATE TABLE IF NOT EXISTS nightly_runs (
+               id INTEGER PRIMARY KEY AUTOINCREMENT,
+               kind TEXT NOT NULL DEFAULT 'nightly',
+               status TEXT NOT NULL DEFAULT 'running',
+               started_at TIMESTAMP,
+               completed_at TIMESTAMP,
+               resumes INTEGER NOT NULL DEFAULT 0
+           )""",
+        "CREATE INDEX IF NOT EXISTS idx_nightly_runs_kind ON nightly_runs(kind, status, id)",
+        """CREATE TABLE IF NOT EXISTS nightly_run_steps (
+               run_id INTEGER NOT NULL REFERENCES nightly_runs(id) ON DELETE CASCADE,
+               step TEXT NOT NULL,
+               position INTEGER NOT NULL DEFAULT 0,
+               status TEXT NOT NULL DEFAULT 'pending',
+               cursor TEXT,
+               started_at TIMESTAMP,
+               completed_at TIMESTAMP,
+               error TEXT,
+               PRIMARY KEY (run_id, step)
+           )""",
+    ],
+    # v12: nightly telemetry for trend and regression reports
+    12: [
+        "ALTER TABLE nightly_runs ADD COLUMN duration_seconds REAL",
+        "ALTER TABLE nightly_runs ADD COLUMN peak_rss_kb INTEGER",
+        "ALTER TABLE nightly_run_steps ADD COLUMN wait_seconds REAL",
+        "ALTER TABLE nightly_run_steps ADD COLUMN duration_seconds REAL",
+        "ALTER TABLE nightly_run_steps ADD COLUMN rows_processed INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE nightly_run_steps ADD COLUMN rows_written INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE nightly_run_steps ADD COLUMN api_calls INTEGER NOT NULL DEFAULT 0",
+    ],
+    # v13: content hash on intel nuggets so extraction dedups through a unique index
+    13: [
+        "ALTER TABLE intel_nuggets ADD COLUMN content_hash TEXT",
+        # The hash is derived, so filling it in is not a change to the nugget
+        "DROP TRIGGER IF EXISTS change_log_intel_nuggets_au",
+        "UPDATE intel_nuggets SET content_hash = intel_content_hash(content)",
+        # Repeated nightly runs could store the same nugget twice; keep the first copy
+        """DELETE FROM intel_nuggets WHERE id NOT IN (
+               SELECT MIN(id) FROM intel_nuggets GROUP BY prospect_id, category, content_hash
+           )""",
+        """CREATE UNIQUE INDEX IF NOT EXISTS idx_nuggets_content
+           ON intel_nuggets(prospect_id, category, content_hash)""",
+        *[stmt for stmt in _change_log_statements() if "change_log_intel_nuggets_au" in stmt],
+    ],
+}
+
+# Columns get_prospects(search_query=...) matches; search() uses all of them
+_NAME_SEARCH_COLUMNS = ("first_name", "last_name", "company_name")
+
+# bm25 weights for prospect_search columns, in declaration order
+_SEARCH_WEIGHTS = "10.0, 10.0, 4.0, 6.0, 1.0, 2.0"
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+def _fts_query(text: str, columns: Optional[tuple[str, ...]] = None) -> Optional[str]:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Returns None when the text contains no searchable words.
+    """
+    tokens = _SEARCH_TOKEN.findall(text)
+    if not tokens:
+        return None
+    expr = " ".join(f'"{token}"*' for token in tokens)
+    if columns:
+        expr = "{" + " ".join(columns) + "} : (" + expr + ")"
+    return expr
+
+
+def archive_path_for(db_path: str) -> str:
+    """Return the activity archive file kept next to ``db_path``.
+
+    ``ironlung3.db`` archives to ``ironlung3_archive.db``; an in-memory
+    database gets an in-memory archive.
+    """
+    if db_path == ":memory:":
+        return db_path
+    path = Path(db_path)
+    return str(path.with_name(f"{path.stem}_archive{path.suffix}"))
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a TIMESTAMP column value, tolerating date-only or odd strings."""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _phone_key(method_type: Any, value: Optional[str]) -> Optional[str]:
+    """Return the normalized phone key stored alongside a contact method.
+
+    Only phone rows carry a key; values without any digits get NULL so
+    they never match a lookup.
+    """
+    type_val = method_type.value if isinstance(method_type, ContactMethodType) else method_type
+    if type_val != ContactMethodType.PHONE.value or not value:
+        return None
+    return normalize_phone(value) or None
+
+
+def intel_content_hash(content: Optional[str]) -> Optional[str]:
+    """Return the dedup key stored with an intel nugget's content."""
+    if content is None:
+        return None
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
 
 
 class Database:
@@ -60,54 +611,84 @@ class Database:
 
     Attributes:
         db_path: Path to database file
+        archive_path: Path to the attached activity archive (see archive_activities)
+        compress_text: Write COMPRESSED_COLUMNS as zlib-framed BLOBs
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, compress_text: Optional[bool] = None):
         """Initialize database.
 
         Args:
             db_path: Path to database file. Use ":memory:" for in-memory.
                     Defaults to config path.
+            compress_text: Store large free-text columns compressed.
+                    Defaults to the IRONLUNG_COMPRESS_TEXT setting.
         """
-        if db_path is None:
+        if db_path is None or compress_text is None:
             config = get_config()
-            self.db_path = str(config.db_path)
-        else:
-            self.db_path = db_path
+            db_path = str(config.db_path) if db_path is None else db_path
+            compress_text = config.compress_text if compress_text is None else compress_text
+        self.db_path = db_path
+        self.compress_text = compress_text
+        self.archive_path = archive_path_for(self.db_path)
 
-        self._conn: Optional[sqlite3.Connection] = None
+        self._connections: Optional[ConnectionManager] = None
+        # Column list shared by main.activities and archive.activities
+        self._archive_columns: Optional[str] = None
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._conn is None:
+    def _get_connection(self) -> RoutedConnection:
+        """Get the routing connection, opening the database on first use.
+
+        Reads run on a per-thread connection; writes are serialized through
+        a single writer connection (see src.db.connection).
+        """
+        if self._connections is None:
             try:
                 # Create directory with restricted permissions (unless in-memory)
                 if self.db_path != ":memory:":
-                    from src.core.security import restrict_permissions, secure_mkdir
+                    from src.core.security import secure_mkdir
 
                     secure_mkdir(Path(self.db_path).parent)
 
-                self._conn = sqlite3.connect(
-                    self.db_path,
-                    detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                )
-                self._conn.row_factory = sqlite3.Row
+                connections = ConnectionManager(self.db_path, configure=self._configure_connection)
+                connections.writer()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Cannot connect to database: {e}") from e
+            self._connections = connections
+
+        return self._connections.routed()
+
+    def _configure_connection(self, conn: sqlite3.Connection, is_writer: bool) -> None:
+        """Apply per-connection settings to a newly opened connection."""
+        # Expose phone normalization to SQL (used by migrations)
+        conn.create_function(
+            "normalize_phone",
+            1,
+            lambda v: normalize_phone(v) if v else None,
+            deterministic=True,
+        )
+        conn.create_function("intel_content_hash", 1, intel_content_hash, deterministic=True)
 
-                # Enable foreign keys
-                self._conn.execute("PRAGMA foreign_keys = ON")
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
 
-                # Enable WAL mode for better concurrency
-                if self.db_path != ":memory:":
-                    self._conn.execute("PRAGMA journal_mode = WAL")
-                    # Restrict database file permissions to owner-only (0600)
-                    db_file = Path(self.db_path)
-                    if db_file.exists():
-                        restrict_permissions(db_file)
+        # Old activities live in a separate file; ATTACH creates it on first write
+        conn.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
 
-            except sqlite3.Error as e:
-                raise DatabaseError(f"Cannot connect to database: {e}") from e
+        # Enable WAL mode so readers never wait on the writer
+        if is_writer and self.db_path != ":memory:":
+            from src.core.security import restrict_permissions
 
-        return self._conn
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA archive.journal_mode = WAL")
+            # Restrict database file permissions to owner-only (0600)
+            db_file = Path(self.db_path)
+            if db_file.exists():
+                restrict_permissions(db_file)
+
+    def _encode_text(self, value: Optional[str]) -> Optional[str | bytes]:
+        """Return the storage form of a COMPRESSED_COLUMNS value."""
+        return compress_text(value) if self.compress_text else value
 
     @staticmethod
     def _lastrowid(cursor: sqlite3.Cursor) -> int:
@@ -117,10 +698,78 @@ class Database:
         return row_id
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        """Close all database connections."""
+        if self._connections is not None:
+            self._connections.close()
+            self._connections = None
+
+    def release_thread_connection(self) -> None:
+        """Close the calling thread's read connection.
+
+        Worker threads call this when they finish so short-lived threads
+        do not leave readers open until close().
+        """
+        if self._connections is not None:
+            self._connections.release_reader()
+
+    def rows_written_on_thread(self) -> int:
+        """Rows the calling thread has inserted, updated or deleted so far."""
+        if self._connections is None:
+            return 0
+        return self._connections.rows_written()
+
+    @contextmanager
+    def transaction(self) -> Iterator["Database"]:
+        """Run several Database calls as one unit of work with a single commit.
+
+        Inside the block the per-method commits and rollbacks are deferred;
+        the unit commits when the block exits and rolls back if an exception
+        escapes it. Blocks nest: an inner block is a savepoint, so an inner
+        failure that the caller catches undoes only the inner block.
+
+        Usage:
+            with db.transaction():
+                db.update_prospect(prospect)
+                db.create_activity(activity)
+        """
+        conn = self._get_connection()
+        try:
+            conn.begin_unit()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Cannot start transaction: {e}") from e
+        try:
+            yield self
+        except BaseException:
+            conn.end_unit(commit=False)
+            raise
+        try:
+            conn.end_unit(commit=True)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to commit transaction: {e}") from e
+
+    @contextmanager
+    def snapshot(self) -> Iterator["Database"]:
+        """Run a group of reads against one consistent state of the database.
+
+        For reports and exports: every read this thread makes inside the
+        block, live and archived activities included, sees the same
+        committed data, and none of it waits on the writer. Writes from
+        other threads carry on and show up after the block exits.
+
+        Usage:
+            with db.snapshot():
+                summary = generate_monthly_summary(db, "2026-02")
+        """
+        self._get_connection()
+        # Settle the archive schema now; the snapshot reader is query-only
+        self._sync_archive_schema()
+        assert self._connections is not None
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(self._connections.snapshot(("main", "archive")))
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Cannot open database snapshot: {e}") from e
+            yield self
 
     def initialize(self) -> None:
         """Create schema if not exists.
@@ -132,10 +781,95 @@ class Database:
         try:
             conn.executescript(self._get_schema_ddl())
             conn.commit()
-            logger.info("Database initialized", extra={"context": {"path": self.db_path}})
         except sqlite3.Error as e:
             raise DatabaseError(f"Cannot initialize database: {e}") from e
 
+        self._apply_migrations(conn)
+        self._sync_archive_schema()
+        logger.info("Database initialized", extra={"context": {"path": self.db_path}})
+
+    def get_schema_version(self) -> int:
+        """Return the highest schema version applied to this database."""
+        conn = self._get_connection()
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return int(row[0] or 0)
+
+    def _apply_migrations(self, conn: RoutedConnection) -> None:
+        """Bring the schema up to SCHEMA_VERSION.
+
+        Each pending version runs in its own transaction; on failure it is
+        rolled back and DatabaseError is raised.
+        """
+        current = self.get_schema_version()
+        for version in sorted(v for v in MIGRATIONS if v > current):
+            try:
+                conn.execute("BEGIN")
+                for statement in MIGRATIONS[version]:
+                    conn.execute(statement)
+                conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Migration to schema v{version} failed: {e}") from e
+            logger.info(
+                "Schema migrated",
+                extra={"context": {"from": current, "to": version, "path": self.db_path}},
+            )
+            current = version
+
+    def _sync_archive_schema(self) -> str:
+        """Make archive.activities mirror the live activities table.
+
+        Creates the archive table on first use and adds any columns later
+        migrations gave the live table. Ids are copied, not generated.
+
+        Returns:
+            Comma-separated column list shared by both tables
+        """
+        if self._archive_columns is not None:
+            return self._archive_columns
+
+        conn = self._get_connection()
+        live = conn.execute("PRAGMA main.table_info(activities)").fetchall()
+        archived = {row["name"] for row in conn.execute("PRAGMA archive.table_info(activities)")}
+        try:
+            if not archived:
+                definitions = []
+                for row in live:
+                    if row["name"] == "id":
+                        definitions.append("id INTEGER PRIMARY KEY")
+                        continue
+                    definition = f"{row['name']} {row['type']}"
+                    if row["notnull"]:
+                        definition += " NOT NULL"
+                    if row["dflt_value"] is not None:
+                        definition += f" DEFAULT {row['dflt_value']}"
+                    definitions.append(definition)
+                conn.execute(f"CREATE TABLE archive.activities ({', '.join(definitions)})")
+                conn.execute(
+                    """CREATE INDEX archive.idx_activities_prospect_created
+                       ON activities(prospect_id, created_at)"""
+                )
+                conn.execute("CREATE INDEX archive.idx_activities_date ON activities(created_at)")
+            else:
+                for row in live:
+                    if row["name"] not in archived:
+                        conn.execute(
+                            f"ALTER TABLE archive.activities ADD COLUMN {row['name']} {row['type']}"
+                        )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Cannot prepare activity archive: {e}") from e
+
+        if self.archive_path != ":memory:" and Path(self.archive_path).exists():
+            from src.core.security import restrict_permissions
+
+            restrict_permissions(Path(self.archive_path))
+
+        self._archive_columns = ", ".join(row["name"] for row in live)
+        return self._archive_columns
+
     def _get_schema_ddl(self) -> str:
         """Return complete schema DDL."""
         return """
@@ -367,6 +1101,9 @@ class Database:
         dead_val = row["dead_reason"]
         dead_reason = DeadReason(dead_val) if dead_val else None
 
+        last_type_val = row["last_activity_type"]
+        last_activity_type = ActivityType(last_type_val) if last_type_val else None
+
         return Prospect(
             id=row["id"],
             company_id=row["company_id"],
@@ -391,11 +1128,13 @@ class Database:
             lost_date=row["lost_date"],
             deal_value=row["deal_value"],
             close_date=row["close_date"],
-            close_notes=row["close_notes"],
+            close_notes=decompress_text(row["close_notes"]),
             notes=row["notes"],
-            custom_fields=row["custom_fields"],
+            custom_fields=decompress_text(row["custom_fields"]),
             created_at=row["created_at"],
             updated_at=row["updated_at"],
+            last_activity_at=_parse_timestamp(row["last_activity_at"]),
+            last_activity_type=last_activity_type,
         )
 
     def _row_to_contact_method(self, row: sqlite3.Row) -> ContactMethod:
@@ -415,6 +1154,19 @@ class Database:
             created_at=row["created_at"],
         )
 
+    def _row_to_intel_nugget(self, row: sqlite3.Row) -> IntelNugget:
+        """Convert a database row to an IntelNugget dataclass."""
+        return IntelNugget(
+            id=row["id"],
+            prospect_id=row["prospect_id"],
+            category=(
+                IntelCategory(row["category"]) if row["category"] else IntelCategory.KEY_FACT
+            ),
+            content=row["content"],
+            source_activity_id=row["source_activity_id"],
+            extracted_date=row["extracted_date"],
+        )
+
     def _row_to_activity(self, row: sqlite3.Row) -> Activity:
         """Convert a database row to an Activity dataclass."""
         activity_type = (
@@ -442,12 +1194,14 @@ class Database:
             stage_before=stage_before,
             stage_after=stage_after,
             email_subject=row["email_subject"],
-            email_body=row["email_body"],
+            email_body=decompress_text(row["email_body"]),
             follow_up_set=row["follow_up_set"],
             attempt_type=attempt_type,
             notes=row["notes"],
             created_by=row["created_by"] or "user",
             created_at=row["created_at"],
+            message_id=row["message_id"],
+            message_source=row["message_source"],
         )
 
     # =========================================================================
@@ -605,9 +1359,9 @@ class Database:
                     prospect.lost_date,
                     prospect.deal_value,
                     prospect.close_date,
-                    prospect.close_notes,
+                    self._encode_text(prospect.close_notes),
                     prospect.notes,
-                    prospect.custom_fields,
+                    self._encode_text(prospect.custom_fields),
                 ),
             )
             conn.commit()
@@ -630,23 +1384,80 @@ class Database:
         return self._row_to_prospect(row)
 
     def get_prospect_full(self, prospect_id: int) -> Optional[ProspectFull]:
-        """Get prospect with company, contact methods, activities."""
-        prospect = self.get_prospect(prospect_id)
-        if prospect is None:
-            return None
+        """Get prospect with company, contact methods, activities, tags and intel."""
+        return self.get_prospect_full_many([prospect_id]).get(prospect_id)
 
-        company = self.get_company(prospect.company_id) if prospect.company_id else None
-        contact_methods = self.get_contact_methods(prospect_id)
-        activities = self.get_activities(prospect_id)
-        tags = self.get_tags(prospect_id)
-
-        return ProspectFull(
-            prospect=prospect,
-            company=company,
-            contact_methods=contact_methods,
-            activities=activities,
-            tags=tags,
-        )
+    def get_prospect_full_many(
+        self, prospect_ids: list[int], activity_limit: int = 50
+    ) -> dict[int, ProspectFull]:
+        """Load ProspectFull for many prospects in a fixed number of queries.
+
+        One query per related table regardless of how many ids are passed;
+        activities are cut to the ``activity_limit`` most recent per prospect.
+
+        Returns:
+            Mapping of prospect id to ProspectFull. Unknown ids are omitted.
+        """
+        if not prospect_ids:
+            return {}
+
+        conn = self._get_connection()
+        ids_json = json.dumps(list(dict.fromkeys(prospect_ids)))
+        id_filter = "IN (SELECT value FROM json_each(?))"
+
+        result: dict[int, ProspectFull] = {}
+        for row in conn.execute(f"SELECT * FROM prospects WHERE id {id_filter}", (ids_json,)):
+            prospect = self._row_to_prospect(row)
+            result[row["id"]] = ProspectFull(prospect=prospect)
+        if not result:
+            return {}
+
+        companies = {
+            row["id"]: self._row_to_company(row)
+            for row in conn.execute(
+                f"""SELECT * FROM companies WHERE id IN
+                    (SELECT company_id FROM prospects WHERE id {id_filter})""",
+                (ids_json,),
+            )
+        }
+        for full in result.values():
+            full.company = companies.get(full.prospect.company_id)
+
+        for row in conn.execute(
+            f"""SELECT * FROM contact_methods WHERE prospect_id {id_filter}
+                ORDER BY prospect_id, is_primary DESC, id ASC""",
+            (ids_json,),
+        ):
+            result[row["prospect_id"]].contact_methods.append(self._row_to_contact_method(row))
+
+        if activity_limit > 0:
+            for row in conn.execute(
+                f"""SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY prospect_id ORDER BY created_at DESC, id DESC
+                        ) AS recent_rank
+                        FROM activities WHERE prospect_id {id_filter}
+                    ) WHERE recent_rank <= ?
+                    ORDER BY prospect_id, recent_rank""",
+                (ids_json, activity_limit),
+            ):
+                result[row["prospect_id"]].activities.append(self._row_to_activity(row))
+
+        for row in conn.execute(
+            f"""SELECT prospect_id, tag_name FROM prospect_tags WHERE prospect_id {id_filter}
+                ORDER BY prospect_id, tag_name""",
+            (ids_json,),
+        ):
+            result[row["prospect_id"]].tags.append(row["tag_name"])
+
+        for row in conn.execute(
+            f"""SELECT * FROM intel_nuggets WHERE prospect_id {id_filter}
+                ORDER BY prospect_id, extracted_date DESC""",
+            (ids_json,),
+        ):
+            result[row["prospect_id"]].intel_nuggets.append(self._row_to_intel_nugget(row))
+
+        return result
 
     def update_prospect(self, prospect: Prospect) -> bool:
         """Update prospect. Returns True if updated."""
@@ -698,9 +1509,9 @@ class Database:
                     prospect.lost_date,
                     prospect.deal_value,
                     prospect.close_date,
-                    prospect.close_notes,
+                    self._encode_text(prospect.close_notes),
                     prospect.notes,
-                    prospect.custom_fields,
+                    self._encode_text(prospect.custom_fields),
                     prospect.id,
                 ),
             )
@@ -736,6 +1547,7 @@ class Database:
             "created_at",
             "updated_at",
             "follow_up_date",
+            "last_activity_at",
             "attempt_count",
             "data_confidence",
         }
@@ -768,9 +1580,14 @@ class Database:
             params.append(score_max)
 
         if search_query:
-            conditions.append("(p.first_name LIKE ? OR p.last_name LIKE ? OR c.name LIKE ?)")
-            pattern = f"%{search_query}%"
-            params.extend([pattern, pattern, pattern])
+            match = _fts_query(search_query, _NAME_SEARCH_COLUMNS)
+            if match is None:
+                conditions.append("0")
+            else:
+                conditions.append(
+                    "p.id IN (SELECT rowid FROM prospect_search WHERE prospect_search MATCH ?)"
+                )
+                params.append(match)
 
         if tags:
             placeholders = ",".join("?" for _ in tags)
@@ -800,21 +1617,217 @@ class Database:
         rows = conn.execute(query, params).fetchall()
         return [self._row_to_prospect(row) for row in rows]
 
+    def iter_prospects(
+        self,
+        populations: Optional[list[Population]] = None,
+        company_id: Optional[int] = None,
+        exclude_populations: Optional[list[Population]] = None,
+        sort_by: str = "id",
+        sort_dir: str = "ASC",
+        batch_size: int = 1000,
+        prospect_ids: Optional[Iterable[int]] = None,
+    ) -> Iterator[list[Prospect]]:
+        """Stream matching prospects in batches of at most ``batch_size``.
+
+        Pages with a keyset on (sort column, id) rather than LIMIT/OFFSET, so
+        each batch is an index seek and the whole table can be walked with
+        bounded memory. Rows updated between batches are neither skipped nor
+        repeated as long as the sort column itself is not changed.
+        ``prospect_ids`` restricts the walk to those prospects.
+        """
+        allowed_sort_cols = {
+            "id",
+            "prospect_score",
+            "created_at",
+            "updated_at",
+            "follow_up_date",
+            "last_activity_at",
+        }
+        if sort_by not in allowed_sort_cols:
+            sort_by = "id"
+        descending = sort_dir.upper() == "DESC"
+
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if populations:
+            placeholders = ",".join("?" for _ in populations)
+            conditions.append(f"population IN ({placeholders})")
+            params.extend(p.value for p in populations)
+
+        if company_id is not None:
+            conditions.append("company_id = ?")
+            params.append(company_id)
+
+        if exclude_populations:
+            placeholders = ",".join("?" for _ in exclude_populations)
+            conditions.append(f"population NOT IN ({placeholders})")
+            params.extend(p.value for p in exclude_populations)
+
+        if prospect_ids is not None:
+            conditions.append("id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(prospect_ids)))
+
+        direction = "DESC" if descending else "ASC"
+        order_by = "id" if sort_by == "id" else f"{sort_by} {direction}, id"
+        conn = self._get_connection()
+        last: Optional[sqlite3.Row] = None
+
+        while True:
+            page_conditions = list(conditions)
+            page_params = list(params)
+            if last is not None:
+                seek, seek_params = self._keyset_condition(sort_by, descending, last)
+                page_conditions.append(seek)
+                page_params.extend(seek_params)
+
+            where_clause = f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ""
+            rows = conn.execute(
+                f"""SELECT * FROM prospects {where_clause}
+                    ORDER BY {order_by} {direction} LIMIT ?""",
+                [*page_params, batch_size],
+            ).fetchall()
+            if not rows:
+                return
+            yield [self._row_to_prospect(row) for row in rows]
+            if len(rows) < batch_size:
+                return
+            last = rows[-1]
+
+    @staticmethod
+    def _keyset_condition(
+        sort_by: str, descending: bool, last: sqlite3.Row
+    ) -> tuple[str, list[Any]]:
+        """WHERE fragment selecting rows after ``last`` in (sort_by, id) order.
+
+        SQLite sorts NULLs first ascending and last descending.
+        """
+        op = "<" if descending else ">"
+        if sort_by == "id":
+            return f"id {op} ?", [last["id"]]
+        value = last[sort_by]
+        if value is None:
+            if descending:
+                return f"({sort_by} IS NULL AND id < ?)", [last["id"]]
+            return f"(({sort_by} IS NULL AND id > ?) OR {sort_by} IS NOT NULL)", [last["id"]]
+        condition = f"({sort_by} {op} ? OR ({sort_by} = ? AND id {op} ?)"
+        if descending:
+            condition += f" OR {sort_by} IS NULL"
+        return condition + ")", [value, value, last["id"]]
+
+    def search(
+        self,
+        query: str,
+        population: Optional[Population] = None,
+        exclude_populations: Optional[list[Population]] = None,
+        limit: int = 50,
+    ) -> list[Prospect]:
+        """Full-text search over prospects, best match first.
+
+        Every word in ``query`` must match the start of a word in the
+        prospect's name, title, company name, notes or intel nuggets.
+        Name and company hits rank above notes; ties go to higher score.
+        """
+        match = _fts_query(query)
+        if match is None:
+            return []
+
+        conditions = ["prospect_search MATCH ?"]
+        params: list[Any] = [match]
+
+        if population is not None:
+            conditions.append("p.population = ?")
+            params.append(population.value)
+
+        if exclude_populations:
+            placeholders = ",".join("?" for _ in exclude_populations)
+            conditions.append(f"p.population NOT IN ({placeholders})")
+            params.extend(p.value for p in exclude_populations)
+
+        params.append(limit)
+        conn = self._get_connection()
+        rows = conn.execute(
+            f"""SELECT p.* FROM prospect_search
+                JOIN prospects p ON p.id = prospect_search.rowid
+                WHERE {" AND ".join(conditions)}
+                ORDER BY bm25(prospect_search, {_SEARCH_WEIGHTS}), p.prospect_score DESC, p.id
+                LIMIT ?""",
+            params,
+        ).fetchall()
+        return [self._row_to_prospect(row) for row in rows]
+
     def get_population_counts(self) -> dict[Population, int]:
         """Return count of prospects in each population."""
         conn = self._get_connection()
         rows = conn.execute(
-            "SELECT population, COUNT(*) as cnt FROM prospects GROUP BY population"
+            """SELECT bucket, value FROM pipeline_counters
+               WHERE metric = 'population' AND day = '' AND value != 0"""
         ).fetchall()
         counts: dict[Population, int] = {}
         for row in rows:
             try:
-                pop = Population(row["population"])
-                counts[pop] = row["cnt"]
+                counts[Population(row["bucket"])] = row["value"]
             except ValueError:
                 pass
         return counts
 
+    def get_pipeline_counters(self, today: Optional[date] = None) -> PipelineCounters:
+        """Return the headline pipeline numbers from pipeline_counters.
+
+        One indexed read of the trigger-maintained counters; cost does not
+        grow with the number of prospects or activities.
+
+        Args:
+            today: Day to report on (defaults to today)
+        """
+        day = (today or date.today()).isoformat()
+        conn = self._get_connection()
+        rows = conn.execute(
+            """SELECT metric, day, bucket, value FROM pipeline_counters
+               WHERE metric = 'population' AND day = '' AND value != 0
+               UNION ALL
+               SELECT metric, day, bucket, value FROM pipeline_counters
+               WHERE metric = 'follow_up' AND day <= ? AND value != 0
+               UNION ALL
+               SELECT metric, day, bucket, value FROM pipeline_counters
+               WHERE metric IN ('demo', 'activity', 'worked') AND day = ? AND value != 0""",
+            (day, day),
+        ).fetchall()
+
+        counters = PipelineCounters()
+        excluded = {Population.DEAD_DNC.value, Population.CLOSED_WON.value, Population.LOST.value}
+        for row in rows:
+            metric, bucket, value = row["metric"], row["bucket"], row["value"]
+            try:
+                if metric == "population":
+                    counters.population_counts[Population(bucket)] = value
+                elif metric == "follow_up" and row["day"] < day:
+                    if bucket not in excluded:
+                        counters.overdue += value
+                elif metric == "follow_up":
+                    counters.follow_ups_today[Population(bucket)] = value
+                elif metric == "demo" and bucket == Population.ENGAGED.value:
+                    counters.demos_today = value
+                elif metric == "activity":
+                    counters.activities_today[ActivityType(bucket)] = value
+                elif metric == "worked":
+                    counters.worked_today = value
+            except ValueError:
+                pass
+        return counters
+
+    def rebuild_pipeline_counters(self) -> None:
+        """Recompute pipeline_counters from prospects and activities.
+
+        The triggers keep the counters exact; this is for repair after
+        writes that bypassed them (e.g. restoring rows with triggers off).
+        """
+        with self.transaction():
+            conn = self._get_connection()
+            conn.execute("DELETE FROM pipeline_counters")
+            for statement in _COUNTER_BACKFILL_SQL:
+                conn.execute(statement)
+
     # =========================================================================
     # CONTACT METHOD OPERATIONS
     # =========================================================================
@@ -826,8 +1839,8 @@ class Database:
             cursor = conn.execute(
                 """INSERT INTO contact_methods
                    (prospect_id, type, value, label, is_primary, is_verified,
-                    verified_date, confidence_score, is_suspect, source)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    verified_date, confidence_score, is_suspect, source, phone_normalized)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     method.prospect_id,
                     (
@@ -843,6 +1856,7 @@ class Database:
                     method.confidence_score,
                     1 if method.is_suspect else 0,
                     method.source,
+                    _phone_key(method.type, method.value),
                 ),
             )
             conn.commit()
@@ -869,7 +1883,8 @@ class Database:
             cursor = conn.execute(
                 """UPDATE contact_methods SET
                    type = ?, value = ?, label = ?, is_primary = ?, is_verified = ?,
-                   verified_date = ?, confidence_score = ?, is_suspect = ?, source = ?
+                   verified_date = ?, confidence_score = ?, is_suspect = ?, source = ?,
+                   phone_normalized = ?
                    WHERE id = ?""",
                 (
                     (
@@ -885,6 +1900,7 @@ class Database:
                     method.confidence_score,
                     1 if method.is_suspect else 0,
                     method.source,
+                    _phone_key(method.type, method.value),
                     method.id,
                 ),
             )
@@ -908,42 +1924,54 @@ class Database:
     def find_prospect_by_phone(self, phone: str) -> Optional[int]:
         """Find prospect ID by phone (normalized 10-digit US match).
 
-        Strips non-digit characters and US country code prefix from both
-        the input and stored values before comparing.
+        Strips non-digit characters and US country code prefix from the
+        input and looks it up against the indexed ``phone_normalized`` key.
         """
-        conn = self._get_connection()
-        # Normalize input to digits, strip US country code
-        digits = "".join(c for c in phone if c.isdigit())
+        digits = normalize_phone(phone)
         if not digits:
             return None
-        if len(digits) == 11 and digits.startswith("1"):
-            digits = digits[1:]
-        # SQLite doesn't have a regex replace, so we fetch phone methods and compare in Python
-        rows = conn.execute(
-            "SELECT prospect_id, value FROM contact_methods WHERE type = 'phone'"
-        ).fetchall()
-        for row in rows:
-            stored_digits = "".join(c for c in row["value"] if c.isdigit())
-            if len(stored_digits) == 11 and stored_digits.startswith("1"):
-                stored_digits = stored_digits[1:]
-            if stored_digits == digits:
-                return int(row["prospect_id"])
-        return None
+        conn = self._get_connection()
+        row = conn.execute(
+            """SELECT prospect_id FROM contact_methods
+               WHERE type = 'phone' AND phone_normalized = ?
+               ORDER BY id LIMIT 1""",
+            (digits,),
+        ).fetchone()
+        if row is None:
+            return None
+        return int(row["prospect_id"])
 
     def is_dnc(self, email: Optional[str] = None, phone: Optional[str] = None) -> bool:
-        """Check if email or phone belongs to a DNC prospect."""
+        """Check if email or phone belongs to a DNC prospect.
+
+        Any DNC prospect sharing the email or phone blocks, even when a
+        non-DNC prospect carries the same value.
+        """
+        conn = self._get_connection()
         if email:
-            prospect_id = self.find_prospect_by_email(email)
-            if prospect_id is not None:
-                prospect = self.get_prospect(prospect_id)
-                if prospect and prospect.population == Population.DEAD_DNC:
-                    return True
+            row = conn.execute(
+                """SELECT 1 FROM contact_methods cm
+                   JOIN prospects p ON p.id = cm.prospect_id
+                   WHERE cm.type = 'email' AND LOWER(cm.value) = LOWER(?)
+                   AND p.population = ?
+                   LIMIT 1""",
+                (email, Population.DEAD_DNC.value),
+            ).fetchone()
+            if row is not None:
+                return True
 
         if phone:
-            prospect_id = self.find_prospect_by_phone(phone)
-            if prospect_id is not None:
-                prospect = self.get_prospect(prospect_id)
-                if prospect and prospect.population == Population.DEAD_DNC:
+            digits = normalize_phone(phone)
+            if digits:
+                row = conn.execute(
+                    """SELECT 1 FROM contact_methods cm
+                       JOIN prospects p ON p.id = cm.prospect_id
+                       WHERE cm.type = 'phone' AND cm.phone_normalized = ?
+                       AND p.population = ?
+                       LIMIT 1""",
+                    (digits, Population.DEAD_DNC.value),
+                ).fetchone()
+                if row is not None:
                     return True
 
         return False
@@ -956,49 +1984,271 @@ class Database:
         """Log an activity."""
         conn = self._get_connection()
         try:
-            cursor = conn.execute(
-                """INSERT INTO activities
-                   (prospect_id, activity_type, outcome, call_duration_seconds,
-                    population_before, population_after, stage_before, stage_after,
-                    email_subject, email_body, follow_up_set, attempt_type,
-                    notes, created_by)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    activity.prospect_id,
-                    (
-                        activity.activity_type.value
-                        if isinstance(activity.activity_type, ActivityType)
-                        else activity.activity_type
-                    ),
-                    activity.outcome.value if activity.outcome else None,
-                    activity.call_duration_seconds,
-                    activity.population_before.value if activity.population_before else None,
-                    activity.population_after.value if activity.population_after else None,
-                    activity.stage_before.value if activity.stage_before else None,
-                    activity.stage_after.value if activity.stage_after else None,
-                    activity.email_subject,
-                    activity.email_body,
-                    activity.follow_up_set,
-                    activity.attempt_type.value if activity.attempt_type else None,
-                    activity.notes,
-                    activity.created_by,
-                ),
-            )
+            cursor = self._insert_activity(conn, activity)
             conn.commit()
             return self._lastrowid(cursor)
         except sqlite3.Error as e:
             conn.rollback()
             raise DatabaseError(f"Failed to create activity: {e}") from e
 
-    def get_activities(self, prospect_id: int, limit: int = 50) -> list[Activity]:
-        """Get activities for prospect, most recent first."""
+    def create_activity_once(self, activity: Activity) -> Optional[int]:
+        """Log an activity unless its external message is already recorded.
+
+        Activities carrying a ``message_id`` are unique per (message_id,
+        message_source, activity_type, prospect_id); a repeat is skipped by
+        the unique index instead of a lookup.
+
+        Returns:
+            New activity ID, or None if the message was already logged
+        """
+        if not activity.message_id:
+            return self.create_activity(activity)
+        conn = self._get_connection()
+        try:
+            cursor = self._insert_activity(conn, activity, or_ignore=True)
+            conn.commit()
+            return self._lastrowid(cursor) if cursor.rowcount else None
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to create activity: {e}") from e
+
+    def _insert_activity(
+        self, conn: RoutedConnection, activity: Activity, or_ignore: bool = False
+    ) -> sqlite3.Cursor:
+        """Execute the INSERT for one activity row."""
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        return conn.execute(
+            f"""{verb} INTO activities
+               (prospect_id, activity_type, outcome, call_duration_seconds,
+                population_before, population_after, stage_before, stage_after,
+                email_subject, email_body, follow_up_set, attempt_type,
+                notes, created_by, message_id, message_source)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                activity.prospect_id,
+                (
+                    activity.activity_type.value
+                    if isinstance(activity.activity_type, ActivityType)
+                    else activity.activity_type
+                ),
+                activity.outcome.value if activity.outcome else None,
+                activity.call_duration_seconds,
+                activity.population_before.value if activity.population_before else None,
+                activity.population_after.value if activity.population_after else None,
+                activity.stage_before.value if activity.stage_before else None,
+                activity.stage_after.value if activity.stage_after else None,
+                activity.email_subject,
+                self._encode_text(activity.email_body),
+                activity.follow_up_set,
+                activity.attempt_type.value if activity.attempt_type else None,
+                activity.notes,
+                activity.created_by,
+                activity.message_id,
+                activity.message_source,
+            ),
+        )
+
+    def get_message_activity(
+        self, message_id: str, message_source: str, activity_type: ActivityType
+    ) -> Optional[Activity]:
+        """Get the first activity logged for an external message, if any."""
+        conn = self._get_connection()
+        row = conn.execute(
+            """SELECT * FROM activities
+               WHERE message_id = ? AND message_source = ? AND activity_type = ?
+               ORDER BY id LIMIT 1""",
+            (message_id, message_source, activity_type.value),
+        ).fetchone()
+        return self._row_to_activity(row) if row else None
+
+    def get_activities(
+        self, prospect_id: int, limit: int = 50, include_archived: bool = False
+    ) -> list[Activity]:
+        """Get activities for prospect, most recent first.
+
+        Args:
+            prospect_id: Prospect whose activities to load
+            limit: Maximum activities returned
+            include_archived: Also read activities moved out by archive_activities()
+        """
         conn = self._get_connection()
         rows = conn.execute(
-            "SELECT * FROM activities WHERE prospect_id = ? ORDER BY created_at DESC LIMIT ?",
+            f"""SELECT * FROM {self.activity_source(include_archived)}
+                WHERE prospect_id = ? ORDER BY created_at DESC, id DESC LIMIT ?""",
             (prospect_id, limit),
         ).fetchall()
         return [self._row_to_activity(row) for row in rows]
 
+    def reencode_text_columns(
+        self, batch_size: int = REENCODE_BATCH_SIZE, vacuum: bool = True
+    ) -> int:
+        """Rewrite COMPRESSED_COLUMNS in the storage form compress_text selects.
+
+        With compression on, plain values long enough to shrink are
+        compressed; with it off, compressed values are expanded back to
+        TEXT. Rows already in the target form are skipped in SQL, so a
+        repeat run only touches rows written since. Archived activities
+        are included. Each batch is one transaction.
+
+        Args:
+            batch_size: Rows rewritten per transaction
+            vacuum: VACUUM both files afterwards so the freed pages leave
+                the file (and the next backup) instead of sitting on the freelist
+
+        Returns:
+            Number of rows rewritten
+        """
+        self._sync_archive_schema()
+        conn = self._get_connection()
+        tables = [
+            ("prospects", COMPRESSED_COLUMNS["prospects"]),
+            ("main.activities", COMPRESSED_COLUMNS["activities"]),
+            ("archive.activities", COMPRESSED_COLUMNS["activities"]),
+        ]
+        rewritten = 0
+        try:
+            for table, columns in tables:
+                if self.compress_text:
+                    pending = " OR ".join(
+                        f"(typeof({c}) = 'text' AND length(CAST({c} AS BLOB)) >= ?)"
+                        for c in columns
+                    )
+                    pending_params: tuple[Any, ...] = (MIN_COMPRESS_BYTES,) * len(columns)
+                else:
+                    pending = " OR ".join(f"typeof({c}) = 'blob'" for c in columns)
+                    pending_params = ()
+                assignments = ", ".join(f"{c} = ?" for c in columns)
+                last_id = 0
+                while True:
+                    with self.transaction():
+                        rows = conn.execute(
+                            f"""SELECT id, {', '.join(columns)} FROM {table}
+                                WHERE id > ? AND ({pending}) ORDER BY id LIMIT ?""",
+                            (last_id, *pending_params, batch_size),
+                        ).fetchall()
+                        if not rows:
+                            break
+                        updates = []
+                        for row in rows:
+                            stored = [row[c] for c in columns]
+                            encoded = [self._encode_text(decompress_text(v)) for v in stored]
+                            if encoded != stored:
+                                updates.append((*encoded, row["id"]))
+                        mark = self._change_log_seq(conn)
+                        conn.executemany(f"UPDATE {table} SET {assignments} WHERE id = ?", updates)
+                        # Same text in another storage form is not a change
+                        conn.execute("DELETE FROM change_log WHERE seq > ?", (mark,))
+                    rewritten += len(updates)
+                    last_id = rows[-1]["id"]
+            if rewritten and vacuum:
+                conn.execute("VACUUM main")
+                conn.execute("VACUUM archive")
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to re-encode text columns: {e}") from e
+
+        logger.info(
+            "Text columns re-encoded",
+            extra={"context": {"rewritten": rewritten, "compressed": self.compress_text}},
+        )
+        return rewritten
+
+    def activity_source(self, include_archived: bool = False) -> str:
+        """Return the FROM target for reading activities.
+
+        The live ``activities`` table holds recent history. Reports that
+        need the full history use the returned subquery instead, which
+        adds the rows archive_activities() moved out. Filters on the outer
+        query are pushed into both halves, so their indexes still apply.
+
+        Usage:
+            source = db.activity_source(include_archived=True)
+            conn.execute(f"SELECT COUNT(*) FROM {source} WHERE activity_type = ?", ...)
+        """
+        if not include_archived:
+            return "activities"
+        columns = self._sync_archive_schema()
+        return (
+            f"(SELECT {columns} FROM main.activities "
+            f"UNION ALL SELECT {columns} FROM archive.activities)"
+        )
+
+    def archive_activities(
+        self,
+        older_than_days: int,
+        today: Optional[date] = None,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+    ) -> int:
+        """Move activities older than the horizon into the archive database.
+
+        Rows keep their ids. Two kinds of old activity stay live: each
+        prospect's latest one, so prospects.last_activity_* keeps its value,
+        and any an intel nugget points at, for the foreign key. Deleting the
+        live rows fires the pipeline counter triggers, so per-day activity
+        counts for archived days go down; today's counts are untouched.
+
+        Each batch is one transaction. With WAL a commit is atomic per file
+        only, so a crash can leave a batch in both files; the next run skips
+        rows already archived and finishes deleting them.
+
+        Args:
+            older_than_days: Archive activities created before this many days ago
+            today: Reference date for the horizon (defaults to today)
+            batch_size: Activities moved per transaction
+
+        Returns:
+            Number of activities archived
+        """
+        if older_than_days < 1:
+            raise ValueError("older_than_days must be at least 1")
+
+        cutoff = ((today or date.today()) - timedelta(days=older_than_days)).isoformat()
+        columns = self._sync_archive_schema()
+        conn = self._get_connection()
+        archived = 0
+        last_id = 0
+        try:
+            while True:
+                with self.transaction():
+                    ids = [
+                        row[0]
+                        for row in conn.execute(
+                            """SELECT a.id FROM activities a
+                               WHERE a.id > ? AND a.created_at < DATE(?)
+                                 AND EXISTS (
+                                     SELECT 1 FROM activities b
+                                     WHERE b.prospect_id = a.prospect_id
+                                       AND (b.created_at > a.created_at
+                                            OR (b.created_at = a.created_at AND b.id > a.id)))
+                                 AND NOT EXISTS (
+                                     SELECT 1 FROM intel_nuggets n
+                                     WHERE n.source_activity_id = a.id)
+                               ORDER BY a.id LIMIT ?""",
+                            (last_id, cutoff, batch_size),
+                        )
+                    ]
+                    if not ids:
+                        break
+                    placeholders = ",".join("?" for _ in ids)
+                    mark = self._change_log_seq(conn)
+                    conn.execute(
+                        f"""INSERT OR IGNORE INTO archive.activities ({columns})
+                            SELECT {columns} FROM main.activities WHERE id IN ({placeholders})""",
+                        ids,
+                    )
+                    conn.execute(f"DELETE FROM main.activities WHERE id IN ({placeholders})", ids)
+                    # Archived rows are still history; keep the move out of change_log
+                    conn.execute("DELETE FROM change_log WHERE seq > ?", (mark,))
+                archived += len(ids)
+                last_id = ids[-1]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to archive activities: {e}") from e
+
+        logger.info(
+            "Activities archived",
+            extra={"context": {"archived": archived, "cutoff": cutoff, "path": self.archive_path}},
+        )
+        return archived
+
     # =========================================================================
     # REMAINING TABLE OPERATIONS
     # =========================================================================
@@ -1058,6 +2308,366 @@ class Database:
         ).fetchone()
         return dict(row) if row else None
 
+    # =========================================================================
+    # CHANGE LOG
+    # =========================================================================
+
+    @staticmethod
+    def _change_log_seq(conn: RoutedConnection) -> int:
+        """Return the last seq issued to change_log (pruning does not lower it)."""
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+        return int(row[0]) if row else 0
+
+    def read_changes(
+        self,
+        consumer: str,
+        entities: Optional[Iterable[str]] = None,
+        after: Optional[int] = None,
+    ) -> ChangeSet:
+        """Return the changes ``consumer`` has not acknowledged yet.
+
+        Triggers record every insert, update and delete on the logged tables
+        in change_log; each consumer keeps its own watermark in
+        system_metadata. Process the returned set, then call ack_changes().
+        If the consumer fails before acknowledging, the same changes come
+        back on the next read. Writes made while it works land after
+        ``until`` and are read next time, so a row can be seen twice but
+        is never missed.
+
+        Args:
+            consumer: Name the watermark is kept under, e.g. "scoring"
+            entities: Tables to report (defaults to every logged table)
+            after: Read from this change_log seq instead of the watermark,
+                e.g. the ``until`` of an earlier set when resuming part-done work
+
+        Returns:
+            ChangeSet; ``full`` is set when there is no usable watermark
+        """
+        tables = tuple(entities) if entities is not None else tuple(_CHANGE_LOG_TABLES)
+        unknown = set(tables) - set(_CHANGE_LOG_TABLES)
+        if unknown:
+            raise ValueError(f"Not in the change log: {', '.join(sorted(unknown))}")
+
+        conn = self._get_connection()
+        with self.snapshot():
+            watermark = (
+                self.get_system_metadata(_CHANGE_WATERMARK_KEY + consumer)
+                if after is None
+                else str(after)
+            )
+            pruned = int(self.get_system_metadata(_CHANGE_LOG_PRUNED_KEY) or 0)
+            until = self._change_log_seq(conn)
+            since = int(watermark) if watermark is not None else None
+            if since is not None and since < pruned:
+                since = None
+            changes = ChangeSet(consumer=consumer, since=since, until=max(until, since or 0))
+            if since is None:
+                return changes
+
+            placeholders = ",".join("?" for _ in tables)
+            companies: set[int] = set()
+            for row in conn.execute(
+                f"""SELECT entity, entity_id, prospect_id, op FROM change_log
+                    WHERE seq > ? AND seq <= ? AND entity IN ({placeholders})
+                    ORDER BY seq""",
+                (since, until, *tables),
+            ):
+                entity, entity_id = row["entity"], row["entity_id"]
+                if row["op"] == "delete":
+                    changes.changed.get(entity, set()).discard(entity_id)
+                    changes.deleted.setdefault(entity, set()).add(entity_id)
+                else:
+                    changes.deleted.get(entity, set()).discard(entity_id)
+                    changes.changed.setdefault(entity, set()).add(entity_id)
+                if row["prospect_id"] is not None:
+                    changes.prospect_ids.add(row["prospect_id"])
+                elif entity == "companies":
+                    companies.add(entity_id)
+            if companies:
+                changes.prospect_ids.update(
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT id FROM prospects WHERE company_id IN "
+                        "(SELECT value FROM json_each(?))",
+                        (json.dumps(sorted(companies)),),
+                    )
+                )
+
+        changes.changed = {k: v for k, v in changes.changed.items() if v}
+        changes.deleted = {k: v for k, v in changes.deleted.items() if v}
+        return changes
+
+    def ack_changes(self, changes: ChangeSet) -> None:
+        """Record that ``changes.consumer`` has processed everything up to ``changes.until``."""
+        self.upsert_system_metadata(_CHANGE_WATERMARK_KEY + changes.consumer, str(changes.until))
+
+    def prune_change_log(self, retention_days: int = CHANGE_LOG_RETENTION_DAYS) -> int:
+        """Delete change_log rows every consumer has acknowledged.
+
+        Rows older than ``retention_days`` go regardless, so a consumer that
+        stopped running does not keep the log growing; its next read_changes()
+        comes back ``full``. With no consumers registered the log is emptied.
+
+        Returns:
+            Number of rows deleted
+        """
+        conn = self._get_connection()
+        try:
+            with self.transaction():
+                watermarks = [
+                    int(row["value"])
+                    for row in conn.execute(
+                        "SELECT value FROM system_metadata WHERE substr(key, 1, ?) = ?",
+                        (len(_CHANGE_WATERMARK_KEY), _CHANGE_WATERMARK_KEY),
+                    )
+                ]
+                through = min(watermarks) if watermarks else self._change_log_seq(conn)
+                expired = conn.execute(
+                    "SELECT MAX(seq) FROM change_log WHERE changed_at < DATETIME('now', ?)",
+                    (f"-{retention_days} days",),
+                ).fetchone()[0]
+                through = max(through, expired or 0)
+                deleted = conn.execute("DELETE FROM change_log WHERE seq <= ?", (through,)).rowcount
+                pruned = int(self.get_system_metadata(_CHANGE_LOG_PRUNED_KEY) or 0)
+                if deleted and through > pruned:
+                    self.upsert_system_metadata(_CHANGE_LOG_PRUNED_KEY, str(through))
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to prune change log: {e}") from e
+
+        logger.info(
+            "Change log pruned", extra={"context": {"deleted": deleted, "through": through}}
+        )
+        return deleted
+
+    # =========================================================================
+    # NIGHTLY RUNS
+    # =========================================================================
+
+    def start_nightly_run(self, steps: Iterable[str], kind: str = "nightly") -> NightlyRun:
+        """Create a run with every step pending.
+
+        Args:
+            steps: Step names in declaration order
+            kind: Run kind, e.g. "nightly"
+
+        Returns:
+            The new run
+        """
+        conn = self._get_connection()
+        try:
+            with self.transaction():
+                cursor = conn.execute(
+                    "INSERT INTO nightly_runs (kind, status, started_at) VALUES (?, ?, ?)",
+                    (kind, NightlyStatus.RUNNING.value, datetime.now()),
+                )
+                run_id = self._lastrowid(cursor)
+                self._add_nightly_steps(conn, run_id, steps)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to start nightly run: {e}") from e
+        run = self.get_nightly_run(run_id)
+        assert run is not None
+        return run
+
+    def resume_nightly_run(self, run_id: int, steps: Iterable[str]) -> NightlyRun:
+        """Pick an interrupted run up again.
+
+        Bumps ``resumes`` and adds rows for steps declared since the run
+        started. Step states and cursors are left for the runner to act on.
+        """
+        conn = self._get_connection()
+        try:
+            with self.transaction():
+                conn.execute(
+                    "UPDATE nightly_runs SET resumes = resumes + 1 WHERE id = ?", (run_id,)
+                )
+                self._add_nightly_steps(conn, run_id, steps)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to resume nightly run: {e}") from e
+        run = self.get_nightly_run(run_id)
+        if run is None:
+            raise DatabaseError(f"Nightly run {run_id} not found")
+        return run
+
+    @staticmethod
+    def _add_nightly_steps(conn: RoutedConnection, run_id: int, steps: Iterable[str]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO nightly_run_steps (run_id, step, position) VALUES (?, ?, ?)",
+            [(run_id, name, position) for position, name in enumerate(steps)],
+        )
+
+    def update_nightly_step(
+        self,
+        run_id: int,
+        step: str,
+        status: NightlyStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a step state change.
+
+        RUNNING stamps started_at and clears the previous error; DONE and
+        FAILED stamp completed_at. The cursor is kept either way.
+        """
+        conn = self._get_connection()
+        now = datetime.now()
+        completed_at = now if status in (NightlyStatus.DONE, NightlyStatus.FAILED) else None
+        try:
+            if status == NightlyStatus.RUNNING:
+                conn.execute(
+                    """UPDATE nightly_run_steps
+                       SET status = ?, started_at = ?, completed_at = NULL, error = NULL
+                       WHERE run_id = ? AND step = ?""",
+                    (status.value, now, run_id, step),
+                )
+            else:
+                conn.execute(
+                    """UPDATE nightly_run_steps SET status = ?, completed_at = ?, error = ?
+                       WHERE run_id = ? AND step = ?""",
+                    (status.value, completed_at, error, run_id, step),
+                )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to update nightly step: {e}") from e
+
+    def checkpoint_nightly_step(self, run_id: int, step: str, cursor: str) -> None:
+        """Save a long step's progress marker so a resumed run can continue from it."""
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                "UPDATE nightly_run_steps SET cursor = ? WHERE run_id = ? AND step = ?",
+                (cursor, run_id, step),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to checkpoint nightly step: {e}") from e
+
+    def record_nightly_step(self, run_id: int, step: NightlyRunStep) -> None:
+        """Store how a step attempt ended: status, error and its measurements."""
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """UPDATE nightly_run_steps
+                   SET status = ?, completed_at = ?, error = ?, wait_seconds = ?,
+                       duration_seconds = ?, rows_processed = ?, rows_written = ?, api_calls = ?
+                   WHERE run_id = ? AND step = ?""",
+                (
+                    step.status.value,
+                    step.completed_at or datetime.now(),
+                    step.error,
+                    step.wait_seconds,
+                    step.duration_seconds,
+                    step.rows_processed,
+                    step.rows_written,
+                    step.api_calls,
+                    run_id,
+                    step.name,
+                ),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to record nightly step: {e}") from e
+
+    def finish_nightly_run(
+        self,
+        run_id: int,
+        status: NightlyStatus,
+        duration_seconds: Optional[float] = None,
+        peak_rss_kb: Optional[int] = None,
+    ) -> None:
+        """Close a run as DONE, FAILED or ABANDONED.
+
+        ``duration_seconds`` is added to what earlier attempts recorded, so
+        a resumed run reports its total time.
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """UPDATE nightly_runs
+                   SET status = ?, completed_at = ?,
+                       duration_seconds = CASE WHEN ? IS NULL THEN duration_seconds
+                                          ELSE COALESCE(duration_seconds, 0) + ? END,
+                       peak_rss_kb = COALESCE(?, peak_rss_kb)
+                   WHERE id = ?""",
+                (
+                    status.value,
+                    datetime.now(),
+                    duration_seconds,
+                    duration_seconds,
+                    peak_rss_kb,
+                    run_id,
+                ),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to finish nightly run: {e}") from e
+
+    def get_nightly_run(self, run_id: int) -> Optional[NightlyRun]:
+        """Get a run with its step checkpoints."""
+        runs = self._load_nightly_runs("WHERE id = ?", (run_id,))
+        return runs[0] if runs else None
+
+    def get_nightly_runs(self, limit: int = 10, kind: Optional[str] = None) -> list[NightlyRun]:
+        """Get the most recent runs, newest first."""
+        if kind is None:
+            return self._load_nightly_runs("ORDER BY id DESC LIMIT ?", (limit,))
+        return self._load_nightly_runs("WHERE kind = ? ORDER BY id DESC LIMIT ?", (kind, limit))
+
+    def get_unfinished_nightly_run(self, kind: str = "nightly") -> Optional[NightlyRun]:
+        """Get the newest run of ``kind`` still marked RUNNING, if any.
+
+        A run stays RUNNING when its process was killed before the last
+        step finished.
+        """
+        runs = self._load_nightly_runs(
+            "WHERE kind = ? AND status = ? ORDER BY id DESC LIMIT 1",
+            (kind, NightlyStatus.RUNNING.value),
+        )
+        return runs[0] if runs else None
+
+    def _load_nightly_runs(self, clause: str, params: tuple[Any, ...]) -> list[NightlyRun]:
+        conn = self._get_connection()
+        with self.snapshot():
+            runs = [
+                NightlyRun(
+                    id=row["id"],
+                    kind=row["kind"],
+                    status=NightlyStatus(row["status"]),
+                    started_at=_parse_timestamp(row["started_at"]),
+                    completed_at=_parse_timestamp(row["completed_at"]),
+                    resumes=row["resumes"],
+                    duration_seconds=row["duration_seconds"],
+                    peak_rss_kb=row["peak_rss_kb"],
+                )
+                for row in conn.execute(f"SELECT * FROM nightly_runs {clause}", params)
+            ]
+            by_id = {run.id: run for run in runs}
+            if by_id:
+                for row in conn.execute(
+                    """SELECT * FROM nightly_run_steps
+                       WHERE run_id IN (SELECT value FROM json_each(?))
+                       ORDER BY run_id, position""",
+                    (json.dumps(list(by_id)),),
+                ):
+                    by_id[row["run_id"]].steps.append(
+                        NightlyRunStep(
+                            name=row["step"],
+                            status=NightlyStatus(row["status"]),
+                            cursor=row["cursor"],
+                            started_at=_parse_timestamp(row["started_at"]),
+                            completed_at=_parse_timestamp(row["completed_at"]),
+                            error=row["error"],
+                            wait_seconds=row["wait_seconds"],
+                            duration_seconds=row["duration_seconds"],
+                            rows_processed=row["rows_processed"],
+                            rows_written=row["rows_written"],
+                            api_calls=row["api_calls"],
+                        )
+                    )
+        return runs
+
     # =========================================================================
     # SYSTEM METADATA
     # =========================================================================
@@ -1082,13 +2692,16 @@ class Database:
         row = conn.execute("SELECT value FROM system_metadata WHERE key = ?", (key,)).fetchone()
         return row["value"] if row else None
 
-    def get_recent_activities_with_notes(
-        self, since: str, limit: int = 100
+    def get_activities_with_notes_after(
+        self, after_id: int, limit: int = 500
     ) -> list[dict[str, Any]]:
-        """Get recent activities that have meaningful notes.
+        """Get live activities with meaningful notes, in id order after ``after_id``.
+
+        Paging by id walks the primary key, so callers can stream the whole
+        table by passing the last id they saw.
 
         Args:
-            since: ISO datetime string lower-bound for created_at
+            after_id: Return activities with a greater id
             limit: Max rows to return
 
         Returns:
@@ -1098,12 +2711,12 @@ class Database:
         rows = conn.execute(
             """SELECT id, prospect_id, notes, activity_type
                FROM activities
-               WHERE created_at >= ?
+               WHERE id > ?
                AND notes IS NOT NULL
                AND LENGTH(notes) > 20
-               ORDER BY created_at DESC
+               ORDER BY id
                LIMIT ?""",
-            (since, limit),
+            (after_id, limit),
         ).fetchall()
         return [dict(row) for row in rows]
 
@@ -1209,31 +2822,70 @@ class Database:
             )
         return result
 
+    @staticmethod
+    def _intel_nugget_params(nugget: IntelNugget) -> tuple[Any, ...]:
+        category = (
+            nugget.category.value if isinstance(nugget.category, IntelCategory) else nugget.category
+        )
+        return (
+            nugget.prospect_id,
+            category,
+            nugget.content,
+            intel_content_hash(nugget.content),
+            nugget.source_activity_id,
+        )
+
     def create_intel_nugget(self, nugget: IntelNugget) -> int:
-        """Create an intel nugget."""
+        """Create an intel nugget.
+
+        A prospect holds each (category, content) once; creating one it
+        already has returns the existing nugget's id.
+        """
         conn = self._get_connection()
+        params = self._intel_nugget_params(nugget)
         try:
             cursor = conn.execute(
                 """INSERT INTO intel_nuggets
-                   (prospect_id, category, content, source_activity_id)
-                   VALUES (?, ?, ?, ?)""",
-                (
-                    nugget.prospect_id,
-                    (
-                        nugget.category.value
-                        if isinstance(nugget.category, IntelCategory)
-                        else nugget.category
-                    ),
-                    nugget.content,
-                    nugget.source_activity_id,
-                ),
+                   (prospect_id, category, content, content_hash, source_activity_id)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT DO NOTHING""",
+                params,
             )
+            if cursor.rowcount:
+                row_id = self._lastrowid(cursor)
+            else:
+                row_id = conn.execute(
+                    """SELECT id FROM intel_nuggets
+                       WHERE prospect_id = ? AND category = ? AND content_hash = ?""",
+                    params[:2] + params[3:4],
+                ).fetchone()["id"]
             conn.commit()
-            return self._lastrowid(cursor)
+            return row_id
         except sqlite3.Error as e:
             conn.rollback()
             raise DatabaseError(f"Failed to create intel nugget: {e}") from e
 
+    def create_intel_nuggets(self, nuggets: Iterable[IntelNugget]) -> int:
+        """Insert nuggets in one batch, skipping ones their prospect already has.
+
+        Returns:
+            Number of nuggets inserted
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.executemany(
+                """INSERT INTO intel_nuggets
+                   (prospect_id, category, content, content_hash, source_activity_id)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT DO NOTHING""",
+                [self._intel_nugget_params(n) for n in nuggets],
+            )
+            conn.commit()
+            return max(cursor.rowcount, 0)
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to create intel nuggets: {e}") from e
+
     def get_intel_nuggets(self, prospect_id: int) -> list[IntelNugget]:
         """Get intel nuggets for prospect."""
         conn = self._get_connection()
@@ -1241,98 +2893,165 @@ class Database:
             "SELECT * FROM intel_nuggets WHERE prospect_id = ? ORDER BY extracted_date DESC",
             (prospect_id,),
         ).fetchall()
-        result = []
-        for row in rows:
-            result.append(
-                IntelNugget(
-                    id=row["id"],
-                    prospect_id=row["prospect_id"],
-                    category=(
-                        IntelCategory(row["category"])
-                        if row["category"]
-                        else IntelCategory.KEY_FACT
-                    ),
-                    content=row["content"],
-                    source_activity_id=row["source_activity_id"],
-                    extracted_date=row["extracted_date"],
-                )
-            )
-        return result
+        return [self._row_to_intel_nugget(row) for row in rows]
 
     # =========================================================================
     # BULK OPERATIONS
     # =========================================================================
 
-    def bulk_update_population(
+    def _load_bulk_ids(self, conn: RoutedConnection, prospect_ids: list[int]) -> None:
+        """Stage ids in the temp table ``bulk_ids`` (seq keeps input order)."""
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS bulk_ids "
+            "(seq INTEGER PRIMARY KEY, prospect_id INTEGER NOT NULL)"
+        )
+        conn.execute("DELETE FROM temp.bulk_ids")
+        conn.executemany(
+            "INSERT INTO temp.bulk_ids (prospect_id) VALUES (?)", ((pid,) for pid in prospect_ids)
+        )
+
+    def _load_transition_rules(self, conn: RoutedConnection) -> None:
+        """Materialize can_transition() as the temp lookup table ``transition_rules``."""
+        from src.engine.populations import can_transition
+
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS transition_rules "
+            "(from_pop TEXT NOT NULL, to_pop TEXT NOT NULL, PRIMARY KEY (from_pop, to_pop))"
+        )
+        conn.execute("DELETE FROM temp.transition_rules")
+        conn.executemany(
+            "INSERT INTO temp.transition_rules (from_pop, to_pop) VALUES (?, ?)",
+            (
+                (from_pop.value, to_pop.value)
+                for from_pop in Population
+                for to_pop in Population
+                if can_transition(from_pop, to_pop)
+            ),
+        )
+
+    def _bulk_transition(
         self,
         prospect_ids: list[int],
         population: Population,
-        reason: str,
+        notes: str,
+        parked_month: Optional[str] = None,
     ) -> tuple[int, int, int]:
-        """Update population for multiple prospects.
+        """Set-based population move shared by bulk_update_population and bulk_park.
 
-        DNC records are skipped, not modified.
-        Invalid transitions (per population rules) are skipped.
+        Classifies every staged id in one query, then applies one UPDATE and
+        one INSERT ... SELECT for the STATUS_CHANGE activities. Ids are
+        evaluated in input order, so a repeated id sees the population its
+        earlier occurrence moved it to, exactly as a row-by-row loop would.
 
         Returns:
             Tuple of (updated_count, skipped_dnc_count, skipped_invalid_count)
         """
-        from src.engine.populations import can_transition
+        if not prospect_ids:
+            return (0, 0, 0)
 
         conn = self._get_connection()
-        updated = 0
-        skipped_dnc = 0
-        skipped_invalid = 0
-
-        for pid in prospect_ids:
-            prospect = self.get_prospect(pid)
-            if prospect is None:
-                continue
-            if prospect.population == Population.DEAD_DNC:
-                skipped_dnc += 1
-                continue
-
-            old_pop = prospect.population
-            if not can_transition(old_pop, population):
-                skipped_invalid += 1
-                logger.warning(
-                    "Bulk update skipped invalid transition",
-                    extra={
-                        "context": {
-                            "prospect_id": pid,
-                            "from": old_pop.value,
-                            "to": population.value,
-                        }
-                    },
-                )
-                continue
+        dnc = Population.DEAD_DNC.value
+        try:
+            self._load_bulk_ids(conn, prospect_ids)
+            self._load_transition_rules(conn)
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS bulk_plan "
+                "(seq INTEGER PRIMARY KEY, prospect_id INTEGER, pop_before TEXT, action TEXT)"
+            )
+            conn.execute("DELETE FROM temp.bulk_plan")
+            conn.execute(
+                """INSERT INTO temp.bulk_plan (seq, prospect_id, pop_before, action)
+                   SELECT seq, prospect_id,
+                          CASE WHEN occurrence = 1 THEN current ELSE :target END,
+                          CASE
+                              WHEN current = :dnc THEN 'dnc'
+                              WHEN NOT allowed THEN 'invalid'
+                              WHEN occurrence > 1 AND :target = :dnc THEN 'dnc'
+                              ELSE 'update'
+                          END
+                   FROM (
+                       SELECT b.seq, b.prospect_id, p.population AS current,
+                              ROW_NUMBER() OVER (
+                                  PARTITION BY b.prospect_id ORDER BY b.seq
+                              ) AS occurrence,
+                              EXISTS (
+                                  SELECT 1 FROM temp.transition_rules r
+                                  WHERE r.from_pop = p.population AND r.to_pop = :target
+                              ) AS allowed
+                       FROM temp.bulk_ids b
+                       JOIN prospects p ON p.id = b.prospect_id
+                   )""",
+                {"target": population.value, "dnc": dnc},
+            )
 
-            try:
+            if parked_month is None:
                 conn.execute(
-                    "UPDATE prospects SET population = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                    (population.value, pid),
+                    """UPDATE prospects SET population = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE id IN (SELECT prospect_id FROM temp.bulk_plan WHERE action = 'update')""",
+                    (population.value,),
                 )
-                # Log activity for each transition
+            else:
                 conn.execute(
-                    """INSERT INTO activities
-                       (prospect_id, activity_type, population_before, population_after,
-                        notes, created_by)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (
-                        pid,
-                        ActivityType.STATUS_CHANGE.value,
-                        old_pop.value,
-                        population.value,
-                        reason,
-                        "user",
-                    ),
+                    """UPDATE prospects SET
+                       population = ?, parked_month = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE id IN (SELECT prospect_id FROM temp.bulk_plan WHERE action = 'update')""",
+                    (population.value, parked_month),
                 )
-                updated += 1
-            except sqlite3.Error:
-                continue
+            conn.execute(
+                """INSERT INTO activities
+                   (prospect_id, activity_type, population_before, population_after,
+                    notes, created_by)
+                   SELECT prospect_id, ?, pop_before, ?, ?, 'user'
+                   FROM temp.bulk_plan WHERE action = 'update'
+                   ORDER BY seq""",
+                (ActivityType.STATUS_CHANGE.value, population.value, notes),
+            )
+            counts = {
+                row["action"]: row["cnt"]
+                for row in conn.execute(
+                    "SELECT action, COUNT(*) AS cnt FROM temp.bulk_plan GROUP BY action"
+                )
+            }
+            invalid_ids = [
+                row["prospect_id"]
+                for row in conn.execute(
+                    "SELECT DISTINCT prospect_id FROM temp.bulk_plan WHERE action = 'invalid'"
+                )
+            ]
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed bulk population update: {e}") from e
+
+        if invalid_ids:
+            logger.warning(
+                "Bulk update skipped invalid transitions",
+                extra={
+                    "context": {
+                        "prospect_ids": invalid_ids[:50],
+                        "count": len(invalid_ids),
+                        "to": population.value,
+                    }
+                },
+            )
 
-        conn.commit()
-        return (updated, skipped_dnc, skipped_invalid)
+        return (counts.get("update", 0), counts.get("dnc", 0), counts.get("invalid", 0))
+
+    def bulk_update_population(
+        self,
+        prospect_ids: list[int],
+        population: Population,
+        reason: str,
+    ) -> tuple[int, int, int]:
+        """Update population for multiple prospects.
+
+        DNC records are skipped, not modified.
+        Invalid transitions (per population rules) are skipped.
+
+        Returns:
+            Tuple of (updated_count, skipped_dnc_count, skipped_invalid_count)
+        """
+        return self._bulk_transition(prospect_ids, population, reason)
 
     def bulk_set_follow_up(
         self,
@@ -1340,20 +3059,25 @@ class Database:
         follow_up_date: datetime,
     ) -> int:
         """Set follow-up date for multiple prospects."""
+        if not prospect_ids:
+            return 0
         conn = self._get_connection()
-        updated = 0
-        for pid in prospect_ids:
-            try:
-                cursor = conn.execute(
-                    "UPDATE prospects SET follow_up_date = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                    (follow_up_date, pid),
-                )
-                if cursor.rowcount > 0:
-                    updated += 1
-            except sqlite3.Error:
-                continue
-        conn.commit()
-        return updated
+        try:
+            self._load_bulk_ids(conn, prospect_ids)
+            conn.execute(
+                """UPDATE prospects SET follow_up_date = ?, updated_at = CURRENT_TIMESTAMP
+                   WHERE id IN (SELECT prospect_id FROM temp.bulk_ids)""",
+                (follow_up_date,),
+            )
+            row = conn.execute(
+                """SELECT COUNT(*) FROM temp.bulk_ids b
+                   JOIN prospects p ON p.id = b.prospect_id"""
+            ).fetchone()
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed bulk follow-up update: {e}") from e
+        return int(row[0])
 
     def bulk_park(
         self,
@@ -1367,62 +3091,12 @@ class Database:
         Returns:
             Tuple of (parked_count, skipped_dnc_count, skipped_invalid_count)
         """
-        from src.engine.populations import can_transition
-
-        conn = self._get_connection()
-        parked = 0
-        skipped_dnc = 0
-        skipped_invalid = 0
-
-        for pid in prospect_ids:
-            prospect = self.get_prospect(pid)
-            if prospect is None:
-                continue
-            if prospect.population == Population.DEAD_DNC:
-                skipped_dnc += 1
-                continue
-
-            old_pop = prospect.population
-            if not can_transition(old_pop, Population.PARKED):
-                skipped_invalid += 1
-                logger.warning(
-                    "Bulk park skipped invalid transition",
-                    extra={
-                        "context": {
-                            "prospect_id": pid,
-                            "from": old_pop.value,
-                        }
-                    },
-                )
-                continue
-
-            try:
-                conn.execute(
-                    """UPDATE prospects SET
-                       population = ?, parked_month = ?, updated_at = CURRENT_TIMESTAMP
-                       WHERE id = ?""",
-                    (Population.PARKED.value, parked_month, pid),
-                )
-                conn.execute(
-                    """INSERT INTO activities
-                       (prospect_id, activity_type, population_before, population_after,
-                        notes, created_by)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (
-                        pid,
-                        ActivityType.STATUS_CHANGE.value,
-                        old_pop.value,
-                        Population.PARKED.value,
-                        f"Parked until {parked_month}",
-                        "user",
-                    ),
-                )
-                parked += 1
-            except sqlite3.Error:
-                continue
-
-        conn.commit()
-        return (parked, skipped_dnc, skipped_invalid)
+        return self._bulk_transition(
+            prospect_ids,
+            Population.PARKED,
+            f"Parked until {parked_month}",
+            parked_month=parked_month,
+        )
 
     # =========================================================================
     # TAG OPERATIONS
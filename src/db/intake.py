@@ -2,9 +2,11 @@
 
 Provides:
     - Three-pass deduplication (email, fuzzy name+company, phone)
+    - Batch dedup index loaded once per import
     - Hard DNC blocking
     - Completeness assessment
     - Import preview before commit
+    - Chunked bulk commit with progress reporting
 
 Usage:
     from src.db.intake import IntakeFunnel
@@ -15,24 +17,31 @@ Usage:
     result = funnel.commit(preview)
 """
 
+import sqlite3
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import Optional
+from typing import Callable, Optional
 
+from src.core.exceptions import DatabaseError
 from src.core.logging import get_logger
+from src.core.phone import normalize_phone
+from src.db.connection import RoutedConnection
 from src.db.database import Database
 from src.db.models import (
-    ContactMethod,
+    ActivityType,
     ContactMethodType,
     ImportSource,
     Population,
-    Prospect,
     assess_completeness,
     normalize_company_name,
+    timezone_from_state,
 )
 
 logger = get_logger(__name__)
 
+# Progress callback: (records_written, total_records)
+ProgressCallback = Callable[[int, int], None]
+
 
 @dataclass
 class ImportRecord:
@@ -138,6 +147,103 @@ class ImportResult:
     source_id: Optional[int] = None
 
 
+@dataclass
+class DedupIndex:
+    """In-memory snapshot of everything the three dedup passes look at.
+
+    Built once per import so each record is classified with dict lookups
+    instead of several database round trips. Where the database holds more
+    than one candidate, the first by id wins, matching the single-record
+    lookups on Database.
+
+    Attributes:
+        email_to_prospect: Lowercase email -> prospect ID
+        phone_to_prospect: Normalized phone -> prospect ID
+        dnc_emails: Lowercase emails owned by any DNC prospect
+        dnc_phones: Normalized phones owned by any DNC prospect
+        company_prospects: Normalized company name -> [(prospect_id, full name)],
+            best score first, capped at ``max_company_prospects``
+    """
+
+    email_to_prospect: dict[str, int] = field(default_factory=dict)
+    phone_to_prospect: dict[str, int] = field(default_factory=dict)
+    dnc_emails: set[str] = field(default_factory=set)
+    dnc_phones: set[str] = field(default_factory=set)
+    company_prospects: dict[str, list[tuple[int, str]]] = field(default_factory=dict)
+
+    max_company_prospects = 500
+
+    @classmethod
+    def build(cls, db: Database) -> "DedupIndex":
+        """Load the dedup index from the database in three queries."""
+        index = cls()
+        conn = db._get_connection()
+
+        rows = conn.execute(
+            """SELECT cm.prospect_id, cm.type, cm.value, cm.phone_normalized, p.population
+               FROM contact_methods cm
+               JOIN prospects p ON p.id = cm.prospect_id
+               ORDER BY cm.id"""
+        ).fetchall()
+        for row in rows:
+            is_dnc = row["population"] == Population.DEAD_DNC.value
+            if row["type"] == ContactMethodType.EMAIL.value:
+                email = row["value"].lower()
+                index.email_to_prospect.setdefault(email, row["prospect_id"])
+                if is_dnc:
+                    index.dnc_emails.add(email)
+            elif row["type"] == ContactMethodType.PHONE.value and row["phone_normalized"]:
+                phone = row["phone_normalized"]
+                index.phone_to_prospect.setdefault(phone, row["prospect_id"])
+                if is_dnc:
+                    index.dnc_phones.add(phone)
+
+        # Name lookups resolve to the first company with a given normalized name
+        company_names: dict[int, str] = {}
+        for row in conn.execute("SELECT id, name_normalized FROM companies ORDER BY id"):
+            if row["name_normalized"] not in index.company_prospects:
+                index.company_prospects[row["name_normalized"]] = []
+                company_names[row["id"]] = row["name_normalized"]
+
+        rows = conn.execute(
+            """SELECT id, company_id, first_name, last_name FROM prospects
+               ORDER BY company_id, prospect_score DESC, id"""
+        ).fetchall()
+        for row in rows:
+            name_norm = company_names.get(row["company_id"])
+            if name_norm is None:
+                continue
+            members = index.company_prospects[name_norm]
+            if len(members) < cls.max_company_prospects:
+                full_name = f"{row['first_name']} {row['last_name']}".strip()
+                members.append((row["id"], full_name))
+
+        return index
+
+    def is_dnc(self, record: ImportRecord) -> bool:
+        """Check if the record's email or phone belongs to a DNC prospect."""
+        if record.email and record.email.lower() in self.dnc_emails:
+            return True
+        if record.phone and normalize_phone(record.phone) in self.dnc_phones:
+            return True
+        return False
+
+    def match_email(self, email: str) -> Optional[int]:
+        """Return the prospect owning this email (case-insensitive)."""
+        return self.email_to_prospect.get(email.lower())
+
+    def match_phone(self, phone: str) -> Optional[int]:
+        """Return the prospect owning this phone (normalized match)."""
+        digits = normalize_phone(phone)
+        if not digits:
+            return None
+        return self.phone_to_prospect.get(digits)
+
+    def company_members(self, company_name: str) -> list[tuple[int, str]]:
+        """Return (prospect_id, full name) pairs at the named company."""
+        return self.company_prospects.get(normalize_company_name(company_name), [])
+
+
 class IntakeFunnel:
     """Import intake with deduplication and DNC protection.
 
@@ -160,6 +266,7 @@ class IntakeFunnel:
         """
         self.db = db
         self.name_similarity_threshold = 0.85
+        self.commit_chunk_size = 500
 
     def analyze(
         self,
@@ -169,7 +276,8 @@ class IntakeFunnel:
     ) -> ImportPreview:
         """Analyze records for dedup and DNC.
 
-        Does NOT modify database.
+        Does NOT modify database. Existing contacts are loaded once into a
+        DedupIndex and every record is classified against it in memory.
 
         Args:
             records: Import records to analyze
@@ -180,6 +288,10 @@ class IntakeFunnel:
             ImportPreview with categorized records
         """
         preview = ImportPreview(source_name=source_name, filename=filename)
+        if not records:
+            return preview
+
+        index = DedupIndex.build(self.db)
 
         for record in records:
             result = AnalysisResult(record=record)
@@ -191,14 +303,14 @@ class IntakeFunnel:
                 continue
 
             # DNC check FIRST - before anything else
-            if self._check_dnc(record):
+            if index.is_dnc(record):
                 result.status = "blocked_dnc"
                 preview.blocked_dnc.append(result)
                 continue
 
             # Pass 1: Exact email match
             if record.email:
-                matched_id = self._check_email_match(record.email)
+                matched_id = index.match_email(record.email)
                 if matched_id is not None:
                     result.status = "merge"
                     result.matched_prospect_id = matched_id
@@ -210,7 +322,7 @@ class IntakeFunnel:
             # Pass 2: Fuzzy name + company match
             if record.first_name and record.last_name and record.company_name:
                 fuzzy_result = self._check_fuzzy_match(
-                    record.first_name, record.last_name, record.company_name
+                    record.first_name, record.last_name, index.company_members(record.company_name)
                 )
                 if fuzzy_result is not None:
                     matched_id, confidence = fuzzy_result
@@ -223,7 +335,7 @@ class IntakeFunnel:
 
             # Pass 3: Phone match -> needs manual review
             if record.phone:
-                phone_matched_id = self._check_phone_match(record.phone)
+                phone_matched_id = index.match_phone(record.phone)
                 if phone_matched_id is not None:
                     result.status = "needs_review"
                     result.matched_prospect_id = phone_matched_id
@@ -251,164 +363,48 @@ class IntakeFunnel:
 
         return preview
 
-    def commit(self, preview: ImportPreview) -> ImportResult:
+    def commit(
+        self,
+        preview: ImportPreview,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ImportResult:
         """Commit analyzed records to database.
 
         Creates prospects, contact methods, activities, import source.
 
+        Records are written in chunks of ``commit_chunk_size`` with
+        ``executemany``, one transaction per chunk, so other writers get a
+        turn between chunks. If a chunk fails it is rolled back and replayed
+        one record per transaction: records before the failing one are kept
+        and the error is raised, the same outcome as writing record by record.
+
         Args:
             preview: Analyzed import preview
+            progress: Called with (records_written, total_records) after each chunk
 
         Returns:
             ImportResult with counts
-        """
-        from src.db.models import Activity, ActivityType, Company, ResearchTask
 
+        Raises:
+            DatabaseError: If a record cannot be written
+        """
         result = ImportResult()
-
-        # Process new records
-        for analysis in preview.new_records:
-            record = analysis.record
-
-            # Find or create company
-            company_id = self._get_or_create_company(record)
-
-            # Determine population based on completeness
-            has_email = record.email is not None and record.email != ""
-            has_phone = record.phone is not None and record.phone != ""
-            population = Population.UNENGAGED if (has_email and has_phone) else Population.BROKEN
-
-            is_broken = population == Population.BROKEN
-            if is_broken:
-                result.broken_count += 1
-
-            # Create prospect
-            prospect = Prospect(
-                company_id=company_id,
-                first_name=record.first_name,
-                last_name=record.last_name,
-                title=record.title,
-                population=population,
-                source=record.source or preview.source_name,
-                notes=record.notes,
-            )
-            prospect_id = self.db.create_prospect(prospect)
-
-            # Create contact methods
-            if record.email:
-                self.db.create_contact_method(
-                    ContactMethod(
-                        prospect_id=prospect_id,
-                        type=ContactMethodType.EMAIL,
-                        value=record.email.lower(),
-                        is_primary=True,
-                        source=preview.source_name,
-                    )
-                )
-
-            if record.phone:
-                self.db.create_contact_method(
-                    ContactMethod(
-                        prospect_id=prospect_id,
-                        type=ContactMethodType.PHONE,
-                        value=record.phone,
-                        is_primary=not record.email,
-                        source=preview.source_name,
-                    )
-                )
-
-            # Log import activity
-            self.db.create_activity(
-                Activity(
-                    prospect_id=prospect_id,
-                    activity_type=ActivityType.IMPORT,
-                    notes=f"Imported from {preview.source_name or preview.filename}",
-                    created_by="system",
-                )
-            )
-
-            # Queue broken records for research
-            if is_broken:
-                self.db.create_research_task(
-                    ResearchTask(
-                        prospect_id=prospect_id,
-                        priority=0,
-                    )
-                )
-
-            result.imported_count += 1
-
-        # Process merge records
-        for analysis in preview.merge_records:
-            record = analysis.record
-            merge_pid: Optional[int] = analysis.matched_prospect_id
-            if merge_pid is None:
-                continue
-
-            existing: Optional[Prospect] = self.db.get_prospect(merge_pid)
-            if existing is None:
-                continue
-            prospect = existing
-
-            # Update fields that are empty in existing record
-            updated = False
-            if not prospect.title and record.title:
-                prospect.title = record.title
-                updated = True
-            if record.notes and not prospect.notes:
-                prospect.notes = record.notes
-                updated = True
-
-            if updated:
-                self.db.update_prospect(prospect)
-
-            # Add any new contact methods
-            existing_methods = self.db.get_contact_methods(merge_pid)
-            existing_emails = {
-                m.value.lower() for m in existing_methods if m.type == ContactMethodType.EMAIL
-            }
-            existing_phones = {
-                "".join(c for c in m.value if c.isdigit())
-                for m in existing_methods
-                if m.type == ContactMethodType.PHONE
-            }
-
-            if record.email and record.email.lower() not in existing_emails:
-                self.db.create_contact_method(
-                    ContactMethod(
-                        prospect_id=merge_pid,
-                        type=ContactMethodType.EMAIL,
-                        value=record.email.lower(),
-                        source=preview.source_name,
-                    )
-                )
-
-            if record.phone:
-                phone_digits = "".join(c for c in record.phone if c.isdigit())
-                if phone_digits not in existing_phones:
-                    self.db.create_contact_method(
-                        ContactMethod(
-                            prospect_id=merge_pid,
-                            type=ContactMethodType.PHONE,
-                            value=record.phone,
-                            source=preview.source_name,
-                        )
-                    )
-
-            # Log merge activity
-            self.db.create_activity(
-                Activity(
-                    prospect_id=merge_pid,
-                    activity_type=ActivityType.ENRICHMENT,
-                    notes=(
-                        f"Merged from import: {preview.source_name or preview.filename}"
-                        f" (match: {analysis.match_reason})"
-                    ),
-                    created_by="system",
-                )
-            )
-
-            result.merged_count += 1
+        company_cache = self._load_company_cache()
+
+        work: list[tuple[AnalysisResult, bool]] = [(a, True) for a in preview.new_records]
+        work.extend((a, False) for a in preview.merge_records)
+        total = len(work)
+
+        for start in range(0, total, self.commit_chunk_size):
+            chunk = work[start : start + self.commit_chunk_size]
+            try:
+                self._write_chunk(chunk, preview, result, company_cache)
+            except DatabaseError:
+                # Replay record by record so everything before the failure lands
+                for item in chunk:
+                    self._write_chunk([item], preview, result, company_cache)
+            if progress is not None:
+                progress(start + len(chunk), total)
 
         # Create import source record
         source = ImportSource(
@@ -436,71 +432,299 @@ class IntakeFunnel:
 
         return result
 
-    def _get_or_create_company(self, record: ImportRecord) -> int:
-        """Find or create company for an import record."""
-        from src.db.models import Company
+    def _load_company_cache(self) -> dict[str, int]:
+        """Map normalized company name -> first company ID with that name."""
+        cache: dict[str, int] = {}
+        rows = self.db._get_connection().execute(
+            "SELECT id, name_normalized FROM companies ORDER BY id"
+        )
+        for row in rows:
+            cache.setdefault(row["name_normalized"], row["id"])
+        return cache
 
-        if not record.company_name:
-            company = Company(name="Unknown", state=record.state)
-            return self.db.create_company(company)
+    @staticmethod
+    def _next_id(conn: RoutedConnection, table: str) -> int:
+        """Next AUTOINCREMENT id for ``table`` (call inside a write transaction)."""
+        row = conn.execute(
+            f"""SELECT MAX(
+                   COALESCE((SELECT seq FROM sqlite_sequence WHERE name = '{table}'), 0),
+                   COALESCE((SELECT MAX(id) FROM {table}), 0))"""
+        ).fetchone()
+        return int(row[0]) + 1
+
+    def _write_chunk(
+        self,
+        chunk: list[tuple[AnalysisResult, bool]],
+        preview: ImportPreview,
+        result: ImportResult,
+        company_cache: dict[str, int],
+    ) -> None:
+        """Write one chunk of new/merge records in a single transaction.
+
+        ``result`` and ``company_cache`` are only updated once the chunk commits.
+        """
+        source_label = preview.source_name or preview.filename
+        conn = self.db._get_connection()
+        try:
+            # A transaction of its own, or a savepoint inside the caller's unit
+            with self.db.transaction():
+                next_company_id = self._next_id(conn, "companies")
+                next_prospect_id = self._next_id(conn, "prospects")
+
+                new_companies: dict[str, int] = {}
+                company_rows: list[tuple] = []
+                prospect_rows: list[tuple] = []
+                method_rows: list[tuple] = []
+                activity_rows: list[tuple] = []
+                research_rows: list[tuple] = []
+                imported = merged = broken = 0
+
+                # Merge targets as they stand now, updated in memory as records apply
+                merge_ids = sorted(
+                    {
+                        a.matched_prospect_id
+                        for a, is_new in chunk
+                        if not is_new and a.matched_prospect_id is not None
+                    }
+                )
+                merge_state: dict[int, dict] = {}
+                if merge_ids:
+                    placeholders = ",".join("?" for _ in merge_ids)
+                    for row in conn.execute(
+                        f"SELECT id, title, notes FROM prospects WHERE id IN ({placeholders})",
+                        merge_ids,
+                    ):
+                        merge_state[row["id"]] = {
+                            "title": row["title"],
+                            "notes": row["notes"],
+                            "emails": set(),
+                            "phones": set(),
+                            "dirty": False,
+                        }
+                    for row in conn.execute(
+                        f"""SELECT prospect_id, type, value, phone_normalized FROM contact_methods
+                            WHERE prospect_id IN ({placeholders})""",
+                        merge_ids,
+                    ):
+                        state = merge_state.get(row["prospect_id"])
+                        if state is None:
+                            continue
+                        if row["type"] == ContactMethodType.EMAIL.value:
+                            state["emails"].add(row["value"].lower())
+                        elif row["type"] == ContactMethodType.PHONE.value:
+                            state["phones"].add(row["phone_normalized"])
+
+                for analysis, is_new in chunk:
+                    record = analysis.record
+
+                    if not is_new:
+                        merge_pid = analysis.matched_prospect_id
+                        state = merge_state.get(merge_pid) if merge_pid is not None else None
+                        if merge_pid is None or state is None:
+                            continue
+
+                        # Update fields that are empty in existing record
+                        if not state["title"] and record.title:
+                            state["title"] = record.title
+                            state["dirty"] = True
+                        if record.notes and not state["notes"]:
+                            state["notes"] = record.notes
+                            state["dirty"] = True
+
+                        # Add any new contact methods
+                        if record.email and record.email.lower() not in state["emails"]:
+                            state["emails"].add(record.email.lower())
+                            method_rows.append(
+                                (
+                                    merge_pid,
+                                    ContactMethodType.EMAIL.value,
+                                    record.email.lower(),
+                                    0,
+                                    preview.source_name,
+                                    None,
+                                )
+                            )
+                        if record.phone:
+                            phone_key = normalize_phone(record.phone) or None
+                            if phone_key not in state["phones"]:
+                                state["phones"].add(phone_key)
+                                method_rows.append(
+                                    (
+                                        merge_pid,
+                                        ContactMethodType.PHONE.value,
+                                        record.phone,
+                                        0,
+                                        preview.source_name,
+                                        phone_key,
+                                    )
+                                )
+
+                        activity_rows.append(
+                            (
+                                merge_pid,
+                                ActivityType.ENRICHMENT.value,
+                                f"Merged from import: {source_label}"
+                                f" (match: {analysis.match_reason})",
+                            )
+                        )
+                        merged += 1
+                        continue
+
+                    # Find or create company (blank names each get their own "Unknown")
+                    company_name = record.company_name or "Unknown"
+                    name_norm = normalize_company_name(company_name)
+                    company_id = None
+                    if record.company_name:
+                        company_id = company_cache.get(name_norm, new_companies.get(name_norm))
+                    if company_id is None:
+                        company_id = next_company_id
+                        next_company_id += 1
+                        company_rows.append(
+                            (
+                                company_id,
+                                company_name,
+                                name_norm,
+                                record.state,
+                                timezone_from_state(record.state),
+                            )
+                        )
+                        if record.company_name:
+                            new_companies[name_norm] = company_id
+
+                    # Determine population based on completeness
+                    has_email = record.email is not None and record.email != ""
+                    has_phone = record.phone is not None and record.phone != ""
+                    population = (
+                        Population.UNENGAGED if (has_email and has_phone) else Population.BROKEN
+                    )
+                    is_broken = population == Population.BROKEN
+                    if is_broken:
+                        broken += 1
+
+                    prospect_id = next_prospect_id
+                    next_prospect_id += 1
+                    prospect_rows.append(
+                        (
+                            prospect_id,
+                            company_id,
+                            record.first_name,
+                            record.last_name,
+                            record.title,
+                            population.value,
+                            record.source or preview.source_name,
+                            record.notes,
+                        )
+                    )
 
-        existing = self.db.get_company_by_normalized_name(record.company_name)
-        if existing and existing.id is not None:
-            return existing.id
+                    if record.email:
+                        method_rows.append(
+                            (
+                                prospect_id,
+                                ContactMethodType.EMAIL.value,
+                                record.email.lower(),
+                                1,
+                                preview.source_name,
+                                None,
+                            )
+                        )
+                    if record.phone:
+                        method_rows.append(
+                            (
+                                prospect_id,
+                                ContactMethodType.PHONE.value,
+                                record.phone,
+                                0 if record.email else 1,
+                                preview.source_name,
+                                normalize_phone(record.phone) or None,
+                            )
+                        )
 
-        company = Company(name=record.company_name, state=record.state)
-        return self.db.create_company(company)
+                    activity_rows.append(
+                        (
+                            prospect_id,
+                            ActivityType.IMPORT.value,
+                            f"Imported from {source_label}",
+                        )
+                    )
 
-    def _check_dnc(self, record: ImportRecord) -> bool:
-        """Check if record matches any DNC.
+                    # Queue broken records for research
+                    if is_broken:
+                        research_rows.append((prospect_id,))
 
-        Returns True if blocked by DNC.
-        """
-        if record.email and self.db.is_dnc(email=record.email):
-            return True
-        if record.phone and self.db.is_dnc(phone=record.phone):
-            return True
-        return False
+                    imported += 1
 
-    def _check_email_match(self, email: str) -> Optional[int]:
-        """Check for exact email match.
+                conn.executemany(
+                    """INSERT INTO companies (id, name, name_normalized, state, timezone)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    company_rows,
+                )
+                conn.executemany(
+                    """INSERT INTO prospects
+                       (id, company_id, first_name, last_name, title, population, source, notes)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    prospect_rows,
+                )
+                conn.executemany(
+                    """INSERT INTO contact_methods
+                       (prospect_id, type, value, is_primary, source, phone_normalized)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    method_rows,
+                )
+                conn.executemany(
+                    """INSERT INTO activities (prospect_id, activity_type, notes, created_by)
+                       VALUES (?, ?, ?, 'system')""",
+                    activity_rows,
+                )
+                conn.executemany(
+                    "INSERT INTO research_queue (prospect_id, priority) VALUES (?, 0)",
+                    research_rows,
+                )
+                conn.executemany(
+                    """UPDATE prospects SET title = ?, notes = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE id = ?""",
+                    [
+                        (state["title"], state["notes"], pid)
+                        for pid, state in merge_state.items()
+                        if state["dirty"]
+                    ],
+                )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to commit import chunk: {e}") from e
 
-        Returns prospect ID if found.
-        """
-        return self.db.find_prospect_by_email(email)
+        company_cache.update(new_companies)
+        result.imported_count += imported
+        result.merged_count += merged
+        result.broken_count += broken
 
     def _check_fuzzy_match(
         self,
         first_name: str,
         last_name: str,
-        company_name: str,
+        candidates: list[tuple[int, str]],
     ) -> Optional[tuple[int, float]]:
-        """Check for fuzzy name + company match.
+        """Check for fuzzy name match among a company's prospects.
 
-        Returns (prospect_id, similarity) if above threshold.
+        Returns (prospect_id, similarity) for the first candidate above threshold.
         """
-        existing_company = self.db.get_company_by_normalized_name(company_name)
-        if existing_company is None or existing_company.id is None:
-            return None
-
-        prospects = self.db.get_prospects(company_id=existing_company.id, limit=500)
-        full_name = f"{first_name} {last_name}".strip()
-
-        for prospect in prospects:
-            existing_name = prospect.full_name
-            similarity = self.name_similarity(full_name, existing_name)
-            if similarity >= self.name_similarity_threshold and prospect.id is not None:
-                return (prospect.id, similarity)
+        full_name = f"{first_name} {last_name}".strip().lower()
+        threshold = self.name_similarity_threshold
+
+        for prospect_id, existing_name in candidates:
+            existing = existing_name.lower()
+            # Length and character-multiset bounds are upper limits on ratio(),
+            # so cheap rejects here never change which candidate matches.
+            total = len(full_name) + len(existing)
+            if total and 2.0 * min(len(full_name), len(existing)) / total < threshold:
+                continue
+            matcher = SequenceMatcher(None, full_name, existing)
+            if matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= threshold:
+                return (prospect_id, similarity)
 
         return None
 
-    def _check_phone_match(self, phone: str) -> Optional[int]:
-        """Check for phone match.
-
-        Returns prospect ID if found (for manual review).
-        """
-        return self.db.find_prospect_by_phone(phone)
-
     @staticmethod
     def name_similarity(name1: str, name2: str) -> float:
         """Calculate name similarity ratio.
@@ -154,6 +154,16 @@ class IntelCategory(str, Enum):
     KEY_FACT = "key_fact"
 
 
+class NightlyStatus(str, Enum):
+    """State of a nightly run or one of its steps."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    ABANDONED = "abandoned"  # Runs only: interrupted and too old to resume
+
+
 # =============================================================================
 # TIMEZONE LOOKUP
 # =============================================================================
@@ -344,6 +354,8 @@ class Prospect:
         custom_fields: JSON blob for user fields
         created_at: Record creation time
         updated_at: Last update time
+        last_activity_at: When the latest activity was logged (trigger-maintained, read-only)
+        last_activity_type: Type of the latest activity (trigger-maintained, read-only)
     """
 
     id: Optional[int] = None
@@ -374,6 +386,8 @@ class Prospect:
     custom_fields: Optional[str] = None  # JSON blob
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    last_activity_at: Optional[datetime] = None
+    last_activity_type: Optional[ActivityType] = None
 
     @property
     def full_name(self) -> str:
@@ -414,6 +428,10 @@ class ContactMethod:
     created_at: Optional[datetime] = None
 
 
+# Activity.message_source for activities keyed by an Outlook (Graph) message id
+MESSAGE_SOURCE = "outlook"
+
+
 @dataclass
 class Activity:
     """Activity log entry.
@@ -437,6 +455,8 @@ class Activity:
         notes: Activity notes (the memory)
         created_by: user or system
         created_at: When logged
+        message_id: External message id (email activities), unique per source
+        message_source: System the message_id comes from (e.g. MESSAGE_SOURCE)
     """
 
     id: Optional[int] = None
@@ -455,6 +475,8 @@ class Activity:
     notes: Optional[str] = None
     created_by: str = "user"
     created_at: Optional[datetime] = None
+    message_id: Optional[str] = None
+    message_source: Optional[str] = None
 
 
 @dataclass
@@ -552,7 +574,7 @@ class ProspectTag:
 class ProspectFull:
     """Prospect with all related data for display.
 
-    Returned by get_prospect_full() — single object with everything
+    Returned by get_prospect_full() / get_prospect_full_many() — single object with everything
     needed to render a prospect card or deep dive.
 
     Attributes:
@@ -561,6 +583,7 @@ class ProspectFull:
         contact_methods: All contact methods
         activities: Activity history (most recent first)
         tags: Tag names
+        intel_nuggets: Extracted intel (most recent first)
     """
 
     prospect: Prospect = field(default_factory=Prospect)
@@ -568,6 +591,136 @@ class ProspectFull:
     contact_methods: list[ContactMethod] = field(default_factory=list)
     activities: list[Activity] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
+    intel_nuggets: list[IntelNugget] = field(default_factory=list)
+
+
+@dataclass
+class PipelineCounters:
+    """Headline pipeline numbers read from the trigger-maintained counters.
+
+    Returned by get_pipeline_counters() — exact as of the last committed write.
+
+    Attributes:
+        population_counts: Prospects per population (populations with none omitted)
+        overdue: Follow-ups dated before today, excluding DNC/closed-won/lost
+        follow_ups_today: Follow-ups dated today, per population
+        demos_today: Engaged follow-ups dated today in the demo_scheduled stage
+        activities_today: Activities logged today, per type
+        worked_today: Distinct prospects with an activity logged today
+    """
+
+    population_counts: dict[Population, int] = field(default_factory=dict)
+    overdue: int = 0
+    follow_ups_today: dict[Population, int] = field(default_factory=dict)
+    demos_today: int = 0
+    activities_today: dict[ActivityType, int] = field(default_factory=dict)
+    worked_today: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total prospects across all populations."""
+        return sum(self.population_counts.values())
+
+
+@dataclass
+class ChangeSet:
+    """Rows changed since a consumer last acknowledged the change log.
+
+    Returned by read_changes(); pass it to ack_changes() once processed.
+    When ``full`` is set the consumer has no usable watermark (first run, or
+    the log was pruned past it) and must process everything.
+
+    Attributes:
+        consumer: Consumer name the watermark is kept under
+        since: change_log seq the read started after (None when full)
+        until: Highest change_log seq covered by this set
+        changed: Inserted or updated row ids per table
+        deleted: Deleted row ids per table
+        prospect_ids: Prospects touched, directly or through their company
+    """
+
+    consumer: str
+    since: Optional[int] = None
+    until: int = 0
+    changed: dict[str, set[int]] = field(default_factory=dict)
+    deleted: dict[str, set[int]] = field(default_factory=dict)
+    prospect_ids: set[int] = field(default_factory=set)
+
+    @property
+    def full(self) -> bool:
+        """True if the consumer must reprocess everything."""
+        return self.since is None
+
+    def ids(self, entity: str) -> set[int]:
+        """Ids of rows in ``entity`` inserted or updated (and still present)."""
+        return self.changed.get(entity, set())
+
+    @property
+    def empty(self) -> bool:
+        """True if there is nothing to process."""
+        return not self.full and not self.changed and not self.deleted
+
+
+@dataclass
+class NightlyRunStep:
+    """Checkpoint of one step of a nightly run.
+
+    Attributes:
+        name: Step name (see autonomous.nightly.NIGHTLY_STEPS)
+        status: Where the step got to
+        cursor: Progress marker a long step saved, for resuming it part-way
+        started_at: When the step last started
+        completed_at: When the step finished or failed
+        error: Error message if the step failed
+        wait_seconds: Time from ready to started on its last attempt
+        duration_seconds: Run time of its last attempt
+        rows_processed: Rows the step read or evaluated
+        rows_written: Rows the step inserted, updated or deleted
+        api_calls: Outbound API requests the step made
+    """
+
+    name: str
+    status: NightlyStatus = NightlyStatus.PENDING
+    cursor: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error: Optional[str] = None
+    wait_seconds: Optional[float] = None
+    duration_seconds: Optional[float] = None
+    rows_processed: int = 0
+    rows_written: int = 0
+    api_calls: int = 0
+
+
+@dataclass
+class NightlyRun:
+    """One nightly cycle, persisted so an interrupted run can resume.
+
+    Attributes:
+        id: Run id
+        kind: "nightly" for the full cycle
+        status: RUNNING until every step has finished (or the run is abandoned)
+        started_at: When the run first started
+        completed_at: When the last step finished
+        resumes: Times the run was picked up again after an interruption
+        duration_seconds: Wall time, summed over every attempt
+        peak_rss_kb: Peak resident memory of the process that finished the run
+        steps: Step checkpoints in declaration order
+    """
+
+    id: Optional[int] = None
+    kind: str = "nightly"
+    status: NightlyStatus = NightlyStatus.RUNNING
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    resumes: int = 0
+    duration_seconds: Optional[float] = None
+    peak_rss_kb: Optional[int] = None
+    steps: list[NightlyRunStep] = field(default_factory=list)
+
+    def step(self, name: str) -> Optional[NightlyRunStep]:
+        """Return the checkpoint for step ``name``, if the run has one."""
+        return next((s for s in self.steps if s.name == name), None)
 
 
 # =============================================================================
@@ -0,0 +1,336 @@
+"""Query instrumentation for IronLung 3.
+
+Records, per statement: call count, total and p95 latency, and rows
+returned (rows affected for writes). A statement that runs slower than the
+threshold gets one EXPLAIN QUERY PLAN capture, so a full-table SCAN stands
+out from an index SEARCH.
+
+Profiling is off by default and covers the whole process when on: every
+Database instance and every direct ``db._get_connection().execute(...)``
+call goes through RoutedConnection, which reports here. Start the app with
+``--db-profile`` or tick "Profile queries" on the Settings tab.
+
+Statements are grouped by their text with whitespace collapsed and
+generated placeholder lists (``IN (?, ?, ?)``) folded, so batch sizes do
+not split one query into many rows.
+
+Usage:
+    from src.db.profiler import get_query_profiler
+
+    profiler = get_query_profiler()
+    profiler.enable(slow_ms=50)
+    ...
+    print(profiler.format_report())
+"""
+
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Statements at or above this many milliseconds get an EXPLAIN QUERY PLAN capture
+DEFAULT_SLOW_MS = 50.0
+
+# Latency samples kept per statement for the p95
+SAMPLES_PER_STATEMENT = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def normalize_sql(sql: str) -> str:
+    """Return the grouping key for a statement."""
+    text = _WHITESPACE.sub(" ", sql).strip()
+    return _PLACEHOLDER_LIST.sub("?, ...", text)
+
+
+def is_explainable(sql: str) -> bool:
+    """Return True if EXPLAIN QUERY PLAN says something useful about ``sql``."""
+    body = sql.lstrip("( \t\r\n")
+    head = body.split(None, 1)[0].upper() if body else ""
+    return head in _EXPLAINABLE
+
+
+@dataclass
+class StatementStats:
+    """Accumulated measurements for one statement.
+
+    Attributes:
+        sql: Normalized statement text
+        calls: Times executed
+        total_ms: Total time spent executing and fetching
+        rows: Rows returned (reads) or affected (writes)
+        slow_calls: Calls at or above the slow threshold
+        plan: EXPLAIN QUERY PLAN detail lines from the first slow call
+    """
+
+    sql: str
+    calls: int = 0
+    total_ms: float = 0.0
+    rows: int = 0
+    slow_calls: int = 0
+    plan: Optional[list[str]] = None
+    samples: deque = field(default_factory=lambda: deque(maxlen=SAMPLES_PER_STATEMENT))
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def p95_ms(self) -> float:
+        """95th percentile latency over the most recent samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return float(ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)])
+
+    @property
+    def scans(self) -> bool:
+        """True if the captured plan walks a whole table or index."""
+        return any(
+            line.startswith("SCAN ") and "VIRTUAL TABLE" not in line for line in self.plan or []
+        )
+
+
+class QueryProfiler:
+    """Process-wide statement statistics.
+
+    Attributes:
+        enabled: Whether connections report statements
+        slow_ms: Threshold for EXPLAIN QUERY PLAN capture
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.slow_ms = DEFAULT_SLOW_MS
+        self._lock = threading.Lock()
+        self._stats: dict[str, StatementStats] = {}
+
+    def enable(self, slow_ms: Optional[float] = None) -> None:
+        """Start recording statements."""
+        if slow_ms is not None:
+            self.slow_ms = slow_ms
+        self.enabled = True
+        logger.info("Query profiling enabled", extra={"context": {"slow_ms": self.slow_ms}})
+
+    def disable(self) -> None:
+        """Stop recording; collected statistics are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discard collected statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def record(
+        self,
+        sql: str,
+        elapsed_ms: float,
+        rows: int,
+        explain: Optional[Callable[[], list[str]]] = None,
+    ) -> None:
+        """Add one execution of ``sql``.
+
+        Args:
+            sql: Statement as executed
+            elapsed_ms: Time spent executing and fetching
+            rows: Rows returned or affected
+            explain: Returns the statement's query plan; called at most once
+                per statement, for the first slow call
+        """
+        key = normalize_sql(sql)
+        slow = elapsed_ms >= self.slow_ms
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(sql=key)
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.rows += rows
+            stats.samples.append(elapsed_ms)
+            if slow:
+                stats.slow_calls += 1
+            capture = slow and explain is not None and stats.plan is None
+            if capture:
+                # Claim the capture so concurrent slow calls do not repeat it
+                stats.plan = []
+        if capture and explain is not None:
+            try:
+                plan = explain()
+            except sqlite3.Error as e:
+                plan = [f"(plan unavailable: {e})"]
+            with self._lock:
+                stats.plan = plan
+
+    def report(self, sort_by: str = "total_ms") -> list[StatementStats]:
+        """Return statement statistics, largest ``sort_by`` first.
+
+        Args:
+            sort_by: "total_ms", "p95_ms", "calls" or "rows"
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: getattr(s, sort_by), reverse=True)
+
+    def format_report(self, limit: int = 20, sort_by: str = "total_ms") -> str:
+        """Render the top statements as a plain-text table."""
+        stats = self.report(sort_by)[:limit]
+        if not stats:
+            return "No statements recorded."
+        lines = [f"{'calls':>7} {'total ms':>10} {'p95 ms':>8} {'rows':>9}  statement"]
+        for s in stats:
+            flag = " [SCAN]" if s.scans else ""
+            lines.append(
+                f"{s.calls:>7} {s.total_ms:>10.1f} {s.p95_ms:>8.2f} {s.rows:>9}  "
+                f"{s.sql[:160]}{flag}"
+            )
+            for detail in s.plan or []:
+                lines.append(f"{'':>38}  plan: {detail}")
+        return "\n".join(lines)
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that reports its statement to the profiler once it is consumed.
+
+    Reads are timed across execute and every fetch, and reported when the
+    result set is exhausted, fetched in full, or the cursor is discarded.
+    The first fetchone() reads one row ahead, so a single-row lookup is
+    reported there and then rather than whenever the cursor is collected.
+    Statements without a result set are reported right after execute.
+    A cursor discarded part-way through is reported without a plan capture:
+    EXPLAIN QUERY PLAN is never run from a finalizer.
+    """
+
+    def track(
+        self,
+        profiler: QueryProfiler,
+        sql: str,
+        parameters: Any,
+        explainable: bool = True,
+    ) -> None:
+        self._profiler = profiler
+        self._sql = sql
+        self._parameters = parameters
+        self._explainable = explainable and is_explainable(sql)
+        self._elapsed = 0.0
+        self._rows = 0
+        self._reported = False
+        # Row read ahead by the first fetchone(), not yet handed to the caller
+        self._pending: Any = None
+
+    def run(self, method: Callable[..., Any], *args: Any) -> "ProfiledCursor":
+        """Run ``execute``/``executemany``/``executescript`` and start timing."""
+        started = time.perf_counter()
+        try:
+            method(*args)
+        finally:
+            self._elapsed += time.perf_counter() - started
+        if self.description is None:
+            self._report(max(self.rowcount, 0))
+        return self
+
+    def _report(self, rows: int = 0, explain: bool = True) -> None:
+        if self._reported:
+            return
+        self._reported = True
+        self._rows += rows
+        self._profiler.record(
+            self._sql,
+            self._elapsed * 1000,
+            self._rows,
+            explain=self._explain if explain and self._explainable else None,
+        )
+
+    def _explain(self) -> list[str]:
+        rows = self.connection.execute(f"EXPLAIN QUERY PLAN {self._sql}", self._parameters)
+        return [str(row[3]) for row in rows]
+
+    def _timed(self, fn: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self._elapsed += time.perf_counter() - started
+
+    def _take_pending(self) -> list[Any]:
+        row, self._pending = self._pending, None
+        return [] if row is None else [row]
+
+    def fetchone(self) -> Any:
+        if self._pending is not None:
+            return self._take_pending()[0]
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._report()
+            return row
+        self._rows += 1
+        if self._rows == 1:
+            # Most lookups stop at one row; find out now whether there is another
+            ahead = self._timed(super().fetchone)
+            if ahead is None:
+                self._report()
+            else:
+                self._rows += 1
+                self._pending = ahead
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> list[Any]:
+        count = self.arraysize if size is None else size
+        if count <= 0:
+            return []
+        rows = self._take_pending()
+        if len(rows) < count:
+            fetched = self._timed(lambda: super(ProfiledCursor, self).fetchmany(count - len(rows)))
+            self._rows += len(fetched)
+            if not fetched:
+                self._report()
+            rows += fetched
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        pending = self._take_pending()
+        rows = self._timed(super().fetchall)
+        self._report(len(rows))
+        return pending + rows
+
+    def __iter__(self) -> "ProfiledCursor":
+        return self
+
+    def __next__(self) -> Any:
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def __del__(self) -> None:
+        if getattr(self, "_reported", True):
+            return
+        try:
+            self._report(explain=False)
+        except Exception:  # pragma: no cover - interpreter shutdown
+            pass
+
+
+_profiler: Optional[QueryProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Get the process-wide query profiler."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = QueryProfiler()
+    return _profiler
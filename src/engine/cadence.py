@@ -138,18 +138,19 @@ def set_follow_up(
     if prospect is None:
         return False
 
-    prospect.follow_up_date = follow_up_date
-    db.update_prospect(prospect)
-
-    # Log the follow-up activity
-    activity = Activity(
-        prospect_id=prospect_id,
-        activity_type=ActivityType.REMINDER,
-        follow_up_set=follow_up_date,
-        notes=reason or f"Follow-up set for {follow_up_date}",
-        created_by="user",
-    )
-    db.create_activity(activity)
+    with db.transaction():
+        prospect.follow_up_date = follow_up_date
+        db.update_prospect(prospect)
+
+        # Log the follow-up activity
+        activity = Activity(
+            prospect_id=prospect_id,
+            activity_type=ActivityType.REMINDER,
+            follow_up_set=follow_up_date,
+            notes=reason or f"Follow-up set for {follow_up_date}",
+            created_by="user",
+        )
+        db.create_activity(activity)
 
     logger.info(
         "Follow-up set",
@@ -221,10 +222,11 @@ def get_todays_follow_ups(db: Database) -> list[Prospect]:
     rows = conn.execute(
         """SELECT * FROM prospects
            WHERE follow_up_date IS NOT NULL
-           AND DATE(follow_up_date) = DATE(?)
+           AND follow_up_date >= DATE(?) AND follow_up_date < DATE(?, '+1 day')
            AND population NOT IN (?, ?, ?)
            ORDER BY follow_up_date ASC""",
         (
+            today,
             today,
             Population.DEAD_DNC.value,
             Population.CLOSED_WON.value,
@@ -279,7 +281,7 @@ def get_todays_queue(db: Database) -> list[Prospect]:
            LEFT JOIN companies c ON p.company_id = c.id
            WHERE p.population = ?
            AND p.follow_up_date IS NOT NULL
-           AND DATE(p.follow_up_date) <= DATE(?)
+           AND p.follow_up_date < DATE(?, '+1 day')
            ORDER BY p.follow_up_date ASC""",
         (Population.ENGAGED.value, today),
     ).fetchall()
@@ -300,7 +302,7 @@ def get_todays_queue(db: Database) -> list[Prospect]:
            WHERE p.population = ?
            AND (
                p.follow_up_date IS NULL
-               OR DATE(p.follow_up_date) <= DATE(?)
+               OR p.follow_up_date < DATE(?, '+1 day')
            )
            ORDER BY p.prospect_score DESC""",
         (Population.UNENGAGED.value, today),
@@ -13,6 +13,7 @@ Usage:
 """
 
 import csv
+from contextlib import nullcontext
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -20,7 +21,7 @@ from typing import Optional
 
 from src.core.logging import get_logger
 from src.db.database import Database
-from src.db.models import ActivityType, Population, Prospect
+from src.db.models import ActivityType, ContactMethodType, Population, Prospect, ProspectFull
 
 logger = get_logger(__name__)
 
@@ -42,6 +43,12 @@ DEFAULT_COLUMNS = [
     "notes",
 ]
 
+# Columns resolved from related tables; need a Database passed to export_prospects
+RELATED_COLUMNS = ["company_name", "email", "phone", "tags"]
+
+# Prospects loaded per get_prospect_full_many call when exporting related columns
+EXPORT_BATCH_SIZE = 500
+
 
 @dataclass
 class MonthlySummary:
@@ -78,20 +85,39 @@ class MonthlySummary:
     avg_cycle_days: Optional[float] = None
 
 
+def _related_value(full: Optional[ProspectFull], col: str) -> str:
+    """Value of a RELATED_COLUMNS column from a loaded ProspectFull."""
+    if full is None:
+        return ""
+    if col == "company_name":
+        return full.company.name if full.company else ""
+    if col == "tags":
+        return ", ".join(full.tags)
+    method_type = ContactMethodType.EMAIL if col == "email" else ContactMethodType.PHONE
+    for method in full.contact_methods:  # primary first
+        if method.type == method_type:
+            return method.value
+    return ""
+
+
 def export_prospects(
     prospects: list[Prospect],
     path: Path,
     columns: Optional[list[str]] = None,
+    db: Optional[Database] = None,
 ) -> bool:
     """Export prospects to CSV.
 
     Writes a CSV file with the specified columns for each prospect.
-    Enum values are exported as their string value.
+    Enum values are exported as their string value. Columns from
+    RELATED_COLUMNS are filled from ``db`` in batches, all read from one
+    snapshot, and left blank when no database is given.
 
     Args:
         prospects: Prospects to export
         path: Output file path
         columns: Columns to include (defaults to DEFAULT_COLUMNS if None)
+        db: Database for related columns (company name, email, phone, tags)
 
     Returns:
         True if export successful
@@ -101,6 +127,7 @@ def export_prospects(
         return False
 
     cols = columns or DEFAULT_COLUMNS
+    load_related = db is not None and any(col in RELATED_COLUMNS for col in cols)
 
     try:
         # Ensure parent directory exists with restricted permissions
@@ -108,16 +135,27 @@ def export_prospects(
 
         secure_mkdir(path.parent)
 
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        # Related columns come from one snapshot so every batch sees the same data
+        snapshot = db.snapshot() if load_related and db is not None else nullcontext()
+        with snapshot, open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
 
             # Write header
             writer.writerow(cols)
 
             # Write data rows
-            for prospect in prospects:
+            fulls: dict[int, ProspectFull] = {}
+            for index, prospect in enumerate(prospects):
+                if load_related and db is not None and index % EXPORT_BATCH_SIZE == 0:
+                    batch = prospects[index : index + EXPORT_BATCH_SIZE]
+                    fulls = db.get_prospect_full_many(
+                        [p.id for p in batch if p.id is not None], activity_limit=0
+                    )
                 row: list[str] = []
                 for col in cols:
+                    if col in RELATED_COLUMNS:
+                        row.append(_related_value(fulls.get(prospect.id or 0), col))
+                        continue
                     value = getattr(prospect, col, None)
                     if value is None:
                         row.append("")
@@ -158,6 +196,7 @@ def generate_monthly_summary(
     db: Database,
     month: str,
     commission_rate: Decimal = Decimal("0.06"),
+    include_archived: bool = True,
 ) -> MonthlySummary:
     """Generate monthly summary report.
 
@@ -168,12 +207,12 @@ def generate_monthly_summary(
         db: Database instance
         month: Month in YYYY-MM format (e.g., "2026-02")
         commission_rate: Commission rate (default 6%)
+        include_archived: Count archived activities too, so months past the
+            archive horizon still report their calls, emails and demos
 
     Returns:
         Monthly summary with all metrics
     """
-    conn = db._get_connection()
-
     # Date range for the month
     month_start = f"{month}-01"
     # Use next month start for exclusive upper bound
@@ -190,88 +229,94 @@ def generate_monthly_summary(
         commission_rate=commission_rate,
     )
 
-    # Count demos booked (DEMO_SCHEDULED activities)
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM activities
-           WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
-        (ActivityType.DEMO_SCHEDULED.value, month_start, next_month_start),
-    ).fetchone()
-    summary.demos_booked = row["cnt"] if row else 0
-
-    # Count calls made
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM activities
-           WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
-        (ActivityType.CALL.value, month_start, next_month_start),
-    ).fetchone()
-    summary.calls_made = row["cnt"] if row else 0
-
-    # Count emails sent
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM activities
-           WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
-        (ActivityType.EMAIL_SENT.value, month_start, next_month_start),
-    ).fetchone()
-    summary.emails_sent = row["cnt"] if row else 0
-
-    # Count deals closed (prospects with close_date in this month)
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt, COALESCE(SUM(deal_value), 0) as total_val
-           FROM prospects
-           WHERE population = ? AND close_date >= ? AND close_date < ?""",
-        (Population.CLOSED_WON.value, month_start, next_month_start),
-    ).fetchone()
-    if row:
-        summary.deals_closed = row["cnt"]
-        total_revenue = Decimal(str(row["total_val"])) if row["total_val"] else Decimal("0")
-        summary.total_revenue = total_revenue
-        summary.commission_earned = total_revenue * commission_rate
-        if summary.deals_closed > 0:
-            summary.avg_deal_size = total_revenue / summary.deals_closed
-
-    # Count new prospects added this month
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM prospects
-           WHERE created_at >= ? AND created_at < ?""",
-        (month_start, next_month_start),
-    ).fetchone()
-    summary.pipeline_added = row["cnt"] if row else 0
-
-    # Count prospects that became engaged this month (via STATUS_CHANGE activities)
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM activities
-           WHERE activity_type = ? AND population_after = ?
-           AND created_at >= ? AND created_at < ?""",
-        (
-            ActivityType.STATUS_CHANGE.value,
-            Population.ENGAGED.value,
-            month_start,
-            next_month_start,
-        ),
-    ).fetchone()
-    summary.pipeline_engaged = row["cnt"] if row else 0
-
-    # Count prospects lost this month
-    row = conn.execute(
-        """SELECT COUNT(*) as cnt FROM activities
-           WHERE activity_type = ? AND population_after = ?
-           AND created_at >= ? AND created_at < ?""",
-        (
-            ActivityType.STATUS_CHANGE.value,
-            Population.LOST.value,
-            month_start,
-            next_month_start,
-        ),
-    ).fetchone()
-    summary.pipeline_lost = row["cnt"] if row else 0
-
-    # Calculate average cycle days for deals closed this month
-    rows = conn.execute(
-        """SELECT close_date, created_at FROM prospects
-           WHERE population = ? AND close_date >= ? AND close_date < ?
-           AND created_at IS NOT NULL""",
-        (Population.CLOSED_WON.value, month_start, next_month_start),
-    ).fetchall()
+    # One snapshot so every count describes the same moment, even while
+    # the GUI and the orchestrator keep writing
+    with db.snapshot():
+        conn = db._get_connection()
+        activities = db.activity_source(include_archived)
+
+        # Count demos booked (DEMO_SCHEDULED activities)
+        row = conn.execute(
+            f"""SELECT COUNT(*) as cnt FROM {activities}
+               WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
+            (ActivityType.DEMO_SCHEDULED.value, month_start, next_month_start),
+        ).fetchone()
+        summary.demos_booked = row["cnt"] if row else 0
+
+        # Count calls made
+        row = conn.execute(
+            f"""SELECT COUNT(*) as cnt FROM {activities}
+               WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
+            (ActivityType.CALL.value, month_start, next_month_start),
+        ).fetchone()
+        summary.calls_made = row["cnt"] if row else 0
+
+        # Count emails sent
+        row = conn.execute(
+            f"""SELECT COUNT(*) as cnt FROM {activities}
+               WHERE activity_type = ? AND created_at >= ? AND created_at < ?""",
+            (ActivityType.EMAIL_SENT.value, month_start, next_month_start),
+        ).fetchone()
+        summary.emails_sent = row["cnt"] if row else 0
+
+        # Count deals closed (prospects with close_date in this month)
+        row = conn.execute(
+            """SELECT COUNT(*) as cnt, COALESCE(SUM(deal_value), 0) as total_val
+               FROM prospects
+               WHERE population = ? AND close_date >= ? AND close_date < ?""",
+            (Population.CLOSED_WON.value, month_start, next_month_start),
+        ).fetchone()
+        if row:
+            summary.deals_closed = row["cnt"]
+            total_revenue = Decimal(str(row["total_val"])) if row["total_val"] else Decimal("0")
+            summary.total_revenue = total_revenue
+            summary.commission_earned = total_revenue * commission_rate
+            if summary.deals_closed > 0:
+                summary.avg_deal_size = total_revenue / summary.deals_closed
+
+        # Count new prospects added this month
+        row = conn.execute(
+            """SELECT COUNT(*) as cnt FROM prospects
+               WHERE created_at >= ? AND created_at < ?""",
+            (month_start, next_month_start),
+        ).fetchone()
+        summary.pipeline_added = row["cnt"] if row else 0
+
+        # Count prospects that became engaged this month (via STATUS_CHANGE activities)
+        row = conn.execute(
+            f"""SELECT COUNT(*) as cnt FROM {activities}
+               WHERE activity_type = ? AND population_after = ?
+               AND created_at >= ? AND created_at < ?""",
+            (
+                ActivityType.STATUS_CHANGE.value,
+                Population.ENGAGED.value,
+                month_start,
+                next_month_start,
+            ),
+        ).fetchone()
+        summary.pipeline_engaged = row["cnt"] if row else 0
+
+        # Count prospects lost this month
+        row = conn.execute(
+            f"""SELECT COUNT(*) as cnt FROM {activities}
+               WHERE activity_type = ? AND population_after = ?
+               AND created_at >= ? AND created_at < ?""",
+            (
+                ActivityType.STATUS_CHANGE.value,
+                Population.LOST.value,
+                month_start,
+                next_month_start,
+            ),
+        ).fetchone()
+        summary.pipeline_lost = row["cnt"] if row else 0
+
+        # Calculate average cycle days for deals closed this month
+        rows = conn.execute(
+            """SELECT close_date, created_at FROM prospects
+               WHERE population = ? AND close_date >= ? AND close_date < ?
+               AND created_at IS NOT NULL""",
+            (Population.CLOSED_WON.value, month_start, next_month_start),
+        ).fetchall()
     if rows:
         total_days = 0.0
         valid_count = 0
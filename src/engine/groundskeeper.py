@@ -92,72 +92,18 @@ class Groundskeeper:
         "broken",
     ]
 
+    # Checked fields in reporting order
+    FIELDS = ("email", "phone", "title", "company")
+
     def flag_stale_records(self) -> list[int]:
         """Flag records with stale data.
 
-        Updates data_freshness table with flagged fields.
+        Logs each flagged prospect for review.
 
         Returns:
             List of prospect IDs flagged
         """
-        flagged_ids: list[int] = []
-
-        # Gather all prospects in active populations
-        from src.db.models import Population
-
-        active_pops = [
-            Population.UNENGAGED,
-            Population.ENGAGED,
-            Population.BROKEN,
-        ]
-
-        prospects: list[Prospect] = []
-        for pop in active_pops:
-            prospects.extend(self.db.get_prospects(population=pop, limit=10000))
-
-        for prospect in prospects:
-            if prospect.id is None:
-                continue
-
-            stale_fields: list[str] = []
-
-            # Check email freshness
-            email_days = self._check_email_freshness(prospect.id)
-            if email_days is not None:
-                stale_fields.append("email")
-
-            # Check phone freshness
-            phone_days = self._check_phone_freshness(prospect.id)
-            if phone_days is not None:
-                stale_fields.append("phone")
-
-            # Check title freshness
-            title_days = self._check_title_freshness(prospect.id)
-            if title_days is not None:
-                stale_fields.append("title")
-
-            # Check company existence freshness
-            company_days = self._check_company_freshness(prospect)
-            if company_days is not None:
-                stale_fields.append("company")
-
-            if stale_fields:
-                flagged_ids.append(prospect.id)
-                logger.info(
-                    "Prospect flagged with stale data",
-                    extra={
-                        "context": {
-                            "prospect_id": prospect.id,
-                            "stale_fields": stale_fields,
-                        }
-                    },
-                )
-
-        logger.info(
-            "Stale record flagging complete",
-            extra={"context": {"total_flagged": len(flagged_ids)}},
-        )
-        return flagged_ids
+        return self._flag(self.find_stale())
 
     def get_stale_by_priority(self, limit: int = 50) -> list[StaleRecord]:
         """Get stale records ordered by priority.
@@ -171,158 +117,144 @@ class Groundskeeper:
         Returns:
             Stale records ordered by priority
         """
-        from src.db.models import Population
+        return self.find_stale(limit=limit)
 
-        active_pops = [
-            Population.UNENGAGED,
-            Population.ENGAGED,
-            Population.BROKEN,
-        ]
+    def find_stale(self, limit: Optional[int] = None) -> list[StaleRecord]:
+        """Every active prospect with stale data, highest priority first.
 
-        prospects: list[Prospect] = []
-        for pop in active_pops:
-            prospects.extend(self.db.get_prospects(population=pop, limit=10000))
-
-        stale_records: list[StaleRecord] = []
-
-        for prospect in prospects:
-            if prospect.id is None:
-                continue
-
-            stale_fields: list[str] = []
-            max_days_stale = 0
-
-            email_days = self._check_email_freshness(prospect.id)
-            if email_days is not None:
-                stale_fields.append("email")
-                max_days_stale = max(max_days_stale, email_days)
-
-            phone_days = self._check_phone_freshness(prospect.id)
-            if phone_days is not None:
-                stale_fields.append("phone")
-                max_days_stale = max(max_days_stale, phone_days)
-
-            title_days = self._check_title_freshness(prospect.id)
-            if title_days is not None:
-                stale_fields.append("title")
-                max_days_stale = max(max_days_stale, title_days)
-
-            company_days = self._check_company_freshness(prospect)
-            if company_days is not None:
-                stale_fields.append("company")
-                max_days_stale = max(max_days_stale, company_days)
-
-            if stale_fields:
-                # Fetch company name for display
-                company = self.db.get_company(prospect.company_id) if prospect.company_id else None
-                company_name = company.name if company else "Unknown"
-
-                priority_score = float(max_days_stale) * float(prospect.prospect_score or 1)
-
-                stale_records.append(
-                    StaleRecord(
-                        prospect_id=prospect.id,
-                        prospect_name=prospect.full_name,
-                        company_name=company_name,
-                        stale_fields=stale_fields,
-                        days_stale=max_days_stale,
-                        priority_score=priority_score,
-                    )
-                )
-
-        # Sort by priority_score descending, take top N
-        stale_records.sort(key=lambda r: r.priority_score, reverse=True)
-        return stale_records[:limit]
-
-    def _check_field_freshness(
-        self, prospect_id: int, field_name: str, threshold_days: int
-    ) -> Optional[int]:
-        """Check freshness for a specific field.
-
-        Looks up data_freshness records for the prospect and field.
-        If no record exists, the data has never been verified and is
-        considered stale (returns threshold_days + 1).
-        If a record exists but is older than threshold, returns days since
-        verification.
+        One query: the latest verified_date per (prospect, field) from
+        data_freshness, checked against the thresholds for the fields each
+        prospect actually has (email/phone contact methods, a title, a
+        company). A field never verified counts as threshold + 1 days old.
 
-        Returns:
-            Days since verification if stale, or None if fresh.
+        Args:
+            limit: Maximum records to return (None for all)
         """
-        freshness_records = self.db.get_data_freshness(prospect_id)
-
-        # Find the most recent record for this field
-        field_records = [r for r in freshness_records if r.get("field_name") == field_name]
-
-        if not field_records:
-            # Never verified - considered stale
-            return threshold_days + 1
-
-        # Get most recent by verified_date (records are already sorted DESC)
-        latest = field_records[0]
-        verified_date = latest.get("verified_date")
-
-        if verified_date is None:
-            return threshold_days + 1
+        population_filter = ",".join("?" for _ in self.ACTIVE_POPULATIONS)
+        sql, params = self._stale_fields_sql(
+            f"p.population IN ({population_filter})", list(self.ACTIVE_POPULATIONS)
+        )
+        rows = self.db._get_connection().execute(
+            f"""{sql}
+                SELECT s.prospect_id, p.first_name, p.last_name, c.name AS company_name,
+                       group_concat(s.field) AS fields, MAX(s.days) AS days_stale,
+                       MAX(s.days) * COALESCE(NULLIF(p.prospect_score, 0), 1) AS priority
+                FROM stale s
+                JOIN prospects p ON p.id = s.prospect_id
+                LEFT JOIN companies c ON c.id = p.company_id
+                GROUP BY s.prospect_id
+                ORDER BY priority DESC, s.prospect_id
+                LIMIT ?""",
+            [*params, -1 if limit is None else limit],
+        )
 
-        # Parse verified_date if it's a string
-        if isinstance(verified_date, str):
-            try:
-                verified_date = date.fromisoformat(verified_date)
-            except (ValueError, TypeError):
-                return threshold_days + 1
+        order = {name: i for i, name in enumerate(self.FIELDS)}
+        return [
+            StaleRecord(
+                prospect_id=row["prospect_id"],
+                prospect_name=f"{row['first_name']} {row['last_name']}".strip(),
+                company_name=row["company_name"] or "Unknown",
+                stale_fields=sorted(row["fields"].split(","), key=order.__getitem__),
+                days_stale=row["days_stale"],
+                priority_score=float(row["priority"]),
+            )
+            for row in rows
+        ]
 
-        days_since = (date.today() - verified_date).days
-        if days_since > threshold_days:
-            return days_since
+    def _stale_fields_sql(self, where: str, params: list[Any]) -> tuple[str, list[Any]]:
+        """WITH clause defining ``stale(prospect_id, field, days)``.
 
-        return None
+        Covers the prospects matching ``where`` (over ``prospects p``); only
+        stale fields are included.
+        """
+        thresholds = {
+            "email": self.thresholds.email_days,
+            "phone": self.thresholds.phone_days,
+            "title": self.thresholds.title_days,
+            "company": self.thresholds.company_days,
+        }
+        has_field = {
+            "email": "EXISTS (SELECT 1 FROM contact_methods m "
+            "WHERE m.prospect_id = p.id AND m.type = 'email')",
+            "phone": "EXISTS (SELECT 1 FROM contact_methods m "
+            "WHERE m.prospect_id = p.id AND m.type = 'phone')",
+            "title": "p.title IS NOT NULL AND p.title != ''",
+            "company": "p.company_id IS NOT NULL AND p.company_id != 0",
+        }
+        checked = " UNION ALL ".join(
+            f"SELECT p.id AS prospect_id, '{name}' AS field, ? AS threshold "
+            f"FROM prospects p WHERE {where} AND {has_field[name]}"
+            for name in self.FIELDS
+        )
+        field_params: list[Any] = []
+        for name in self.FIELDS:
+            field_params += [thresholds[name], *params]
+
+        sql = f"""WITH latest AS (
+                      SELECT prospect_id, field_name, MAX(DATE(verified_date)) AS verified
+                      FROM data_freshness
+                      GROUP BY prospect_id, field_name
+                  ),
+                  checked AS ({checked}),
+                  aged AS (
+                      SELECT f.prospect_id, f.field, f.threshold,
+                             CASE WHEN l.verified IS NULL THEN f.threshold + 1
+                                  ELSE CAST(julianday(?) - julianday(l.verified) AS INTEGER)
+                             END AS days
+                      FROM checked f
+                      LEFT JOIN latest l
+                        ON l.prospect_id = f.prospect_id AND l.field_name = f.field
+                  ),
+                  stale AS (SELECT prospect_id, field, days FROM aged WHERE days > threshold)"""
+        return sql, [*field_params, date.today().isoformat()]
+
+    def _stale_days(self, prospect_id: int) -> dict[str, int]:
+        """Days since verification for each stale field of one prospect."""
+        sql, params = self._stale_fields_sql("p.id = ?", [prospect_id])
+        rows = self.db._get_connection().execute(f"{sql} SELECT field, days FROM stale", params)
+        return {row["field"]: row["days"] for row in rows}
 
     def _check_email_freshness(self, prospect_id: int) -> Optional[int]:
         """Check email verification freshness.
 
-        Returns days since verification, or None if fresh.
+        Returns days since verification, or None if fresh or no email.
         """
-        # Only check if the prospect actually has an email
-        contact_methods = self.db.get_contact_methods(prospect_id)
-        has_email = any(
-            m.type.value == "email" if hasattr(m.type, "value") else m.type == "email"
-            for m in contact_methods
-        )
-        if not has_email:
-            return None
-
-        return self._check_field_freshness(prospect_id, "email", self.thresholds.email_days)
+        return self._stale_days(prospect_id).get("email")
 
     def _check_phone_freshness(self, prospect_id: int) -> Optional[int]:
         """Check phone verification freshness."""
-        contact_methods = self.db.get_contact_methods(prospect_id)
-        has_phone = any(
-            m.type.value == "phone" if hasattr(m.type, "value") else m.type == "phone"
-            for m in contact_methods
-        )
-        if not has_phone:
-            return None
-
-        return self._check_field_freshness(prospect_id, "phone", self.thresholds.phone_days)
+        return self._stale_days(prospect_id).get("phone")
 
     def _check_title_freshness(self, prospect_id: int) -> Optional[int]:
         """Check title verification freshness."""
-        prospect = self.db.get_prospect(prospect_id)
-        if not prospect or not prospect.title:
-            return None
-
-        return self._check_field_freshness(prospect_id, "title", self.thresholds.title_days)
+        return self._stale_days(prospect_id).get("title")
 
     def _check_company_freshness(self, prospect: Prospect) -> Optional[int]:
         """Check company existence verification freshness.
 
         Returns days since verification, or None if fresh.
         """
-        if not prospect.company_id:
+        if prospect.id is None:
             return None
-
-        assert prospect.id is not None
-        return self._check_field_freshness(prospect.id, "company", self.thresholds.company_days)
+        return self._stale_days(prospect.id).get("company")
+
+    def _flag(self, records: list[StaleRecord]) -> list[int]:
+        """Log ``records`` as flagged and return their prospect IDs."""
+        for record in records:
+            logger.info(
+                "Prospect flagged with stale data",
+                extra={
+                    "context": {
+                        "prospect_id": record.prospect_id,
+                        "stale_fields": record.stale_fields,
+                    }
+                },
+            )
+        logger.info(
+            "Stale record flagging complete",
+            extra={"context": {"total_flagged": len(records)}},
+        )
+        return [record.prospect_id for record in records]
 
     def run_maintenance(self) -> dict[str, Any]:
         """Run full maintenance cycle.
@@ -330,32 +262,31 @@ class Groundskeeper:
         Called during nightly cycle.
 
         Returns:
-            Dict with counts: {"flagged": N, "by_field": {...}}
+            Dict with counts: {"checked": N, "flagged": N, "by_field": {...}}
+            where checked is the number of active prospects evaluated
         """
         logger.info("Starting groundskeeper maintenance cycle")
 
-        flagged_ids = self.flag_stale_records()
+        population_filter = ",".join("?" for _ in self.ACTIVE_POPULATIONS)
+        checked = (
+            self.db._get_connection()
+            .execute(
+                f"SELECT COUNT(*) FROM prospects WHERE population IN ({population_filter})",
+                self.ACTIVE_POPULATIONS,
+            )
+            .fetchone()[0]
+        )
+        records = self.find_stale()
+        flagged_ids = self._flag(records)
 
         # Count stale fields across all flagged records
-        by_field: dict[str, int] = {
-            "email": 0,
-            "phone": 0,
-            "title": 0,
-            "company": 0,
-        }
-
-        for prospect_id in flagged_ids:
-            if self._check_email_freshness(prospect_id) is not None:
-                by_field["email"] += 1
-            if self._check_phone_freshness(prospect_id) is not None:
-                by_field["phone"] += 1
-            if self._check_title_freshness(prospect_id) is not None:
-                by_field["title"] += 1
-            prospect = self.db.get_prospect(prospect_id)
-            if prospect and self._check_company_freshness(prospect) is not None:
-                by_field["company"] += 1
+        by_field: dict[str, int] = {name: 0 for name in self.FIELDS}
+        for record in records:
+            for name in record.stale_fields:
+                by_field[name] += 1
 
         result = {
+            "checked": checked,
             "flagged": len(flagged_ids),
             "by_field": by_field,
         }
@@ -1,13 +1,22 @@
-"""Real-time intel nugget extraction.
+"""Intel nugget extraction from activity notes.
 
-Extracts intel from activity notes during card processing,
-not just during the nightly cycle.
+Extracts intel from activity notes during card processing
+(extract_intel_from_notes) and, nightly, from every activity logged since
+the last run (extract_intel_backlog).
+
+All rule keywords are compiled into one regex shaped like a trie, so each
+note is scanned once whatever the number of rules. Nuggets are deduplicated
+by the unique (prospect, category, content hash) index on intel_nuggets, so
+the real-time and nightly paths can see the same note without doubling up.
 
 Usage:
     from src.engine.intel_extract import extract_intel_from_notes
     count = extract_intel_from_notes(db, prospect_id, notes)
 """
 
+import re
+from dataclasses import dataclass
+
 from src.core.logging import get_logger
 from src.db.database import Database
 from src.db.models import IntelCategory, IntelNugget
@@ -75,6 +84,104 @@ _DECISION_KEYWORDS = [
     "sign off",
 ]
 
+# Activities read per batch by extract_intel_backlog
+BACKLOG_BATCH_SIZE = 500
+
+# system_metadata key holding the last activity id extract_intel_backlog scanned
+_BACKLOG_WATERMARK_KEY = "intel_extract_watermark"
+
+
+@dataclass(frozen=True)
+class IntelRule:
+    """One kind of intel and the keywords that reveal it.
+
+    Attributes:
+        category: Category of the nuggets the rule creates
+        template: Nugget content; {keyword} is the first listed keyword found,
+            {notes} the start of the notes
+        keywords: Lowercase phrases, in preference order
+    """
+
+    category: IntelCategory
+    template: str
+    keywords: tuple[str, ...]
+
+
+INTEL_RULES = (
+    IntelRule(IntelCategory.PAIN_POINT, "Mentioned '{keyword}': {notes}", tuple(_PAIN_KEYWORDS)),
+    IntelRule(IntelCategory.COMPETITOR, "Competitor intel: {notes}", tuple(_COMPETITOR_KEYWORDS)),
+    IntelRule(IntelCategory.DECISION_TIMELINE, "Timeline: {notes}", tuple(_TIMELINE_KEYWORDS)),
+    # Budget signals (mapped to KEY_FACT — closest available category)
+    IntelRule(IntelCategory.KEY_FACT, "Budget signal: {notes}", tuple(_BUDGET_KEYWORDS)),
+    # Decision process (mapped to DECISION_TIMELINE — closest available category)
+    IntelRule(
+        IntelCategory.DECISION_TIMELINE, "Decision process: {notes}", tuple(_DECISION_KEYWORDS)
+    ),
+)
+
+
+def _trie_pattern(keywords: list[str]) -> str:
+    """Regex matching the longest of ``keywords`` at a position, shared prefixes merged."""
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional: prefer the longer keyword, fall back to this one
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+class IntelMatcher:
+    """Finds which rules a note triggers in a single pass over its text."""
+
+    def __init__(self, rules: tuple[IntelRule, ...] = INTEL_RULES):
+        self.rules = rules
+        keywords = sorted({kw for rule in rules for kw in rule.keywords})
+        # Zero-width lookahead so matches may overlap ("budget cycle" / "budget")
+        self._pattern = re.compile(f"(?=({_trie_pattern(keywords)}))")
+        # A match is the longest keyword at its position; every keyword that is
+        # a prefix of it matched there too. Map each to (rule index, keyword rank).
+        self._hits: dict[str, list[tuple[int, int]]] = {
+            found: [
+                (index, rank)
+                for index, rule in enumerate(rules)
+                for rank, kw in enumerate(rule.keywords)
+                if found.startswith(kw)
+            ]
+            for found in keywords
+        }
+
+    def match(self, notes: str) -> list[tuple[IntelCategory, str]]:
+        """Return (category, content) for each rule the notes trigger, in rule order."""
+        best: dict[int, int] = {}
+        for found in self._pattern.finditer(notes.lower()):
+            for index, rank in self._hits[found.group(1)]:
+                if rank < best.get(index, len(self.rules[index].keywords)):
+                    best[index] = rank
+
+        return [
+            (rule.category, rule.template.format(keyword=rule.keywords[best[i]], notes=notes[:200]))
+            for i, rule in enumerate(self.rules)
+            if i in best
+        ]
+
+
+_matcher = IntelMatcher()
+
+
+def match_intel(notes: str) -> list[tuple[IntelCategory, str]]:
+    """Return the (category, content) nuggets the default rules find in ``notes``."""
+    return _matcher.match(notes)
+
 
 def extract_intel_from_notes(
     db: Database,
@@ -96,67 +203,84 @@ def extract_intel_from_notes(
     if not notes or not notes.strip():
         return 0
 
-    notes_lower = notes.lower()
-    nuggets_to_create: list[tuple[IntelCategory, str]] = []
+    matches = match_intel(notes)
+    if not matches:
+        return 0
 
-    # Pain points
-    for kw in _PAIN_KEYWORDS:
-        if kw in notes_lower:
-            nuggets_to_create.append((IntelCategory.PAIN_POINT, f"Mentioned '{kw}': {notes[:200]}"))
-            break
+    nuggets = [
+        IntelNugget(prospect_id=prospect_id, category=category, content=content)
+        for category, content in matches
+    ]
+    try:
+        created = db.create_intel_nuggets(nuggets)
+    except Exception as e:
+        logger.warning(f"Failed to create intel nuggets: {e}")
+        return 0
 
-    # Competitors
-    for kw in _COMPETITOR_KEYWORDS:
-        if kw in notes_lower:
-            nuggets_to_create.append((IntelCategory.COMPETITOR, f"Competitor intel: {notes[:200]}"))
-            break
+    if created:
+        logger.info(
+            "Intel nuggets extracted in real-time",
+            extra={
+                "context": {
+                    "prospect_id": prospect_id,
+                    "categories": sorted({category.value for category, _ in matches}),
+                    "created": created,
+                    "source": source,
+                }
+            },
+        )
+    return created
 
-    # Timeline
-    for kw in _TIMELINE_KEYWORDS:
-        if kw in notes_lower:
-            nuggets_to_create.append((IntelCategory.DECISION_TIMELINE, f"Timeline: {notes[:200]}"))
-            break
 
-    # Budget signals (mapped to KEY_FACT — closest available category)
-    for kw in _BUDGET_KEYWORDS:
-        if kw in notes_lower:
-            nuggets_to_create.append((IntelCategory.KEY_FACT, f"Budget signal: {notes[:200]}"))
-            break
+@dataclass
+class IntelBacklogResult:
+    """Outcome of extract_intel_backlog.
 
-    # Decision process (mapped to DECISION_TIMELINE — closest available category)
-    for kw in _DECISION_KEYWORDS:
-        if kw in notes_lower:
-            nuggets_to_create.append(
-                (IntelCategory.DECISION_TIMELINE, f"Decision process: {notes[:200]}")
-            )
-            break
+    Attributes:
+        scanned: Activities read
+        extracted: New nuggets created
+        watermark: Last activity id scanned
+    """
+
+    scanned: int = 0
+    extracted: int = 0
+    watermark: int = 0
 
-    # Deduplicate against existing nuggets
-    created = 0
-    existing = db.get_intel_nuggets(prospect_id)
 
-    for category, content in nuggets_to_create:
-        is_duplicate = any(n.category == category and n.content == content for n in existing)
-        if not is_duplicate:
-            nugget = IntelNugget(
-                prospect_id=prospect_id,
+def extract_intel_backlog(db: Database, batch_size: int = BACKLOG_BATCH_SIZE) -> IntelBacklogResult:
+    """Extract intel from every activity logged since the last call.
+
+    Activities are streamed in id order from a watermark kept in
+    system_metadata. Each batch's nuggets are inserted together with the
+    advanced watermark in one transaction, so an interrupted run resumes
+    after the last finished batch and nothing is scanned twice. Notes
+    edited after they were scanned are not revisited.
+    """
+    watermark = int(db.get_system_metadata(_BACKLOG_WATERMARK_KEY) or 0)
+    result = IntelBacklogResult(watermark=watermark)
+
+    while True:
+        rows = db.get_activities_with_notes_after(result.watermark, limit=batch_size)
+        if not rows:
+            break
+
+        nuggets = [
+            IntelNugget(
+                prospect_id=row["prospect_id"],
                 category=category,
                 content=content,
+                source_activity_id=row["id"],
             )
-            try:
-                db.create_intel_nugget(nugget)
-                created += 1
-                logger.info(
-                    f"Intel nugget extracted in real-time",
-                    extra={
-                        "context": {
-                            "prospect_id": prospect_id,
-                            "category": category.value,
-                            "source": source,
-                        }
-                    },
-                )
-            except Exception as e:
-                logger.warning(f"Failed to create intel nugget: {e}")
+            for row in rows
+            for category, content in match_intel(row["notes"])
+        ]
+        with db.transaction():
+            result.extracted += db.create_intel_nuggets(nuggets) if nuggets else 0
+            db.upsert_system_metadata(_BACKLOG_WATERMARK_KEY, str(rows[-1]["id"]))
+        result.watermark = rows[-1]["id"]
+        result.scanned += len(rows)
 
-    return created
+        if len(rows) < batch_size:
+            break
+
+    return result
@@ -151,7 +151,7 @@ class InterventionEngine:
                FROM prospects p
                LEFT JOIN companies c ON p.company_id = c.id
                WHERE p.follow_up_date IS NOT NULL
-                 AND DATE(p.follow_up_date) < DATE(?)
+                 AND p.follow_up_date < DATE(?)
                  AND p.population NOT IN (?, ?, ?)
                ORDER BY p.follow_up_date ASC""",
             (
@@ -197,13 +197,11 @@ class InterventionEngine:
         rows = conn.execute(
             """SELECT p.id, p.first_name, p.last_name, p.engagement_stage,
                       c.name as company_name,
-                      MAX(a.created_at) as last_activity
+                      p.last_activity_at as last_activity
                FROM prospects p
                LEFT JOIN companies c ON p.company_id = c.id
-               LEFT JOIN activities a ON a.prospect_id = p.id
                WHERE p.population = ?
-               GROUP BY p.id
-               HAVING last_activity IS NULL OR DATE(last_activity) < DATE(?)""",
+                 AND (p.last_activity_at IS NULL OR p.last_activity_at < DATE(?))""",
             (Population.ENGAGED.value, cutoff),
         ).fetchall()
 
@@ -251,7 +249,7 @@ class InterventionEngine:
                LEFT JOIN activities a ON a.prospect_id = p.id
                    AND a.activity_type IN ('call', 'voicemail', 'email_sent', 'demo')
                WHERE p.population = ?
-                 AND DATE(p.created_at) < DATE(?)
+                 AND p.created_at < DATE(?)
                  AND a.id IS NULL
                ORDER BY p.prospect_score DESC""",
             (Population.UNENGAGED.value, cutoff),
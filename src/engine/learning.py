@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.core.logging import get_logger
+from src.db.compression import decompress_text
 from src.db.database import Database
 from src.db.models import Population
 
@@ -157,47 +158,54 @@ class LearningEngine:
         """
         self.db = db
 
-    def analyze_outcomes(self) -> LearningInsights:
+    def analyze_outcomes(self, include_archived: bool = True) -> LearningInsights:
         """Analyze all won and lost deals for patterns.
 
+        Args:
+            include_archived: Also read archived activity notes; closed deals
+                often have most of their history past the archive horizon
+
         Returns:
             LearningInsights with patterns found
         """
-        conn = self.db._get_connection()
-
-        # Gather notes from won deals
-        won_rows = conn.execute(
-            """SELECT p.id, p.close_notes, p.notes, p.created_at, p.close_date,
-                      c.name as company_name
-               FROM prospects p
-               LEFT JOIN companies c ON p.company_id = c.id
-               WHERE p.population = ?""",
-            (Population.CLOSED_WON.value,),
-        ).fetchall()
-
-        # Gather notes from lost deals
-        lost_rows = conn.execute(
-            """SELECT p.id, p.lost_reason, p.lost_competitor, p.notes,
-                      c.name as company_name
-               FROM prospects p
-               LEFT JOIN companies c ON p.company_id = c.id
-               WHERE p.population = ?""",
-            (Population.LOST.value,),
-        ).fetchall()
-
-        # Also gather activity notes for richer context
-        won_ids = [row["id"] for row in won_rows]
-        lost_ids = [row["id"] for row in lost_rows]
-
-        won_activity_notes = self._get_activity_notes(conn, won_ids)
-        lost_activity_notes = self._get_activity_notes(conn, lost_ids)
+        # Read deals and their notes from one snapshot so the two sides agree
+        with self.db.snapshot():
+            conn = self.db._get_connection()
+
+            # Gather notes from won deals
+            won_rows = conn.execute(
+                """SELECT p.id, p.close_notes, p.notes, p.created_at, p.close_date,
+                          c.name as company_name
+                   FROM prospects p
+                   LEFT JOIN companies c ON p.company_id = c.id
+                   WHERE p.population = ?""",
+                (Population.CLOSED_WON.value,),
+            ).fetchall()
+
+            # Gather notes from lost deals
+            lost_rows = conn.execute(
+                """SELECT p.id, p.lost_reason, p.lost_competitor, p.notes,
+                          c.name as company_name
+                   FROM prospects p
+                   LEFT JOIN companies c ON p.company_id = c.id
+                   WHERE p.population = ?""",
+                (Population.LOST.value,),
+            ).fetchall()
+
+            # Also gather activity notes for richer context
+            won_ids = [row["id"] for row in won_rows]
+            lost_ids = [row["id"] for row in lost_rows]
+
+            won_activity_notes = self._get_activity_notes(conn, won_ids, include_archived)
+            lost_activity_notes = self._get_activity_notes(conn, lost_ids, include_archived)
 
         # Build combined note strings per deal
         won_notes = []
         for row in won_rows:
             parts = []
-            if row["close_notes"]:
-                parts.append(row["close_notes"])
+            close_notes = decompress_text(row["close_notes"])
+            if close_notes:
+                parts.append(close_notes)
             if row["notes"]:
                 parts.append(row["notes"])
             parts.extend(won_activity_notes.get(row["id"], []))
@@ -339,7 +347,9 @@ class LearningEngine:
 
         return suggestions
 
-    def _get_activity_notes(self, conn, prospect_ids: list[int]) -> dict[int, list[str]]:
+    def _get_activity_notes(
+        self, conn, prospect_ids: list[int], include_archived: bool = False
+    ) -> dict[int, list[str]]:
         """Get activity notes grouped by prospect ID."""
         if not prospect_ids:
             return {}
@@ -347,7 +357,7 @@ class LearningEngine:
         placeholders = ",".join("?" for _ in prospect_ids)
         rows = conn.execute(
             f"""SELECT prospect_id, notes
-                FROM activities
+                FROM {self.db.activity_source(include_archived)}
                 WHERE prospect_id IN ({placeholders})
                   AND notes IS NOT NULL AND notes != ''
                 ORDER BY created_at DESC""",
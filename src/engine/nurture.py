@@ -396,28 +396,29 @@ class NurtureEngine:
                     )
                     continue
 
-            # Mark as sent
-            now = datetime.now().isoformat()
-            conn.execute(
-                """UPDATE nurture_queue
-                   SET status = 'sent', sent_at = ?
-                   WHERE id = ?""",
-                (now, email.id),
-            )
+            with self.db.transaction():
+                # Mark as sent
+                now = datetime.now().isoformat()
+                conn.execute(
+                    """UPDATE nurture_queue
+                       SET status = 'sent', sent_at = ?
+                       WHERE id = ?""",
+                    (now, email.id),
+                )
 
-            # Log as automated attempt activity
-            from src.db.models import Activity, ActivityType, AttemptType
-
-            activity = Activity(
-                prospect_id=email.prospect_id,
-                activity_type=ActivityType.EMAIL_SENT,
-                attempt_type=AttemptType.AUTOMATED,
-                email_subject=email.subject,
-                email_body=email.body,
-                notes=f"Nurture {email.sequence.value} step {email.sequence_step}",
-                created_by="system",
-            )
-            self.db.create_activity(activity)
+                # Log as automated attempt activity
+                from src.db.models import Activity, ActivityType, AttemptType
+
+                activity = Activity(
+                    prospect_id=email.prospect_id,
+                    activity_type=ActivityType.EMAIL_SENT,
+                    attempt_type=AttemptType.AUTOMATED,
+                    email_subject=email.subject,
+                    email_body=email.body,
+                    notes=f"Nurture {email.sequence.value} step {email.sequence_step}",
+                    created_by="system",
+                )
+                self.db.create_activity(activity)
 
             sent_count += 1
             logger.info(
@@ -430,8 +431,6 @@ class NurtureEngine:
                 },
             )
 
-        conn.commit()
-
         logger.info(
             "Approved emails sent",
             extra={"context": {"sent": sent_count}},
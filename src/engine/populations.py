@@ -157,68 +157,69 @@ def transition_prospect(
     if to_population != Population.ENGAGED:
         new_stage = None
 
-    # Update the prospect
-    prospect.population = to_population
-    prospect.engagement_stage = new_stage
-
-    # Set metadata for terminal states
-    if to_population == Population.DEAD_DNC:
-        from datetime import date as date_type
-        from datetime import datetime as datetime_type
-
-        from src.db.models import DeadReason
-
-        prospect.dead_reason = DeadReason.DNC
-        prospect.dead_date = date_type.today()
-        # Store precise timestamp for grace period reversal
-        _set_dnc_timestamp(db, prospect_id, datetime_type.now())
-
-    if to_population == Population.PARKED and prospect.parked_month is None:
-        # Default to next month if not set
-        from datetime import date as date_type
-
-        today = date_type.today()
-        month = today.month + 1
-        year = today.year
-        if month > 12:
-            month = 1
-            year += 1
-        prospect.parked_month = f"{year}-{month:02d}"
-
-    db.update_prospect(prospect)
-
-    # When moving to BROKEN, ensure a research_queue entry exists so the Broken tab
-    # can display the record (In Progress section). Intake creates these for new
-    # imports, but prospects sequestered via transition or Trello sync do not.
-    if to_population == Population.BROKEN:
-        from src.db.models import ResearchTask
-
-        conn = db._get_connection()
-        existing = conn.execute(
-            "SELECT 1 FROM research_queue WHERE prospect_id = ? LIMIT 1",
-            (prospect_id,),
-        ).fetchone()
-        if not existing:
-            db.create_research_task(
-                ResearchTask(prospect_id=prospect_id, priority=0),
-            )
-            logger.info(
-                "Created research task for sequestered broken prospect",
-                extra={"context": {"prospect_id": prospect_id}},
-            )
-
-    # Log the transition activity
-    activity = Activity(
-        prospect_id=prospect_id,
-        activity_type=ActivityType.STATUS_CHANGE,
-        population_before=from_pop,
-        population_after=to_population,
-        stage_before=old_stage,
-        stage_after=new_stage,
-        notes=reason or f"Transition: {from_pop.value} -> {to_population.value}",
-        created_by="user",
-    )
-    db.create_activity(activity)
+    with db.transaction():
+        # Update the prospect
+        prospect.population = to_population
+        prospect.engagement_stage = new_stage
+
+        # Set metadata for terminal states
+        if to_population == Population.DEAD_DNC:
+            from datetime import date as date_type
+            from datetime import datetime as datetime_type
+
+            from src.db.models import DeadReason
+
+            prospect.dead_reason = DeadReason.DNC
+            prospect.dead_date = date_type.today()
+            # Store precise timestamp for grace period reversal
+            _set_dnc_timestamp(db, prospect_id, datetime_type.now())
+
+        if to_population == Population.PARKED and prospect.parked_month is None:
+            # Default to next month if not set
+            from datetime import date as date_type
+
+            today = date_type.today()
+            month = today.month + 1
+            year = today.year
+            if month > 12:
+                month = 1
+                year += 1
+            prospect.parked_month = f"{year}-{month:02d}"
+
+        db.update_prospect(prospect)
+
+        # When moving to BROKEN, ensure a research_queue entry exists so the Broken tab
+        # can display the record (In Progress section). Intake creates these for new
+        # imports, but prospects sequestered via transition or Trello sync do not.
+        if to_population == Population.BROKEN:
+            from src.db.models import ResearchTask
+
+            conn = db._get_connection()
+            existing = conn.execute(
+                "SELECT 1 FROM research_queue WHERE prospect_id = ? LIMIT 1",
+                (prospect_id,),
+            ).fetchone()
+            if not existing:
+                db.create_research_task(
+                    ResearchTask(prospect_id=prospect_id, priority=0),
+                )
+                logger.info(
+                    "Created research task for sequestered broken prospect",
+                    extra={"context": {"prospect_id": prospect_id}},
+                )
+
+        # Log the transition activity
+        activity = Activity(
+            prospect_id=prospect_id,
+            activity_type=ActivityType.STATUS_CHANGE,
+            population_before=from_pop,
+            population_after=to_population,
+            stage_before=old_stage,
+            stage_after=new_stage,
+            notes=reason or f"Transition: {from_pop.value} -> {to_population.value}",
+            created_by="user",
+        )
+        db.create_activity(activity)
 
     logger.info(
         "Prospect transitioned",
@@ -277,22 +278,23 @@ def transition_stage(
     if not can_transition_stage(old_stage, to_stage):
         raise PipelineError(f"Invalid stage transition: {old_stage.value} -> {to_stage.value}")
 
-    # Update the prospect
-    prospect.engagement_stage = to_stage
-    db.update_prospect(prospect)
-
-    # Log the stage transition
-    activity = Activity(
-        prospect_id=prospect_id,
-        activity_type=ActivityType.STATUS_CHANGE,
-        population_before=Population.ENGAGED,
-        population_after=Population.ENGAGED,
-        stage_before=old_stage,
-        stage_after=to_stage,
-        notes=reason or f"Stage: {old_stage.value} -> {to_stage.value}",
-        created_by="user",
-    )
-    db.create_activity(activity)
+    with db.transaction():
+        # Update the prospect
+        prospect.engagement_stage = to_stage
+        db.update_prospect(prospect)
+
+        # Log the stage transition
+        activity = Activity(
+            prospect_id=prospect_id,
+            activity_type=ActivityType.STATUS_CHANGE,
+            population_before=Population.ENGAGED,
+            population_after=Population.ENGAGED,
+            stage_before=old_stage,
+            stage_after=to_stage,
+            notes=reason or f"Stage: {old_stage.value} -> {to_stage.value}",
+            created_by="user",
+        )
+        db.create_activity(activity)
 
     logger.info(
         "Engagement stage changed",
@@ -414,26 +416,27 @@ def reverse_dnc(
             f"Prospect {prospect_id} is not DNC (current: {prospect.population.value})"
         )
 
-    # Perform the reversal — bypass normal transition rules
-    prospect.population = restore_to
-    prospect.dead_reason = None
-    prospect.dead_date = None
-    prospect.engagement_stage = None
-
-    db.update_prospect(prospect)
-    _clear_dnc_timestamp(db, prospect_id)
-
-    # Log the reversal
-    activity = Activity(
-        prospect_id=prospect_id,
-        activity_type=ActivityType.STATUS_CHANGE,
-        notes=(
-            f"DNC REVERSED within grace period -> {restore_to.value}. "
-            f"Reason: {reason or 'No reason given'}"
-        ),
-        created_by="user",
-    )
-    db.create_activity(activity)
+    with db.transaction():
+        # Perform the reversal — bypass normal transition rules
+        prospect.population = restore_to
+        prospect.dead_reason = None
+        prospect.dead_date = None
+        prospect.engagement_stage = None
+
+        db.update_prospect(prospect)
+        _clear_dnc_timestamp(db, prospect_id)
+
+        # Log the reversal
+        activity = Activity(
+            prospect_id=prospect_id,
+            activity_type=ActivityType.STATUS_CHANGE,
+            notes=(
+                f"DNC REVERSED within grace period -> {restore_to.value}. "
+                f"Reason: {reason or 'No reason given'}"
+            ),
+            created_by="user",
+        )
+        db.create_activity(activity)
 
     logger.info(
         f"DNC reversed for prospect {prospect_id}",
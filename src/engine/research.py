@@ -25,7 +25,7 @@ import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 from src.core.logging import get_logger
 from src.db.database import Database
@@ -421,21 +421,51 @@ class ResearchEngine:
 
         return links
 
-    def run_batch(self, limit: int = 50) -> int:
+    def run_batch(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ) -> int:
         """Run research on batch of broken prospects.
 
         Called during nightly cycle. Processes broken prospects
-        with pending research tasks, ordered by priority.
+        with pending research tasks, ordered by priority. After each
+        prospect ``on_progress`` gets a cursor listing the prospects
+        attempted so far; passing it back in skips them (and counts them
+        against ``limit``), so a resumed batch does not repeat lookups.
 
         Args:
             limit: Maximum prospects to research
+            cursor: Progress marker from an interrupted batch's ``on_progress``
+            on_progress: Called with a new cursor after each prospect
 
         Returns:
-            Number of prospects researched
+            Number of prospects researched (including those done before a resume)
         """
-        broken = self.db.get_prospects(population=Population.BROKEN, limit=limit)
-
+        attempted: list[int] = []
         researched = 0
+        if cursor:
+            try:
+                state = json.loads(cursor)
+                attempted = [int(i) for i in state["attempted"]]
+                researched = int(state["researched"])
+            except (ValueError, TypeError, KeyError):
+                logger.warning(
+                    "Ignoring unreadable research cursor", extra={"context": {"cursor": cursor}}
+                )
+                attempted, researched = [], 0
+
+        skip = set(attempted)
+        remaining = max(limit - len(attempted), 0)
+        broken = [
+            p
+            for p in self.db.get_prospects(
+                population=Population.BROKEN, limit=remaining + len(skip)
+            )
+            if p.id not in skip
+        ][:remaining]
+
         for prospect in broken:
             if prospect.id is None:
                 continue
@@ -458,6 +488,9 @@ class ResearchEngine:
                         }
                     },
                 )
+            attempted.append(prospect.id)
+            if on_progress is not None:
+                on_progress(json.dumps({"attempted": attempted, "researched": researched}))
 
         logger.info(
             "Batch research completed",
@@ -80,7 +80,7 @@ def find_resurrection_candidates(
            LEFT JOIN companies c ON p.company_id = c.id
            WHERE p.population = ?
              AND p.lost_date IS NOT NULL
-             AND DATE(p.lost_date) < DATE(?)
+             AND p.lost_date < DATE(?)
              AND p.prospect_score >= ?
            ORDER BY p.prospect_score DESC""",
         (Population.LOST.value, cutoff, min_original_score),
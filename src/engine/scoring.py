@@ -17,11 +17,16 @@ Usage:
     confidence = calculate_confidence(prospect, contact_methods)
 """
 
+import json
+import sqlite3
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
+from src.core.exceptions import DatabaseError
 from src.core.logging import get_logger
+from src.db.database import Database
 from src.db.models import (
     Company,
     ContactMethod,
@@ -106,6 +111,29 @@ SIZE_SCORES: dict[str, int] = {
     "small": 50,
 }
 
+# Timing bonus by days since last contact: (at most this many days, bonus)
+RECENCY_BONUS: tuple[tuple[int, int], ...] = (
+    (7, 50),  # Hot - contacted this week
+    (14, 40),  # Warm - contacted in last 2 weeks
+    (30, 30),  # Cooling
+    (60, 15),  # Getting cold
+    (90, 5),  # Cold
+)
+
+# Verifications younger than this many days count as fresh for confidence
+VERIFIED_FRESH_DAYS = 90
+
+# Populations rescore_all() keeps scored
+ACTIVE_POPULATIONS = [Population.UNENGAGED, Population.ENGAGED, Population.BROKEN]
+
+# Prospects loaded, scored and written per transaction by rescore_all()
+RESCORE_BATCH_SIZE = 1000
+
+# change_log consumer for rescore_all(); system_metadata key for its last run date
+RESCORE_CONSUMER = "scoring"
+_RESCORE_ENTITIES = ("prospects", "companies", "contact_methods", "data_freshness")
+_RESCORE_DATE_KEY = "rescore_last_date"
+
 
 # =============================================================================
 # SCORING FUNCTIONS
@@ -222,7 +250,7 @@ def calculate_confidence(
                 return False
         if not isinstance(vdate, date):
             return False
-        return bool((date.today() - vdate).days < 90)
+        return bool((date.today() - vdate).days < VERIFIED_FRESH_DAYS)
 
     fresh_verified = any(_is_fresh_verified(m) for m in contact_methods)
     if fresh_verified:
@@ -376,16 +404,10 @@ def _score_timing(prospect: Prospect) -> int:
             score += 30
         else:
             days_since = (date.today() - prospect.last_contact_date).days
-            if days_since <= 7:
-                score += 50  # Hot - contacted this week
-            elif days_since <= 14:
-                score += 40  # Warm - contacted in last 2 weeks
-            elif days_since <= 30:
-                score += 30  # Cooling
-            elif days_since <= 60:
-                score += 15  # Getting cold
-            elif days_since <= 90:
-                score += 5  # Cold
+            for max_days, bonus in RECENCY_BONUS:
+                if days_since <= max_days:
+                    score += bonus
+                    break
             # > 90 days: no bonus
 
     # Follow-up date proximity bonus
@@ -413,51 +435,211 @@ def _score_source(prospect: Prospect) -> int:
     return 40  # Unrecognized source
 
 
-def rescore_all(db) -> int:
-    """Re-score all active prospects.
-
-    Called during nightly cycle.
+def rescore_all(
+    db: Database,
+    full: bool = False,
+    cursor: Optional[str] = None,
+    on_progress: Optional[Callable[[str], None]] = None,
+) -> int:
+    """Re-score active prospects whose score or confidence may have moved.
+
+    Called during the nightly cycle and after imports. A prospect is
+    rescored when its row, its company, its contact methods or its
+    freshness records changed since the last run (read from the change
+    log), or when a day boundary in the timing and verification-freshness
+    components passed since then. The first run, and any run after the
+    change log was pruned past this consumer, scores every active prospect.
+
+    Inputs are loaded in batches with one query per table, and changed
+    scores are written with a single executemany per batch that sets only
+    prospect_score and data_confidence. Prospects are visited in id order;
+    after each batch ``on_progress`` gets a cursor that, passed back in,
+    resumes an interrupted run after the last finished batch. Prospects
+    changed since the interrupted run read the change log are rescored
+    again even if they were already done.
 
-    Iterates all prospects in active populations (UNENGAGED, ENGAGED, BROKEN),
-    recalculates their prospect_score and data_confidence, and persists updates.
+    Args:
+        db: Database instance
+        full: Rescore every active prospect regardless of changes
+        cursor: Progress marker from an interrupted run's ``on_progress``
+        on_progress: Called with a new cursor after each committed batch
 
     Returns:
-        Number of prospects re-scored
+        Number of prospects re-scored (including those done before a resume)
     """
-    active_populations = [
-        Population.UNENGAGED,
-        Population.ENGAGED,
-        Population.BROKEN,
-    ]
+    today = date.today()
+    changes = db.read_changes(RESCORE_CONSUMER, entities=_RESCORE_ENTITIES)
+    last_run = _last_rescore_date(db)
+
+    dirty: Optional[set[int]] = None
+    if not (full or changes.full or last_run is None or last_run > today):
+        dirty = changes.prospect_ids | _timing_boundary_crossings(db, last_run, today)
 
     count = 0
+    resume = _parse_rescore_cursor(cursor)
+    if resume is not None:
+        late = db.read_changes(RESCORE_CONSUMER, entities=_RESCORE_ENTITIES, after=resume["until"])
+        if not late.full:
+            after = resume["after"]
+            if dirty is None:
+                dirty = _active_ids_after(db, after)
+            else:
+                dirty = {prospect_id for prospect_id in dirty if prospect_id > after}
+            dirty |= late.prospect_ids
+            count = resume["count"]
+
+    written = 0
+    conn = db._get_connection()
+    try:
+        for batch in _iter_scoring_inputs(db, dirty):
+            updates = []
+            for prospect, company, contact_methods in batch:
+                new_score = calculate_score(prospect, company)
+                new_confidence = calculate_confidence(prospect, contact_methods)
+                if (
+                    prospect.prospect_score != new_score
+                    or prospect.data_confidence != new_confidence
+                ):
+                    updates.append((new_score, new_confidence, prospect.id))
+            if updates:
+                with db.transaction():
+                    conn.executemany(
+                        "UPDATE prospects SET prospect_score = ?, data_confidence = ? "
+                        "WHERE id = ?",
+                        updates,
+                    )
+            count += len(batch)
+            written += len(updates)
+            if on_progress is not None:
+                on_progress(
+                    json.dumps({"after": batch[-1][0].id, "until": changes.until, "count": count})
+                )
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to write prospect scores: {e}") from e
+
+    db.ack_changes(changes)
+    db.upsert_system_metadata(_RESCORE_DATE_KEY, today.isoformat())
 
-    for pop in active_populations:
-        prospects = db.get_prospects(population=pop, limit=10000)
+    logger.info(
+        "Rescore complete",
+        extra={
+            "context": {
+                "rescored": count,
+                "changed": written,
+                "incremental": dirty is not None,
+                "resumed": resume is not None,
+            }
+        },
+    )
+    return count
 
-        for prospect in prospects:
-            # Fetch related data
-            company = db.get_company(prospect.company_id) if prospect.company_id else None
-            contact_methods = db.get_contact_methods(prospect.id)
 
-            if company is None:
-                # Create a minimal Company so scoring doesn't break
-                company = Company()
+def _parse_rescore_cursor(cursor: Optional[str]) -> Optional[dict[str, int]]:
+    """Decode a rescore_all() progress cursor; None if absent or unreadable."""
+    if not cursor:
+        return None
+    try:
+        state = json.loads(cursor)
+        return {key: int(state[key]) for key in ("after", "until", "count")}
+    except (ValueError, TypeError, KeyError):
+        logger.warning("Ignoring unreadable rescore cursor", extra={"context": {"cursor": cursor}})
+        return None
+
+
+def _active_ids_after(db: Database, after: int) -> set[int]:
+    """Ids of active prospects above ``after``."""
+    placeholders = ",".join("?" for _ in ACTIVE_POPULATIONS)
+    rows = db._get_connection().execute(
+        f"SELECT id FROM prospects WHERE population IN ({placeholders}) AND id > ?",
+        [p.value for p in ACTIVE_POPULATIONS] + [after],
+    )
+    return {row[0] for row in rows}
 
-            # Calculate new scores
-            new_score = calculate_score(prospect, company)
-            new_confidence = calculate_confidence(prospect, contact_methods)
 
-            # Update if changed
-            if prospect.prospect_score != new_score or prospect.data_confidence != new_confidence:
-                prospect.prospect_score = new_score
-                prospect.data_confidence = new_confidence
-                db.update_prospect(prospect)
+def _last_rescore_date(db: Database) -> Optional[date]:
+    """Date of the last rescore_all() run, or None if it never ran."""
+    value = db.get_system_metadata(_RESCORE_DATE_KEY)
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
 
-            count += 1
 
-    logger.info(
-        "Rescore complete",
-        extra={"context": {"rescored": count}},
+def _timing_boundary_crossings(db: Database, since: date, today: date) -> set[int]:
+    """Prospects whose date-based score inputs changed bucket since ``since``.
+
+    _score_timing moves when days-since-last-contact passes a RECENCY_BONUS
+    limit: d days means a last contact in [since - d, today - d).
+    calculate_confidence moves when a verification ages past
+    VERIFIED_FRESH_DAYS: verified in (since - N, today - N].
+    """
+    if since >= today:
+        return set()
+
+    ranges = []
+    params: list[Any] = [p.value for p in ACTIVE_POPULATIONS]
+    for max_days, _ in RECENCY_BONUS:
+        ranges.append("(DATE(last_contact_date) >= ? AND DATE(last_contact_date) < ?)")
+        params += [
+            (since - timedelta(days=max_days)).isoformat(),
+            (today - timedelta(days=max_days)).isoformat(),
+        ]
+    params += [
+        (since - timedelta(days=VERIFIED_FRESH_DAYS)).isoformat(),
+        (today - timedelta(days=VERIFIED_FRESH_DAYS)).isoformat(),
+    ]
+
+    placeholders = ",".join("?" for _ in ACTIVE_POPULATIONS)
+    rows = db._get_connection().execute(
+        f"""SELECT id FROM prospects
+            WHERE population IN ({placeholders}) AND ({" OR ".join(ranges)})
+            UNION
+            SELECT prospect_id FROM contact_methods
+            WHERE is_verified = 1
+              AND DATE(verified_date) > ? AND DATE(verified_date) <= ?""",
+        params,
     )
-    return count
+    return {row[0] for row in rows}
+
+
+def _iter_scoring_inputs(
+    db: Database, prospect_ids: Optional[set[int]]
+) -> Iterator[list[tuple[Prospect, Company, list[ContactMethod]]]]:
+    """Yield (prospect, company, contact methods) for active prospects in batches.
+
+    Each batch costs three queries: prospects, their companies and their
+    contact methods. ``prospect_ids`` of None means every active prospect.
+    A prospect whose company row is missing gets an empty Company.
+    """
+    if prospect_ids is not None and not prospect_ids:
+        return
+    conn = db._get_connection()
+    batches = db.iter_prospects(
+        populations=ACTIVE_POPULATIONS,
+        batch_size=RESCORE_BATCH_SIZE,
+        prospect_ids=sorted(prospect_ids) if prospect_ids is not None else None,
+    )
+    for prospects in batches:
+        company_ids = json.dumps(sorted({p.company_id for p in prospects if p.company_id}))
+        companies = {
+            row["id"]: db._row_to_company(row)
+            for row in conn.execute(
+                "SELECT * FROM companies WHERE id IN (SELECT value FROM json_each(?))",
+                (company_ids,),
+            )
+        }
+        contact_methods: dict[int, list[ContactMethod]] = defaultdict(list)
+        for row in conn.execute(
+            "SELECT * FROM contact_methods WHERE prospect_id IN (SELECT value FROM json_each(?))",
+            (json.dumps([p.id for p in prospects]),),
+        ):
+            contact_methods[row["prospect_id"]].append(db._row_to_contact_method(row))
+
+        yield [
+            (
+                prospect,
+                companies.get(prospect.company_id) or Company(),
+                contact_methods[prospect.id] if prospect.id is not None else [],
+            )
+            for prospect in prospects
+        ]
@@ -87,7 +87,7 @@ class TroubledCardsService:
                LEFT JOIN companies c ON p.company_id = c.id
                WHERE p.population IN (?, ?)
                  AND p.follow_up_date IS NOT NULL
-                 AND DATE(p.follow_up_date) < ?
+                 AND p.follow_up_date < DATE(?)
                ORDER BY p.follow_up_date ASC""",
             (
                 Population.ENGAGED.value,
@@ -124,13 +124,11 @@ class TroubledCardsService:
         rows = conn.execute(
             """SELECT p.id, p.first_name, p.last_name, p.population,
                       c.name as company_name,
-                      MAX(a.created_at) as last_activity
+                      p.last_activity_at as last_activity
                FROM prospects p
                LEFT JOIN companies c ON p.company_id = c.id
-               LEFT JOIN activities a ON p.id = a.prospect_id
                WHERE p.population = ?
-               GROUP BY p.id
-               HAVING last_activity IS NULL OR DATE(last_activity) < ?""",
+                 AND (p.last_activity_at IS NULL OR p.last_activity_at < DATE(?))""",
             (Population.ENGAGED.value, cutoff),
         ).fetchall()
 
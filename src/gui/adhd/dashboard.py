@@ -3,7 +3,7 @@
 Small widget showing today's stats at a glance:
 cards processed, calls, emails, demos, streak.
 
-Data is gathered from the database (activities today)
+Data is gathered from the database (today's activity counters)
 and the dopamine engine (streak).
 """
 
@@ -31,7 +31,7 @@ class DashboardData:
 class DashboardService:
     """Gathers dashboard data from the database and dopamine engine.
 
-    The service queries today's activities and combines them with
+    The service reads today's activity counters and combines them with
     the current streak for a single glanceable object.
     """
 
@@ -57,21 +57,9 @@ class DashboardService:
         if target_date is None:
             target_date = date.today()
 
-        conn = self._db._get_connection()
-
-        # Count today's activities by type
-        date_str = target_date.isoformat()
-        rows = conn.execute(
-            """SELECT activity_type, COUNT(*) as cnt
-               FROM activities
-               WHERE DATE(created_at) = ?
-               GROUP BY activity_type""",
-            (date_str,),
-        ).fetchall()
-
-        type_counts: dict[str, int] = {}
-        for row in rows:
-            type_counts[row["activity_type"]] = row["cnt"]
+        # Today's activities by type, from the trigger-maintained counters
+        activities = self._db.get_pipeline_counters(target_date).activities_today
+        type_counts = {activity_type.value: count for activity_type, count in activities.items()}
 
         # Cards processed = status changes + skips + defers
         cards_processed = (
@@ -1420,11 +1420,11 @@ class IronLungApp:
             parts = []
 
             # Core pipeline counts
-            pop_counts = self.db.get_population_counts()
+            counters = self.db.get_pipeline_counters()
+            pop_counts = counters.population_counts
             from src.db.models import Population
 
-            total = sum(pop_counts.values())
-            parts.append(f"{total} prospects")
+            parts.append(f"{counters.total} prospects")
             parts.append(f"{pop_counts.get(Population.ENGAGED, 0)} engaged")
 
             # Dashboard stats (if available)
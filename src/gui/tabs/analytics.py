@@ -2,8 +2,12 @@
 
 Step 7.8: Revenue tracking, commission earned, close rate,
 cycle time, top sources, pipeline movement. Numbers + CSV export.
+
+Reports are built on a worker thread from a read snapshot, so a long
+report never holds up card processing on the Today tab.
 """
 
+import threading
 import tkinter as tk
 from datetime import date
 from pathlib import Path
@@ -24,7 +28,10 @@ class AnalyticsTab(TabBase):
     def __init__(self, parent: tk.Widget, db: Database):
         super().__init__(parent, db)
         self._summary: MonthlySummary | None = None
+        self._pop_counts: dict[Population, int] = {}
         self._current_month: str = date.today().strftime("%Y-%m")
+        # Bumped per load so a slow, superseded report is dropped on arrival
+        self._load_generation = 0
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -124,17 +131,60 @@ class AnalyticsTab(TabBase):
             self._pipeline_labels[key] = val
 
     def refresh(self) -> None:
-        """Reload analytics from database."""
+        """Reload analytics from database in the background."""
+        self._start_load()
+
+    def _start_load(self, export: bool = False) -> None:
+        """Build the report for the selected month on a worker thread.
+
+        Args:
+            export: Offer the CSV export once the report arrives
+        """
         self._current_month = self._month_var.get().strip()
+        self._load_generation += 1
+        thread = threading.Thread(
+            target=self._load_report,
+            args=(self._load_generation, self._current_month, export),
+            daemon=True,
+        )
+        thread.start()
+
+    def _load_report(self, generation: int, month: str, export: bool) -> None:
+        """Background worker: build the summary and hand it to the main thread."""
+        summary: MonthlySummary | None = None
+        pop_counts: dict[Population, int] = {}
         try:
-            self._summary = generate_monthly_summary(self.db, self._current_month)
+            summary = generate_monthly_summary(self.db, month)
+            pop_counts = self.db.get_population_counts()
         except Exception as e:
             logger.error(
                 "Analytics refresh failed",
-                extra={"context": {"month": self._current_month, "error": str(e)}},
+                extra={"context": {"month": month, "error": str(e)}},
             )
-            self._summary = None
+        finally:
+            # Each refresh runs on a new thread; don't leave its reader open
+            self.db.release_thread_connection()
+        try:
+            self.parent.after(0, self._apply_report, generation, summary, pop_counts, export)
+        except (RuntimeError, tk.TclError):
+            # Window closed while the report was running
+            pass
+
+    def _apply_report(
+        self,
+        generation: int,
+        summary: MonthlySummary | None,
+        pop_counts: dict[Population, int],
+        export: bool,
+    ) -> None:
+        """Called on the main thread when a report finishes."""
+        if generation != self._load_generation:
+            return
+        self._summary = summary
+        self._pop_counts = pop_counts
         self._update_display()
+        if export:
+            self._export_csv()
 
     def on_activate(self) -> None:
         """Called when tab becomes visible."""
@@ -186,7 +236,6 @@ class AnalyticsTab(TabBase):
         self._metrics_labels["lost"].configure(text=str(s.pipeline_lost))
 
         # Pipeline snapshot (current, not month-specific)
-        pop_counts = self.db.get_population_counts()
         pop_map = {
             "engaged": Population.ENGAGED,
             "unengaged": Population.UNENGAGED,
@@ -196,14 +245,13 @@ class AnalyticsTab(TabBase):
             "lost_pop": Population.LOST,
         }
         for key, pop in pop_map.items():
-            count = pop_counts.get(pop, 0)
+            count = self._pop_counts.get(pop, 0)
             self._pipeline_labels[key].configure(text=str(count))
 
     def generate_report(self, month: str) -> None:
         """Generate and export monthly report."""
         self._month_var.set(month)
-        self.refresh()
-        self._export_csv()
+        self._start_load(export=True)
 
     def _export_csv(self) -> None:
         """Export current summary to CSV."""
@@ -204,10 +204,11 @@ class CalendarTab(TabBase):
                               p.engagement_stage, c.timezone as company_tz
                        FROM prospects p
                        LEFT JOIN companies c ON p.company_id = c.id
-                       WHERE DATE(p.follow_up_date) = DATE(?)
+                       WHERE p.follow_up_date >= DATE(?) AND p.follow_up_date < DATE(?, '+1 day')
                        AND p.population NOT IN (?, ?, ?)
                        ORDER BY p.prospect_score DESC""",
                     (
+                        day_iso,
                         day_iso,
                         Population.DEAD_DNC.value,
                         Population.CLOSED_WON.value,
@@ -302,10 +303,11 @@ class CalendarTab(TabBase):
                           c.name as company_name, c.timezone as company_tz
                    FROM prospects p
                    LEFT JOIN companies c ON p.company_id = c.id
-                   WHERE DATE(p.follow_up_date) = DATE(?)
+                   WHERE p.follow_up_date >= DATE(?) AND p.follow_up_date < DATE(?, '+1 day')
                    AND p.population NOT IN (?, ?, ?)
                    ORDER BY c.timezone ASC, p.prospect_score DESC""",
                 (
+                    day_iso,
                     day_iso,
                     Population.DEAD_DNC.value,
                     Population.CLOSED_WON.value,
@@ -1,9 +1,10 @@
 """Import tab - File upload, mapping, and preview."""
 
+import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from src.core.logging import get_logger
 from src.gui.tabs import TabBase
@@ -107,6 +108,9 @@ class ImportTab(TabBase):
         )
         self._import_btn.pack(side=tk.LEFT, padx=5)
 
+        self._progress_label = ttk.Label(action_frame, text="")
+        self._progress_label.pack(side=tk.LEFT, padx=10)
+
         # Import history section
         history_frame = ttk.LabelFrame(scrollable_frame, text="Import History", padding=10)
         history_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -118,6 +122,10 @@ class ImportTab(TabBase):
         history_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self._history_text.config(yscrollcommand=history_scroll.set)
 
+    def _show_import_progress(self, done: int, total: int) -> None:
+        """Render commit progress posted by the import worker."""
+        self._progress_label.config(text=f"Importing... {done:,} / {total:,}")
+
     def _sync_from_trello(self) -> None:
         """Run Trello-to-pipeline sync."""
         if self.app:
@@ -417,6 +425,29 @@ class ImportTab(TabBase):
                 self._preset_var.get() if self._preset_var.get() != "None" else None,
             )
 
+            # Backup, analysis, commit and rescore run on a worker thread so the
+            # window keeps taking input; results come back through after()
+            self._import_btn.config(state="disabled")
+            self._preview_btn.config(state="disabled")
+            self._progress_label.config(text="Importing...")
+            threading.Thread(target=self._run_import, args=(records, filename), daemon=True).start()
+
+        except Exception as e:
+            messagebox.showerror("Error", f"Import failed: {e}")
+            logger.error(f"Import execution failed: {e}")
+
+    def _post(self, callback: Callable[..., None], *args: Any) -> None:
+        """Hand ``callback`` to the Tk thread; ignored once the window is gone."""
+        try:
+            self.parent.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _run_import(self, records: list, filename: str) -> None:
+        """Background worker: back up, analyze, commit and rescore one import."""
+        result = None
+        error: Optional[Exception] = None
+        try:
             # Pre-import backup (safety net)
             try:
                 from src.db.backup import BackupManager
@@ -435,8 +466,10 @@ class ImportTab(TabBase):
                 source_name="manual_import",
                 filename=filename,
             )
-
-            result = funnel.commit(preview)
+            result = funnel.commit(
+                preview,
+                progress=lambda done, total: self._post(self._show_import_progress, done, total),
+            )
 
             # Score the newly imported prospects so queue ordering works immediately
             try:
@@ -446,37 +479,47 @@ class ImportTab(TabBase):
                 logger.info(f"Post-import rescore: {scored} prospects scored")
             except Exception as e:
                 logger.warning(f"Post-import rescore failed (non-fatal): {e}")
+        except Exception as e:
+            error = e
+            logger.error(f"Import execution failed: {e}")
+        finally:
+            self.db.release_thread_connection()
+        self._post(self._finish_import, result, error)
+
+    def _finish_import(self, result: Any, error: Optional[Exception]) -> None:
+        """Called on the Tk thread when the import worker is done."""
+        self._progress_label.config(text="")
+        if error is not None or result is None:
+            self._import_btn.config(state="normal")
+            self._preview_btn.config(state="normal")
+            messagebox.showerror("Error", f"Import failed: {error}")
+            return
 
-            # Show success message
-            messagebox.showinfo(
-                "Import Complete",
-                f"Import successful!\n\n"
-                f"Created: {result.imported_count}\n"
-                f"Merged: {result.merged_count}\n"
-                f"Broken: {result.broken_count}",
-            )
-
-            logger.info(
-                f"Import completed: {result.imported_count} created, "
-                f"{result.merged_count} merged"
-            )
-
-            # Refresh history and all data tabs so new prospects appear
-            self.refresh()
-            if self.app and hasattr(self.app, "refresh_data_tabs"):
-                self.app.refresh_data_tabs()
+        # Show success message
+        messagebox.showinfo(
+            "Import Complete",
+            f"Import successful!\n\n"
+            f"Created: {result.imported_count}\n"
+            f"Merged: {result.merged_count}\n"
+            f"Broken: {result.broken_count}",
+        )
 
-            # Clear selection
-            self._selected_file = None
-            self._parse_result = None
-            self._file_label.config(text="No file selected")
-            self._preview_btn.config(state="disabled")
-            self._import_btn.config(state="disabled")
-            self._render_empty_mapping()
+        logger.info(
+            f"Import completed: {result.imported_count} created, {result.merged_count} merged"
+        )
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Import failed: {e}")
-            logger.error(f"Import execution failed: {e}")
+        # Refresh history and all data tabs so new prospects appear
+        self.refresh()
+        if self.app and hasattr(self.app, "refresh_data_tabs"):
+            self.app.refresh_data_tabs()
+
+        # Clear selection
+        self._selected_file = None
+        self._parse_result = None
+        self._file_label.config(text="No file selected")
+        self._preview_btn.config(state="disabled")
+        self._import_btn.config(state="disabled")
+        self._render_empty_mapping()
 
     def _load_import_history(self) -> None:
         """Load import history from database."""
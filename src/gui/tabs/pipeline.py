@@ -1,16 +1,31 @@
 """Pipeline tab - Full database view with filtering."""
 
-import csv
 import tkinter as tk
+from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.core.logging import get_logger
-from src.db.models import Population
+from src.db.models import Population, Prospect
+from src.engine.export import export_prospects
 from src.gui.tabs import TabBase
 
 logger = get_logger(__name__)
 
+# Columns written by Export View: the tree's columns plus company and contact details
+EXPORT_COLUMNS = [
+    "id",
+    "first_name",
+    "last_name",
+    "population",
+    "title",
+    "prospect_score",
+    "company_name",
+    "email",
+    "phone",
+    "tags",
+]
+
 
 class PipelineTab(TabBase):
     """Full pipeline view with filtering and bulk operations."""
@@ -18,6 +33,7 @@ class PipelineTab(TabBase):
     def __init__(self, parent: tk.Widget, db: object):
         super().__init__(parent, db)
         self._tree: Optional[ttk.Treeview] = None
+        self._view_prospects: list[Prospect] = []
         self._population_filter: Optional[str] = None
         self._search_var = tk.StringVar()
         self._population_var = tk.StringVar(value="All")
@@ -175,6 +191,7 @@ class PipelineTab(TabBase):
 
         # Clear existing items
         self._tree.delete(*self._tree.get_children())
+        self._view_prospects = []
 
         # Get filter value
         from src.db.models import Population
@@ -192,38 +209,44 @@ class PipelineTab(TabBase):
 
         # Get prospects
         try:
-            prospects = self.db.get_prospects(
-                population=population_filter,
-                exclude_populations=[Population.BROKEN] if exclude_broken else None,
-                limit=10000,
-            )
-
-            # Apply search filter
-            search_term = self._search_var.get().lower()
+            exclude = [Population.BROKEN] if exclude_broken else None
+            search_term = self._search_var.get().strip()
             if search_term:
-                prospects = [
-                    p
-                    for p in prospects
-                    if search_term in p.full_name.lower()
-                    or (p.title and search_term in p.title.lower())
-                    or (p.population and search_term in p.population.value.lower())
+                batches: Iterable[list[Prospect]] = [
+                    self.db.search(
+                        search_term,
+                        population=population_filter,
+                        exclude_populations=exclude,
+                        limit=10000,
+                    )
                 ]
-
-            # Insert into tree
-            for p in prospects:
-                self._tree.insert(
-                    "",
-                    tk.END,
-                    values=(
-                        p.id,
-                        p.full_name,
-                        p.population.value if p.population else "",
-                        p.title or "",
-                        str(p.prospect_score or ""),
-                    ),
+            else:
+                batches = self.db.iter_prospects(
+                    populations=[population_filter] if population_filter else None,
+                    exclude_populations=exclude,
+                    sort_by="prospect_score",
+                    sort_dir="DESC",
                 )
 
-            logger.info(f"Pipeline refreshed: {len(prospects)} prospects loaded")
+            # Insert into tree a batch at a time
+            loaded = 0
+            for prospects in batches:
+                for p in prospects:
+                    self._tree.insert(
+                        "",
+                        tk.END,
+                        values=(
+                            p.id,
+                            p.full_name,
+                            p.population.value if p.population else "",
+                            p.title or "",
+                            str(p.prospect_score or ""),
+                        ),
+                    )
+                self._view_prospects.extend(prospects)
+                loaded += len(prospects)
+
+            logger.info(f"Pipeline refreshed: {loaded} prospects loaded")
         except Exception as e:
             logger.error(f"Failed to refresh pipeline: {e}")
             messagebox.showerror("Error", f"Failed to load prospects: {e}")
@@ -240,6 +263,9 @@ class PipelineTab(TabBase):
         """Export current view to CSV."""
         if self._tree is None:
             return
+        if not self._view_prospects:
+            messagebox.showwarning("Warning", "No prospects in the current view")
+            return
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
@@ -248,18 +274,12 @@ class PipelineTab(TabBase):
         if not file_path:
             return
 
-        try:
-            with open(file_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["ID", "Name", "Population", "Title", "Score"])
-                for row_id in self._tree.get_children():
-                    writer.writerow(self._tree.item(row_id)["values"])
-
+        # Company, email, phone and tags are loaded in batches from one snapshot
+        if export_prospects(self._view_prospects, Path(file_path), EXPORT_COLUMNS, db=self.db):
             messagebox.showinfo("Export Complete", f"Exported to {file_path}")
             logger.info(f"Pipeline exported to {file_path}")
-        except Exception as e:
-            logger.error(f"Export failed: {e}")
-            messagebox.showerror("Error", f"Export failed: {e}")
+        else:
+            messagebox.showerror("Error", "Export failed; see the log for details")
 
     def _apply_bulk_move(self) -> None:
         """Apply bulk move to selected prospects."""
@@ -15,6 +15,7 @@ from tkinter import filedialog, messagebox, ttk
 from typing import Optional
 
 from src.core.logging import get_logger
+from src.db.profiler import get_query_profiler
 from src.gui.tabs import TabBase
 from src.gui.theme import COLORS
 
@@ -292,6 +293,60 @@ class SettingsTab(TabBase):
             side="left"
         )
 
+        # --- Database Diagnostics ---
+        sep_diag = ttk.Separator(container, orient="horizontal")
+        sep_diag.pack(fill="x", padx=12, pady=8)
+        ttk.Label(container, text="Database Diagnostics", font=("Segoe UI", 12, "bold")).pack(
+            anchor="w", padx=12, pady=4
+        )
+        ttk.Label(
+            container,
+            text="Per-statement SQL timings. Slow statements show their query plan; "
+            "[SCAN] marks a full table walk. Start with --db-profile to record from launch.",
+            foreground="#6c757d",
+            wraplength=650,
+        ).pack(anchor="w", padx=24, pady=(0, 4))
+
+        diag_frame = ttk.Frame(container)
+        diag_frame.pack(fill="x", padx=12, pady=4)
+        self._profile_var = tk.BooleanVar(value=get_query_profiler().enabled)
+        ttk.Checkbutton(
+            diag_frame,
+            text="Profile queries",
+            variable=self._profile_var,
+            command=self._toggle_profiling,
+        ).pack(side="left", padx=(0, 8))
+        ttk.Button(diag_frame, text="Refresh", command=self._refresh_diagnostics).pack(
+            side="left", padx=(0, 8)
+        )
+        ttk.Button(diag_frame, text="Reset", command=self._reset_diagnostics).pack(side="left")
+
+        self._diag_text = tk.Text(
+            container, height=12, wrap="none", state="disabled", font=("Consolas", 9)
+        )
+        self._diag_text.pack(fill="x", padx=12, pady=(4, 0))
+
+        # --- Nightly Performance ---
+        sep_nightly = ttk.Separator(container, orient="horizontal")
+        sep_nightly.pack(fill="x", padx=12, pady=8)
+        ttk.Label(container, text="Nightly Performance", font=("Segoe UI", 12, "bold")).pack(
+            anchor="w", padx=12, pady=4
+        )
+        ttk.Label(
+            container,
+            text="Per-step time, rows and API calls of recent nightly runs, compared with "
+            "the median of the runs before. Also available with --nightly-report.",
+            foreground="#6c757d",
+            wraplength=650,
+        ).pack(anchor="w", padx=24, pady=(0, 4))
+        ttk.Button(container, text="Refresh", command=self._refresh_nightly_report).pack(
+            anchor="w", padx=12, pady=4
+        )
+        self._nightly_text = tk.Text(
+            container, height=16, wrap="none", state="disabled", font=("Consolas", 9)
+        )
+        self._nightly_text.pack(fill="x", padx=12, pady=(4, 0))
+
         # --- Update Application ---
         sep4 = ttk.Separator(container, orient="horizontal")
         sep4.pack(fill="x", padx=12, pady=8)
@@ -466,12 +521,59 @@ class SettingsTab(TabBase):
         self._load_current_values()
         self._refresh_readiness()
         self._refresh_status()
+        self._refresh_diagnostics()
+        self._refresh_nightly_report()
         logger.info("Settings tab refreshed")
 
     def on_activate(self) -> None:
         """Called when this tab becomes visible."""
         self.refresh()
 
+    # ------------------------------------------------------------------
+    # Database diagnostics
+    # ------------------------------------------------------------------
+
+    def _toggle_profiling(self) -> None:
+        """Turn the query profiler on or off from the checkbox."""
+        profiler = get_query_profiler()
+        if self._profile_var.get():
+            profiler.enable()
+        else:
+            profiler.disable()
+        self._refresh_diagnostics()
+
+    def _reset_diagnostics(self) -> None:
+        """Discard recorded statement timings."""
+        get_query_profiler().reset()
+        self._refresh_diagnostics()
+
+    def _refresh_diagnostics(self) -> None:
+        """Show the profiler's top statements."""
+        profiler = get_query_profiler()
+        self._profile_var.set(profiler.enabled)
+        if profiler.enabled or profiler.report():
+            text = profiler.format_report()
+        else:
+            text = "Profiling is off. Tick 'Profile queries' or start with --db-profile."
+        self._diag_text.config(state="normal")
+        self._diag_text.delete("1.0", tk.END)
+        self._diag_text.insert("1.0", text)
+        self._diag_text.config(state="disabled")
+
+    def _refresh_nightly_report(self) -> None:
+        """Show nightly step trends and regressions."""
+        from src.autonomous.nightly_report import build_nightly_report, format_nightly_report
+
+        try:
+            text = format_nightly_report(build_nightly_report(self.db))
+        except Exception as e:
+            logger.warning(f"Nightly report unavailable: {e}")
+            text = f"Nightly report unavailable: {e}"
+        self._nightly_text.config(state="normal")
+        self._nightly_text.delete("1.0", tk.END)
+        self._nightly_text.insert("1.0", text)
+        self._nightly_text.config(state="disabled")
+
     # ------------------------------------------------------------------
     # Backup / Restore
     # ------------------------------------------------------------------
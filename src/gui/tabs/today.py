@@ -101,8 +101,7 @@ class TodayTab(TabBase):
             return
 
         try:
-            pop_counts = self.db.get_population_counts()
-            total = sum(pop_counts.values())
+            total = self.db.get_pipeline_counters().total
         except Exception:
             total = 0
 
@@ -261,8 +260,7 @@ class TodayTab(TabBase):
         """Called when this tab becomes visible."""
         # Check if database is empty — if so, show onboarding (not the brief)
         try:
-            pop_counts = self.db.get_population_counts()
-            total = sum(pop_counts.values())
+            total = self.db.get_pipeline_counters().total
         except Exception:
             total = 0
 
@@ -778,7 +776,7 @@ class TodayTab(TabBase):
         if not query or not self.frame:
             return
 
-        results = self.db.get_prospects(search_query=query, limit=10)
+        results = self.db.search(query, limit=10)
         if not results:
             messagebox.showinfo(
                 "Search", f"No prospects found for '{query}'", parent=self.frame.winfo_toplevel()
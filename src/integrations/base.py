@@ -4,7 +4,7 @@ All integrations inherit from IntegrationBase, which provides:
     - Health check interface
     - Configuration check
     - Rate limiting
-    - Retry with exponential backoff
+    - Retry with exponential backoff (each attempt counted in run_metrics)
     - Logging patterns
 """
 
@@ -14,6 +14,7 @@ from typing import Any, Callable, Optional, TypeVar
 
 from src.core.exceptions import IntegrationError
 from src.core.logging import get_logger
+from src.utils.run_metrics import count_api_call
 
 logger = get_logger(__name__)
 
@@ -73,6 +74,7 @@ class IntegrationBase(ABC):
         delay = base_delay
 
         for attempt in range(max_retries + 1):
+            count_api_call()
             try:
                 return func()
             except exceptions as e:
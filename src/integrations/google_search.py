@@ -19,6 +19,7 @@ import requests  # type: ignore[import-untyped]
 from src.core.exceptions import IntegrationError
 from src.core.logging import get_logger
 from src.integrations.base import IntegrationBase
+from src.utils.run_metrics import count_api_call
 
 logger = get_logger(__name__)
 
@@ -76,6 +77,8 @@ class GoogleSearchClient(IntegrationBase):
             return False
 
         try:
+            # Not retried, so with_retry does not count it
+            count_api_call()
             response = requests.get(
                 GOOGLE_CSE_URL,
                 params={
@@ -381,13 +381,13 @@ class TrelloPipelineSync:
 
     def _find_prospect_by_name(self, first_name: str, last_name: str) -> Optional[Prospect]:
         """Find an existing prospect by first + last name."""
-        prospects = self._db.get_prospects(limit=10000)
-        for p in prospects:
-            if (
-                p.first_name.lower() == first_name.lower()
-                and p.last_name.lower() == last_name.lower()
-            ):
-                return p
+        for prospects in self._db.iter_prospects():
+            for p in prospects:
+                if (
+                    p.first_name.lower() == first_name.lower()
+                    and p.last_name.lower() == last_name.lower()
+                ):
+                    return p
         return None
 
     def _find_or_create_company(self, name: str) -> int:
@@ -0,0 +1,77 @@
+"""Process measurements for nightly run telemetry.
+
+Outbound API requests are counted per thread, so a nightly step running on
+a worker thread can read how many calls it made while other steps run
+beside it. Integrations count each attempt in IntegrationBase.with_retry;
+Claude calls are counted when their usage is tracked.
+
+Usage:
+    from src.utils.run_metrics import api_calls_on_thread, peak_rss_kb
+
+    before = api_calls_on_thread()
+    do_work()
+    calls = api_calls_on_thread() - before
+"""
+
+import sys
+import threading
+from typing import Optional
+
+_local = threading.local()
+
+
+def count_api_call() -> None:
+    """Note one outbound API request made by the calling thread."""
+    _local.calls = getattr(_local, "calls", 0) + 1
+
+
+def api_calls_on_thread() -> int:
+    """Outbound API requests the calling thread has made so far."""
+    return int(getattr(_local, "calls", 0))
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KiB, or None if unavailable.
+
+    The peak covers the life of the process, so for a nightly run started
+    from the GUI it includes whatever the GUI used before the run.
+    """
+    if sys.platform == "win32":
+        return _windows_peak_rss_kb()
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return int(peak // 1024 if sys.platform == "darwin" else peak)
+
+
+def _windows_peak_rss_kb() -> Optional[int]:
+    """PeakWorkingSetSize from GetProcessMemoryInfo."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        windll = ctypes.windll  # type: ignore[attr-defined]
+        process = windll.kernel32.GetCurrentProcess()
+        if not windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return int(counters.PeakWorkingSetSize // 1024)
+    except (AttributeError, OSError):
+        return None
@@ -178,6 +178,34 @@ class TestScheduleDemo:
         assert len(demo_activities) >= 1
 
 
+class TestActionBatch:
+    """Test that a batch of actions commits as one unit of work."""
+
+    def test_failed_action_keeps_the_others(self, anne, populated_db, prospect_id, monkeypatch):
+        """A failing action is rolled back to its savepoint; the rest persist."""
+
+        def explode(action):
+            prospect = populated_db.get_prospect(prospect_id)
+            prospect.prospect_score = 99
+            populated_db.update_prospect(prospect)
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(anne, "_execute_log_activity", explode)
+        before = populated_db.get_prospect(prospect_id).prospect_score
+        result = anne.execute_actions(
+            [
+                {"action": "log_note", "prospect_id": prospect_id, "text": "batched note"},
+                {"action": "log_activity", "prospect_id": prospect_id, "type": "call"},
+            ]
+        )
+        assert result["executed"] == ["log_note"]
+        assert len(result["failed"]) == 1
+        assert populated_db.get_prospect(prospect_id).prospect_score == before
+        notes = [a.notes for a in populated_db.get_activities(prospect_id)]
+        assert "batched note" in notes
+        assert not populated_db._get_connection().in_transaction
+
+
 class TestUnknownAction:
     """Test error handling for unknown actions."""
 
@@ -56,15 +56,18 @@ class TestCaptureEmailActivity:
         assert row is not None
         assert row["activity_type"] == ActivityType.EMAIL_RECEIVED.value
 
-    def test_notes_contain_message_id_marker(self, fk_relaxed_db: Database):
-        """Activity notes contain the message_id marker."""
+    def test_message_id_stored_in_column(self, fk_relaxed_db: Database):
+        """Activity records the message id in its message_id column."""
         activity_id = capture_email_activity(fk_relaxed_db, "email-msg-003")
         assert activity_id is not None
 
         conn = fk_relaxed_db._get_connection()
-        row = conn.execute("SELECT notes FROM activities WHERE id = ?", (activity_id,)).fetchone()
+        row = conn.execute(
+            "SELECT message_id, message_source FROM activities WHERE id = ?", (activity_id,)
+        ).fetchone()
         assert row is not None
-        assert "message_id:email-msg-003" in row["notes"]
+        assert row["message_id"] == "email-msg-003"
+        assert row["message_source"] == "outlook"
 
     def test_duplicate_returns_none(self, fk_relaxed_db: Database):
         """Second capture of same message_id returns None."""
@@ -162,7 +165,7 @@ class TestCrossTypeDuplication:
         email_id = capture_email_activity(fk_relaxed_db, "shared-id-001")
         cal_id = capture_calendar_activity(fk_relaxed_db, "shared-id-001")
 
-        # Both should succeed because markers differ: message_id: vs event_id:
+        # Both should succeed: emails key on message_id, calendar on its event_id marker
         assert email_id is not None
         assert cal_id is not None
         assert email_id != cal_id
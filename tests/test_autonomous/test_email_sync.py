@@ -328,6 +328,34 @@ class TestSyncSent:
         second = sync.sync_sent(since=datetime.utcnow() - timedelta(days=1))
         assert second == 0
 
+    def test_each_matched_recipient_gets_activity(self, fk_relaxed_db: Database):
+        """One message to two prospects logs one EMAIL_SENT per prospect."""
+        first = _setup_prospect_with_email(fk_relaxed_db, "one@example.com", "One", "Rcpt")
+        second = _setup_prospect_with_email(fk_relaxed_db, "two@example.com", "Two", "Rcpt")
+
+        sent_messages = [
+            {
+                "id": "sent-msg-4",
+                "toRecipients": [
+                    {"emailAddress": {"address": "one@example.com"}},
+                    {"emailAddress": {"address": "two@example.com"}},
+                ],
+                "subject": "Group note",
+                "bodyPreview": "Hi both.",
+                "sentDateTime": "2026-02-18T15:00:00Z",
+            },
+        ]
+        sync = EmailSync(db=fk_relaxed_db, outlook=MockOutlookClient(sent_messages=sent_messages))
+
+        assert sync.sync_sent(since=datetime.utcnow() - timedelta(days=1)) == 2
+        for pid in (first, second):
+            sent = [
+                a
+                for a in fk_relaxed_db.get_activities(pid)
+                if a.activity_type == ActivityType.EMAIL_SENT
+            ]
+            assert [a.message_id for a in sent] == ["sent-msg-4"]
+
     def test_returns_zero_for_empty_sentitems(self, fk_relaxed_db: Database):
         """No sent messages -> 0 synced."""
         outlook = MockOutlookClient(sent_messages=[])
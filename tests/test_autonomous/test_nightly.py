@@ -2,27 +2,40 @@
 
 Covers:
     - run_nightly_cycle: full 11-step cycle completes with error capture
+    - _run_steps: dependency order, failure isolation, per-step timings
+    - nightly_runs checkpoints: skipping finished steps, cursors, resume window
     - run_condensed_cycle: quick catch-up cycle completes
     - check_last_run: sentinel lookup in data_freshness table
+    - _assess_broken: promotion of completed Broken records, incremental after the first run
     - _activate_monthly_buckets: parked prospect reactivation
     - _import_ac_contacts: ActiveCampaign contact import into DB
-    - _extract_intel_from_activities: keyword-based intel nugget extraction
+    - intel step: backlog extraction counts the activities it scanned
 """
 
+import threading
+import time
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 import pytest
 
 from src.autonomous.nightly import (
+    NIGHTLY_STEPS,
+    RESUME_WINDOW_HOURS,
     NightlyCycleResult,
+    NightlyStep,
+    StepCheckpoint,
     _activate_monthly_buckets,
-    _extract_intel_from_activities,
+    _assess_broken,
     _import_ac_contacts,
     _is_first_business_day,
+    _open_run,
     _record_cycle_run,
+    _run_steps,
+    _step_intel,
     check_last_run,
+    format_nightly_runs,
     run_condensed_cycle,
     run_nightly_cycle,
 )
@@ -34,9 +47,11 @@ from src.db.models import (
     ContactMethod,
     ContactMethodType,
     IntelCategory,
+    NightlyStatus,
     Population,
     Prospect,
 )
+from src.utils.run_metrics import count_api_call
 
 
 @pytest.fixture
@@ -95,6 +110,8 @@ class TestRunNightlyCycle:
 
         for field_name in [
             "backups_created",
+            "activities_archived",
+            "texts_compressed",
             "prospects_imported",
             "duplicates_merged",
             "research_completed",
@@ -115,6 +132,306 @@ class TestRunNightlyCycle:
         last = check_last_run(fk_relaxed_db)
         assert last is not None
 
+    def test_records_timing_for_every_step(self, memory_db: Database):
+        result = run_nightly_cycle(memory_db)
+
+        assert sorted(t.name for t in result.steps) == sorted(s.name for s in NIGHTLY_STEPS)
+        for timing in result.steps:
+            assert timing.duration_seconds >= 0
+            assert timing.wait_seconds >= 0
+
+    def test_runs_on_file_database(self, temp_db: Database):
+        result = run_nightly_cycle(temp_db, max_workers=4)
+
+        assert len(result.steps) == len(NIGHTLY_STEPS)
+        assert check_last_run(temp_db) is not None
+
+    def test_intel_scans_old_notes_before_archive(self, temp_db: Database):
+        """Old notes yield nuggets before archive moves them; those rows stay put."""
+        company_id = temp_db.create_company(Company(name="Archive Intel Co"))
+        pid = temp_db.create_prospect(
+            Prospect(company_id=company_id, first_name="Old", last_name="Notes")
+        )
+        old = (datetime.now() - timedelta(days=800)).strftime("%Y-%m-%d %H:%M:%S")
+        conn = temp_db._get_connection()
+        conn.executemany(
+            "INSERT INTO activities (prospect_id, activity_type, notes, created_at) "
+            "VALUES (?, 'call', ?, ?)",
+            [
+                (
+                    (pid, f"Call {i}: they are worried about item {i}.", old)
+                    if i % 2
+                    else (pid, f"Call {i}: left a voicemail about item {i}.", old)
+                )
+                for i in range(1200)
+            ],
+        )
+        conn.commit()
+        recent = temp_db.create_activity(
+            Activity(
+                prospect_id=pid,
+                activity_type=ActivityType.CALL,
+                notes="They are currently using CompetitorX for processing.",
+            )
+        )
+
+        result = run_nightly_cycle(temp_db, max_workers=4)
+
+        assert not [e for e in result.errors if "Intel" in e]
+        nuggets = temp_db.get_intel_nuggets(pid)
+        assert len(nuggets) == 601
+        assert recent in {n.source_activity_id for n in nuggets}
+        # Archive keeps activities a nugget points at and moves the rest
+        assert result.activities_archived == 600
+
+
+# ===========================================================================
+# _run_steps
+# ===========================================================================
+
+
+class TestRunSteps:
+    """Dependency-ordered execution on the worker pool."""
+
+    def test_dependency_graph_is_closed(self):
+        names = {step.name for step in NIGHTLY_STEPS}
+        assert len(names) == len(NIGHTLY_STEPS)
+        for step in NIGHTLY_STEPS:
+            assert set(step.depends_on) <= names, step.name
+
+    def test_steps_start_after_their_dependencies(self, temp_db: Database):
+        finished: list[str] = []
+        started: dict[str, list[str]] = {}
+        lock = threading.Lock()
+
+        def track(name: str):
+            def run(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+                with lock:
+                    started[name] = list(finished)
+                time.sleep(0.01)
+                with lock:
+                    finished.append(name)
+
+            return run
+
+        steps = [NightlyStep(s.name, s.label, track(s.name), s.depends_on) for s in NIGHTLY_STEPS]
+        _run_steps(temp_db, steps, NightlyCycleResult(started_at=datetime.now()), workers=4)
+
+        assert sorted(finished) == sorted(s.name for s in NIGHTLY_STEPS)
+        for step in NIGHTLY_STEPS:
+            assert set(step.depends_on) <= set(started[step.name]), step.name
+
+    def test_independent_steps_overlap(self, temp_db: Database):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            barrier.wait()
+
+        steps = [NightlyStep("a", "A", meet), NightlyStep("b", "B", meet)]
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(temp_db, steps, result, workers=2)
+
+        assert result.errors == []
+
+    def test_failed_step_still_releases_dependents(self, temp_db: Database):
+        ran: list[str] = []
+
+        def fail(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            raise RuntimeError("boom")
+
+        def record(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            ran.append("after")
+
+        steps = [
+            NightlyStep("first", "1 (First)", fail),
+            NightlyStep("after", "2 (After)", record, ("first",)),
+        ]
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(temp_db, steps, result, workers=2)
+
+        assert ran == ["after"]
+        assert result.errors == ["Step 1 (First): boom"]
+        timings = {t.name: t for t in result.steps}
+        assert timings["first"].error == "boom"
+        assert timings["after"].error is None
+
+    def test_wait_time_counts_queueing_for_a_worker(self, temp_db: Database):
+        def slow(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            time.sleep(0.05)
+
+        steps = [NightlyStep("a", "A", slow), NightlyStep("b", "B", slow)]
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(temp_db, steps, result, workers=1)
+
+        waits = sorted(t.wait_seconds for t in result.steps)
+        assert waits[1] >= 0.04
+
+    def test_dependency_cycle_raises(self, temp_db: Database):
+        def noop(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            pass
+
+        steps = [NightlyStep("a", "A", noop, ("b",)), NightlyStep("b", "B", noop, ("a",))]
+        with pytest.raises(ValueError):
+            _run_steps(temp_db, steps, NightlyCycleResult(started_at=datetime.now()), workers=2)
+
+
+# ===========================================================================
+# nightly_runs checkpoints
+# ===========================================================================
+
+
+def _recording_steps(ran: list[str], seen: dict[str, Optional[str]]) -> list[NightlyStep]:
+    """Two-step graph whose steps log their name and the cursor they were handed."""
+
+    def make(name: str):
+        def run(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            ran.append(name)
+            seen[name] = checkpoint.cursor
+            checkpoint.save(f"{name}-progress")
+
+        return run
+
+    return [
+        NightlyStep("first", "1 (First)", make("first")),
+        NightlyStep("second", "2 (Second)", make("second"), ("first",)),
+    ]
+
+
+class TestNightlyRunCheckpoints:
+    """Run and step state persisted in nightly_runs."""
+
+    def test_cycle_records_finished_run(self, memory_db: Database):
+        result = run_nightly_cycle(memory_db)
+
+        run = memory_db.get_nightly_run(result.run_id)
+        assert run is not None
+        assert run.status in (NightlyStatus.DONE, NightlyStatus.FAILED)
+        assert run.completed_at is not None
+        assert [s.name for s in run.steps] == [s.name for s in NIGHTLY_STEPS]
+        assert all(s.status in (NightlyStatus.DONE, NightlyStatus.FAILED) for s in run.steps)
+
+    def test_steps_record_state_and_cursor(self, memory_db: Database):
+        ran: list[str] = []
+        seen: dict[str, Optional[str]] = {}
+        run = memory_db.start_nightly_run(["first", "second"])
+        result = NightlyCycleResult(started_at=datetime.now())
+
+        _run_steps(memory_db, _recording_steps(ran, seen), result, workers=1, run=run)
+
+        saved = memory_db.get_nightly_run(run.id)
+        assert [s.status for s in saved.steps] == [NightlyStatus.DONE, NightlyStatus.DONE]
+        assert saved.step("second").cursor == "second-progress"
+        assert seen == {"first": None, "second": None}
+
+    def test_resume_skips_done_steps_and_hands_back_cursor(self, memory_db: Database):
+        run = memory_db.start_nightly_run(["first", "second"])
+        memory_db.update_nightly_step(run.id, "first", NightlyStatus.DONE)
+        memory_db.update_nightly_step(run.id, "second", NightlyStatus.RUNNING)
+        memory_db.checkpoint_nightly_step(run.id, "second", "halfway")
+        run = memory_db.resume_nightly_run(run.id, ["first", "second"])
+
+        ran: list[str] = []
+        seen: dict[str, Optional[str]] = {}
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(memory_db, _recording_steps(ran, seen), result, workers=1, run=run)
+
+        assert ran == ["second"]
+        assert seen["second"] == "halfway"
+        timings = {t.name: t for t in result.steps}
+        assert timings["first"].skipped
+        assert not timings["second"].skipped
+
+    def test_failed_step_is_recorded(self, memory_db: Database):
+        def fail(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            raise RuntimeError("boom")
+
+        run = memory_db.start_nightly_run(["only"])
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(memory_db, [NightlyStep("only", "1", fail)], result, workers=1, run=run)
+
+        step = memory_db.get_nightly_run(run.id).step("only")
+        assert step.status == NightlyStatus.FAILED
+        assert step.error == "boom"
+
+    def test_open_run_resumes_recent_interrupted_run(self, memory_db: Database):
+        interrupted = memory_db.start_nightly_run([s.name for s in NIGHTLY_STEPS])
+
+        run = _open_run(memory_db, resume=True)
+
+        assert run.id == interrupted.id
+        assert run.resumes == 1
+
+    def test_open_run_abandons_stale_run(self, memory_db: Database):
+        stale = memory_db.start_nightly_run([s.name for s in NIGHTLY_STEPS])
+        memory_db._get_connection().execute(
+            "UPDATE nightly_runs SET started_at = ? WHERE id = ?",
+            (datetime.now() - timedelta(hours=RESUME_WINDOW_HOURS + 1), stale.id),
+        )
+        memory_db._get_connection().commit()
+
+        run = _open_run(memory_db, resume=True)
+
+        assert run.id != stale.id
+        assert memory_db.get_nightly_run(stale.id).status == NightlyStatus.ABANDONED
+
+    def test_open_run_without_resume_starts_fresh(self, memory_db: Database):
+        interrupted = memory_db.start_nightly_run([s.name for s in NIGHTLY_STEPS])
+
+        run = _open_run(memory_db, resume=False)
+
+        assert run.id != interrupted.id
+        assert memory_db.get_nightly_run(interrupted.id).status == NightlyStatus.ABANDONED
+
+    def test_condensed_cycle_finishes_interrupted_run(self, memory_db: Database):
+        interrupted = memory_db.start_nightly_run([s.name for s in NIGHTLY_STEPS])
+
+        result = run_condensed_cycle(memory_db)
+
+        assert result.run_id == interrupted.id
+        assert result.resumed
+        assert memory_db.get_nightly_run(interrupted.id).status != NightlyStatus.RUNNING
+
+    def test_steps_record_telemetry(self, memory_db: Database):
+        def work(db: Database, result: NightlyCycleResult, checkpoint: StepCheckpoint) -> None:
+            db.create_company(Company(name="Telemetry Co"))
+            count_api_call()
+            checkpoint.rows_processed = 7
+
+        run = memory_db.start_nightly_run(["work"])
+        result = NightlyCycleResult(started_at=datetime.now())
+        _run_steps(memory_db, [NightlyStep("work", "1", work)], result, workers=1, run=run)
+
+        timing = result.steps[0]
+        assert (timing.rows_processed, timing.api_calls) == (7, 1)
+        assert timing.rows_written >= 1
+        step = memory_db.get_nightly_run(run.id).step("work")
+        assert step.status == NightlyStatus.DONE
+        assert (step.rows_processed, step.rows_written, step.api_calls) == (
+            7,
+            timing.rows_written,
+            1,
+        )
+        assert step.duration_seconds is not None and step.wait_seconds is not None
+
+    def test_cycle_records_run_duration_and_memory(self, memory_db: Database):
+        result = run_nightly_cycle(memory_db)
+
+        run = memory_db.get_nightly_run(result.run_id)
+        assert run.duration_seconds is not None and run.duration_seconds >= 0
+        assert run.peak_rss_kb == result.peak_rss_kb
+
+    def test_format_nightly_runs(self, memory_db: Database):
+        run = memory_db.start_nightly_run(["backup", "rescore"])
+        memory_db.update_nightly_step(run.id, "backup", NightlyStatus.DONE)
+        memory_db.checkpoint_nightly_step(run.id, "rescore", '{"after": 42}')
+
+        text = format_nightly_runs(memory_db.get_nightly_runs())
+
+        assert f"Run {run.id} [running]" in text
+        assert "backup" in text and "done" in text
+        assert '{"after": 42}' in text
+        assert format_nightly_runs([]) == "No nightly runs recorded."
+
 
 # ===========================================================================
 # run_condensed_cycle
@@ -176,6 +493,52 @@ class TestCheckLastRun:
 # ===========================================================================
 
 
+class TestAssessBroken:
+    """Promote Broken prospects once they have both an email and a phone."""
+
+    def _create_broken(self, db: Database, name: str) -> int:
+        company_id = db.create_company(Company(name=f"{name} Co"))
+        pid = db.create_prospect(
+            Prospect(
+                company_id=company_id,
+                first_name=name,
+                last_name="Broken",
+                population=Population.BROKEN,
+            )
+        )
+        db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.EMAIL, value=f"{name}@x.com")
+        )
+        return pid
+
+    def _add_phone(self, db: Database, pid: int) -> None:
+        db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.PHONE, value="3035551234")
+        )
+
+    def test_first_run_walks_all_broken(self, memory_db: Database):
+        pid = self._create_broken(memory_db, "Alice")
+        self._add_phone(memory_db, pid)
+
+        assert _assess_broken(memory_db) == (1, 1)
+        assert memory_db.get_prospect(pid).population == Population.UNENGAGED
+
+    def test_later_runs_assess_only_changed_prospects(self, memory_db: Database):
+        untouched = self._create_broken(memory_db, "Bob")
+        changed = self._create_broken(memory_db, "Cara")
+        assert _assess_broken(memory_db) == (2, 0)
+
+        self._add_phone(memory_db, untouched)
+        # Hide Bob's change: only prospects in the change log are re-assessed
+        memory_db._get_connection().execute("DELETE FROM change_log")
+        self._add_phone(memory_db, changed)
+
+        # Evaluated counts only Cara, the one prospect in the change log
+        assert _assess_broken(memory_db) == (1, 1)
+        assert memory_db.get_prospect(changed).population == Population.UNENGAGED
+        assert memory_db.get_prospect(untouched).population == Population.BROKEN
+
+
 class TestActivateMonthlyBuckets:
     """Reactivate PARKED prospects whose month has arrived."""
 
@@ -341,110 +704,33 @@ class TestImportACContacts:
 
 
 # ===========================================================================
-# _extract_intel_from_activities
+# intel step
 # ===========================================================================
 
 
-class TestExtractIntelFromActivities:
-    """Keyword-based intel extraction from activity notes."""
-
-    def _create_activity_with_notes(self, db: Database, prospect_id: int, notes: str) -> int:
-        """Helper: create an activity with specific notes."""
-        activity = Activity(
-            prospect_id=prospect_id,
-            activity_type=ActivityType.CALL,
-            notes=notes,
-            created_by="user",
-        )
-        return db.create_activity(activity)
-
-    def _setup_prospect(self, db: Database) -> int:
-        """Helper: create a minimal company + prospect."""
-        company_id = db.create_company(Company(name="Intel Test Co"))
-        return db.create_prospect(
-            Prospect(company_id=company_id, first_name="Intel", last_name="Subject")
-        )
+class TestIntelStep:
+    """Nightly step 11 extracts intel over the activity backlog."""
 
-    def test_extracts_pain_point(self, memory_db: Database):
-        """Activity mentioning 'struggling with' produces a PAIN_POINT nugget."""
-        pid = self._setup_prospect(memory_db)
-        self._create_activity_with_notes(
-            memory_db,
-            pid,
-            "They are struggling with their current loan origination system heavily.",
-        )
-
-        extracted = _extract_intel_from_activities(memory_db)
-        assert extracted >= 1
-
-        nuggets = memory_db.get_intel_nuggets(pid)
-        categories = [n.category for n in nuggets]
-        assert IntelCategory.PAIN_POINT in categories
-
-    def test_extracts_competitor_intel(self, memory_db: Database):
-        """Activity mentioning 'currently using' produces a COMPETITOR nugget."""
-        pid = self._setup_prospect(memory_db)
-        self._create_activity_with_notes(
-            memory_db,
-            pid,
-            "They are currently using CompetitorX for all their processing needs.",
-        )
-
-        extracted = _extract_intel_from_activities(memory_db)
-        assert extracted >= 1
-
-        nuggets = memory_db.get_intel_nuggets(pid)
-        categories = [n.category for n in nuggets]
-        assert IntelCategory.COMPETITOR in categories
-
-    def test_extracts_timeline(self, memory_db: Database):
-        """Activity mentioning 'next quarter' produces a DECISION_TIMELINE nugget."""
-        pid = self._setup_prospect(memory_db)
-        self._create_activity_with_notes(
-            memory_db,
-            pid,
-            "They want to make a decision by next quarter at the latest.",
-        )
-
-        extracted = _extract_intel_from_activities(memory_db)
-        assert extracted >= 1
-
-        nuggets = memory_db.get_intel_nuggets(pid)
-        categories = [n.category for n in nuggets]
-        assert IntelCategory.DECISION_TIMELINE in categories
-
-    def test_no_intel_from_short_notes(self, memory_db: Database):
-        """Notes shorter than 20 chars are ignored by the SQL filter."""
-        pid = self._setup_prospect(memory_db)
-        self._create_activity_with_notes(memory_db, pid, "Short note")
-
-        extracted = _extract_intel_from_activities(memory_db)
-        assert extracted == 0
-
-    def test_no_activities_returns_zero(self, memory_db: Database):
-        """No recent activities -> 0 nuggets."""
-        extracted = _extract_intel_from_activities(memory_db)
-        assert extracted == 0
-
-    def test_duplicate_nuggets_not_created(self, memory_db: Database):
-        """Running extraction twice does not create duplicate nuggets."""
-        pid = self._setup_prospect(memory_db)
-        self._create_activity_with_notes(
-            memory_db,
-            pid,
-            "They are struggling with their legacy platform and need an upgrade soon.",
+    def test_counts_scanned_activities(self, memory_db: Database):
+        company_id = memory_db.create_company(Company(name="Intel Step Co"))
+        pid = memory_db.create_prospect(
+            Prospect(company_id=company_id, first_name="Intel", last_name="Step")
         )
+        for notes in (
+            "They are struggling with their current loan origination system.",
+            "Left a voicemail, will try again tomorrow morning.",
+        ):
+            memory_db.create_activity(
+                Activity(prospect_id=pid, activity_type=ActivityType.CALL, notes=notes)
+            )
 
-        first_run = _extract_intel_from_activities(memory_db)
-        assert first_run >= 1
-
-        second_run = _extract_intel_from_activities(memory_db)
-        assert second_run == 0
+        result = NightlyCycleResult(started_at=datetime.now())
+        checkpoint = StepCheckpoint()
+        _step_intel(memory_db, result, checkpoint)
 
-        nuggets = memory_db.get_intel_nuggets(pid)
-        # Should have exactly the nuggets from the first run, not doubled
-        pain_nuggets = [n for n in nuggets if n.category == IntelCategory.PAIN_POINT]
-        assert len(pain_nuggets) == 1
+        assert result.intel_extracted == 1
+        assert checkpoint.rows_processed == 2
+        assert memory_db.get_intel_nuggets(pid)[0].category == IntelCategory.PAIN_POINT
 
 
 # ===========================================================================
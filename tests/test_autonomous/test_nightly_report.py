@@ -0,0 +1,103 @@
+"""Tests for the nightly telemetry report (src/autonomous/nightly_report.py)."""
+
+from typing import Optional
+
+from src.autonomous.nightly_report import (
+    BASELINE_RUNS,
+    build_nightly_report,
+    format_nightly_report,
+)
+from src.db.database import Database
+from src.db.models import NightlyRunStep, NightlyStatus
+
+
+def _record_run(
+    db: Database,
+    durations: dict[str, float],
+    status: NightlyStatus = NightlyStatus.DONE,
+    peak_rss_kb: Optional[int] = None,
+) -> int:
+    run = db.start_nightly_run(list(durations))
+    for name, seconds in durations.items():
+        db.record_nightly_step(
+            run.id,
+            NightlyRunStep(
+                name=name,
+                status=NightlyStatus.DONE,
+                duration_seconds=seconds,
+                rows_processed=100,
+                rows_written=10,
+                api_calls=2,
+            ),
+        )
+    if status != NightlyStatus.RUNNING:
+        db.finish_nightly_run(
+            run.id, status, duration_seconds=sum(durations.values()), peak_rss_kb=peak_rss_kb
+        )
+    return run.id
+
+
+class TestBuildNightlyReport:
+    def test_empty(self, memory_db: Database):
+        report = build_nightly_report(memory_db)
+
+        assert report.latest is None
+        assert format_nightly_report(report) == "No finished nightly runs recorded."
+
+    def test_baseline_is_median_of_previous_runs(self, memory_db: Database):
+        for seconds in (10.0, 12.0, 40.0):
+            _record_run(memory_db, {"rescore": seconds, "brief": 1.0})
+        _record_run(memory_db, {"rescore": 11.0, "brief": 1.0})
+
+        report = build_nightly_report(memory_db)
+        rescore = next(s for s in report.steps if s.name == "rescore")
+
+        assert rescore.durations == [10.0, 12.0, 40.0, 11.0]
+        assert rescore.latest_seconds == 11.0
+        assert rescore.baseline_seconds == 12.0
+        assert not rescore.regressed
+        assert (rescore.rows_processed, rescore.rows_written, rescore.api_calls) == (100, 10, 2)
+
+    def test_flags_regression_and_slowest_step(self, memory_db: Database):
+        for _ in range(BASELINE_RUNS):
+            _record_run(memory_db, {"rescore": 40.0, "research": 60.0, "brief": 0.2})
+        _record_run(memory_db, {"rescore": 360.0, "research": 61.0, "brief": 0.9})
+
+        report = build_nightly_report(memory_db)
+
+        assert [s.name for s in report.regressions] == ["rescore"]
+        assert report.slowest.name == "rescore"
+        # brief got 4.5x slower but by under REGRESSION_MIN_SECONDS
+        assert not next(s for s in report.steps if s.name == "brief").regressed
+
+    def test_baseline_window_excludes_older_runs(self, memory_db: Database):
+        _record_run(memory_db, {"rescore": 500.0})
+        for _ in range(BASELINE_RUNS):
+            _record_run(memory_db, {"rescore": 10.0})
+        _record_run(memory_db, {"rescore": 11.0})
+
+        rescore = build_nightly_report(memory_db).steps[0]
+        assert rescore.baseline_seconds == 10.0
+
+    def test_ignores_unfinished_runs(self, memory_db: Database):
+        _record_run(memory_db, {"rescore": 10.0})
+        _record_run(memory_db, {"rescore": 99.0}, status=NightlyStatus.RUNNING)
+
+        report = build_nightly_report(memory_db)
+        assert len(report.runs) == 1
+        assert report.steps[0].latest_seconds == 10.0
+
+
+class TestFormatNightlyReport:
+    def test_lists_steps_regressions_and_memory(self, memory_db: Database):
+        for _ in range(3):
+            _record_run(memory_db, {"rescore": 40.0, "brief": 1.0}, peak_rss_kb=204800)
+        run_id = _record_run(memory_db, {"rescore": 400.0, "brief": 1.0}, peak_rss_kb=307200)
+
+        text = format_nightly_report(build_nightly_report(memory_db))
+
+        assert f"Latest run {run_id} (done)" in text
+        assert "peak memory 300 MB" in text
+        assert "Slowest step: rescore (6.7m)" in text
+        assert "Regressions: rescore 6.7m vs 40.0s (10.0x)" in text
+        assert "REGRESSED" in text
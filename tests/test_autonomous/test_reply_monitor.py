@@ -135,6 +135,32 @@ class TestPollInbox:
         email_received = [a for a in activities if a.activity_type == ActivityType.EMAIL_RECEIVED]
         assert len(email_received) >= 1
 
+    def test_repeat_poll_logs_message_once(self, memory_db: Database):
+        """Polling the same message again does not log a second activity."""
+        pid = _setup_prospect_with_email(memory_db, "rita@example.com", "Rita", "Repeat")
+
+        messages = [
+            EmailMessage(
+                id="msg-repeat",
+                from_address="rita@example.com",
+                to_addresses=["jeff@mycompany.com"],
+                subject="Re: Pricing",
+                body="Sounds good.",
+                received_at=datetime.utcnow(),
+            ),
+        ]
+        monitor = ReplyMonitor(db=memory_db, outlook=MockOutlookClient(inbox_messages=messages))
+        monitor.poll_inbox()
+        monitor.poll_inbox()
+
+        email_received = [
+            a
+            for a in memory_db.get_activities(pid)
+            if a.activity_type == ActivityType.EMAIL_RECEIVED
+        ]
+        assert len(email_received) == 1
+        assert email_received[0].message_id == "msg-repeat"
+
     def test_empty_inbox_returns_empty_list(self, memory_db: Database):
         """Empty inbox -> no matches."""
         outlook = MockOutlookClient(inbox_messages=[])
@@ -200,8 +226,10 @@ class TestGetPendingReviews:
             activity_type=ActivityType.EMAIL_RECEIVED,
             outcome=ActivityOutcome.INTERESTED,
             email_subject="Re: Demo?",
-            notes="message_id:msg-100 classification:interested",
+            notes="classification:interested",
             created_by="system",
+            message_id="msg-100",
+            message_source="outlook",
         )
         memory_db.create_activity(activity)
 
@@ -281,8 +309,10 @@ class TestMarkReviewed:
                 prospect_id=pid,
                 activity_type=ActivityType.EMAIL_RECEIVED,
                 outcome=ActivityOutcome.INTERESTED,
-                notes="message_id:msg-300 classification:interested",
+                notes="classification:interested",
                 created_by="system",
+                message_id="msg-300",
+                message_source="outlook",
             )
         )
 
@@ -307,15 +337,18 @@ class TestMarkReviewed:
         conn = memory_db._get_connection()
         conn.execute(
             """INSERT INTO activities
-               (prospect_id, activity_type, outcome, notes, created_by, created_at)
-               VALUES (?, ?, ?, ?, ?, ?)""",
+               (prospect_id, activity_type, outcome, notes, created_by, created_at,
+                message_id, message_source)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 pid,
                 ActivityType.EMAIL_RECEIVED.value,
                 ActivityOutcome.INTERESTED.value,
-                "message_id:msg-400 classification:interested",
+                "classification:interested",
                 "system",
                 "2020-01-01 00:00:00",
+                "msg-400",
+                "outlook",
             ),
         )
         conn.commit()
@@ -333,6 +366,30 @@ class TestMarkReviewed:
         count_after = len([r for r in after if r.prospect_id == pid])
         assert count_after < count_before
 
+    def test_mark_reviewed_twice_logs_once(self, memory_db: Database):
+        """A repeated review of the same message is ignored."""
+        pid = _setup_prospect_with_email(memory_db, "hal@example.com", "Hal", "Twice")
+        memory_db.create_activity(
+            Activity(
+                prospect_id=pid,
+                activity_type=ActivityType.EMAIL_RECEIVED,
+                outcome=ActivityOutcome.INTERESTED,
+                message_id="msg-500",
+                message_source="outlook",
+            )
+        )
+
+        monitor = ReplyMonitor(db=memory_db, outlook=MockOutlookClient())
+        assert monitor.mark_reviewed("msg-500", "promoted") is True
+        assert monitor.mark_reviewed("msg-500", "promoted") is True
+
+        reviews = [
+            a
+            for a in memory_db.get_activities(pid)
+            if a.activity_type == ActivityType.STATUS_CHANGE
+        ]
+        assert len(reviews) == 1
+
     def test_empty_message_id_returns_false(self, memory_db: Database):
         """Empty message_id -> returns False."""
         outlook = MockOutlookClient()
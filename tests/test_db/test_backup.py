@@ -95,6 +95,31 @@ class TestCreateBackup:
 # =========================================================================
 
 
+class TestBackupArchive:
+    """Test the rolling copy of the activity archive."""
+
+    def test_copies_archive(self, tmp_path: Path):
+        """The archive next to the database is copied into the backup directory."""
+        conn = sqlite3.connect(str(tmp_path / "source_archive.db"))
+        conn.execute("CREATE TABLE activities (id INTEGER PRIMARY KEY, notes TEXT)")
+        conn.execute("INSERT INTO activities VALUES (7, 'old call')")
+        conn.commit()
+        conn.close()
+
+        manager = BackupManager(db_path=tmp_path / "source.db", backup_path=tmp_path / "backups")
+        copy = manager.backup_archive()
+
+        assert copy == tmp_path / "backups" / "activity_archive.db"
+        with sqlite3.connect(str(copy)) as check:
+            assert check.execute("SELECT notes FROM activities").fetchone() == ("old call",)
+        assert manager.list_backups() == []
+
+    def test_no_archive_returns_none(self, tmp_path: Path):
+        """Nothing to copy before the first archival run."""
+        manager = BackupManager(db_path=tmp_path / "source.db", backup_path=tmp_path / "backups")
+        assert manager.backup_archive() is None
+
+
 class TestListBackups:
     """Test listing backups."""
 
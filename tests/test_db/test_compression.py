@@ -0,0 +1,60 @@
+"""Tests for compressed text storage (src/db/compression.py)."""
+
+import zlib
+
+import pytest
+
+from src.core.exceptions import DatabaseError
+from src.db.compression import (
+    FORMAT_VERSION,
+    MIN_COMPRESS_BYTES,
+    compress_text,
+    decompress_text,
+)
+
+LONG_TEXT = "Following up on our call about your pipeline. " * 40
+
+
+class TestCompressText:
+    """Test the storage encoder."""
+
+    def test_long_text_becomes_framed_blob(self):
+        """Compressible text is a version byte followed by a zlib stream."""
+        stored = compress_text(LONG_TEXT)
+        assert isinstance(stored, bytes)
+        assert stored[0] == FORMAT_VERSION
+        assert zlib.decompress(stored[1:]).decode("utf-8") == LONG_TEXT
+        assert len(stored) < len(LONG_TEXT) // 4
+
+    def test_short_text_unchanged(self):
+        """Text below the threshold stays plain TEXT."""
+        short = "x" * (MIN_COMPRESS_BYTES - 1)
+        assert compress_text(short) is short
+
+    def test_none(self):
+        """NULL stays NULL."""
+        assert compress_text(None) is None
+
+
+class TestDecompressText:
+    """Test the storage decoder."""
+
+    def test_round_trip_unicode(self):
+        """Non-ASCII text survives a round trip."""
+        text = "Café closing notes — señor Núñez signed. " * 20
+        assert decompress_text(compress_text(text)) == text
+
+    def test_plain_text_passes_through(self):
+        """Rows written before compression was enabled read unchanged."""
+        assert decompress_text("plain body") == "plain body"
+        assert decompress_text(None) is None
+
+    def test_unknown_version_raises(self):
+        """A BLOB from a newer format is reported, not misread."""
+        with pytest.raises(DatabaseError, match="version"):
+            decompress_text(bytes([FORMAT_VERSION + 1]) + zlib.compress(b"later"))
+
+    def test_corrupt_payload_raises(self):
+        """A damaged stream surfaces as DatabaseError."""
+        with pytest.raises(DatabaseError, match="Corrupt"):
+            decompress_text(bytes([FORMAT_VERSION]) + b"not zlib")
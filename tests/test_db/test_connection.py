@@ -0,0 +1,202 @@
+"""Tests for reader/writer connection routing."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.db.connection import ConnectionManager, is_read_only
+
+
+def _configure(conn, is_writer):
+    conn.execute("PRAGMA foreign_keys = ON")
+    if is_writer:
+        conn.execute("PRAGMA journal_mode = WAL")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Manager over a file database with one table."""
+    mgr = ConnectionManager(str(tmp_path / "routing.db"), configure=_configure, write_timeout=2.0)
+    conn = mgr.routed()
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    conn.commit()
+    yield mgr
+    mgr.close()
+
+
+class TestIsReadOnly:
+    """Statement classification."""
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT 1",
+            "  select * from t",
+            "-- comment\nSELECT 1",
+            "EXPLAIN QUERY PLAN SELECT 1",
+            "WITH x AS (SELECT 1) SELECT * FROM x",
+            "PRAGMA table_info(t)",
+        ],
+    )
+    def test_reads(self, sql):
+        assert is_read_only(sql)
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "INSERT INTO t VALUES (1, 'a')",
+            "UPDATE t SET v = 'b'",
+            "DELETE FROM t",
+            "WITH x AS (SELECT 1) INSERT INTO t SELECT 1, 'a' FROM x",
+            "PRAGMA foreign_keys = ON",
+            "BEGIN IMMEDIATE",
+            "CREATE TEMP TABLE x (a)",
+            "",
+        ],
+    )
+    def test_writes(self, sql):
+        assert not is_read_only(sql)
+
+
+class TestRouting:
+    """Statements land on the right connection and the gate is released."""
+
+    def test_reader_is_query_only(self, manager):
+        with pytest.raises(sqlite3.OperationalError):
+            manager.reader().execute("INSERT INTO t (v) VALUES ('x')")
+
+    def test_write_holds_gate_until_commit(self, manager):
+        conn = manager.routed()
+        conn.execute("INSERT INTO t (v) VALUES ('a')")
+        assert manager.gate.held_by_me
+        assert conn.in_transaction
+        conn.commit()
+        assert not manager.gate.held_by_me
+        assert not conn.in_transaction
+
+    def test_reads_inside_transaction_see_own_writes(self, manager):
+        conn = manager.routed()
+        conn.execute("INSERT INTO t (v) VALUES ('a')")
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+        # Another thread's reader does not see the uncommitted row
+        seen = []
+        t = threading.Thread(
+            target=lambda: seen.append(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+        )
+        t.start()
+        t.join()
+        assert seen == [0]
+        conn.rollback()
+        assert not manager.gate.held_by_me
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_failed_write_releases_gate(self, manager):
+        conn = manager.routed()
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO missing VALUES (1)")
+        assert not manager.gate.held_by_me
+
+    def test_second_writer_waits_for_commit(self, manager):
+        conn = manager.routed()
+        conn.execute("INSERT INTO t (v) VALUES ('first')")
+        order = []
+
+        def other():
+            conn.execute("INSERT INTO t (v) VALUES ('second')")
+            order.append("second")
+            conn.commit()
+
+        t = threading.Thread(target=other)
+        t.start()
+        t.join(timeout=0.2)
+        order.append("first")
+        conn.commit()
+        t.join(timeout=5)
+        assert order == ["first", "second"]
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    def test_writer_busy_times_out(self, tmp_path):
+        mgr = ConnectionManager(str(tmp_path / "busy.db"), configure=_configure, write_timeout=0.1)
+        conn = mgr.routed()
+        conn.execute("CREATE TABLE t (v)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        errors = []
+
+        def other():
+            try:
+                conn.execute("INSERT INTO t VALUES (2)")
+            except sqlite3.OperationalError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=other)
+        t.start()
+        t.join()
+        conn.commit()
+        mgr.close()
+        assert errors and "locked" in str(errors[0])
+
+    def test_memory_database_shares_one_connection(self):
+        mgr = ConnectionManager(":memory:", configure=_configure)
+        assert mgr.reader() is mgr.writer()
+        mgr.close()
+
+    def test_rows_written_counts_per_thread(self, manager):
+        conn = manager.routed()
+        conn.executemany("INSERT INTO t (v) VALUES (?)", [("a",), ("b",), ("c",)])
+        conn.execute("UPDATE t SET v = 'z' WHERE v IN ('a', 'b')")
+        conn.execute("SELECT * FROM t").fetchall()
+        conn.commit()
+
+        other: list[int] = []
+        thread = threading.Thread(target=lambda: other.append(manager.rows_written()))
+        thread.start()
+        thread.join()
+
+        assert manager.rows_written() == 5
+        assert other == [0]
+
+    def test_release_reader_closes_thread_connection(self, manager):
+        first = manager.reader()
+        manager.release_reader()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+        second = manager.reader()
+        assert second is not first
+        assert second.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+class TestSnapshot:
+    """snapshot() pins the thread's reads to one committed state."""
+
+    def test_reads_ignore_later_commits(self, manager):
+        conn = manager.routed()
+        conn.execute("INSERT INTO t (v) VALUES ('before')")
+        conn.commit()
+
+        def other():
+            conn.execute("INSERT INTO t (v) VALUES ('during')")
+            conn.commit()
+
+        with manager.snapshot():
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+            t = threading.Thread(target=other)
+            t.start()
+            t.join()
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    def test_nested_snapshot_keeps_outer_transaction(self, manager):
+        with manager.snapshot() as outer:
+            with manager.snapshot() as inner:
+                assert inner is outer
+            assert outer.in_transaction
+        assert not outer.in_transaction
+
+    def test_writer_not_blocked_by_snapshot(self, manager):
+        conn = manager.routed()
+        with manager.snapshot():
+            conn.execute("INSERT INTO t (v) VALUES ('x')")
+            conn.commit()
+            assert not manager.gate.held_by_me
@@ -1,11 +1,12 @@
 """Tests for database operations."""
 
+import threading
 from datetime import date, datetime
 from pathlib import Path
 
 import pytest
 
-from src.db.database import Database
+from src.db.database import Database, intel_content_hash
 from src.db.models import (
     Activity,
     ActivityOutcome,
@@ -17,6 +18,7 @@ from src.db.models import (
     ImportSource,
     IntelCategory,
     IntelNugget,
+    NightlyStatus,
     Population,
     Prospect,
     ResearchStatus,
@@ -347,6 +349,35 @@ class TestProspectCRUD:
         assert len(full.contact_methods) == 1
         assert len(full.activities) == 1
 
+    def test_get_prospect_full_many(self, memory_db: Database):
+        """Batch loader caps activities per prospect and includes intel."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        pids = [
+            memory_db.create_prospect(Prospect(company_id=cid, first_name=f"P{i}", last_name="X"))
+            for i in range(3)
+        ]
+        for pid in pids:
+            for n in range(4):
+                memory_db.create_activity(
+                    Activity(prospect_id=pid, activity_type=ActivityType.NOTE, notes=f"n{n}")
+                )
+        memory_db.add_tag(pids[0], "hot")
+        memory_db.create_intel_nugget(
+            IntelNugget(prospect_id=pids[1], category=IntelCategory.KEY_FACT, content="Fact")
+        )
+
+        statements: list[str] = []
+        memory_db._get_connection().set_trace_callback(statements.append)
+        fulls = memory_db.get_prospect_full_many([*pids, 9999], activity_limit=2)
+        memory_db._get_connection().set_trace_callback(None)
+
+        assert len(statements) == 6
+        assert set(fulls) == set(pids)
+        assert [a.notes for a in fulls[pids[2]].activities] == ["n3", "n2"]
+        assert fulls[pids[0]].tags == ["hot"]
+        assert [n.content for n in fulls[pids[1]].intel_nuggets] == ["Fact"]
+        assert all(f.company.name == "Test Co" for f in fulls.values())
+
     def test_get_population_counts(self, memory_db: Database):
         """Can get counts per population."""
         cid = memory_db.create_company(Company(name="Test Co", state="TX"))
@@ -546,6 +577,72 @@ class TestContactMethodsCRUD:
         assert updated.value == "new@test.com"
         assert updated.is_verified is True
 
+    def test_find_prospect_by_phone_country_code(self, memory_db: Database):
+        """Phone lookup ignores formatting and a leading US country code."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="B"))
+        memory_db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.PHONE, value="+1 (713) 555-1234")
+        )
+        assert memory_db.find_prospect_by_phone("713.555.1234") == pid
+        assert memory_db.find_prospect_by_phone("17135551234") == pid
+        assert memory_db.find_prospect_by_phone("no digits") is None
+
+    def test_phone_key_follows_update(self, memory_db: Database):
+        """Updating a phone value re-keys the normalized lookup column."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="B"))
+        memory_db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.PHONE, value="303-555-1234")
+        )
+        method = memory_db.get_contact_methods(pid)[0]
+        method.value = "(720) 555-9876"
+        memory_db.update_contact_method(method)
+        assert memory_db.find_prospect_by_phone("303-555-1234") is None
+        assert memory_db.find_prospect_by_phone("7205559876") == pid
+
+    def test_is_dnc_when_phone_shared_with_live_prospect(self, memory_db: Database):
+        """A DNC prospect blocks a shared phone even if a live record was created first."""
+        cid = memory_db.create_company(Company(name="Shared Line", state="TX"))
+        live = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="Live", last_name="One")
+        )
+        dead = memory_db.create_prospect(
+            Prospect(
+                company_id=cid,
+                first_name="Dead",
+                last_name="Two",
+                population=Population.DEAD_DNC,
+            )
+        )
+        for pid in (live, dead):
+            memory_db.create_contact_method(
+                ContactMethod(prospect_id=pid, type=ContactMethodType.PHONE, value="713-555-0000")
+            )
+        assert memory_db.is_dnc(phone="(713) 555-0000") is True
+
+    def test_phone_and_email_lookups_use_index(self, memory_db: Database):
+        """Phone and email lookups are index searches, not table scans."""
+        conn = memory_db._get_connection()
+        phone_plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT prospect_id FROM contact_methods "
+                "WHERE type = 'phone' AND phone_normalized = ? ORDER BY id LIMIT 1",
+                ("7135551234",),
+            )
+        )
+        email_plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT prospect_id FROM contact_methods "
+                "WHERE LOWER(value) = LOWER(?) AND type = 'email'",
+                ("a@b.com",),
+            )
+        )
+        assert "idx_contact_methods_phone_normalized" in phone_plan
+        assert "idx_contact_methods_email_lower" in email_plan
+
 
 class TestActivityCRUD:
     """Test Activity operations."""
@@ -784,6 +881,52 @@ class TestBulkOperations:
         assert memory_db.get_prospect(p1).population == Population.CLOSED_WON
         assert memory_db.get_prospect(p2).population == Population.LOST
 
+    def test_bulk_update_logs_status_change(self, memory_db: Database):
+        """Each moved prospect gets a STATUS_CHANGE activity with before/after."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        p1 = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="A", last_name="B", population=Population.BROKEN)
+        )
+        memory_db.bulk_update_population([p1], Population.UNENGAGED, "Data found")
+        activity = memory_db.get_activities(p1)[0]
+        assert activity.activity_type == ActivityType.STATUS_CHANGE
+        assert activity.population_before == Population.BROKEN
+        assert activity.population_after == Population.UNENGAGED
+        assert activity.notes == "Data found"
+
+    def test_bulk_update_repeated_ids_match_row_by_row(self, memory_db: Database):
+        """A repeated id sees the population its first occurrence moved it to."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        p1 = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="A", last_name="B", population=Population.UNENGAGED)
+        )
+        assert memory_db.bulk_update_population([p1, p1], Population.DEAD_DNC, "x") == (1, 1, 0)
+        assert len(memory_db.get_activities(p1)) == 1
+
+        p2 = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="C", last_name="D", population=Population.UNENGAGED)
+        )
+        assert memory_db.bulk_park([p2, p2, 99999], "2026-09") == (2, 0, 0)
+        befores = [a.population_before for a in memory_db.get_activities(p2)]
+        assert sorted(befores) == sorted([Population.UNENGAGED, Population.PARKED])
+
+    def test_bulk_update_thousands(self, memory_db: Database):
+        """Bulk moves of thousands of rows run as set operations."""
+        cid = memory_db.create_company(Company(name="Test Co", state="TX"))
+        conn = memory_db._get_connection()
+        conn.executemany(
+            "INSERT INTO prospects (company_id, first_name, last_name, population) "
+            "VALUES (?, ?, ?, ?)",
+            [(cid, f"P{i}", "Q", "dead_dnc" if i % 10 == 0 else "unengaged") for i in range(3000)],
+        )
+        conn.commit()
+        ids = [row[0] for row in conn.execute("SELECT id FROM prospects")]
+        assert memory_db.bulk_update_population(ids, Population.ENGAGED, "go") == (2700, 300, 0)
+        count = conn.execute(
+            "SELECT COUNT(*) FROM activities WHERE activity_type = 'status_change'"
+        ).fetchone()[0]
+        assert count == 2700
+
 
 class TestTagOperations:
     """Test tag operations."""
@@ -946,6 +1089,908 @@ class TestRemainingTables:
         assert records[0]["field_name"] == "email"
 
 
+class TestTransaction:
+    """Test Database.transaction() units of work."""
+
+    def _prospect(self, db: Database) -> Prospect:
+        cid = db.create_company(Company(name="Unit Co", state="TX"))
+        pid = db.create_prospect(Prospect(company_id=cid, first_name="Una", last_name="Unit"))
+        return db.get_prospect(pid)
+
+    def test_several_writes_commit_once(self, temp_db: Database):
+        """create/update calls inside a unit share a single COMMIT."""
+        prospect = self._prospect(temp_db)
+        statements: list[str] = []
+        conn = temp_db._get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            with temp_db.transaction():
+                prospect.prospect_score = 42
+                temp_db.update_prospect(prospect)
+                temp_db.create_activity(
+                    Activity(prospect_id=prospect.id, activity_type=ActivityType.NOTE)
+                )
+        finally:
+            conn.set_trace_callback(None)
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 1
+        assert temp_db.get_prospect(prospect.id).prospect_score == 42
+        assert len(temp_db.get_activities(prospect.id)) == 1
+
+    def test_exception_rolls_back_everything(self, memory_db: Database):
+        """An error inside the unit discards all of its writes."""
+        prospect = self._prospect(memory_db)
+        with pytest.raises(RuntimeError):
+            with memory_db.transaction():
+                prospect.prospect_score = 42
+                memory_db.update_prospect(prospect)
+                memory_db.create_activity(
+                    Activity(prospect_id=prospect.id, activity_type=ActivityType.NOTE)
+                )
+                raise RuntimeError("boom")
+        assert memory_db.get_prospect(prospect.id).prospect_score != 42
+        assert memory_db.get_activities(prospect.id) == []
+
+    def test_nested_unit_rolls_back_to_savepoint(self, memory_db: Database):
+        """A failed inner unit undoes only its own writes."""
+        prospect = self._prospect(memory_db)
+        with memory_db.transaction():
+            memory_db.create_activity(
+                Activity(prospect_id=prospect.id, activity_type=ActivityType.NOTE, notes="keep")
+            )
+            with pytest.raises(RuntimeError):
+                with memory_db.transaction():
+                    memory_db.create_activity(
+                        Activity(
+                            prospect_id=prospect.id, activity_type=ActivityType.NOTE, notes="drop"
+                        )
+                    )
+                    raise RuntimeError("inner")
+        assert [a.notes for a in memory_db.get_activities(prospect.id)] == ["keep"]
+
+    def test_writer_released_after_unit(self, temp_db: Database):
+        """Other threads can write once the unit has committed."""
+        import threading
+
+        prospect = self._prospect(temp_db)
+        with temp_db.transaction():
+            prospect.prospect_score = 7
+            temp_db.update_prospect(prospect)
+        assert not temp_db._get_connection().in_transaction
+
+        errors: list[Exception] = []
+
+        def write():
+            try:
+                temp_db.create_activity(
+                    Activity(prospect_id=prospect.id, activity_type=ActivityType.NOTE)
+                )
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        worker = threading.Thread(target=write)
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive() and errors == []
+
+
+class TestPipelineCounters:
+    """Test the trigger-maintained pipeline_counters table."""
+
+    def _snapshot(self, db: Database) -> list[tuple]:
+        rows = db._get_connection().execute(
+            "SELECT metric, day, bucket, value FROM pipeline_counters WHERE value != 0 "
+            "ORDER BY metric, day, bucket"
+        )
+        return [tuple(row) for row in rows]
+
+    def test_headline_numbers(self, memory_db: Database):
+        """Populations, overdue, today's follow-ups, demos and activities are reported."""
+        today = date(2026, 3, 10)
+        cid = memory_db.create_company(Company(name="Count Co", state="TX"))
+        engaged = memory_db.create_prospect(
+            Prospect(
+                company_id=cid,
+                first_name="Dee",
+                last_name="Demo",
+                population=Population.ENGAGED,
+                engagement_stage=EngagementStage.DEMO_SCHEDULED,
+                follow_up_date=datetime(2026, 3, 10, 14, 0),
+            )
+        )
+        memory_db.create_prospect(
+            Prospect(
+                company_id=cid,
+                first_name="Ollie",
+                last_name="Overdue",
+                population=Population.UNENGAGED,
+                follow_up_date=datetime(2026, 3, 2),
+            )
+        )
+        memory_db.create_prospect(
+            Prospect(
+                company_id=cid,
+                first_name="Lou",
+                last_name="Lost",
+                population=Population.LOST,
+                follow_up_date=datetime(2026, 1, 5),
+            )
+        )
+        conn = memory_db._get_connection()
+        for activity_type in ("call", "call", "email_sent"):
+            conn.execute(
+                "INSERT INTO activities (prospect_id, activity_type, created_at) "
+                "VALUES (?, ?, '2026-03-10 09:00:00')",
+                (engaged, activity_type),
+            )
+        conn.commit()
+
+        counters = memory_db.get_pipeline_counters(today)
+        assert counters.total == 3
+        assert counters.population_counts[Population.ENGAGED] == 1
+        assert counters.overdue == 1
+        assert counters.follow_ups_today == {Population.ENGAGED: 1}
+        assert counters.demos_today == 1
+        assert counters.activities_today == {ActivityType.CALL: 2, ActivityType.EMAIL_SENT: 1}
+        assert counters.worked_today == 1
+        assert memory_db.get_population_counts() == counters.population_counts
+
+    def test_triggers_match_rebuild(self, memory_db: Database):
+        """After inserts, updates and deletes the counters equal a full recount."""
+        cid = memory_db.create_company(Company(name="Churn Co", state="TX"))
+        ids = [
+            memory_db.create_prospect(
+                Prospect(
+                    company_id=cid,
+                    first_name=f"P{i}",
+                    last_name="Churn",
+                    population=Population.ENGAGED if i % 2 else Population.UNENGAGED,
+                    follow_up_date=datetime(2026, 3, 1 + i),
+                )
+            )
+            for i in range(6)
+        ]
+        for pid in ids:
+            memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.CALL))
+            memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.NOTE))
+
+        moved = memory_db.get_prospect(ids[0])
+        moved.population = Population.ENGAGED
+        moved.engagement_stage = EngagementStage.DEMO_SCHEDULED
+        moved.follow_up_date = datetime(2026, 4, 1, 9, 30)
+        memory_db.update_prospect(moved)
+        memory_db.bulk_update_population(ids[1:3], Population.PARKED, "test")
+        conn = memory_db._get_connection()
+        conn.execute(
+            "UPDATE activities SET prospect_id = ?, created_at = '2026-01-01 08:00:00' "
+            "WHERE prospect_id = ? AND activity_type = 'note'",
+            (ids[4], ids[3]),
+        )
+        conn.execute("DELETE FROM prospects WHERE id = ?", (ids[5],))
+        conn.commit()
+
+        incremental = self._snapshot(memory_db)
+        memory_db.rebuild_pipeline_counters()
+        assert incremental == self._snapshot(memory_db)
+
+    def test_status_reads_do_not_scan_prospects(self, memory_db: Database):
+        """The counters read is answered from the counters table alone."""
+        statements: list[str] = []
+        conn = memory_db._get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            memory_db.get_pipeline_counters()
+        finally:
+            conn.set_trace_callback(None)
+        assert len(statements) == 1
+        assert "prospects" not in statements[0] and "activities" not in statements[0]
+
+
+class TestLastActivity:
+    """Test trigger-maintained prospects.last_activity_at / last_activity_type."""
+
+    def _log(self, db: Database, pid: int, activity_type: str, created_at: str) -> int:
+        conn = db._get_connection()
+        cursor = conn.execute(
+            "INSERT INTO activities (prospect_id, activity_type, created_at) VALUES (?, ?, ?)",
+            (pid, activity_type, created_at),
+        )
+        conn.commit()
+        return cursor.lastrowid
+
+    def test_tracks_latest_activity(self, memory_db: Database):
+        """Inserts advance the last touch; older back-dated rows do not."""
+        cid = memory_db.create_company(Company(name="Touch Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="T", last_name="T"))
+        assert memory_db.get_prospect(pid).last_activity_at is None
+
+        self._log(memory_db, pid, "call", "2026-03-02 10:00:00")
+        self._log(memory_db, pid, "note", "2026-02-01 10:00:00")
+        prospect = memory_db.get_prospect(pid)
+        assert prospect.last_activity_at == datetime(2026, 3, 2, 10, 0)
+        assert prospect.last_activity_type == ActivityType.CALL
+
+    def test_delete_falls_back_to_previous(self, memory_db: Database):
+        """Deleting the latest activity restores the one before it."""
+        cid = memory_db.create_company(Company(name="Undo Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="U", last_name="U"))
+        self._log(memory_db, pid, "voicemail", "2026-03-01 09:00:00")
+        latest = self._log(memory_db, pid, "email_sent", "2026-03-05 09:00:00")
+
+        conn = memory_db._get_connection()
+        conn.execute("DELETE FROM activities WHERE id = ?", (latest,))
+        conn.commit()
+        prospect = memory_db.get_prospect(pid)
+        assert prospect.last_activity_type == ActivityType.VOICEMAIL
+        assert prospect.last_activity_at == datetime(2026, 3, 1, 9, 0)
+
+        conn.execute("DELETE FROM activities WHERE prospect_id = ?", (pid,))
+        conn.commit()
+        assert memory_db.get_prospect(pid).last_activity_at is None
+
+    def test_update_prospect_does_not_clobber(self, memory_db: Database):
+        """Writing back a stale Prospect keeps the trigger-maintained value."""
+        cid = memory_db.create_company(Company(name="Stale Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="S", last_name="S"))
+        stale = memory_db.get_prospect(pid)
+        memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.CALL))
+
+        stale.prospect_score = 50
+        memory_db.update_prospect(stale)
+        assert memory_db.get_prospect(pid).last_activity_type == ActivityType.CALL
+
+
+class TestActivityArchive:
+    """Test moving old activities to the attached archive database."""
+
+    def _log(self, db: Database, pid: int, activity_type: str, created_at: str) -> int:
+        conn = db._get_connection()
+        cursor = conn.execute(
+            """INSERT INTO activities (prospect_id, activity_type, notes, created_at)
+               VALUES (?, ?, ?, ?)""",
+            (pid, activity_type, f"{activity_type} on {created_at}", created_at),
+        )
+        conn.commit()
+        return cursor.lastrowid
+
+    def _prospect(self, db: Database) -> int:
+        cid = db.create_company(Company(name="Archive Co", state="TX"))
+        return db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="R"))
+
+    def test_moves_old_activities_and_reads_across(self, temp_db: Database):
+        """Old rows leave the live table; include_archived reads both, ids kept."""
+        pid = self._prospect(temp_db)
+        old = self._log(temp_db, pid, "call", "2024-01-10 09:00:00")
+        older = self._log(temp_db, pid, "voicemail", "2024-01-05 09:00:00")
+        recent = self._log(temp_db, pid, "email_sent", "2026-03-01 09:00:00")
+
+        assert temp_db.archive_activities(older_than_days=365, today=date(2026, 3, 2)) == 2
+
+        assert [a.id for a in temp_db.get_activities(pid)] == [recent]
+        full = temp_db.get_activities(pid, include_archived=True)
+        assert [a.id for a in full] == [recent, old, older]
+        assert full[1].created_at == datetime(2024, 1, 10, 9, 0)
+        assert full[1].activity_type == ActivityType.CALL
+        assert Path(temp_db.archive_path).exists()
+
+    def test_keeps_latest_activity_per_prospect(self, memory_db: Database):
+        """A prospect's last touch stays live so last_activity_at is unchanged."""
+        pid = self._prospect(memory_db)
+        self._log(memory_db, pid, "call", "2024-01-05 09:00:00")
+        latest = self._log(memory_db, pid, "email_sent", "2024-02-01 09:00:00")
+
+        assert memory_db.archive_activities(older_than_days=30, today=date(2026, 3, 2)) == 1
+        assert [a.id for a in memory_db.get_activities(pid)] == [latest]
+        prospect = memory_db.get_prospect(pid)
+        assert prospect.last_activity_at == datetime(2024, 2, 1, 9, 0)
+        assert prospect.last_activity_type == ActivityType.EMAIL_SENT
+
+    def test_keeps_activities_referenced_by_intel(self, memory_db: Database):
+        """Activities an intel nugget points at stay live for the foreign key."""
+        pid = self._prospect(memory_db)
+        cited = self._log(memory_db, pid, "call", "2024-01-05 09:00:00")
+        self._log(memory_db, pid, "note", "2026-03-01 09:00:00")
+        memory_db.create_intel_nugget(
+            IntelNugget(
+                prospect_id=pid,
+                category=IntelCategory.PAIN_POINT,
+                content="Slow closings",
+                source_activity_id=cited,
+            )
+        )
+
+        assert memory_db.archive_activities(older_than_days=30, today=date(2026, 3, 2)) == 0
+
+    def test_rerun_finishes_half_moved_batch(self, memory_db: Database):
+        """Rows already copied to the archive are deleted live without duplicating."""
+        pid = self._prospect(memory_db)
+        stranded = self._log(memory_db, pid, "call", "2024-01-05 09:00:00")
+        self._log(memory_db, pid, "note", "2026-03-01 09:00:00")
+        columns = memory_db.activity_source(include_archived=True)  # creates archive table
+        assert "archive.activities" in columns
+        conn = memory_db._get_connection()
+        conn.execute(
+            "INSERT INTO archive.activities SELECT * FROM main.activities WHERE id = ?",
+            (stranded,),
+        )
+        conn.commit()
+
+        assert memory_db.archive_activities(older_than_days=30, today=date(2026, 3, 2)) == 1
+        full = memory_db.get_activities(pid, include_archived=True)
+        assert [a.id for a in full].count(stranded) == 1
+
+    def test_small_batches(self, memory_db: Database):
+        """Archival walks the live table in several transactions."""
+        pid = self._prospect(memory_db)
+        for day in range(1, 8):
+            self._log(memory_db, pid, "call", f"2024-01-0{day} 09:00:00")
+        self._log(memory_db, pid, "note", "2026-03-01 09:00:00")
+
+        archived = memory_db.archive_activities(
+            older_than_days=30, today=date(2026, 3, 2), batch_size=3
+        )
+        assert archived == 7
+        assert len(memory_db.get_activities(pid, include_archived=True)) == 8
+
+    def test_rejects_non_positive_horizon(self, memory_db: Database):
+        """A zero horizon would archive today's activity log."""
+        with pytest.raises(ValueError):
+            memory_db.archive_activities(older_than_days=0)
+
+
+class TestTextCompression:
+    """Test opt-in compressed storage of large free-text columns."""
+
+    BODY = "Hi Dana, following up on the rate-lock workflow demo. " * 30
+
+    def _stored(self, db: Database, sql: str, params: tuple) -> object:
+        return db._get_connection().execute(sql, params).fetchone()[0]
+
+    def test_compressed_columns_round_trip(self):
+        """With compression on, bodies are stored as BLOBs and read back as text."""
+        db = Database(":memory:", compress_text=True)
+        db.initialize()
+        cid = db.create_company(Company(name="Zip Co", state="TX"))
+        pid = db.create_prospect(
+            Prospect(company_id=cid, first_name="Z", last_name="Z", close_notes=self.BODY)
+        )
+        db.create_activity(
+            Activity(prospect_id=pid, activity_type=ActivityType.EMAIL_SENT, email_body=self.BODY)
+        )
+
+        assert isinstance(
+            self._stored(db, "SELECT close_notes FROM prospects WHERE id = ?", (pid,)), bytes
+        )
+        assert isinstance(
+            self._stored(db, "SELECT email_body FROM activities WHERE prospect_id = ?", (pid,)),
+            bytes,
+        )
+        assert db.get_prospect(pid).close_notes == self.BODY
+        assert db.get_activities(pid)[0].email_body == self.BODY
+        db.close()
+
+    def test_off_by_default_in_tests(self, memory_db: Database):
+        """Without the setting, values are stored as plain TEXT."""
+        cid = memory_db.create_company(Company(name="Plain Co", state="TX"))
+        pid = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="P", last_name="P", close_notes=self.BODY)
+        )
+        assert memory_db.compress_text is False
+        assert self._stored(
+            memory_db, "SELECT close_notes FROM prospects WHERE id = ?", (pid,)
+        ) == (self.BODY)
+
+    def test_reencode_compresses_then_expands(self, temp_db: Database):
+        """Existing rows are rewritten in place, including archived activities."""
+        cid = temp_db.create_company(Company(name="Old Co", state="TX"))
+        pid = temp_db.create_prospect(
+            Prospect(company_id=cid, first_name="O", last_name="O", custom_fields=self.BODY)
+        )
+        for _ in range(3):
+            temp_db.create_activity(
+                Activity(
+                    prospect_id=pid, activity_type=ActivityType.EMAIL_SENT, email_body=self.BODY
+                )
+            )
+        conn = temp_db._get_connection()
+        conn.execute("UPDATE activities SET created_at = '2024-01-05 09:00:00'")
+        conn.commit()
+        assert temp_db.archive_activities(older_than_days=365) == 2
+
+        temp_db.compress_text = True
+        assert temp_db.reencode_text_columns() == 4
+        assert (
+            conn.execute(
+                """SELECT COUNT(*) FROM (SELECT email_body FROM main.activities
+                UNION ALL SELECT email_body FROM archive.activities)
+               WHERE typeof(email_body) = 'blob'"""
+            ).fetchone()[0]
+            == 3
+        )
+        assert temp_db.reencode_text_columns() == 0
+        bodies = [a.email_body for a in temp_db.get_activities(pid, include_archived=True)]
+        assert bodies == [self.BODY] * 3
+        assert temp_db.get_prospect(pid).custom_fields == self.BODY
+
+        temp_db.compress_text = False
+        assert temp_db.reencode_text_columns(vacuum=False) == 4
+        assert self._stored(
+            temp_db, "SELECT custom_fields FROM prospects WHERE id = ?", (pid,)
+        ) == (self.BODY)
+
+
+class TestSnapshot:
+    """Database.snapshot() for consistent report reads."""
+
+    def test_counts_stay_fixed_while_another_thread_writes(self, temp_db: Database):
+        cid = temp_db.create_company(Company(name="Snap Co", state="TX"))
+        temp_db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="One"))
+
+        def add_prospect():
+            temp_db.create_prospect(Prospect(company_id=cid, first_name="B", last_name="Two"))
+
+        with temp_db.snapshot():
+            before = temp_db.get_population_counts()
+            worker = threading.Thread(target=add_prospect)
+            worker.start()
+            worker.join()
+            assert temp_db.get_population_counts() == before
+            assert len(temp_db.get_activities(1, include_archived=True)) == 0
+        assert sum(temp_db.get_population_counts().values()) == sum(before.values()) + 1
+
+    def test_memory_database_snapshot_reads_through(self, memory_db: Database):
+        with memory_db.snapshot() as db:
+            assert db is memory_db
+            assert db.get_population_counts() is not None
+
+
+class TestChangeLog:
+    """change_log triggers and the read_changes/ack_changes consumer API."""
+
+    def _seed(self, db: Database) -> tuple[int, int]:
+        cid = db.create_company(Company(name="Delta Co", state="TX"))
+        pid = db.create_prospect(Prospect(company_id=cid, first_name="Dee", last_name="Ell"))
+        return cid, pid
+
+    def test_first_read_is_full_then_incremental(self, memory_db: Database):
+        self._seed(memory_db)
+        first = memory_db.read_changes("test")
+        assert first.full
+        memory_db.ack_changes(first)
+
+        again = memory_db.read_changes("test")
+        assert not again.full
+        assert again.empty
+
+    def test_reports_rows_and_prospects_per_table(self, memory_db: Database):
+        cid, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("test"))
+        other = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="Oh", last_name="Tee")
+        )
+        method_id = memory_db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.EMAIL, value="d@delta.com")
+        )
+        activity_id = memory_db.create_activity(
+            Activity(prospect_id=pid, activity_type=ActivityType.NOTE, notes="hello")
+        )
+        memory_db._get_connection().execute("DELETE FROM activities WHERE id = ?", (activity_id,))
+
+        changes = memory_db.read_changes("test")
+        assert changes.ids("prospects") == {other}
+        assert changes.ids("contact_methods") == {method_id}
+        assert changes.ids("activities") == set()
+        assert changes.deleted == {"activities": {activity_id}}
+        assert changes.prospect_ids == {pid, other}
+
+        only_methods = memory_db.read_changes("test", entities=["contact_methods"])
+        assert set(only_methods.changed) == {"contact_methods"}
+        assert only_methods.prospect_ids == {pid}
+
+    def test_derived_score_writes_are_not_changes(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("test"))
+
+        prospect = memory_db.get_prospect(pid)
+        prospect.prospect_score = 88
+        prospect.data_confidence = 70
+        memory_db.update_prospect(prospect)
+        assert memory_db.read_changes("test").empty
+
+        prospect.title = "CFO"
+        memory_db.update_prospect(prospect)
+        assert memory_db.read_changes("test").prospect_ids == {pid}
+
+    def test_company_change_fans_out_to_its_prospects(self, memory_db: Database):
+        cid, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("test"))
+
+        company = memory_db.get_company(cid)
+        company.state = "CO"
+        memory_db.update_company(company)
+
+        changes = memory_db.read_changes("test")
+        assert changes.ids("companies") == {cid}
+        assert changes.prospect_ids == {pid}
+
+    def test_watermarks_are_per_consumer(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("a"))
+        memory_db.ack_changes(memory_db.read_changes("b"))
+        memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.NOTE))
+
+        memory_db.ack_changes(memory_db.read_changes("a"))
+        assert memory_db.read_changes("a").empty
+        assert memory_db.read_changes("b").ids("activities")
+
+    def test_unacknowledged_changes_are_read_again(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("test"))
+        memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.NOTE))
+
+        assert memory_db.read_changes("test").prospect_ids == {pid}
+        assert memory_db.read_changes("test").prospect_ids == {pid}
+
+    def test_unknown_table_rejected(self, memory_db: Database):
+        with pytest.raises(ValueError):
+            memory_db.read_changes("test", entities=["research_queue"])
+
+    def test_prune_keeps_rows_a_consumer_still_needs(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("fast"))
+        memory_db.ack_changes(memory_db.read_changes("slow"))
+        memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.NOTE))
+        memory_db.ack_changes(memory_db.read_changes("fast"))
+
+        assert memory_db.prune_change_log() == 2
+        assert memory_db.read_changes("slow").ids("activities")
+
+    def test_consumer_pruned_past_reads_full(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        memory_db.ack_changes(memory_db.read_changes("test"))
+        memory_db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.NOTE))
+        memory_db._get_connection().execute(
+            "UPDATE change_log SET changed_at = DATETIME('now', '-60 days')"
+        )
+
+        assert memory_db.prune_change_log(retention_days=30) == 3
+        assert memory_db.read_changes("test").full
+
+    def test_archiving_is_not_a_change(self, memory_db: Database):
+        _, pid = self._seed(memory_db)
+        conn = memory_db._get_connection()
+        for day in ("2020-01-01", "2020-02-01"):
+            conn.execute(
+                "INSERT INTO activities (prospect_id, activity_type, created_at) "
+                "VALUES (?, 'note', ?)",
+                (pid, day),
+            )
+        conn.commit()
+        memory_db.ack_changes(memory_db.read_changes("test"))
+
+        assert memory_db.archive_activities(older_than_days=30) == 1
+        assert memory_db.read_changes("test").empty
+
+
+class TestNightlyRuns:
+    """Nightly run and step checkpoints."""
+
+    STEPS = ["backup", "rescore", "brief"]
+
+    def test_start_creates_pending_steps(self, memory_db):
+        run = memory_db.start_nightly_run(self.STEPS)
+
+        assert run.status == NightlyStatus.RUNNING
+        assert run.started_at is not None
+        assert [s.name for s in run.steps] == self.STEPS
+        assert all(s.status == NightlyStatus.PENDING for s in run.steps)
+
+    def test_step_state_and_cursor(self, memory_db):
+        run = memory_db.start_nightly_run(self.STEPS)
+        memory_db.update_nightly_step(run.id, "rescore", NightlyStatus.RUNNING)
+        memory_db.checkpoint_nightly_step(run.id, "rescore", '{"after": 10}')
+        memory_db.update_nightly_step(run.id, "backup", NightlyStatus.FAILED, error="disk full")
+
+        run = memory_db.get_nightly_run(run.id)
+        rescore = run.step("rescore")
+        assert rescore.status == NightlyStatus.RUNNING
+        assert rescore.started_at is not None and rescore.completed_at is None
+        assert rescore.cursor == '{"after": 10}'
+        assert run.step("backup").error == "disk full"
+        assert run.step("backup").completed_at is not None
+
+    def test_unfinished_run_and_resume(self, memory_db):
+        done = memory_db.start_nightly_run(self.STEPS)
+        memory_db.finish_nightly_run(done.id, NightlyStatus.DONE)
+        assert memory_db.get_unfinished_nightly_run() is None
+
+        interrupted = memory_db.start_nightly_run(self.STEPS)
+        assert memory_db.get_unfinished_nightly_run().id == interrupted.id
+
+        resumed = memory_db.resume_nightly_run(interrupted.id, self.STEPS + ["intel"])
+        assert resumed.resumes == 1
+        assert [s.name for s in resumed.steps] == self.STEPS + ["intel"]
+
+    def test_get_runs_newest_first(self, memory_db):
+        ids = [memory_db.start_nightly_run(self.STEPS).id for _ in range(3)]
+
+        runs = memory_db.get_nightly_runs(limit=2)
+        assert [r.id for r in runs] == ids[:0:-1]
+        assert all(len(r.steps) == len(self.STEPS) for r in runs)
+
+
+class TestIterProspects:
+    """Test keyset-paginated prospect streaming."""
+
+    def _seed(self, db: Database, count: int) -> int:
+        cid = db.create_company(Company(name="Stream Co", state="TX"))
+        for i in range(count):
+            db.create_prospect(
+                Prospect(
+                    company_id=cid,
+                    first_name=f"P{i}",
+                    last_name="Row",
+                    population=Population.ENGAGED if i % 3 == 0 else Population.UNENGAGED,
+                    prospect_score=i % 7,
+                    follow_up_date=None if i % 4 == 0 else datetime(2026, 3, 1 + i % 20),
+                )
+            )
+        return cid
+
+    def test_batches_cover_every_row_once(self, memory_db: Database):
+        """Batches respect batch_size and together contain every prospect."""
+        self._seed(memory_db, 25)
+        batches = list(memory_db.iter_prospects(batch_size=10))
+        assert [len(b) for b in batches] == [10, 10, 5]
+        ids = [p.id for b in batches for p in b]
+        assert ids == sorted(ids) and len(set(ids)) == 25
+
+    @pytest.mark.parametrize("sort_by", ["prospect_score", "follow_up_date"])
+    @pytest.mark.parametrize("sort_dir", ["ASC", "DESC"])
+    def test_sorted_keyset_matches_offset_order(self, memory_db: Database, sort_by, sort_dir):
+        """Keyset paging over ties and NULLs yields the same order as one query."""
+        self._seed(memory_db, 40)
+        streamed = [
+            p.id
+            for b in memory_db.iter_prospects(sort_by=sort_by, sort_dir=sort_dir, batch_size=3)
+            for p in b
+        ]
+        rows = memory_db._get_connection().execute(
+            f"SELECT id FROM prospects ORDER BY {sort_by} {sort_dir}, id {sort_dir}"
+        )
+        assert streamed == [row["id"] for row in rows]
+
+    def test_population_filter(self, memory_db: Database):
+        """Population filters apply across all batches."""
+        self._seed(memory_db, 30)
+        engaged = [
+            p for b in memory_db.iter_prospects([Population.ENGAGED], batch_size=4) for p in b
+        ]
+        assert len(engaged) == 10
+        assert all(p.population == Population.ENGAGED for p in engaged)
+
+    def test_updates_during_iteration_do_not_skip_rows(self, memory_db: Database):
+        """Writing to yielded rows between batches keeps the walk intact."""
+        self._seed(memory_db, 12)
+        seen = 0
+        for batch in memory_db.iter_prospects(batch_size=5):
+            for prospect in batch:
+                prospect.prospect_score = 99
+                memory_db.update_prospect(prospect)
+                seen += 1
+        assert seen == 12
+
+
+class TestFullTextSearch:
+    """Test the FTS5 prospect search index."""
+
+    def _seed(self, db: Database) -> tuple[int, int, int]:
+        cid = db.create_company(Company(name="Acme Lending", state="TX"))
+        jose = db.create_prospect(
+            Prospect(company_id=cid, first_name="José", last_name="Smith", title="CFO")
+        )
+        ann = db.create_prospect(
+            Prospect(company_id=cid, first_name="Ann", last_name="Golfer", notes="met at expo")
+        )
+        return cid, jose, ann
+
+    def test_prefix_match_across_words(self, memory_db: Database):
+        """Each word matches as a prefix, accents ignored."""
+        _, jose, _ = self._seed(memory_db)
+        assert [p.id for p in memory_db.search("jose smi")] == [jose]
+        assert {p.id for p in memory_db.search("acme")} == {p.id for p in memory_db.get_prospects()}
+
+    def test_name_ranks_above_notes(self, memory_db: Database):
+        """A name hit outranks the same word in notes or intel."""
+        cid, jose, ann = self._seed(memory_db)
+        memory_db.create_intel_nugget(
+            IntelNugget(prospect_id=jose, category=IntelCategory.PAIN_POINT, content="Golf fan")
+        )
+        assert [p.id for p in memory_db.search("golf")] == [ann, jose]
+
+    def test_index_follows_updates_and_deletes(self, memory_db: Database):
+        """Triggers keep the index in step with prospects and companies."""
+        cid, jose, ann = self._seed(memory_db)
+        prospect = memory_db.get_prospect(jose)
+        prospect.last_name = "Jones"
+        memory_db.update_prospect(prospect)
+        assert memory_db.search("smith") == []
+        assert [p.id for p in memory_db.search("jones")] == [jose]
+
+        company = memory_db.get_company(cid)
+        company.name = "Zenith Mortgage"
+        memory_db.update_company(company)
+        assert memory_db.search("acme") == []
+        assert len(memory_db.search("zenith")) == 2
+
+        memory_db._get_connection().execute("DELETE FROM prospects WHERE id = ?", (ann,))
+        memory_db._get_connection().commit()
+        assert memory_db.search("golfer") == []
+
+    def test_population_filter(self, memory_db: Database):
+        """Population filters apply to search results."""
+        self._seed(memory_db)
+        assert memory_db.search("acme", population=Population.DEAD_DNC) == []
+        assert len(memory_db.search("acme", exclude_populations=[Population.DEAD_DNC])) == 2
+
+    def test_no_searchable_words(self, memory_db: Database):
+        """Punctuation-only queries match nothing instead of erroring."""
+        self._seed(memory_db)
+        assert memory_db.search("%'\"*") == []
+        assert memory_db.get_prospects(search_query="***") == []
+
+    def test_match_uses_fts_index(self, memory_db: Database):
+        """Prefix queries are answered by the FTS index, not a scan."""
+        plan = (
+            memory_db._get_connection()
+            .execute(
+                "EXPLAIN QUERY PLAN SELECT rowid FROM prospect_search WHERE prospect_search MATCH ?",
+                ('"smi"*',),
+            )
+            .fetchall()
+        )
+        assert any("VIRTUAL TABLE INDEX" in row[3] for row in plan)
+
+
+class TestSchemaMigrations:
+    """Test upgrading databases created by older schema versions."""
+
+    def test_fresh_database_is_current(self, memory_db: Database):
+        """A new database is created at the latest schema version."""
+        from src.db.database import SCHEMA_VERSION
+
+        assert memory_db.get_schema_version() == SCHEMA_VERSION
+
+    def test_v1_database_backfills_phone_key(self, tmp_path: Path):
+        """Upgrading a v1 database backfills normalized phone keys."""
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(str(db_path))
+        legacy.executescript(Database(str(db_path))._get_schema_ddl())
+        legacy.execute("INSERT INTO companies (name, name_normalized) VALUES ('Old', 'old')")
+        legacy.execute(
+            "INSERT INTO prospects (company_id, first_name, last_name) VALUES (1, 'Old', 'Timer')"
+        )
+        legacy.execute(
+            "INSERT INTO contact_methods (prospect_id, type, value) "
+            "VALUES (1, 'phone', '1-303-555-4444')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = Database(str(db_path))
+        db.initialize()
+        assert db.find_prospect_by_phone("(303) 555-4444") == 1
+        assert [p.id for p in db.search("timer")] == [1]
+        db.initialize()  # Re-running is a no-op
+        db.close()
+
+    def test_v4_database_lifts_message_ids_out_of_notes(self, tmp_path: Path):
+        """Upgrading moves 'message_id:' note markers into the message_id column."""
+        import sqlite3
+
+        from src.db.database import MIGRATIONS
+
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(str(db_path))
+        legacy.executescript(Database(str(db_path))._get_schema_ddl())
+        legacy.execute("INSERT INTO companies (name, name_normalized) VALUES ('Old', 'old')")
+        legacy.execute(
+            "INSERT INTO prospects (company_id, first_name, last_name) VALUES (1, 'Old', 'Mail')"
+        )
+        legacy.executemany(
+            "INSERT INTO activities (prospect_id, activity_type, notes) VALUES (1, ?, ?)",
+            [
+                ("email_received", "message_id:m-1 classification:interested"),
+                ("email_received", "message_id:m-1 classification:interested"),
+                ("email_sent", "message_id:m-2"),
+                ("note", "message_id:m-3 pasted by hand"),
+            ],
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = Database(str(db_path))
+        conn = db._get_connection()
+        for version in (2, 3, 4):
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+        conn.commit()
+        db.initialize()
+
+        rows = conn.execute(
+            "SELECT activity_type, notes, message_id, message_source FROM activities ORDER BY id"
+        ).fetchall()
+        assert [tuple(r) for r in rows] == [
+            ("email_received", "classification:interested", "m-1", "outlook"),
+            ("email_received", "message_id:m-1 classification:interested", None, None),
+            ("email_sent", None, "m-2", "outlook"),
+            ("note", "message_id:m-3 pasted by hand", None, None),
+        ]
+        assert db.get_message_activity("m-2", "outlook", ActivityType.EMAIL_SENT).id == 3
+        duplicate = Activity(
+            prospect_id=1,
+            activity_type=ActivityType.EMAIL_SENT,
+            message_id="m-2",
+            message_source="outlook",
+        )
+        assert db.create_activity_once(duplicate) is None
+        db.close()
+
+    def test_v12_database_hashes_and_dedups_nuggets(self, tmp_path: Path):
+        """Upgrading fills content_hash, drops duplicate nuggets and logs no changes."""
+        import sqlite3
+
+        from src.db.database import MIGRATIONS
+
+        db_path = tmp_path / "legacy.db"
+        legacy = sqlite3.connect(str(db_path))
+        legacy.executescript(Database(str(db_path))._get_schema_ddl())
+        legacy.execute("INSERT INTO companies (name, name_normalized) VALUES ('Old', 'old')")
+        legacy.execute(
+            "INSERT INTO prospects (company_id, first_name, last_name) VALUES (1, 'Old', 'Intel')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        db = Database(str(db_path))
+        conn = db._get_connection()
+        for version in range(2, 13):
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+        conn.executemany(
+            "INSERT INTO intel_nuggets (prospect_id, category, content) VALUES (1, ?, ?)",
+            [
+                ("pain_point", "Timeline: Q3"),
+                ("pain_point", "Timeline: Q3"),
+                ("decision_timeline", "Timeline: Q3"),
+            ],
+        )
+        conn.commit()
+        seq = conn.execute("SELECT MAX(seq) FROM change_log").fetchone()[0]
+        db.initialize()
+
+        rows = conn.execute(
+            "SELECT id, category, content_hash FROM intel_nuggets ORDER BY id"
+        ).fetchall()
+        assert [(r["id"], r["category"]) for r in rows] == [
+            (1, "pain_point"),
+            (3, "decision_timeline"),
+        ]
+        assert rows[0]["content_hash"] == intel_content_hash("Timeline: Q3")
+        updates = conn.execute(
+            "SELECT COUNT(*) FROM change_log WHERE seq > ? AND op = 'update'", (seq,)
+        ).fetchone()[0]
+        assert updates == 0
+        nugget = IntelNugget(
+            prospect_id=1, category=IntelCategory.PAIN_POINT, content="Timeline: Q3"
+        )
+        assert db.create_intel_nugget(nugget) == 1
+        db.close()
+
+
 class TestDatabaseIntegrity:
     """Test database integrity constraints."""
 
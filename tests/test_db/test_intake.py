@@ -3,7 +3,14 @@
 import pytest
 
 from src.db.database import Database
-from src.db.intake import AnalysisResult, ImportPreview, ImportRecord, ImportResult, IntakeFunnel
+from src.db.intake import (
+    AnalysisResult,
+    DedupIndex,
+    ImportPreview,
+    ImportRecord,
+    ImportResult,
+    IntakeFunnel,
+)
 from src.db.models import (
     Activity,
     ActivityType,
@@ -615,6 +622,108 @@ class TestCommitMergeRecords:
         assert "email" in enrichment[0].notes
 
 
+class TestBulkCommit:
+    """Test the chunked bulk commit path."""
+
+    def test_progress_reported_per_chunk(self, memory_db):
+        """Progress callback receives running totals after each chunk."""
+        funnel = IntakeFunnel(memory_db)
+        funnel.commit_chunk_size = 2
+        records = [
+            ImportRecord(first_name=f"P{i}", last_name="Q", email=f"p{i}@q.com") for i in range(5)
+        ]
+        calls: list[tuple[int, int]] = []
+        result = funnel.commit(funnel.analyze(records), progress=lambda d, t: calls.append((d, t)))
+        assert result.imported_count == 5
+        assert calls == [(2, 5), (4, 5), (5, 5)]
+
+    def test_same_new_company_created_once(self, memory_db):
+        """Records naming the same new company share one company row."""
+        funnel = IntakeFunnel(memory_db)
+        funnel.commit_chunk_size = 1
+        records = [
+            ImportRecord(first_name="A", last_name="One", company_name="Zenith Lending, LLC"),
+            ImportRecord(first_name="B", last_name="Two", company_name="Zenith Lending"),
+        ]
+        funnel.commit(funnel.analyze(records))
+        prospects = memory_db.get_prospects()
+        assert len({p.company_id for p in prospects}) == 1
+        assert len(memory_db.search_companies("zenith")) == 1
+
+    def test_phone_key_written_for_new_records(self, memory_db):
+        """Bulk-inserted phones are findable through the normalized key."""
+        funnel = IntakeFunnel(memory_db)
+        records = [ImportRecord(first_name="A", last_name="B", phone="+1 (713) 555-7777")]
+        funnel.commit(funnel.analyze(records))
+        assert memory_db.find_prospect_by_phone("7135557777") is not None
+
+    def test_failure_keeps_records_before_failing_one(self, memory_db):
+        """A bad record raises; earlier records stay committed, later ones are not written."""
+        from src.core.exceptions import DatabaseError
+
+        funnel = IntakeFunnel(memory_db)
+        records = [
+            ImportRecord(first_name="Good", last_name="One"),
+            ImportRecord(first_name="Good", last_name="Two"),
+            ImportRecord(first_name=None, last_name="Bad"),  # type: ignore[arg-type]
+            ImportRecord(first_name="Good", last_name="Three"),
+        ]
+        preview = funnel.analyze(records)
+        with pytest.raises(DatabaseError):
+            funnel.commit(preview)
+        names = sorted(p.last_name for p in memory_db.get_prospects())
+        assert names == ["One", "Two"]
+        assert memory_db.get_import_sources() == []
+
+    def test_one_transaction_per_chunk(self, memory_db):
+        """A 50-record import commits once, not once per row."""
+        funnel = IntakeFunnel(memory_db)
+        records = [
+            ImportRecord(
+                first_name=f"P{i}", last_name="Q", email=f"p{i}@q.com", phone=f"555{i:07d}"
+            )
+            for i in range(50)
+        ]
+        preview = funnel.analyze(records)
+        conn = memory_db._get_connection()
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            funnel.commit(preview)
+        finally:
+            conn.set_trace_callback(None)
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") <= 2
+
+    def test_commit_inside_caller_transaction(self, memory_db):
+        """Chunks become savepoints of the caller's unit and land when it commits."""
+        funnel = IntakeFunnel(memory_db)
+        funnel.commit_chunk_size = 2
+        records = [ImportRecord(first_name=f"P{i}", last_name="Q") for i in range(5)]
+        preview = funnel.analyze(records)
+
+        with memory_db.transaction():
+            result = funnel.commit(preview)
+
+        assert result.imported_count == 5
+        assert len(memory_db.get_prospects()) == 5
+
+    def test_failure_replay_inside_caller_transaction(self, memory_db):
+        """A failing chunk is replayed record by record within the caller's unit."""
+        from src.core.exceptions import DatabaseError
+
+        funnel = IntakeFunnel(memory_db)
+        records = [
+            ImportRecord(first_name="Good", last_name="One"),
+            ImportRecord(first_name=None, last_name="Bad"),  # type: ignore[arg-type]
+        ]
+        preview = funnel.analyze(records)
+        with memory_db.transaction():
+            with pytest.raises(DatabaseError, match="NOT NULL"):
+                funnel.commit(preview)
+
+        assert [p.last_name for p in memory_db.get_prospects()] == ["One"]
+
+
 class TestImportPreview:
     """Test ImportPreview properties."""
 
@@ -686,6 +795,60 @@ class TestMixedImport:
         assert result.merged_count == 1
 
 
+class TestDedupIndex:
+    """Test the batch dedup index used by analyze."""
+
+    def test_index_maps_contacts(self, memory_db):
+        """Index holds lowercase emails, normalized phones and company members."""
+        pid = _setup_existing_prospect(memory_db, email="John@Acme.com", phone="+1 713-555-1234")
+        index = DedupIndex.build(memory_db)
+        assert index.match_email("JOHN@acme.com") == pid
+        assert index.match_phone("(713) 555-1234") == pid
+        assert index.company_members("Acme Corp, Inc.") == [(pid, "John Doe")]
+        assert not index.dnc_emails and not index.dnc_phones
+
+    def test_dnc_shared_phone_blocks(self, memory_db):
+        """A phone shared with any DNC prospect is blocked."""
+        _setup_existing_prospect(memory_db, email=None, phone="7135550000")
+        _setup_existing_prospect(
+            memory_db,
+            first_name="Dead",
+            last_name="Line",
+            email=None,
+            phone="713-555-0000",
+            population=Population.DEAD_DNC,
+        )
+        index = DedupIndex.build(memory_db)
+        assert index.is_dnc(ImportRecord(first_name="X", phone="7135550000")) is True
+
+    def test_analyze_query_count_is_flat(self, memory_db):
+        """analyze issues the same number of queries for 1 record or 200."""
+        _setup_existing_prospect(memory_db)
+        conn = memory_db._get_connection()
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+        try:
+            funnel = IntakeFunnel(memory_db)
+            funnel.analyze([ImportRecord(first_name="A", last_name="B", email="a@b.com")])
+            single = len(statements)
+            statements.clear()
+            funnel.analyze(
+                [
+                    ImportRecord(
+                        first_name=f"P{i}",
+                        last_name="Q",
+                        email=f"p{i}@q.com",
+                        phone=f"555-01{i:02d}",
+                        company_name="Acme Corp",
+                    )
+                    for i in range(200)
+                ]
+            )
+        finally:
+            conn.set_trace_callback(None)
+        assert len(statements) == single
+
+
 # =========================================================================
 # NAME SIMILARITY TESTS
 # =========================================================================
@@ -0,0 +1,151 @@
+"""Tests for the query profiler."""
+
+import pytest
+
+from src.db.database import Database
+from src.db.profiler import QueryProfiler, get_query_profiler, normalize_sql
+
+
+@pytest.fixture
+def profiler():
+    """The process-wide profiler, enabled with every statement counted as slow."""
+    prof = get_query_profiler()
+    prof.reset()
+    prof.enable(slow_ms=0)
+    yield prof
+    prof.disable()
+    prof.reset()
+
+
+def _stats_for(profiler: QueryProfiler, fragment: str):
+    matches = [s for s in profiler.report() if fragment in s.sql]
+    assert matches, f"no statement containing {fragment!r}"
+    return matches[0]
+
+
+class TestNormalizeSql:
+    def test_collapses_whitespace(self):
+        assert normalize_sql("SELECT *\n   FROM t\tWHERE a = ?") == "SELECT * FROM t WHERE a = ?"
+
+    def test_folds_placeholder_lists(self):
+        assert normalize_sql("SELECT * FROM t WHERE id IN (?, ?, ?)") == normalize_sql(
+            "SELECT * FROM t WHERE id IN (?,?)"
+        )
+
+
+class TestQueryProfiler:
+    def test_p95_and_totals(self):
+        prof = QueryProfiler()
+        for ms in range(1, 101):
+            prof.record("SELECT 1", float(ms), rows=1)
+        stats = prof.report()[0]
+        assert stats.calls == 100
+        assert stats.rows == 100
+        assert stats.total_ms == pytest.approx(5050.0)
+        assert stats.p95_ms == 95.0
+
+    def test_plan_captured_once_for_slow_statement(self):
+        prof = QueryProfiler()
+        prof.slow_ms = 10
+        calls = []
+
+        def explain():
+            calls.append(1)
+            return ["SCAN t"]
+
+        prof.record("SELECT * FROM t", 5.0, 0, explain=explain)
+        prof.record("SELECT * FROM t", 20.0, 0, explain=explain)
+        prof.record("SELECT * FROM t", 30.0, 0, explain=explain)
+        stats = prof.report()[0]
+        assert calls == [1]
+        assert stats.slow_calls == 2
+        assert stats.scans
+
+
+class TestProfiledConnection:
+    def test_disabled_profiler_records_nothing(self, memory_db: Database):
+        prof = get_query_profiler()
+        prof.reset()
+        memory_db.get_population_counts()
+        assert prof.report() == []
+
+    def test_reads_record_rows_and_plan(self, profiler, temp_db: Database):
+        conn = temp_db._get_connection()
+        conn.execute("INSERT INTO companies (name, name_normalized) VALUES ('A', 'a')")
+        conn.execute("INSERT INTO companies (name, name_normalized) VALUES ('B', 'b')")
+        conn.commit()
+
+        rows = list(conn.execute("SELECT name FROM companies WHERE state IS NULL"))
+        assert len(rows) == 2
+        conn.execute("SELECT name FROM companies WHERE id = ?", (1,)).fetchone()
+
+        scan = _stats_for(profiler, "WHERE state IS NULL")
+        assert scan.calls == 1
+        assert scan.rows == 2
+        assert scan.scans
+
+        lookup = _stats_for(profiler, "WHERE id = ?")
+        assert lookup.plan and lookup.plan[0].startswith("SEARCH")
+        assert not lookup.scans
+
+    def test_writes_record_rows_affected(self, profiler, temp_db: Database):
+        conn = temp_db._get_connection()
+        conn.executemany(
+            "INSERT INTO companies (name, name_normalized) VALUES (?, ?)",
+            [("A", "a"), ("B", "b"), ("C", "c")],
+        )
+        conn.commit()
+        stats = _stats_for(profiler, "INSERT INTO companies")
+        assert stats.rows == 3
+        assert stats.plan is None
+
+    def test_single_row_lookup_reported_at_first_fetch(self, profiler, temp_db: Database):
+        conn = temp_db._get_connection()
+        conn.execute("INSERT INTO companies (name, name_normalized) VALUES ('A', 'a')")
+        conn.commit()
+
+        cursor = conn.execute("SELECT name FROM companies WHERE id = ?", (1,))
+        assert cursor.fetchone()["name"] == "A"
+
+        # Reported while the cursor is still alive, plan included
+        lookup = _stats_for(profiler, "WHERE id = ?")
+        assert (lookup.calls, lookup.rows) == (1, 1)
+        assert lookup.plan and lookup.plan[0].startswith("SEARCH")
+        del cursor
+        assert _stats_for(profiler, "WHERE id = ?").calls == 1
+
+    def test_read_ahead_row_is_not_lost(self, profiler, temp_db: Database):
+        conn = temp_db._get_connection()
+        conn.executemany(
+            "INSERT INTO companies (name, name_normalized) VALUES (?, ?)",
+            [(name, name.lower()) for name in "ABCD"],
+        )
+        conn.commit()
+        sql = "SELECT name FROM companies ORDER BY name"
+
+        cursor = conn.execute(sql)
+        first = cursor.fetchone()["name"]
+        assert [first] + [row["name"] for row in cursor.fetchmany(2)] == ["A", "B", "C"]
+        cursor = conn.execute(sql)
+        first = cursor.fetchone()["name"]
+        assert [first] + [row["name"] for row in cursor.fetchall()] == ["A", "B", "C", "D"]
+
+        stats = _stats_for(profiler, "ORDER BY name")
+        assert (stats.calls, stats.rows) == (2, 7)
+
+    def test_discarded_cursor_reported_without_plan(self, profiler, temp_db: Database):
+        conn = temp_db._get_connection()
+        conn.executemany(
+            "INSERT INTO companies (name, name_normalized) VALUES (?, ?)",
+            [("A", "a"), ("B", "b"), ("C", "c")],
+        )
+        conn.commit()
+
+        cursor = conn.execute("SELECT name FROM companies WHERE state IS NULL")
+        cursor.fetchone()
+        assert not [s for s in profiler.report() if "state IS NULL" in s.sql]
+        del cursor
+
+        stats = _stats_for(profiler, "WHERE state IS NULL")
+        assert (stats.calls, stats.rows) == (1, 2)
+        assert stats.plan is None
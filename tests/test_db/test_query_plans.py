@@ -0,0 +1,191 @@
+"""EXPLAIN QUERY PLAN guards for the date-filtered queue and staleness queries.
+
+Each report below is run with a trace callback; every statement it issues
+that filters prospects by follow-up, lost, created or last-activity date
+must be answered with an index rather than a full table scan.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.db.database import Database
+from src.db.models import Company, EngagementStage, Population, Prospect
+
+_DATE_FILTER = re.compile(r"\b(follow_up_date|lost_date|created_at)\s*(<|>=)")
+_WRAPPED_DATE = re.compile(r"DATE\(\s*(p\.)?(follow_up_date|lost_date|created_at)\s*\)")
+_FULL_SCAN = re.compile(r"^SCAN (p|prospects)\b(?!.*USING)")
+_STALE_FILTER = re.compile(r"\blast_activity_at\s*<")
+_ACTIVITY_AGGREGATE = re.compile(r"MAX\(\s*a\.created_at\s*\)", re.IGNORECASE)
+
+
+@pytest.fixture
+def queue_db(memory_db: Database) -> Database:
+    """Database with prospects spread across populations and dates."""
+    cid = memory_db.create_company(Company(name="Plan Co", state="TX"))
+    today = datetime.combine(date.today(), datetime.min.time())
+    for i in range(30):
+        memory_db.create_prospect(
+            Prospect(
+                company_id=cid,
+                first_name=f"P{i}",
+                last_name="Plan",
+                population=[Population.ENGAGED, Population.UNENGAGED, Population.LOST][i % 3],
+                engagement_stage=EngagementStage.PRE_DEMO if i % 3 == 0 else None,
+                follow_up_date=today + timedelta(days=i - 15),
+                lost_date=(date.today() - timedelta(days=400 + i)) if i % 3 == 2 else None,
+                prospect_score=i * 3,
+            )
+        )
+    return memory_db
+
+
+def _date_filtered_statements(db: Database, run, pattern=_DATE_FILTER) -> list[str]:
+    statements: list[str] = []
+    conn = db._get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        run(db)
+    finally:
+        conn.set_trace_callback(None)
+    wrapped = [sql for sql in statements if _WRAPPED_DATE.search(sql)]
+    assert not wrapped, f"date column wrapped in DATE(), index unusable:\n{wrapped[0]}"
+    return [
+        sql
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and pattern.search(sql)
+    ]
+
+
+def _run_cadence(db):
+    from src.engine.cadence import get_overdue, get_todays_follow_ups, get_todays_queue
+
+    get_todays_queue(db)
+    get_todays_follow_ups(db)
+    get_overdue(db)
+
+
+def _run_briefs(db):
+    from src.content.daily_cockpit import get_cockpit_data
+    from src.content.eod_summary import generate_eod_summary
+    from src.content.morning_brief import generate_morning_brief
+
+    get_cockpit_data(db)
+    generate_morning_brief(db)
+    generate_eod_summary(db)
+
+
+def _run_engines(db):
+    from src.ai.rescue import RescueEngine
+    from src.engine.intervention import InterventionEngine
+    from src.engine.resurrection import find_resurrection_candidates
+    from src.engine.troubled_cards import TroubledCardsService
+
+    InterventionEngine(db).detect_decay()
+    find_resurrection_candidates(db)
+    TroubledCardsService(db).get_troubled_cards()
+    RescueEngine(db).generate_rescue_list()
+
+
+def _run_staleness(db):
+    from src.ai.contact_analyzer import find_stalling_patterns
+    from src.ai.proactive_interrogation import interrogate_cards
+    from src.engine.intervention import InterventionEngine
+    from src.engine.troubled_cards import TroubledCardsService
+
+    interrogate_cards(db)
+    find_stalling_patterns(db)
+    InterventionEngine(db).detect_decay()
+    TroubledCardsService(db).get_troubled_cards()
+
+
+class TestQueueQueryPlans:
+    """Date-range queue queries must stay sargable."""
+
+    @pytest.mark.parametrize("run", [_run_cadence, _run_briefs, _run_engines])
+    def test_no_full_prospect_scan(self, queue_db: Database, run):
+        statements = _date_filtered_statements(queue_db, run)
+        assert statements, "expected date-filtered queries to be issued"
+
+        conn = queue_db._get_connection()
+        for sql in statements:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            scans = [step for step in plan if _FULL_SCAN.match(step)]
+            assert not scans, f"full scan in:\n{sql}\nplan: {plan}"
+
+    def test_composite_indexes_exist(self, memory_db: Database):
+        names = {
+            row["name"]
+            for row in memory_db._get_connection().execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {
+            "idx_prospects_population_follow_up",
+            "idx_prospects_population_score",
+            "idx_prospects_population_lost_date",
+            "idx_prospects_population_last_activity",
+        } <= names
+
+
+class TestStalenessQueryPlans:
+    """Staleness reports read prospects.last_activity_at, not the activity log."""
+
+    def test_no_activity_aggregation_or_full_scan(self, queue_db: Database):
+        for pid in (1, 2, 3):
+            queue_db._get_connection().execute(
+                "INSERT INTO activities (prospect_id, activity_type, created_at) "
+                "VALUES (?, 'call', '2025-01-01 10:00:00')",
+                (pid,),
+            )
+        queue_db._get_connection().commit()
+
+        statements: list[str] = []
+        conn = queue_db._get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            _run_staleness(queue_db)
+        finally:
+            conn.set_trace_callback(None)
+        aggregated = [sql for sql in statements if _ACTIVITY_AGGREGATE.search(sql)]
+        assert not aggregated, f"last touch derived from activities:\n{aggregated[0]}"
+
+        stale = [sql for sql in statements if _STALE_FILTER.search(sql)]
+        assert len(stale) >= 4
+        for sql in stale:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            assert not [step for step in plan if _FULL_SCAN.match(step)], plan
+
+
+class TestCanonicalDates:
+    """Follow-up and lost dates are stored in a sortable form."""
+
+    def test_blank_follow_up_becomes_null(self, memory_db: Database):
+        cid = memory_db.create_company(Company(name="Blank Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="B"))
+        conn = memory_db._get_connection()
+        conn.execute("UPDATE prospects SET follow_up_date = '' WHERE id = ?", (pid,))
+        conn.commit()
+        row = conn.execute("SELECT follow_up_date FROM prospects WHERE id = ?", (pid,)).fetchone()
+        assert row["follow_up_date"] is None
+
+    def test_canonical_values_untouched(self, memory_db: Database):
+        cid = memory_db.create_company(Company(name="Keep Co", state="TX"))
+        due = datetime(2026, 3, 4, 9, 30)
+        pid = memory_db.create_prospect(
+            Prospect(company_id=cid, first_name="A", last_name="B", follow_up_date=due)
+        )
+        assert str(memory_db.get_prospect(pid).follow_up_date) == "2026-03-04 09:30:00"
+
+    def test_timezone_offset_normalized(self, memory_db: Database):
+        cid = memory_db.create_company(Company(name="Tz Co", state="TX"))
+        pid = memory_db.create_prospect(Prospect(company_id=cid, first_name="A", last_name="B"))
+        conn = memory_db._get_connection()
+        conn.execute(
+            "UPDATE prospects SET follow_up_date = '2026-03-04T23:00:00-05:00' WHERE id = ?",
+            (pid,),
+        )
+        conn.commit()
+        row = conn.execute("SELECT follow_up_date FROM prospects WHERE id = ?", (pid,)).fetchone()
+        assert row["follow_up_date"] == "2026-03-05 04:00:00"
@@ -19,6 +19,8 @@ from src.db.models import (
     Activity,
     ActivityType,
     Company,
+    ContactMethod,
+    ContactMethodType,
     EngagementStage,
     Population,
     Prospect,
@@ -280,6 +282,33 @@ class TestExportProspects:
         assert rows[0]["title"] == ""
         assert rows[0]["notes"] == ""
 
+    def test_related_columns_loaded_from_db(self, tmp_path, db, company_id):
+        """Company name, primary email and tags are filled in from the database."""
+        pid = db.create_prospect(
+            Prospect(company_id=company_id, first_name="Cara", last_name="Lee")
+        )
+        db.create_contact_method(
+            ContactMethod(prospect_id=pid, type=ContactMethodType.EMAIL, value="cara@x.com")
+        )
+        db.add_tag(pid, "vip")
+        path = tmp_path / "prospects.csv"
+        export_prospects(
+            [db.get_prospect(pid)],
+            path,
+            columns=["first_name", "company_name", "email", "phone", "tags"],
+            db=db,
+        )
+
+        with open(path, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0] == {
+            "first_name": "Cara",
+            "company_name": "Export Corp",
+            "email": "cara@x.com",
+            "phone": "",
+            "tags": "vip",
+        }
+
 
 # =============================================================================
 # MONTHLY SUMMARY GENERATION
@@ -351,6 +380,19 @@ class TestGenerateMonthlySummary:
         assert summary.total_revenue == Decimal("0")
         assert summary.calls_made == 0
 
+    def test_counts_archived_activities(self, populated_db):
+        """Activities moved to the archive still count toward their month."""
+        archived = populated_db.archive_activities(older_than_days=30, today=date(2027, 3, 1))
+        assert archived > 0
+
+        summary = generate_monthly_summary(populated_db, "2026-02")
+        assert summary.calls_made == 5
+        assert summary.emails_sent == 3
+        assert summary.demos_booked == 2
+
+        live_only = generate_monthly_summary(populated_db, "2026-02", include_archived=False)
+        assert live_only.calls_made + live_only.emails_sent + live_only.demos_booked < 10
+
     def test_pipeline_added_counts_new_prospects(self, populated_db):
         """Pipeline added counts new prospects created in the month."""
         summary = generate_monthly_summary(populated_db, "2026-02")
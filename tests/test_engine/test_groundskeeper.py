@@ -231,6 +231,43 @@ class TestGetStaleByPriority:
         assert "company" in p1_record.stale_fields
 
 
+class TestFindStale:
+    """Test the single-query stale scan shared by flagging and prioritization."""
+
+    def test_returns_every_stale_prospect_without_limit(self, stale_db):
+        db, cid, p1_id, p2_id, p3_id = stale_db
+        keeper = Groundskeeper(db)
+        records = keeper.find_stale()
+        assert [r.prospect_id for r in records] == [p1_id, p3_id]
+        assert keeper.flag_stale_records() == [p1_id, p3_id]
+
+    def test_latest_verification_wins(self, stale_db):
+        """A recent re-verification makes an old record irrelevant."""
+        db, cid, p1_id, p2_id, p3_id = stale_db
+        db.create_data_freshness(p1_id, "email", date.today() - timedelta(days=5))
+        keeper = Groundskeeper(db)
+
+        p1_record = next(r for r in keeper.find_stale() if r.prospect_id == p1_id)
+        assert p1_record.stale_fields == ["phone", "title", "company"]
+        assert keeper._check_email_freshness(p1_id) is None
+
+    def test_inactive_populations_skipped(self, stale_db):
+        db, cid, p1_id, p2_id, p3_id = stale_db
+        prospect = db.get_prospect(p1_id)
+        prospect.population = Population.PARKED
+        db.update_prospect(prospect)
+
+        assert p1_id not in [r.prospect_id for r in Groundskeeper(db).find_stale()]
+
+    def test_priority_uses_max_days_and_score(self, stale_db):
+        db, cid, p1_id, p2_id, p3_id = stale_db
+        records = {r.prospect_id: r for r in Groundskeeper(db).find_stale()}
+        assert records[p1_id].days_stale == 200
+        assert records[p1_id].priority_score == 200 * 80
+        # Never-verified phone (181) beats never-verified title (121)
+        assert records[p3_id].days_stale == DEFAULT_THRESHOLDS.phone_days + 1
+
+
 # =============================================================================
 # run_maintenance
 # =============================================================================
@@ -250,6 +287,7 @@ class TestRunMaintenance:
         assert isinstance(result["flagged"], int)
         assert isinstance(result["by_field"], dict)
         assert result["flagged"] >= 2  # p1 and p3
+        assert result["checked"] == 3  # every active prospect, stale or not
 
     def test_by_field_counts(self, stale_db):
         """by_field dict has correct field keys."""
@@ -267,7 +305,7 @@ class TestRunMaintenance:
         """Empty database returns zero counts."""
         keeper = Groundskeeper(memory_db)
         result = keeper.run_maintenance()
-        assert result["flagged"] == 0
+        assert (result["checked"], result["flagged"]) == (0, 0)
         assert result["by_field"]["email"] == 0
         assert result["by_field"]["phone"] == 0
         assert result["by_field"]["title"] == 0
@@ -0,0 +1,244 @@
+"""Tests for intel extraction (src/engine/intel_extract.py).
+
+Covers:
+    - IntelMatcher: every rule found in one pass, overlapping keywords, keyword preference
+    - extract_intel_from_notes: real-time extraction and dedup
+    - extract_intel_backlog: watermarked streaming over the activity backlog
+"""
+
+import pytest
+
+from src.db.database import Database
+from src.db.models import Activity, ActivityType, Company, IntelCategory, IntelNugget, Prospect
+from src.engine.intel_extract import (
+    INTEL_RULES,
+    IntelMatcher,
+    IntelRule,
+    extract_intel_backlog,
+    extract_intel_from_notes,
+    match_intel,
+)
+
+
+@pytest.fixture
+def prospect_id(memory_db: Database) -> int:
+    company_id = memory_db.create_company(Company(name="Intel Test Co"))
+    return memory_db.create_prospect(
+        Prospect(company_id=company_id, first_name="Intel", last_name="Subject")
+    )
+
+
+def _log(db: Database, prospect_id: int, notes: str) -> int:
+    return db.create_activity(
+        Activity(prospect_id=prospect_id, activity_type=ActivityType.CALL, notes=notes)
+    )
+
+
+def _naive_match(notes: str) -> list[tuple[IntelCategory, str]]:
+    """The per-rule keyword loops the matcher replaces."""
+    lower = notes.lower()
+    found = []
+    for rule in INTEL_RULES:
+        for kw in rule.keywords:
+            if kw in lower:
+                found.append((rule.category, rule.template.format(keyword=kw, notes=notes[:200])))
+                break
+    return found
+
+
+class TestIntelMatcher:
+    def test_finds_every_rule(self):
+        notes = (
+            "Frustrated with a manual process, currently using LoanCo, "
+            "budget approved for Q3 but the committee has to sign off."
+        )
+
+        categories = [category for category, _ in match_intel(notes)]
+
+        assert categories == [
+            IntelCategory.PAIN_POINT,
+            IntelCategory.COMPETITOR,
+            IntelCategory.DECISION_TIMELINE,
+            IntelCategory.KEY_FACT,
+            IntelCategory.DECISION_TIMELINE,
+        ]
+
+    def test_overlapping_keywords_trigger_both_rules(self):
+        """'budget cycle' is a timeline keyword and contains the budget keyword."""
+        contents = [content for _, content in match_intel("Waiting on their budget cycle.")]
+
+        assert contents == [
+            "Timeline: Waiting on their budget cycle.",
+            "Budget signal: Waiting on their budget cycle.",
+        ]
+
+    def test_prefers_first_listed_keyword(self):
+        """Content names the first keyword in rule order, not the first in the text."""
+        [(category, content)] = match_intel("A real bottleneck; they are struggling with it.")
+
+        assert category == IntelCategory.PAIN_POINT
+        assert content.startswith("Mentioned 'struggling with':")
+
+    def test_case_insensitive_and_truncates_notes(self):
+        notes = "DEADLINE is firm. " + "x" * 300
+
+        [(_, content)] = match_intel(notes)
+
+        assert content == f"Timeline: {notes[:200]}"
+
+    def test_agrees_with_keyword_loops(self):
+        samples = [
+            "",
+            "Left a voicemail.",
+            "They are comparing us with an alternative vendor this quarter.",
+            "CEO wants pricing by end of the fiscal year; issue with funding.",
+            "q1q2q3q4 costcommitteemy boss",
+            "Need to run it by the board approval committee next month.",
+        ]
+        for notes in samples:
+            assert match_intel(notes) == _naive_match(notes), notes
+
+    def test_custom_rules(self):
+        matcher = IntelMatcher(
+            (
+                IntelRule(IntelCategory.KEY_FACT, "Short {keyword}", ("ab",)),
+                IntelRule(IntelCategory.KEY_FACT, "Long {keyword}", ("abc", "b")),
+            )
+        )
+
+        assert matcher.match("xABCx") == [
+            (IntelCategory.KEY_FACT, "Short ab"),
+            (IntelCategory.KEY_FACT, "Long abc"),
+        ]
+
+
+class TestExtractIntelFromNotes:
+    def test_creates_nuggets(self, memory_db: Database, prospect_id: int):
+        created = extract_intel_from_notes(
+            memory_db, prospect_id, "They are worried about the deadline."
+        )
+
+        assert created == 2
+        categories = {n.category for n in memory_db.get_intel_nuggets(prospect_id)}
+        assert categories == {IntelCategory.PAIN_POINT, IntelCategory.DECISION_TIMELINE}
+
+    def test_repeat_notes_are_deduplicated(self, memory_db: Database, prospect_id: int):
+        notes = "They are worried about the deadline."
+        extract_intel_from_notes(memory_db, prospect_id, notes)
+
+        assert extract_intel_from_notes(memory_db, prospect_id, notes) == 0
+        assert len(memory_db.get_intel_nuggets(prospect_id)) == 2
+
+    def test_blank_notes(self, memory_db: Database, prospect_id: int):
+        assert extract_intel_from_notes(memory_db, prospect_id, "   ") == 0
+
+
+class TestExtractIntelBacklog:
+    def test_extracts_pain_point(self, memory_db: Database, prospect_id: int):
+        _log(memory_db, prospect_id, "They are struggling with their loan origination system.")
+
+        result = extract_intel_backlog(memory_db)
+
+        assert result.extracted >= 1
+        categories = [n.category for n in memory_db.get_intel_nuggets(prospect_id)]
+        assert IntelCategory.PAIN_POINT in categories
+
+    def test_extracts_competitor_intel(self, memory_db: Database, prospect_id: int):
+        _log(memory_db, prospect_id, "They are currently using CompetitorX for processing.")
+
+        extract_intel_backlog(memory_db)
+
+        categories = [n.category for n in memory_db.get_intel_nuggets(prospect_id)]
+        assert IntelCategory.COMPETITOR in categories
+
+    def test_extracts_timeline(self, memory_db: Database, prospect_id: int):
+        _log(memory_db, prospect_id, "They want to make a decision by next quarter at the latest.")
+
+        extract_intel_backlog(memory_db)
+
+        categories = [n.category for n in memory_db.get_intel_nuggets(prospect_id)]
+        assert IntelCategory.DECISION_TIMELINE in categories
+
+    def test_records_source_activity(self, memory_db: Database, prospect_id: int):
+        activity_id = _log(memory_db, prospect_id, "They are frustrated by slow turnarounds.")
+
+        extract_intel_backlog(memory_db)
+
+        [nugget] = memory_db.get_intel_nuggets(prospect_id)
+        assert nugget.source_activity_id == activity_id
+
+    def test_short_notes_ignored(self, memory_db: Database, prospect_id: int):
+        _log(memory_db, prospect_id, "Deadline")
+
+        result = extract_intel_backlog(memory_db)
+
+        assert (result.scanned, result.extracted) == (0, 0)
+
+    def test_no_activities(self, memory_db: Database):
+        result = extract_intel_backlog(memory_db)
+
+        assert (result.scanned, result.extracted, result.watermark) == (0, 0, 0)
+
+    def test_streams_whole_backlog_in_batches(self, memory_db: Database, prospect_id: int):
+        """Busy days are not capped: every activity is scanned, batch after batch."""
+        for i in range(23):
+            _log(memory_db, prospect_id, f"Call {i}: they are worried about item {i}.")
+
+        result = extract_intel_backlog(memory_db, batch_size=5)
+
+        assert (result.scanned, result.extracted) == (23, 23)
+        assert len(memory_db.get_intel_nuggets(prospect_id)) == 23
+
+    def test_watermark_skips_scanned_activities(self, memory_db: Database, prospect_id: int):
+        _log(memory_db, prospect_id, "They are struggling with their legacy platform.")
+        first = extract_intel_backlog(memory_db)
+
+        second = extract_intel_backlog(memory_db)
+        last_id = _log(memory_db, prospect_id, "They are comparing three vendors right now.")
+        third = extract_intel_backlog(memory_db)
+
+        assert (first.scanned, second.scanned, third.scanned) == (1, 0, 1)
+        assert (second.extracted, third.extracted) == (0, 1)
+        assert third.watermark == last_id
+
+    def test_skips_nuggets_already_extracted_in_real_time(
+        self, memory_db: Database, prospect_id: int
+    ):
+        notes = "They are struggling with their legacy platform."
+        extract_intel_from_notes(memory_db, prospect_id, notes)
+        _log(memory_db, prospect_id, notes)
+
+        result = extract_intel_backlog(memory_db)
+
+        assert (result.scanned, result.extracted) == (1, 0)
+        assert len(memory_db.get_intel_nuggets(prospect_id)) == 1
+
+
+class TestNuggetDedupIndex:
+    def test_create_intel_nugget_returns_existing_id(self, memory_db: Database, prospect_id: int):
+        nugget = IntelNugget(
+            prospect_id=prospect_id, category=IntelCategory.KEY_FACT, content="Uses LoanCo"
+        )
+        first = memory_db.create_intel_nugget(nugget)
+
+        assert memory_db.create_intel_nugget(nugget) == first
+        assert len(memory_db.get_intel_nuggets(prospect_id)) == 1
+
+    def test_bulk_insert_counts_new_rows(self, memory_db: Database, prospect_id: int):
+        nuggets = [
+            IntelNugget(prospect_id=prospect_id, category=IntelCategory.KEY_FACT, content=text)
+            for text in ("A", "B", "A")
+        ]
+
+        assert memory_db.create_intel_nuggets(nuggets) == 2
+        assert memory_db.create_intel_nuggets(nuggets) == 0
+
+    def test_same_content_in_other_category_is_kept(self, memory_db: Database, prospect_id: int):
+        memory_db.create_intel_nuggets(
+            [
+                IntelNugget(prospect_id=prospect_id, category=category, content="Same text")
+                for category in (IntelCategory.KEY_FACT, IntelCategory.PAIN_POINT)
+            ]
+        )
+
+        assert len(memory_db.get_intel_nuggets(prospect_id)) == 2
@@ -193,6 +193,38 @@ class TestAnalyzeOutcomes:
         pattern_descs = [p.pattern for p in insights.win_patterns]
         assert any("referral" in d.lower() for d in pattern_descs)
 
+    def test_archived_activity_notes_included(self, db, company_id):
+        """Notes moved to the activity archive still feed the analysis."""
+        pid = db.create_prospect(
+            Prospect(
+                company_id=company_id,
+                first_name="Won",
+                last_name="Archived",
+                population=Population.CLOSED_WON,
+            )
+        )
+        db.create_activity(
+            Activity(
+                prospect_id=pid,
+                activity_type=ActivityType.NOTE,
+                notes="The referral from our existing client was key to this deal",
+            )
+        )
+        db.create_activity(Activity(prospect_id=pid, activity_type=ActivityType.CALL))
+        conn = db._get_connection()
+        conn.execute(
+            "UPDATE activities SET created_at = '2024-01-05 09:00:00' WHERE prospect_id = ?",
+            (pid,),
+        )
+        conn.commit()
+        assert db.archive_activities(older_than_days=365) == 1
+
+        engine = LearningEngine(db)
+        patterns = [p.pattern.lower() for p in engine.analyze_outcomes().win_patterns]
+        assert any("referral" in d for d in patterns)
+        live_only = engine.analyze_outcomes(include_archived=False).win_patterns
+        assert not any("referral" in p.pattern.lower() for p in live_only)
+
 
 class TestGetSuggestionsForProspect:
     """Tests for prospect-specific suggestions."""
@@ -12,6 +12,7 @@ Tests Phase 5: Research Engine
     - Company site scraping (deferred)
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -420,6 +421,38 @@ class TestRunBatch:
         count = engine.run_batch(limit=3)
         assert count == 3
 
+    def test_batch_resumes_from_cursor(self, memory_db, mock_google):
+        """A cursor skips prospects already attempted and counts them against the limit."""
+        cid = memory_db.create_company(Company(name="Test Corp", domain="test.com", state="CA"))
+        for i in range(5):
+            memory_db.create_prospect(
+                Prospect(
+                    company_id=cid,
+                    first_name=f"Person{i}",
+                    last_name="Test",
+                    population=Population.BROKEN,
+                )
+            )
+        engine = ResearchEngine(memory_db, google_client=mock_google)
+        cursors: list[str] = []
+
+        def stop(cursor: str) -> None:
+            cursors.append(cursor)
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            engine.run_batch(limit=3, on_progress=stop)
+        first = json.loads(cursors[0])["attempted"]
+
+        resumed: list[str] = []
+        count = engine.run_batch(limit=3, cursor=cursors[0], on_progress=resumed.append)
+
+        assert count == 3
+        attempted = json.loads(resumed[-1])["attempted"]
+        assert len(attempted) == 3
+        assert attempted[: len(first)] == first
+        assert len(set(attempted)) == 3
+
 
 # =============================================================================
 # ResearchEngine._apply_finding
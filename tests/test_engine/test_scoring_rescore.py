@@ -7,6 +7,7 @@ Tests Phase 5: Batch Rescore
     - Handles prospects with and without companies
 """
 
+import json
 from datetime import date, datetime, timedelta
 
 import pytest
@@ -247,3 +248,121 @@ class TestRescoreAll:
             p = db.get_prospect(pid)
             assert 0 <= p.prospect_score <= 100
             assert 0 <= p.data_confidence <= 100
+
+
+class TestIncrementalRescore:
+    """Later runs rescore only prospects whose inputs or timing bucket changed."""
+
+    def test_second_run_with_no_changes_scores_nothing(self, rescore_db):
+        db = rescore_db[0]
+        assert rescore_all(db) == 3
+        assert rescore_all(db) == 0
+
+    def test_contact_method_change_rescores_its_prospect(self, rescore_db):
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        rescore_all(db)
+        before = db.get_prospect(p3_id).data_confidence
+
+        db.create_contact_method(
+            ContactMethod(prospect_id=p3_id, type=ContactMethodType.EMAIL, value="c@mystery.com")
+        )
+        assert rescore_all(db) == 1
+        assert db.get_prospect(p3_id).data_confidence > before
+
+    def test_company_change_rescores_its_prospects(self, rescore_db):
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        rescore_all(db)
+
+        company = db.get_company(mystery_id)
+        company.state = "CO"
+        company.size = "enterprise"
+        db.update_company(company)
+        assert rescore_all(db) == 1
+
+    def test_timing_boundary_crossing_rescores(self, rescore_db):
+        """p1 was contacted 10 days ago; a run last week saw it in the 7-day bucket."""
+        from src.engine.scoring import _RESCORE_DATE_KEY
+
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        rescore_all(db)
+        current = db.get_prospect(p1_id).prospect_score
+        last_week = (date.today() - timedelta(days=5)).isoformat()
+        db.upsert_system_metadata(_RESCORE_DATE_KEY, last_week)
+        conn = db._get_connection()
+        conn.execute("UPDATE prospects SET prospect_score = 0 WHERE id = ?", (p1_id,))
+
+        # p2 (contacted 2 days ago) stays in the 7-day bucket and is skipped
+        assert rescore_all(db) == 1
+        assert db.get_prospect(p1_id).prospect_score == current
+
+    def test_full_rescores_everything(self, rescore_db):
+        db = rescore_db[0]
+        rescore_all(db)
+        assert rescore_all(db, full=True) == 3
+
+    def test_writes_only_score_columns(self, rescore_db):
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        conn = db._get_connection()
+        conn.execute("UPDATE prospects SET updated_at = '2020-01-01 00:00:00'")
+        conn.commit()
+
+        rescore_all(db)
+        row = conn.execute("SELECT updated_at FROM prospects WHERE id = ?", (p1_id,)).fetchone()
+        assert row[0] == datetime(2020, 1, 1)
+
+
+class TestResumableRescore:
+    """Progress cursors let an interrupted rescore continue after its last batch."""
+
+    @staticmethod
+    def _interrupt_after_first_batch(db) -> str:
+        cursors: list[str] = []
+
+        def stop(cursor: str) -> None:
+            cursors.append(cursor)
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            rescore_all(db, on_progress=stop)
+        return cursors[0]
+
+    def test_reports_progress_after_each_batch(self, rescore_db, monkeypatch):
+        monkeypatch.setattr("src.engine.scoring.RESCORE_BATCH_SIZE", 1)
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        cursors: list[str] = []
+
+        assert rescore_all(db, on_progress=cursors.append) == 3
+        assert [json.loads(c)["after"] for c in cursors] == sorted([p1_id, p2_id, p3_id])
+        assert json.loads(cursors[-1])["count"] == 3
+
+    def test_resume_skips_finished_batches(self, rescore_db, monkeypatch):
+        monkeypatch.setattr("src.engine.scoring.RESCORE_BATCH_SIZE", 1)
+        db, acme_id, mystery_id, p1_id, p2_id, p3_id, p4_id = rescore_db
+        cursor = self._interrupt_after_first_batch(db)
+        first = json.loads(cursor)["after"]
+        conn = db._get_connection()
+        conn.execute("UPDATE prospects SET prospect_score = -1 WHERE id = ?", (first,))
+        conn.commit()
+
+        assert rescore_all(db, cursor=cursor) == 3
+        # Done before the interruption and unchanged since: not visited again
+        assert db.get_prospect(first).prospect_score == -1
+
+    def test_resume_revisits_prospects_changed_since(self, rescore_db, monkeypatch):
+        monkeypatch.setattr("src.engine.scoring.RESCORE_BATCH_SIZE", 1)
+        db = rescore_db[0]
+        cursor = self._interrupt_after_first_batch(db)
+        first = json.loads(cursor)["after"]
+        conn = db._get_connection()
+        conn.execute("UPDATE prospects SET prospect_score = -1 WHERE id = ?", (first,))
+        conn.commit()
+        db.create_contact_method(
+            ContactMethod(prospect_id=first, type=ContactMethodType.PHONE, value="5125550100")
+        )
+
+        assert rescore_all(db, cursor=cursor) == 4
+        assert db.get_prospect(first).prospect_score != -1
+
+    def test_unreadable_cursor_is_ignored(self, rescore_db):
+        db = rescore_db[0]
+        assert rescore_all(db, cursor="not json") == 3
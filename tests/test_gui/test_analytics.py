@@ -0,0 +1,40 @@
+"""Tests for the Analytics tab's background report loader."""
+
+import threading
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+
+from src.db.database import Database
+from src.gui.tabs.analytics import AnalyticsTab
+
+
+class _Parent:
+    """Stands in for the Tk parent; records what the worker posts back."""
+
+    def __init__(self) -> None:
+        self.posted: list[tuple[Any, ...]] = []
+
+    def after(self, _ms: int, callback: Any, *args: Any) -> None:
+        self.posted.append(args)
+
+
+class TestLoadReport:
+    def test_worker_releases_its_reader(self, temp_db: Database):
+        """Each refresh runs on a new thread; its reader must not outlive it."""
+        tab = SimpleNamespace(db=temp_db, parent=_Parent(), _apply_report=None)
+        manager = temp_db._connections
+        assert manager is not None
+        before = len(manager._readers)
+
+        for generation in range(3):
+            worker = threading.Thread(
+                target=AnalyticsTab._load_report,
+                args=(tab, generation, date.today().strftime("%Y-%m"), False),
+            )
+            worker.start()
+            worker.join()
+
+        assert len(manager._readers) == before
+        assert [args[0] for args in tab.parent.posted] == [0, 1, 2]
+        assert all(args[1] is not None for args in tab.parent.posted)
@@ -0,0 +1,69 @@
+"""Tests for the Import tab's background import worker."""
+
+import sys
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.db.backup import BackupManager
+from src.db.database import Database
+from src.db.intake import ImportRecord
+from src.gui.tabs.import_tab import ImportTab
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _drop_tab_module():
+    """test_integration imports the tabs under a mocked tkinter; let it re-import."""
+    yield
+    sys.modules.pop("src.gui.tabs.import_tab", None)
+
+
+@pytest.fixture
+def no_backup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BackupManager, "create_backup", lambda self, label=None: None)
+
+
+def _tab(db: Database) -> SimpleNamespace:
+    """Just enough of an ImportTab for _run_import; records what it posts."""
+    posted: list[tuple[str, tuple[Any, ...]]] = []
+    tab = SimpleNamespace(db=db, posted=posted)
+    tab._show_import_progress = "progress"
+    tab._finish_import = "finish"
+    tab._post = lambda callback, *args: posted.append((callback, args))
+    return tab
+
+
+class TestRunImport:
+    def test_commits_off_the_tk_thread(self, temp_db: Database, no_backup: None):
+        """Progress and the result are posted back; the worker's reader is closed."""
+        tab = _tab(temp_db)
+        records = [
+            ImportRecord(first_name=f"P{i}", last_name="Q", email=f"p{i}@q.com") for i in range(3)
+        ]
+        manager = temp_db._connections
+        assert manager is not None
+        readers = len(manager._readers)
+
+        worker = threading.Thread(target=ImportTab._run_import, args=(tab, records, "list.csv"))
+        worker.start()
+        worker.join()
+
+        kinds = [callback for callback, _ in tab.posted]
+        assert kinds[0] == "progress" and kinds[-1] == "finish"
+        result, error = tab.posted[-1][1]
+        assert error is None
+        assert result.imported_count == 3
+        assert len(temp_db.get_prospects()) == 3
+        assert len(manager._readers) == readers
+
+    def test_failure_is_posted(self, memory_db: Database, no_backup: None):
+        tab = _tab(memory_db)
+        records = [ImportRecord(first_name=None, last_name="Bad")]  # type: ignore[arg-type]
+
+        ImportTab._run_import(tab, records, "bad.csv")  # type: ignore[arg-type]
+
+        callback, (result, error) = tab.posted[-1]
+        assert callback == "finish"
+        assert result is None and error is not None
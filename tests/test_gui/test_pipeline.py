@@ -0,0 +1,63 @@
+"""Tests for the Pipeline tab's Export View."""
+
+import csv
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Iterator
+
+import pytest
+
+from src.db.database import Database
+from src.db.models import Company, ContactMethod, ContactMethodType, Prospect
+
+
+@pytest.fixture
+def pipeline() -> Iterator[ModuleType]:
+    """The tab module, imported late: test_integration imports it under a mocked tkinter."""
+    from src.gui.tabs import pipeline
+
+    yield pipeline
+    sys.modules.pop("src.gui.tabs.pipeline", None)
+
+
+class TestExportView:
+    def test_exports_view_with_related_columns(
+        self,
+        memory_db: Database,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        pipeline: ModuleType,
+    ):
+        company_id = memory_db.create_company(Company(name="Acme Lending"))
+        prospect_id = memory_db.create_prospect(
+            Prospect(company_id=company_id, first_name="Ann", last_name="Lee")
+        )
+        memory_db.create_contact_method(
+            ContactMethod(
+                prospect_id=prospect_id,
+                type=ContactMethodType.EMAIL,
+                value="ann@acme.com",
+                is_primary=True,
+            )
+        )
+        memory_db.add_tag(prospect_id, "hot")
+        out = tmp_path / "view.csv"
+        monkeypatch.setattr(pipeline.filedialog, "asksaveasfilename", lambda **kw: str(out))
+        shown: list[str] = []
+        monkeypatch.setattr(pipeline.messagebox, "showinfo", lambda title, msg: shown.append(title))
+        tab = SimpleNamespace(
+            db=memory_db, _tree=object(), _view_prospects=[memory_db.get_prospect(prospect_id)]
+        )
+
+        pipeline.PipelineTab.export_view(tab)
+
+        with open(out, newline="", encoding="utf-8") as f:
+            [row] = list(csv.DictReader(f))
+        assert list(row) == pipeline.EXPORT_COLUMNS
+        assert (row["company_name"], row["email"], row["tags"]) == (
+            "Acme Lending",
+            "ann@acme.com",
+            "hot",
+        )
+        assert shown == ["Export Complete"]
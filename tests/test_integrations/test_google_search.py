@@ -4,15 +4,17 @@ Covers:
     - GoogleSearchClient.is_configured: with and without credentials
     - GoogleSearchClient.get_remaining_quota: quota tracking
     - GoogleSearchClient.search: raises IntegrationError when not configured
+    - GoogleSearchClient.health_check: counted as an API call
 """
 
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.core.exceptions import IntegrationError
 from src.integrations.google_search import GoogleSearchClient
+from src.utils.run_metrics import api_calls_on_thread
 
 # ===========================================================================
 # is_configured
@@ -121,3 +123,23 @@ class TestSearch:
         results = client.search("test query")
         assert len(results) == 1
         assert results[0].title == "Cached"
+
+
+# ===========================================================================
+# health_check
+# ===========================================================================
+
+
+class TestHealthCheck:
+    """Credential check against the live API."""
+
+    def test_counts_api_call(self):
+        """The test query is counted even though it bypasses with_retry."""
+        client = GoogleSearchClient(api_key="k", cx="c")
+        before = api_calls_on_thread()
+
+        with patch("src.integrations.google_search.requests.get") as get:
+            get.return_value = MagicMock(status_code=200)
+            assert client.health_check() is True
+
+        assert api_calls_on_thread() - before == 1
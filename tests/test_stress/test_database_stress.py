@@ -675,3 +675,76 @@ class TestDoubleInit:
         db.initialize()
         db.initialize()
         assert db.get_company(cid) is not None
+
+
+# =========================================================================
+# CONCURRENT THREADS
+# =========================================================================
+
+
+class TestConcurrentThreads:
+    """Readers and writers on separate threads sharing one Database."""
+
+    def test_concurrent_readers_and_writers(self, db):
+        """Parallel reads and writes finish without 'database is locked'."""
+        import threading
+
+        cid = _make_company(db)
+        pids = [_make_prospect(db, cid, first=f"P{i}") for i in range(20)]
+        errors: list[BaseException] = []
+        start = threading.Barrier(8)
+
+        def writer(offset):
+            try:
+                start.wait()
+                for i in range(50):
+                    pid = pids[(offset + i) % len(pids)]
+                    db.create_activity(
+                        Activity(
+                            prospect_id=pid,
+                            activity_type=ActivityType.NOTE,
+                            notes=f"w{offset}-{i}",
+                        )
+                    )
+                    prospect = db.get_prospect(pid)
+                    prospect.prospect_score = i
+                    db.update_prospect(prospect)
+            except BaseException as e:  # noqa: BLE001 - surfaced below
+                errors.append(e)
+
+        def reader():
+            try:
+                start.wait()
+                for _ in range(100):
+                    db.get_prospects(population=Population.UNENGAGED)
+                    db.get_population_counts()
+                    db.get_activities(pids[0])
+            except BaseException as e:  # noqa: BLE001 - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(3)]
+        threads += [threading.Thread(target=reader) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+
+        assert not errors, errors
+        total = db._get_connection().execute("SELECT COUNT(*) FROM activities").fetchone()[0]
+        assert total == 150
+
+    def test_reader_sees_committed_writes_from_other_thread(self, db):
+        """A read on one thread observes a commit made on another."""
+        import threading
+
+        cid = _make_company(db)
+        db.get_prospects()  # open this thread's reader first
+
+        def write():
+            _make_prospect(db, cid, first="Late")
+
+        t = threading.Thread(target=write)
+        t.start()
+        t.join()
+
+        assert [p.first_name for p in db.get_prospects()] == ["Late"]
@@ -0,0 +1,48 @@
+"""Tests for nightly telemetry process measurements."""
+
+import threading
+
+from src.integrations.base import IntegrationBase
+from src.utils.run_metrics import api_calls_on_thread, count_api_call, peak_rss_kb
+
+
+class _Integration(IntegrationBase):
+    def health_check(self) -> bool:
+        return True
+
+    def is_configured(self) -> bool:
+        return True
+
+
+class TestApiCallCounter:
+    def test_counts_per_thread(self):
+        before = api_calls_on_thread()
+        count_api_call()
+        count_api_call()
+
+        other: list[int] = []
+        thread = threading.Thread(target=lambda: other.append(api_calls_on_thread()))
+        thread.start()
+        thread.join()
+
+        assert api_calls_on_thread() - before == 2
+        assert other == [0]
+
+    def test_with_retry_counts_each_attempt(self):
+        attempts = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ConnectionError("reset")
+            return "ok"
+
+        before = api_calls_on_thread()
+        assert _Integration().with_retry(flaky, base_delay=0) == "ok"
+        assert api_calls_on_thread() - before == 2
+
+
+class TestPeakRss:
+    def test_reports_positive_kib(self):
+        peak = peak_rss_kb()
+        assert peak is None or peak > 0